@@ -7,6 +7,7 @@ import discord
 
 from eldoria.app.banner import startup_banner
 from eldoria.app.bot import EldoriaBot
+from eldoria.app.profiler import get_profiler
 from eldoria.app.startup import startup
 from eldoria.config import TOKEN
 
@@ -21,7 +22,8 @@ def create_bot() -> EldoriaBot:
     intents.guilds = True
     intents.members = True
 
-    bot = EldoriaBot(intents=intents)    
+    # La synchronisation des commandes est faite par Core.on_ready (sautée si l'arbre n'a pas changé)
+    bot = EldoriaBot(intents=intents, auto_sync_commands=False)
     return bot
 
 
@@ -33,5 +35,8 @@ def main(started_at: float) -> None:
 
     bot.set_started_at(started_at)
     bot.set_discord_started_at(time.perf_counter())
+    profiler = get_profiler()
+    if profiler is not None:
+        profiler.mark("connexion à Discord")
     log.info("⏳ Connexion à Discord…")
     bot.run(TOKEN)
@@ -0,0 +1,149 @@
+"""Synchronisation des commandes applicatives conditionnée par un hash de l'arbre de commandes.
+
+Le hash (sha256 des définitions `to_dict()` + `guild_ids` de chaque commande) est persisté après chaque
+synchronisation réussie. Au démarrage suivant, si l'arbre n'a pas changé, aucun appel REST n'est fait :
+redémarrages et déploiements successifs ne consomment plus le quota de synchronisation. Les commandes déjà
+enregistrées sont alors seulement relues (GET, sans upsert) pour associer leur id aux commandes locales,
+comme le ferait `sync_commands` : `bot.application_commands` (index du help, mentions) reste peuplé.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from eldoria.utils.timestamp import now_ts
+
+if TYPE_CHECKING:
+    from eldoria.app.bot import EldoriaBot
+
+log = logging.getLogger(__name__)
+
+COMMAND_SYNC_STATE_PATH = Path("./data/command_sync.json")
+
+# Listes construites par py-cord en itérant des ensembles : leur ordre dépend de PYTHONHASHSEED
+_UNORDERED_KEYS = frozenset({"contexts", "integration_types"})
+
+
+def _canonical(value: Any, key: str | None = None) -> Any:
+    """Retourne une copie de `value` dont les listes sans ordre significatif sont triées, à tous les niveaux."""
+    if isinstance(value, dict):
+        return {k: _canonical(v, k) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_canonical(v) for v in value]
+        if key in _UNORDERED_KEYS or isinstance(value, (set, frozenset)):
+            items.sort(key=lambda v: json.dumps(v, sort_keys=True, default=str))
+        return items
+    return value
+
+
+def _command_definition(cmd: object) -> dict[str, Any]:
+    """Retourne la définition stable d'une commande (payload envoyé à Discord + serveurs ciblés)."""
+    to_dict = getattr(cmd, "to_dict", None)
+    payload = to_dict() if callable(to_dict) else {"name": getattr(cmd, "name", repr(cmd))}
+    guild_ids = getattr(cmd, "guild_ids", None)
+    return {"payload": _canonical(payload), "guild_ids": sorted(guild_ids) if guild_ids else None}
+
+
+def compute_commands_hash(bot: EldoriaBot) -> str:
+    """Calcule un hash stable de l'arbre des commandes applicatives en attente de synchronisation."""
+    commands = getattr(bot, "pending_application_commands", None) or []
+    definitions = [_command_definition(cmd) for cmd in commands]
+    definitions.sort(key=lambda d: json.dumps(d, sort_keys=True, default=str))
+    raw = json.dumps(definitions, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _command_type(cmd: object) -> int:
+    try:
+        return int(getattr(cmd, "type", 1))
+    except (TypeError, ValueError):
+        return 1
+
+
+async def attach_registered_commands(bot: EldoriaBot) -> int:
+    """Associe aux commandes locales l'id des commandes déjà enregistrées chez Discord, sans rien modifier côté Discord.
+
+    Une lecture par portée (globale, puis chaque guild ciblée) ; chaque commande retrouvée (même nom et type)
+    reçoit son id et est ajoutée à `bot.application_commands`. Retourne le nombre d'associations faites.
+    """
+    application_id = getattr(bot, "application_id", None)
+    scopes: dict[int | None, dict[tuple[str, int], object]] = {}
+    for cmd in getattr(bot, "pending_application_commands", None) or []:
+        for guild_id in getattr(cmd, "guild_ids", None) or [None]:
+            scopes.setdefault(guild_id, {})[(getattr(cmd, "name", ""), _command_type(cmd))] = cmd
+
+    attached = 0
+    for guild_id, by_key in scopes.items():
+        if guild_id is None:
+            registered = await bot.http.get_global_commands(application_id)
+        else:
+            registered = await bot.http.get_guild_commands(application_id, guild_id)
+        for data in registered:
+            cmd = by_key.get((data.get("name"), int(data.get("type", 1))))
+            if cmd is None:
+                continue
+            cmd.id = int(data["id"])
+            # Registre interne rempli par py-cord à la synchronisation (source de `bot.application_commands`)
+            bot._application_commands[cmd.id] = cmd
+            attached += 1
+    return attached
+
+
+def read_sync_state() -> dict[str, Any] | None:
+    """Lit l'état de la dernière synchronisation, ou None s'il est absent ou illisible."""
+    try:
+        data = json.loads(COMMAND_SYNC_STATE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_sync_state(commands_hash: str, application_id: int | None) -> None:
+    """Enregistre le hash synchronisé (écriture atomique, erreurs seulement journalisées)."""
+    state = {"hash": commands_hash, "application_id": application_id, "synced_at": now_ts()}
+    try:
+        COMMAND_SYNC_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = COMMAND_SYNC_STATE_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        tmp.replace(COMMAND_SYNC_STATE_PATH)
+    except OSError:
+        log.warning("⚠️ Impossible d'écrire l'état de synchronisation des commandes", exc_info=True)
+
+
+async def sync_commands_if_changed(bot: EldoriaBot, *, force: bool = False) -> bool:
+    """Synchronise les commandes applicatives seulement si leur arbre a changé depuis la dernière synchronisation.
+
+    `force=True` ignore le hash et force un remplacement complet côté Discord.
+    Retourne True si une synchronisation a été faite, False si elle a été évitée.
+    Les erreurs de synchronisation sont propagées (l'état n'est alors pas mis à jour).
+    """
+    application_id = getattr(bot, "application_id", None)
+    try:
+        commands_hash = compute_commands_hash(bot)
+    except Exception:
+        log.warning("⚠️ Hash des commandes impossible à calculer, synchronisation complète", exc_info=True)
+        await bot.sync_commands(force=force)
+        return True
+
+    state = read_sync_state()
+    if (
+        not force
+        and state is not None
+        and state.get("hash") == commands_hash
+        and state.get("application_id") == application_id
+    ):
+        try:
+            attached = await attach_registered_commands(bot)
+        except Exception:
+            log.warning("⚠️ Impossible de relire les commandes enregistrées, ids des commandes indisponibles", exc_info=True)
+        else:
+            log.info("⏭️ Commandes inchangées depuis la dernière synchronisation, %d ids relus sans synchronisation", attached)
+        return False
+
+    await bot.sync_commands(force=force)
+    _write_sync_state(commands_hash, application_id)
+    return True
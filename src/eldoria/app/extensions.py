@@ -15,6 +15,8 @@ _base_extensions: list[str] = [
         "eldoria.extensions.welcome_message",
         "eldoria.extensions.ticketing",
     "eldoria.extensions.logs",
+    "eldoria.extensions.diagnostics",
+    "eldoria.extensions.db_maintenance",
 ]
 
 if SAVE_ENABLED:
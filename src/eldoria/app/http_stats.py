@@ -0,0 +1,313 @@
+"""Comptabilité des appels REST Discord : appels par route, par feature et par guild, 429 et attente de bucket.
+
+`install_http_stats(bot)` enveloppe `bot.http.request` : chaque appel est compté par route (gabarit
+`Route.path`, ex: `/channels/{channel_id}/messages`), par feature Eldoria appelante (extension, service ou UI
+trouvés dans la pile d'appel) et par guild (`Route.guild_id`, ou guild du salon de `Route.channel_id`).
+
+Les limites de débit sont gérées dans le client HTTP de la bibliothèque, qui ne les signale que par ses logs
+(logger `discord.http`) : un handler dédié relève les 429 (par bucket ou globaux) et les attentes
+préventives de bucket, et les attribue à l'appel en cours via une variable de contexte.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from eldoria.utils import metrics
+
+log = logging.getLogger(__name__)
+
+HTTP_LOGGER_NAME = "discord.http"
+
+# Préfixes de modules reconnus comme « feature » appelante (le premier trouvé en remontant la pile l'emporte)
+_FEATURE_PACKAGES = ("eldoria.extensions.", "eldoria.features.", "eldoria.ui.")
+_UNKNOWN_FEATURE = "(bibliothèque)"
+
+REST_REQUESTS_TOTAL = metrics.REGISTRY.counter(
+    "eldoria_rest_requests_total",
+    "Appels REST Discord, par méthode, route, feature appelante et statut.",
+    ("method", "route", "feature", "status"),
+)
+REST_SECONDS = metrics.REGISTRY.histogram(
+    "eldoria_rest_request_duration_seconds",
+    "Durée des appels REST Discord (attentes de rate limit comprises).",
+    ("method", "route"),
+)
+REST_RATE_LIMITED_TOTAL = metrics.REGISTRY.counter(
+    "eldoria_rest_rate_limited_total", "Réponses 429 reçues, par route et portée (bucket / global).", ("route", "scope")
+)
+REST_RATE_LIMIT_WAIT_TOTAL = metrics.REGISTRY.counter(
+    "eldoria_rest_rate_limit_wait_seconds_total", "Temps passé à attendre une limite de débit, par route.", ("route",)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RestCall:
+    """Appel REST en cours (route, feature appelante, guild concernée)."""
+
+    method: str
+    route: str
+    feature: str
+    guild_id: int | None
+
+
+_CURRENT_CALL: contextvars.ContextVar[RestCall | None] = contextvars.ContextVar("eldoria_rest_call", default=None)
+
+
+@dataclass(slots=True)
+class RestStats:
+    """Agrégats en mémoire des appels REST (détail par guild, que les métriques n'exposent pas)."""
+
+    routes: Counter[tuple[str, str]] = field(default_factory=Counter)
+    features: Counter[str] = field(default_factory=Counter)
+    guild_routes: dict[int, Counter[tuple[str, str]]] = field(default_factory=dict)
+    rate_limited: Counter[tuple[str, str]] = field(default_factory=Counter)
+    global_rate_limits: int = 0
+    wait_s: float = 0.0
+    started_at: float = field(default_factory=time.time)
+
+    def record_call(self, call: RestCall) -> None:
+        """Compte un appel REST."""
+        key = (call.method, call.route)
+        self.routes[key] += 1
+        self.features[call.feature] += 1
+        if call.guild_id is not None:
+            self.guild_routes.setdefault(call.guild_id, Counter())[key] += 1
+
+    def record_rate_limit(self, call: RestCall | None, wait_s: float, *, hit: bool, is_global: bool) -> None:
+        """Compte une attente de limite de débit (`hit=True` pour un 429 reçu, False pour une attente préventive)."""
+        route = call.route if call is not None else "?"
+        self.wait_s += wait_s
+        if hit:
+            self.rate_limited[(call.method if call is not None else "?", route)] += 1
+            if is_global:
+                self.global_rate_limits += 1
+
+    def mark_global(self) -> None:
+        """Requalifie en global le dernier 429 compté (même réponse, déjà comptée et attendue une fois)."""
+        self.global_rate_limits += 1
+
+    def top_routes(self, guild_id: int | None = None, limit: int = 10) -> list[tuple[tuple[str, str], int]]:
+        """Retourne les routes les plus appelées, toutes guilds confondues ou pour une guild."""
+        counter = self.routes if guild_id is None else self.guild_routes.get(guild_id, Counter())
+        return counter.most_common(limit)
+
+    def top_guilds(self, limit: int = 5) -> list[tuple[int, int]]:
+        """Retourne les guilds qui génèrent le plus d'appels REST."""
+        totals = Counter({gid: sum(c.values()) for gid, c in self.guild_routes.items()})
+        return totals.most_common(limit)
+
+    def summary(self, guild_id: int | None = None, limit: int = 10) -> list[str]:
+        """Retourne un résumé lisible : débit, routes et features les plus appelées, limites de débit."""
+        total = sum(self.routes.values())
+        minutes = max((time.time() - self.started_at) / 60, 1e-9)
+        lines = [
+            f"Appels REST : {total} ({total / minutes:.1f}/min), 429 : {sum(self.rate_limited.values())} "
+            f"(dont {self.global_rate_limits} globaux), attente rate limit : {self.wait_s:.1f} s",
+        ]
+        scope = f"guild {guild_id}" if guild_id is not None else "toutes guilds"
+        lines.append(f"Routes ({scope}) :")
+        for (method, route), count in self.top_routes(guild_id, limit):
+            limited = self.rate_limited.get((method, route), 0)
+            suffix = f", 429 : {limited}" if limited else ""
+            lines.append(f"  {method} {route} : {count}{suffix}")
+        if guild_id is None:
+            lines.append("Features :")
+            lines.extend(f"  {feature} : {count}" for feature, count in self.features.most_common(limit))
+            lines.append("Guilds :")
+            lines.extend(f"  {gid} : {count}" for gid, count in self.top_guilds())
+        return lines
+
+
+_STATS = RestStats()
+
+
+def get_rest_stats() -> RestStats:
+    """Retourne les agrégats REST du processus."""
+    return _STATS
+
+
+def reset_rest_stats() -> None:
+    """Remet les agrégats REST à zéro."""
+    global _STATS, _PENDING_429
+    _STATS = RestStats()
+    with _PENDING_LOCK:
+        _PENDING_429 = None
+
+
+def calling_feature(depth: int = 1) -> str:
+    """Retourne la feature Eldoria la plus proche dans la pile d'appel (`extensions.xp_voice`, `features.duel`...)."""
+    try:
+        frame: Any = sys._getframe(depth + 1)
+    except ValueError:
+        return _UNKNOWN_FEATURE
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(_FEATURE_PACKAGES):
+            return ".".join(module.split(".")[1:3])
+        frame = frame.f_back
+    return _UNKNOWN_FEATURE
+
+
+def _route_guild_id(bot: Any, route: Any) -> int | None:
+    guild_id = getattr(route, "guild_id", None)
+    if guild_id is not None:
+        return int(guild_id)
+    channel_id = getattr(route, "channel_id", None)
+    if channel_id is None:
+        return None
+    channel = bot.get_channel(int(channel_id))
+    guild = getattr(channel, "guild", None)
+    return getattr(guild, "id", None)
+
+
+def _wrap_request(bot: Any, original: Any) -> Any:
+    async def request(route: Any, *args: Any, **kwargs: Any) -> Any:
+        call = RestCall(
+            method=str(getattr(route, "method", "?")),
+            route=str(getattr(route, "path", route)),
+            feature=calling_feature(),
+            guild_id=_route_guild_id(bot, route),
+        )
+        _STATS.record_call(call)
+        token = _CURRENT_CALL.set(call)
+        start = time.perf_counter()
+        status = "error"
+        try:
+            result = await original(route, *args, **kwargs)
+            status = "ok"
+            return result
+        except Exception as e:
+            status = str(getattr(e, "status", "error"))
+            raise
+        finally:
+            _CURRENT_CALL.reset(token)
+            _flush_pending_429()
+            REST_REQUESTS_TOTAL.inc(method=call.method, route=call.route, feature=call.feature, status=status)
+            REST_SECONDS.observe(time.perf_counter() - start, method=call.method, route=call.route)
+
+    request._eldoria_http_stats = True  # type: ignore[attr-defined]
+    request.__wrapped__ = original  # type: ignore[attr-defined]
+    return request
+
+
+# Gabarits des logs du client HTTP (py-cord) ; tout autre log mentionnant une limite de débit est ignoré.
+# Pour un 429 global, py-cord journalise d'abord le 429 de bucket puis « Global rate limit has been hit »
+# pour la même réponse : le second log change la portée du 429, ce n'est ni un second 429 ni une seconde attente.
+_HIT = "we are being rate limited"
+_GLOBAL = "global rate limit has been hit"
+_EXHAUSTED = "a rate limit bucket has been exhausted"
+_DONE = "done sleeping for the rate limit"
+_TEMPLATES = (_HIT, _GLOBAL, _EXHAUSTED, _DONE)
+
+
+def _rate_limit_template(record: logging.LogRecord) -> str | None:
+    message = str(record.msg).lower()
+    return next((t for t in _TEMPLATES if message.startswith(t)), None)
+
+
+def _is_rate_limit_record(record: logging.LogRecord) -> bool:
+    return _rate_limit_template(record) is not None
+
+
+def _wait_seconds(record: logging.LogRecord) -> float:
+    for arg in record.args if isinstance(record.args, tuple) else ():
+        if isinstance(arg, (int, float)) and not isinstance(arg, bool):
+            return float(arg)
+        if isinstance(arg, str):
+            try:
+                return float(arg)
+            except ValueError:
+                continue
+    return 0.0
+
+
+# 429 dont la portée n'est pas encore connue : (route, global ?), publié dans la métrique au log suivant
+_PENDING_429: tuple[str, bool] | None = None
+_PENDING_LOCK = threading.Lock()
+
+
+def _flush_pending_429() -> None:
+    global _PENDING_429
+    with _PENDING_LOCK:
+        pending, _PENDING_429 = _PENDING_429, None
+    if pending is not None:
+        route, is_global = pending
+        REST_RATE_LIMITED_TOTAL.inc(route=route, scope="global" if is_global else "bucket")
+
+
+def _mark_pending_global() -> bool:
+    global _PENDING_429
+    with _PENDING_LOCK:
+        if _PENDING_429 is None or _PENDING_429[1]:
+            return False
+        _PENDING_429 = (_PENDING_429[0], True)
+        return True
+
+
+class _KeepLevelFilter(logging.Filter):
+    """Laisse passer les logs de limite de débit et, pour le reste, conserve le niveau d'origine du logger."""
+
+    def __init__(self, level: int) -> None:
+        super().__init__()
+        self.level = level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= self.level or _is_rate_limit_record(record)
+
+
+class RateLimitLogHandler(logging.Handler):
+    """Relève les limites de débit signalées par les logs du client HTTP et les attribue à l'appel en cours."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Comptabilise un 429 (par bucket ou global) ou une attente préventive de bucket."""
+        global _PENDING_429
+        template = _rate_limit_template(record)
+        if template is None:
+            return
+        call = _CURRENT_CALL.get()
+        route = call.route if call is not None else "?"
+
+        if template == _GLOBAL and _mark_pending_global():
+            _STATS.mark_global()
+            return
+
+        _flush_pending_429()
+        if template == _DONE:
+            return
+
+        wait_s = _wait_seconds(record)
+        hit = template != _EXHAUSTED
+        is_global = template == _GLOBAL
+        _STATS.record_rate_limit(call, wait_s, hit=hit, is_global=is_global)
+        REST_RATE_LIMIT_WAIT_TOTAL.inc(wait_s, route=route)
+        if template == _HIT:
+            with _PENDING_LOCK:
+                _PENDING_429 = (route, False)
+        elif is_global:
+            # Log global sans 429 de bucket juste avant : compté tel quel
+            REST_RATE_LIMITED_TOTAL.inc(route=route, scope="global")
+
+
+def install_http_stats(bot: Any) -> bool:
+    """Instrumente le client HTTP du bot (idempotent). Retourne False s'il était déjà instrumenté."""
+    http = bot.http
+    if getattr(http.request, "_eldoria_http_stats", False):
+        return False
+    http.request = _wrap_request(bot, http.request)
+
+    # Les attentes préventives de bucket sont journalisées en DEBUG : le logger doit les laisser passer,
+    # sans laisser remonter le reste de ses logs sous son niveau d'origine.
+    http_logger = logging.getLogger(HTTP_LOGGER_NAME)
+    if not any(isinstance(h, RateLimitLogHandler) for h in http_logger.handlers):
+        http_logger.addFilter(_KeepLevelFilter(http_logger.getEffectiveLevel()))
+        http_logger.addHandler(RateLimitLogHandler(logging.DEBUG))
+        http_logger.setLevel(logging.DEBUG)
+    return True
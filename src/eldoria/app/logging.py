@@ -1,10 +1,29 @@
-"""Utilitaires pour la configuration du logging, avec un format lisible et une réduction du bruit des logs Discord."""
+"""Utilitaires pour la configuration du logging, avec un format lisible et une réduction du bruit des logs Discord.
+
+Les logs passent par une file : le root logger n'a qu'un `QueueHandler` (filtre anti-bruit appliqué une seule
+fois, avant la file), et un `QueueListener` exécute le formatage, l'écriture console / fichier et la rotation
+dans un thread dédié. La boucle asyncio ne fait donc plus d'I/O fichier à chaque log ; `stop_logging()`
+(enregistré via `atexit`) vide la file avant l'arrêt du processus.
+
+Les avertissements et erreurs répétés (même logger, même gabarit de message, même type d'exception) sont
+limités par `LogDeduplicator` : au-delà de quelques occurrences par fenêtre, ils sont comptés puis résumés
+(« N messages similaires supprimés ») au lieu de remplir `bot.log` de tracebacks identiques. Un thread démon
+relève les fenêtres closes chaque seconde, pour que le résumé soit écrit à la fin de la fenêtre même si plus
+aucun log n'arrive ensuite.
+"""
 
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from eldoria.config import LOG_PATH
@@ -22,15 +41,208 @@ class DiscordReconnectNoiseFilter(logging.Filter):
         if "ClientConnectorDNSError" in msg or "getaddrinfo failed" in msg:
             return False
         return True
-    
+
+
+@dataclass(slots=True)
+class _DedupWindow:
+    """Occurrences d'un même message dans la fenêtre courante."""
+
+    started_at: float
+    logger: str
+    level: int
+    template: str
+    exc_type: str | None
+    emitted: int = 0
+    suppressed: int = 0
+
+
+class LogDeduplicator(logging.Filter):
+    """Limite les logs répétés : `burst` occurrences par fenêtre de `window` secondes et par clé, puis résumé.
+
+    La clé est (logger, gabarit du message avant formatage, type d'exception) : un même échec répété pour
+    chaque membre ou chaque duel ne produit qu'une poignée de tracebacks, suivie d'un résumé à la fin de la
+    fenêtre. Seuls les niveaux >= `min_level` sont concernés.
+    """
+
+    SUMMARY_ATTR = "eldoria_dedup_summary"
+
+    def __init__(
+        self,
+        *,
+        window: float = 60.0,
+        burst: int = 3,
+        min_level: int = logging.WARNING,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise le filtre avec sa fenêtre (s), le nombre de messages laissés passer et le niveau minimal."""
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.min_level = min_level
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._windows: dict[tuple[str, str, str | None], _DedupWindow] = {}
+        self._pending: list[logging.LogRecord] = []
+        self._last_sweep = clock()
+        self.suppressed_total = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Laisse passer le message s'il reste du quota dans sa fenêtre, sinon le compte comme supprimé."""
+        if getattr(record, self.SUMMARY_ATTR, False):
+            return True
+        with self._lock:
+            now = self._clock()
+            if now - self._last_sweep >= 1.0:
+                self._sweep(now)
+            if record.levelno < self.min_level:
+                return True
+
+            exc_type = record.exc_info[0].__name__ if record.exc_info and record.exc_info[0] else None
+            key = (record.name, str(record.msg), exc_type)
+            current = self._windows.get(key)
+            if current is None or now - current.started_at >= self.window:
+                if current is not None:
+                    self._close(current, now)
+                current = self._windows[key] = _DedupWindow(now, record.name, record.levelno, str(record.msg), exc_type)
+
+            if current.emitted < self.burst:
+                current.emitted += 1
+                return True
+            current.suppressed += 1
+            self.suppressed_total += 1
+            return False
+
+    def _close(self, current: _DedupWindow, now: float) -> None:
+        if current.suppressed:
+            self._pending.append(self._summary_record(current, now))
+
+    def _sweep(self, now: float) -> None:
+        self._last_sweep = now
+        for key, current in list(self._windows.items()):
+            if now - current.started_at >= self.window:
+                self._close(current, now)
+                del self._windows[key]
+
+    def _summary_record(self, current: _DedupWindow, now: float) -> logging.LogRecord:
+        exc = f" [{current.exc_type}]" if current.exc_type else ""
+        record = logging.LogRecord(
+            current.logger,
+            current.level,
+            __file__,
+            0,
+            "🔁 %d messages similaires supprimés en %.0f s%s : %s",
+            (current.suppressed, now - current.started_at, exc, current.template),
+            None,
+        )
+        setattr(record, self.SUMMARY_ATTR, True)
+        return record
+
+    def drain_summaries(self, *, force: bool = False) -> list[logging.LogRecord]:
+        """Clôt les fenêtres expirées et retourne les résumés prêts ; `force=True` les clôt toutes (arrêt du bot)."""
+        with self._lock:
+            now = self._clock()
+            if force:
+                for current in self._windows.values():
+                    self._close(current, now)
+                self._windows.clear()
+            else:
+                self._sweep(now)
+            pending, self._pending = self._pending, []
+        return pending
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """`QueueHandler` qui laisse le formatage (dont celui des tracebacks) au thread du listener.
+
+    Seul le message est fusionné avec ses arguments au moment de l'appel, pour figer l'état des objets loggués.
+    Les résumés produits par un `LogDeduplicator` installé sur ce handler sont mis en file à la suite, ou par
+    le thread de relève (`start_summary_ticker`) quand plus aucun log n'arrive.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue[logging.LogRecord]) -> None:
+        """Initialise le handler sur la file donnée, sans thread de relève des résumés."""
+        super().__init__(log_queue)
+        self._ticker: threading.Thread | None = None
+        self._ticker_stop = threading.Event()
+
+    def start_summary_ticker(self, interval: float = 1.0) -> None:
+        """Démarre le thread démon qui met en file, toutes les `interval` secondes, les résumés des fenêtres closes."""
+        if self._ticker is not None:
+            return
+        self._ticker_stop.clear()
+        self._ticker = threading.Thread(
+            target=self._tick_summaries, args=(interval,), name="eldoria-log-dedup", daemon=True
+        )
+        self._ticker.start()
+
+    def stop_summary_ticker(self) -> None:
+        """Arrête le thread de relève des résumés (idempotent)."""
+        self._ticker_stop.set()
+        if self._ticker is not None:
+            self._ticker.join(1.0)
+            self._ticker = None
+
+    def _tick_summaries(self, interval: float) -> None:
+        while not self._ticker_stop.wait(interval):
+            self.flush_summaries()
+
+    def handle(self, record: logging.LogRecord) -> bool:  # type: ignore[override]
+        """Traite l'enregistrement puis met en file les résumés de messages supprimés devenus disponibles."""
+        rv = bool(super().handle(record))
+        self.flush_summaries()
+        return rv
+
+    def flush_summaries(self, *, force: bool = False) -> None:
+        """Met en file les résumés des filtres de déduplication (tous, fenêtres ouvertes comprises, si `force`)."""
+        for f in self.filters:
+            if isinstance(f, LogDeduplicator):
+                for summary in f.drain_summaries(force=force):
+                    super().handle(summary)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Copie l'enregistrement avec son message déjà fusionné (args résolus), exception non formatée."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_LISTENER: QueueListener | None = None
+_ATEXIT_REGISTERED = False
+
+
+def get_log_listener() -> QueueListener | None:
+    """Retourne le listener de la file de logs actif, ou None si le logging n'est pas configuré."""
+    return _LISTENER
+
+
+def stop_logging() -> None:
+    """Vide la file de logs, arrête le thread d'écriture et ferme les handlers (idempotent)."""
+    global _LISTENER
+    listener, _LISTENER = _LISTENER, None
+    if listener is None:
+        return
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, DeferredFormatQueueHandler):
+            handler.stop_summary_ticker()
+            handler.flush_summaries(force=True)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
 
 def setup_logging(
         level: int = logging.INFO,
         log_file: str = LOG_PATH,
         max_bytes: int = 5_000_000,  # ~5MB
         backup_count: int = 5,       # garde bot.log.1 ... bot.log.5
-        ) -> None:
-    """Configure le logging avec un format lisible et une réduction du bruit des logs Discord."""
+        dedup_window: float = 60.0,  # fenêtre de déduplication des warnings / erreurs (s)
+        dedup_burst: int = 3,        # occurrences identiques laissées passer par fenêtre
+        ) -> QueueListener:
+    """Configure le logging (file + thread d'écriture) avec un format lisible et une réduction du bruit des logs Discord."""
+    global _LISTENER, _ATEXIT_REGISTERED
+    stop_logging()
+
     root = logging.getLogger()
     root.setLevel(level)
     root.handlers.clear()
@@ -48,9 +260,7 @@ def setup_logging(
     stream_handler = logging.StreamHandler(sys.stdout)
     stream_handler.setLevel(level)
     stream_handler.setFormatter(formatter)
-    root.addHandler(stream_handler)
-    stream_handler.addFilter(DiscordReconnectNoiseFilter())
-    
+
     Path(log_file).parent.mkdir(parents=True, exist_ok=True)
     file_handler = RotatingFileHandler(
         log_file,
@@ -60,8 +270,6 @@ def setup_logging(
     )
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    root.addHandler(file_handler)
-    file_handler.addFilter(DiscordReconnectNoiseFilter())
 
     # ---- Marqueur de démarrage (dans le fichier uniquement) ----
     try:
@@ -72,3 +280,18 @@ def setup_logging(
     except OSError:
         # si jamais le disque / permissions posent souci, on ne casse pas le bot
         pass
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = DeferredFormatQueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    queue_handler.addFilter(DiscordReconnectNoiseFilter())
+    queue_handler.addFilter(LogDeduplicator(window=dedup_window, burst=dedup_burst))
+    root.addHandler(queue_handler)
+    queue_handler.start_summary_ticker(min(1.0, dedup_window))
+
+    _LISTENER = QueueListener(log_queue, stream_handler, file_handler, respect_handler_level=True)
+    _LISTENER.start()
+    if not _ATEXIT_REGISTERED:
+        atexit.register(stop_logging)
+        _ATEXIT_REGISTERED = True
+    return _LISTENER
@@ -0,0 +1,245 @@
+"""Surveillance de la boucle asyncio : mesure continue du retard et détection des appels bloquants.
+
+Une tâche « battement » dort `interval` secondes en boucle et mesure le retard de son réveil (histogramme
+`eldoria_event_loop_lag_seconds`). Un thread de surveillance vérifie que ces battements continuent : si la
+boucle ne bat plus depuis plus de `threshold` secondes, il capture la pile du thread de la boucle
+(`sys._current_frames`) et l'attribue au handler Eldoria en cours (cog / listener) et à l'appel bloquant
+(frame Eldoria la plus profonde : repo SQLite, lecture de fichier...). La durée totale du blocage est connue
+au battement suivant.
+
+Les blocages sont agrégés par (handler, appel) : `top_offenders()` et la commande admin `/loop_lag`
+donnent les pires responsables, avec la dernière pile capturée.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from types import FrameType
+
+from eldoria.utils import metrics
+
+log = logging.getLogger(__name__)
+
+# Nombre de frames (les plus profondes) conservées dans la pile d'un blocage
+STACK_LIMIT = 20
+
+# Modules ignorés pour l'attribution (enveloppes d'instrumentation, surveillance elle-même)
+_IGNORED_MODULES = ("eldoria.utils.metrics", "eldoria.app.loop_watchdog")
+
+LAG_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LOOP_LAG_SECONDS = metrics.REGISTRY.histogram(
+    "eldoria_event_loop_lag_seconds", "Retard de réveil du battement de la boucle asyncio.", buckets=LAG_BUCKETS
+)
+LOOP_BLOCKED_TOTAL = metrics.REGISTRY.counter(
+    "eldoria_event_loop_blocked_total", "Blocages de la boucle au-delà du seuil, par handler.", ("owner",)
+)
+LOOP_BLOCKED_SECONDS = metrics.REGISTRY.histogram(
+    "eldoria_event_loop_blocked_seconds", "Durée des blocages de la boucle, par handler.", ("owner",), buckets=LAG_BUCKETS
+)
+
+
+@dataclass(slots=True)
+class BlockingCapture:
+    """Pile capturée pendant un blocage, avec le handler et l'appel auxquels il est attribué."""
+
+    owner: str
+    site: str
+    stack: str
+
+
+@dataclass(slots=True)
+class BlockingOffender:
+    """Blocages cumulés d'un couple (handler, appel bloquant)."""
+
+    owner: str
+    site: str
+    count: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    last_stack: str = ""
+
+
+def _frame_label(frame: FrameType) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}.{frame.f_code.co_qualname}"
+
+
+def attribute_frame(frame: FrameType) -> BlockingCapture:
+    """Attribue une pile au handler Eldoria le plus externe (extension de préférence) et à la frame Eldoria la plus profonde."""
+    frames: list[FrameType] = []
+    current: FrameType | None = frame
+    while current is not None:
+        frames.append(current)
+        current = current.f_back
+    # frames : de la plus profonde à la plus externe
+    ours = [
+        f for f in frames
+        if str(f.f_globals.get("__name__", "")).startswith("eldoria.")
+        and not str(f.f_globals.get("__name__", "")).startswith(_IGNORED_MODULES)
+    ]
+    extensions = [f for f in ours if str(f.f_globals.get("__name__", "")).startswith("eldoria.extensions.")]
+
+    if ours:
+        owner_frame = extensions[-1] if extensions else ours[-1]
+        owner = _frame_label(owner_frame)
+        site = f"{_frame_label(ours[0])}:{ours[0].f_lineno}"
+    else:
+        owner = "(hors eldoria)"
+        site = f"{_frame_label(frame)}:{frame.f_lineno}"
+
+    stack = "".join(traceback.format_list(traceback.extract_stack(frame)[-STACK_LIMIT:]))
+    return BlockingCapture(owner=owner, site=site, stack=stack)
+
+
+class LoopWatchdog:
+    """Battement asyncio + thread de surveillance qui capture la pile de la boucle quand elle bloque."""
+
+    def __init__(self, *, threshold: float = 0.25, interval: float = 0.05) -> None:
+        """Initialise la surveillance : `threshold` (s) au-delà duquel un blocage est capturé, `interval` (s) entre battements."""
+        self.threshold = threshold
+        self.interval = interval
+        self.max_lag = 0.0
+        self.offenders: dict[tuple[str, str], BlockingOffender] = {}
+        self._last_beat = time.monotonic()
+        self._pending: BlockingCapture | None = None
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Indique si le battement et le thread de surveillance tournent."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Démarre la surveillance (à appeler depuis la boucle à surveiller)."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat(), name="eldoria-loop-watchdog")
+        self._thread = threading.Thread(target=self._watch, name="eldoria-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Arrête le battement et le thread de surveillance."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join, 1.0)
+            self._thread = None
+
+    # -------------------- Boucle asyncio --------------------
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._last_beat = now
+            self.record_lag(max(0.0, now - expected))
+
+    def record_lag(self, lag: float) -> None:
+        """Enregistre le retard d'un battement et clôt le blocage capturé entre-temps, s'il y en a un."""
+        LOOP_LAG_SECONDS.observe(lag)
+        self.max_lag = max(self.max_lag, lag)
+        capture, self._pending = self._pending, None
+        if capture is not None:
+            self.record_blocking(capture, lag)
+
+    def record_blocking(self, capture: BlockingCapture, seconds: float) -> None:
+        """Ajoute un blocage aux agrégats et aux métriques, puis le journalise avec sa pile."""
+        offender = self.offenders.get((capture.owner, capture.site))
+        if offender is None:
+            offender = self.offenders[(capture.owner, capture.site)] = BlockingOffender(capture.owner, capture.site)
+        offender.count += 1
+        offender.total_s += seconds
+        offender.max_s = max(offender.max_s, seconds)
+        offender.last_stack = capture.stack
+
+        LOOP_BLOCKED_TOTAL.inc(owner=capture.owner)
+        LOOP_BLOCKED_SECONDS.observe(seconds, owner=capture.owner)
+        log.warning(
+            "⚠️ Boucle asyncio bloquée %.0f ms par %s (%s)\n%s",
+            seconds * 1000,
+            capture.owner,
+            capture.site,
+            capture.stack.rstrip(),
+        )
+
+    # -------------------- Thread de surveillance --------------------
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self) -> BlockingCapture | None:
+        """Capture la pile de la boucle si elle ne bat plus depuis plus de `threshold` (un seul relevé par blocage)."""
+        if self._pending is not None or self._loop_thread_id is None:
+            return None
+        beat = self._last_beat
+        if time.monotonic() - beat - self.interval < self.threshold:
+            return None
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+        capture = attribute_frame(frame)
+        # La boucle a pu repartir pendant la capture : la pile ne correspondrait plus au blocage
+        if self._last_beat != beat:
+            return None
+        self._pending = capture
+        return capture
+
+    # -------------------- Rapport --------------------
+    def top_offenders(self, limit: int = 5) -> list[BlockingOffender]:
+        """Retourne les pires responsables de blocages (durée cumulée décroissante)."""
+        return sorted(self.offenders.values(), key=lambda o: (o.total_s, o.max_s), reverse=True)[:limit]
+
+    def summary(self, limit: int = 5) -> list[str]:
+        """Retourne un résumé lisible : quantiles du retard de la boucle et pires blocages."""
+        p50 = LOOP_LAG_SECONDS.quantile(0.5) or 0.0
+        p99 = LOOP_LAG_SECONDS.quantile(0.99) or 0.0
+        lines = [
+            f"Retard de la boucle : p50 {p50 * 1000:.1f} ms, p99 {p99 * 1000:.1f} ms, "
+            f"max {self.max_lag * 1000:.1f} ms ({LOOP_LAG_SECONDS.count()} battements)",
+            f"Seuil de blocage : {self.threshold * 1000:.0f} ms",
+        ]
+        offenders = self.top_offenders(limit)
+        if not offenders:
+            lines.append("Aucun blocage détecté.")
+        for o in offenders:
+            lines.append(
+                f"  {o.owner} → {o.site} : {o.count}x, total {o.total_s * 1000:.0f} ms, max {o.max_s * 1000:.0f} ms"
+            )
+        return lines
+
+
+_WATCHDOG: LoopWatchdog | None = None
+
+
+def start_watchdog(threshold_ms: int) -> LoopWatchdog:
+    """Démarre (une seule fois) la surveillance de la boucle courante avec le seuil donné en millisecondes."""
+    global _WATCHDOG
+    if _WATCHDOG is None:
+        _WATCHDOG = LoopWatchdog(threshold=threshold_ms / 1000)
+    _WATCHDOG.start()
+    log.info("✅ Surveillance de la boucle asyncio active (seuil %d ms)", threshold_ms)
+    return _WATCHDOG
+
+
+def get_watchdog() -> LoopWatchdog | None:
+    """Retourne la surveillance active, ou None si elle n'a pas été démarrée."""
+    return _WATCHDOG
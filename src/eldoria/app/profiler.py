@@ -0,0 +1,294 @@
+"""Profilage du démarrage du bot (mode activé par la variable d'environnement `STARTUP_PROFILE`).
+
+Mesure le temps d'import de chaque module (hook sur `sys.meta_path`), le temps de chaque `load_extension`,
+de chaque étape de `startup()` et le délai jusqu'aux premiers événements gateway (`on_connect`, `on_ready`).
+Le rapport est écrit à côté des logs : `startup_profile.json` (lisible par machine) et `startup_profile.txt`
+(arbre des imports façon flame graph).
+
+Ce module n'importe que la bibliothèque standard : il doit pouvoir être chargé avant tout le reste du bot.
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+PROFILE_ENV_VAR = "STARTUP_PROFILE"
+REPORT_BASENAME = "startup_profile"
+
+# Seuil (ms cumulées) en dessous duquel un import n'apparaît pas dans l'arbre texte
+TREE_MIN_MS = 1.0
+
+
+@dataclass(slots=True)
+class ImportRecord:
+    """Temps d'exécution d'un module importé (self = hors sous-imports, cumulative = avec)."""
+
+    name: str
+    parent: str | None
+    depth: int
+    start_ms: float
+    self_ms: float = 0.0
+    cumulative_ms: float = 0.0
+
+
+@dataclass(slots=True)
+class TimingRecord:
+    """Durée d'une étape ou d'une extension, en millisecondes."""
+
+    name: str
+    ms: float
+    ok: bool = True
+
+
+@dataclass(slots=True)
+class StartupProfiler:
+    """Collecte les mesures de démarrage et produit le rapport."""
+
+    started_at: float = field(default_factory=time.perf_counter)
+    imports: list[ImportRecord] = field(default_factory=list)
+    steps: list[TimingRecord] = field(default_factory=list)
+    extensions: list[TimingRecord] = field(default_factory=list)
+    marks: dict[str, float] = field(default_factory=dict)
+    _stack: list[list[Any]] = field(default_factory=list)
+    _finder: _ImportTimingFinder | None = None
+
+    # -------------------- Imports --------------------
+    def install(self) -> None:
+        """Installe le hook de mesure des imports en tête de `sys.meta_path`."""
+        if self._finder is not None:
+            return
+        self._finder = _ImportTimingFinder(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self) -> None:
+        """Retire le hook de mesure des imports."""
+        if self._finder is None:
+            return
+        try:
+            sys.meta_path.remove(self._finder)
+        except ValueError:
+            pass
+        self._finder = None
+
+    @contextmanager
+    def import_frame(self, name: str) -> Iterator[None]:
+        """Mesure l'exécution d'un module, en soustrayant le temps des imports imbriqués pour le temps propre."""
+        parent = self._stack[-1][0].name if self._stack else None
+        record = ImportRecord(name=name, parent=parent, depth=len(self._stack), start_ms=self.elapsed_ms())
+        self.imports.append(record)
+        # [record, début, temps des enfants]
+        frame: list[Any] = [record, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            cumulative = (time.perf_counter() - frame[1]) * 1000
+            record.cumulative_ms = cumulative
+            record.self_ms = max(cumulative - frame[2], 0.0)
+            if self._stack:
+                self._stack[-1][2] += cumulative
+
+    # -------------------- Étapes / extensions / marqueurs --------------------
+    def elapsed_ms(self) -> float:
+        """Temps écoulé depuis le début du profilage, en millisecondes."""
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def record_step(self, name: str, ms: float, *, ok: bool = True) -> None:
+        """Enregistre la durée d'une étape de `startup()`."""
+        self.steps.append(TimingRecord(name=name, ms=ms, ok=ok))
+
+    def record_extension(self, name: str, ms: float, *, ok: bool = True) -> None:
+        """Enregistre la durée de chargement d'une extension."""
+        self.extensions.append(TimingRecord(name=name, ms=ms, ok=ok))
+
+    def mark(self, name: str) -> None:
+        """Enregistre le premier passage à un point du démarrage (ex: `on_connect`), relatif au début."""
+        self.marks.setdefault(name, self.elapsed_ms())
+
+    # -------------------- Rapport --------------------
+    def top_imports(self, limit: int = 20) -> list[ImportRecord]:
+        """Retourne les imports au temps propre le plus élevé."""
+        return sorted(self.imports, key=lambda r: r.self_ms, reverse=True)[:limit]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Retourne le rapport complet sous forme sérialisable en JSON."""
+        return {
+            "total_ms": self.elapsed_ms(),
+            "marks_ms": dict(self.marks),
+            "imports_total_ms": sum(r.cumulative_ms for r in self.imports if r.depth == 0),
+            "steps": [asdict(s) for s in self.steps],
+            "extensions": [asdict(e) for e in self.extensions],
+            "top_imports": [asdict(r) for r in self.top_imports()],
+            "imports": [asdict(r) for r in self.imports],
+        }
+
+    def format_tree(self, *, min_ms: float = TREE_MIN_MS) -> str:
+        """Produit le rapport texte : marqueurs, étapes, extensions puis arbre des imports (cumulé / propre)."""
+        lines = [f"Démarrage profilé : {self.elapsed_ms():.1f} ms"]
+        for name, ms in self.marks.items():
+            lines.append(f"  {name:<40} @ {ms:10.1f} ms")
+
+        lines.append("")
+        lines.append("Étapes")
+        for s in self.steps:
+            lines.append(f"  {'✅' if s.ok else '❌'} {s.name:<50} {s.ms:10.1f} ms")
+
+        lines.append("")
+        lines.append("Extensions")
+        for e in self.extensions:
+            lines.append(f"  {'✅' if e.ok else '❌'} {e.name:<50} {e.ms:10.1f} ms")
+
+        lines.append("")
+        lines.append(f"Imports (cumulé | propre, >= {min_ms:g} ms)")
+        lines.extend(_format_import_tree(self.imports, min_ms=min_ms))
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, directory: Path) -> tuple[Path, Path]:
+        """Écrit le rapport JSON et le rapport texte dans `directory` et retourne leurs chemins."""
+        directory.mkdir(parents=True, exist_ok=True)
+        json_path = directory / f"{REPORT_BASENAME}.json"
+        txt_path = directory / f"{REPORT_BASENAME}.txt"
+        json_path.write_text(json.dumps(self.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
+        txt_path.write_text(self.format_tree(), encoding="utf-8")
+        return json_path, txt_path
+
+
+def _format_import_tree(imports: Sequence[ImportRecord], *, min_ms: float) -> list[str]:
+    """Formate les imports dans l'ordre d'exécution, indentés par profondeur, avec une barre proportionnelle."""
+    if not imports:
+        return ["  (aucun import mesuré)"]
+
+    widest = max(r.cumulative_ms for r in imports) or 1.0
+    lines: list[str] = []
+    hidden_depth: int | None = None
+    for r in imports:
+        # Un parent masqué masque aussi tout son sous-arbre
+        if hidden_depth is not None and r.depth > hidden_depth:
+            continue
+        hidden_depth = None
+        if r.cumulative_ms < min_ms:
+            hidden_depth = r.depth
+            continue
+        bar = "█" * max(1, round(30 * r.cumulative_ms / widest))
+        lines.append(f"  {r.cumulative_ms:9.1f} | {r.self_ms:8.1f}  {'  ' * r.depth}{r.name}  {bar}")
+    return lines
+
+
+class _ImportTimingFinder(importlib.abc.MetaPathFinder):
+    """Finder passe-plat : délègue la recherche aux autres finders et chronomètre l'exécution du module trouvé."""
+
+    def __init__(self, profiler: StartupProfiler) -> None:
+        """Initialise le finder avec le profiler qui reçoit les mesures."""
+        self._profiler = profiler
+        self._resolving: set[str] = set()
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> Any:
+        """Retrouve le spec via les finders suivants, puis enveloppe `exec_module` de son loader."""
+        if fullname in self._resolving:
+            return None
+
+        self._resolving.add(fullname)
+        try:
+            spec = None
+            for finder in list(sys.meta_path):
+                if finder is self:
+                    continue
+                find = getattr(finder, "find_spec", None)
+                if find is None:
+                    continue
+                spec = find(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._resolving.discard(fullname)
+
+        loader = getattr(spec, "loader", None)
+        # Les importers builtin/frozen sont des classes partagées : on ne les modifie pas
+        if spec is None or loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return spec
+
+        exec_module = loader.exec_module
+        profiler = self._profiler
+
+        def timed_exec_module(module: ModuleType) -> None:
+            with profiler.import_frame(fullname):
+                exec_module(module)
+
+        try:
+            loader.exec_module = timed_exec_module
+        except AttributeError:
+            pass
+        return spec
+
+
+# -------------------- Instance globale --------------------
+_PROFILER: StartupProfiler | None = None
+
+
+def profile_requested() -> bool:
+    """Retourne True si `STARTUP_PROFILE` demande le profilage (1 / true / yes / on)."""
+    return (os.getenv(PROFILE_ENV_VAR) or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def start_profiling(started_at: float | None = None) -> StartupProfiler:
+    """Démarre le profilage (idempotent) et installe le hook d'import."""
+    global _PROFILER
+    if _PROFILER is None:
+        _PROFILER = StartupProfiler(started_at=started_at if started_at is not None else time.perf_counter())
+        _PROFILER.install()
+    return _PROFILER
+
+
+def start_profiling_from_env(started_at: float | None = None) -> StartupProfiler | None:
+    """Démarre le profilage si `STARTUP_PROFILE` est activé, sinon ne fait rien."""
+    if not profile_requested():
+        return None
+    return start_profiling(started_at)
+
+
+def get_profiler() -> StartupProfiler | None:
+    """Retourne le profiler actif, ou None si le mode profilage n'est pas activé."""
+    return _PROFILER
+
+
+def finish_profiling(directory: Path | None = None) -> tuple[Path, Path] | None:
+    """Termine le profilage : retire le hook, écrit le rapport à côté des logs et le désactive."""
+    global _PROFILER
+    profiler = _PROFILER
+    if profiler is None:
+        return None
+    _PROFILER = None
+    profiler.uninstall()
+
+    if directory is None:
+        from eldoria.config import LOG_PATH
+
+        directory = Path(LOG_PATH).parent
+
+    try:
+        paths = profiler.write_report(directory)
+    except OSError:
+        log.warning("⚠️ Impossible d'écrire le rapport de profilage du démarrage", exc_info=True)
+        return None
+
+    log.info("⏱️ Profil de démarrage écrit : %s (%.1f ms)", paths[1], profiler.elapsed_ms())
+    return paths
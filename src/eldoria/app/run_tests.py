@@ -1,14 +1,24 @@
-"""Module de gestion des tests unitaires avec pytest."""
+"""Module de gestion des tests unitaires avec pytest.
 
+Le résultat est mis en cache par hash du code (src/ + tests/) : un build déjà testé ne relance jamais pytest.
+Au démarrage, les tests tournent par défaut en arrière-plan après `on_ready` (voir `STARTUP_TESTS`).
+"""
+
+import asyncio
+import hashlib
 import importlib.util
+import json
 import logging
 import os
 import re
 import subprocess
 import sys
+import time
 from pathlib import Path
+from typing import Any
 
 from eldoria.exceptions.internal import TestsFailed
+from eldoria.utils.timestamp import now_ts
 
 log = logging.getLogger(__name__)
 
@@ -25,7 +35,14 @@ _PYTEST_SUMMARY_RE = re.compile(
 )
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SRC_PATH = PROJECT_ROOT / "src"
 TESTS_PATH = PROJECT_ROOT / "tests"
+TESTS_CACHE_PATH = Path("./data/startup_tests.json")
+
+
+def _inside_pytest() -> bool:
+    """Retourne True si le processus courant est déjà un run pytest (évite pytest-dans-pytest)."""
+    return "PYTEST_CURRENT_TEST" in os.environ or "pytest" in sys.modules
 
 def _parse_pytest_counts(output: str) -> dict[str, int]:
     """Extrait les compteurs depuis la/les lignes de fin pytest.
@@ -56,6 +73,12 @@ def _parse_pytest_counts(output: str) -> dict[str, int]:
 
     return counts
 
+
+def _strict() -> bool:
+    """Indique si un échec des tests doit lever TestsFailed (TESTS_STRICT=1, par défaut : on bloque)."""
+    return os.getenv("TESTS_STRICT", "1") == "1"
+
+
 def run_tests(*, logger: logging.Logger | None = None) -> str | None:
     """Lance pytest si des tests existent.
 
@@ -63,7 +86,7 @@ def run_tests(*, logger: logging.Logger | None = None) -> str | None:
     En cas d'échec, log la liste des tests en échec (résumé pytest) et lève si TESTS_STRICT=1.
     """
     # ✅ Ne jamais relancer pytest quand on est déjà dans pytest (évite pytest-dans-pytest)
-    if "PYTEST_CURRENT_TEST" in os.environ or "pytest" in sys.modules:
+    if _inside_pytest():
         return None
 
     if logger is None:
@@ -144,8 +167,102 @@ def run_tests(*, logger: logging.Logger | None = None) -> str | None:
 
         logger.warning("📌 Détails des échecs:\n%s", "\n".join(snippet))
 
-    strict = os.getenv("TESTS_STRICT", "1") == "1"  # par défaut: on bloque
-    if strict:
+    if _strict():
         raise TestsFailed()
 
     return f"{failed} tests fails / {total}"
+
+
+# -------------------- Cache par hash du code --------------------
+def compute_source_hash(roots: tuple[Path, ...] | None = None) -> str:
+    """Calcule un hash sha256 stable des fichiers Python (chemin relatif + contenu) sous src/ et tests/."""
+    if roots is None:
+        roots = (SRC_PATH, TESTS_PATH)
+
+    digest = hashlib.sha256()
+    for root in roots:
+        if not root.exists():
+            continue
+        for file in sorted(root.rglob("*.py")):
+            if "__pycache__" in file.parts:
+                continue
+            digest.update(file.relative_to(root.parent).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(file.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _read_cache() -> dict[str, Any] | None:
+    """Lit le résultat de tests en cache, ou None s'il est absent ou illisible."""
+    try:
+        data = json.loads(TESTS_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_cache(source_hash: str, *, ok: bool, label: str) -> None:
+    """Enregistre le résultat des tests pour ce hash de code (écriture atomique, erreurs seulement journalisées)."""
+    entry = {"hash": source_hash, "ok": ok, "label": label, "tested_at": now_ts()}
+    try:
+        TESTS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = TESTS_CACHE_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        tmp.replace(TESTS_CACHE_PATH)
+    except OSError:
+        log.warning("⚠️ Impossible d'écrire le cache des tests (%s)", TESTS_CACHE_PATH, exc_info=True)
+
+
+def run_tests_cached(*, logger: logging.Logger | None = None) -> str | None:
+    """Lance les tests, sauf si ce même code (hash de src/ et tests/) a déjà été testé : le résultat en cache est alors réutilisé.
+
+    Même contrat que `run_tests` (label pour step(), TestsFailed si échec en mode strict).
+    """
+    if _inside_pytest():
+        return None
+
+    if logger is None:
+        logger = log
+
+    source_hash = compute_source_hash()
+    cached = _read_cache()
+    if cached is not None and cached.get("hash") == source_hash:
+        label = str(cached.get("label") or "Tests validés")
+        if not cached.get("ok", False):
+            logger.warning("❌ Tests en échec pour ce build (résultat en cache) : %s", label)
+            if _strict():
+                raise TestsFailed()
+        return f"{label} (cache)"
+
+    try:
+        label = run_tests(logger=logger)
+    except TestsFailed:
+        _write_cache(source_hash, ok=False, label="Tests en échec")
+        raise
+
+    # Tests non lancés (pytest absent, aucun test) : rien à mettre en cache
+    if label is None:
+        return None
+
+    _write_cache(source_hash, ok="fails" not in label, label=label)
+    return label
+
+
+async def run_tests_in_background(*, logger: logging.Logger | None = None) -> str | None:
+    """Lance `run_tests_cached` dans un thread sans bloquer la boucle asyncio, et journalise le résultat comme une étape de démarrage."""
+    if logger is None:
+        logger = log
+
+    start = time.perf_counter()
+    try:
+        label = await asyncio.to_thread(run_tests_cached, logger=logger)
+    except Exception:
+        ms = (time.perf_counter() - start) * 1000
+        logger.exception("❌ %-50s %8.1f ms", "Tests (arrière-plan)", ms)
+        return None
+
+    if label is not None:
+        ms = (time.perf_counter() - start) * 1000
+        logger.info("✅ %-53s %8.1f ms", f"Tests en arrière-plan ({label})", ms)
+    return label
@@ -0,0 +1,245 @@
+"""Profilage à la demande du bot en production : échantillonnage des piles et différentiel mémoire.
+
+- `sample_stacks` : un thread relève périodiquement la pile du thread de la boucle asyncio (ou de tous les
+  threads) via `sys._current_frames` pendant une durée bornée. Le résultat est exporté en « piles repliées »
+  (`frame;frame;frame N`), le format d'entrée de flamegraph.pl / speedscope.
+- `memory_diff` : deux instantanés `tracemalloc` à `duration` secondes d'intervalle, comparés par module
+  (croissance des vues, du cache des membres...). Le traçage est démarré pour la mesure puis arrêté s'il
+  ne l'était pas déjà.
+
+Un seul profilage à la fois (`profiling_busy`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+
+# Profondeur maximale relevée par pile (les frames les plus externes sont tronquées)
+MAX_STACK_DEPTH = 64
+TRACEMALLOC_FRAMES = 10
+
+_LOCK = asyncio.Lock()
+
+
+def profiling_busy() -> bool:
+    """Indique si un profilage (piles ou mémoire) est déjà en cours."""
+    return _LOCK.locked()
+
+
+# -------------------- Échantillonnage des piles --------------------
+
+@dataclass(slots=True)
+class SamplingProfile:
+    """Résultat d'un échantillonnage : piles repliées et nombre d'échantillons."""
+
+    duration_s: float
+    interval_s: float
+    samples: int = 0
+    stacks: Counter[str] = field(default_factory=Counter)
+
+    def add(self, stack: str) -> None:
+        """Ajoute un échantillon (pile repliée, de la frame la plus externe à la plus profonde)."""
+        self.samples += 1
+        self.stacks[stack] += 1
+
+    def collapsed(self) -> str:
+        """Retourne les piles au format replié (`a;b;c N`), une par ligne, les plus fréquentes d'abord."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top_functions(self, limit: int = 10) -> list[tuple[str, int]]:
+        """Retourne les fonctions les plus souvent en haut de pile (temps propre)."""
+        leaves: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return leaves.most_common(limit)
+
+    def summary(self, limit: int = 10) -> list[str]:
+        """Retourne un résumé lisible : nombre d'échantillons et fonctions les plus présentes en haut de pile."""
+        lines = [f"{self.samples} échantillons en {self.duration_s:.1f} s (intervalle {self.interval_s * 1000:.0f} ms)"]
+        for name, count in self.top_functions(limit):
+            lines.append(f"  {count / max(self.samples, 1):6.1%}  {name}")
+        return lines
+
+
+def _frame_name(frame: FrameType) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}.{frame.f_code.co_qualname}"
+
+
+def collapse_frame(frame: FrameType, prefix: str = "") -> str:
+    """Replie une pile en `prefix;externe;...;profonde` (noms `module.qualname`)."""
+    names: list[str] = []
+    current: FrameType | None = frame
+    while current is not None and len(names) < MAX_STACK_DEPTH:
+        names.append(_frame_name(current))
+        current = current.f_back
+    names.reverse()
+    if prefix:
+        names.insert(0, prefix)
+    return ";".join(names)
+
+
+class StackSampler:
+    """Thread d'échantillonnage des piles d'un thread (ou de tous) à intervalle fixe."""
+
+    def __init__(self, *, interval: float = 0.005, thread_id: int | None = None) -> None:
+        """Prépare l'échantillonnage de `thread_id` (None : tous les threads sauf l'échantillonneur)."""
+        self.interval = interval
+        self.thread_id = thread_id
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at = 0.0
+        self.profile = SamplingProfile(duration_s=0.0, interval_s=interval)
+
+    def sample_once(self) -> None:
+        """Relève une pile par thread ciblé."""
+        own = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()} if self.thread_id is None else {}
+        for ident, frame in sys._current_frames().items():
+            if ident == own or (self.thread_id is not None and ident != self.thread_id):
+                continue
+            prefix = f"thread:{names.get(ident, ident)}" if self.thread_id is None else ""
+            self.profile.add(collapse_frame(frame, prefix))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample_once()
+
+    def start(self) -> None:
+        """Démarre le thread d'échantillonnage."""
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="eldoria-stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> SamplingProfile:
+        """Arrête l'échantillonnage et retourne le profil."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.profile.duration_s = time.perf_counter() - self._started_at
+        return self.profile
+
+
+async def sample_stacks(duration: float, *, interval: float = 0.005, all_threads: bool = False) -> SamplingProfile:
+    """Échantillonne les piles de la boucle courante (ou de tous les threads) pendant `duration` secondes."""
+    async with _LOCK:
+        sampler = StackSampler(interval=interval, thread_id=None if all_threads else threading.get_ident())
+        sampler.start()
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            profile = await asyncio.to_thread(sampler.stop)
+        return profile
+
+
+# -------------------- Différentiel mémoire --------------------
+
+@dataclass(frozen=True, slots=True)
+class MemoryStat:
+    """Mémoire allouée par un module : taille courante et variation pendant la mesure."""
+
+    module: str
+    size: int
+    size_diff: int
+    count_diff: int
+
+
+@dataclass(slots=True)
+class MemoryDiff:
+    """Résultat d'un différentiel `tracemalloc` entre deux instantanés."""
+
+    duration_s: float
+    traced_current: int
+    traced_peak: int
+    modules: list[MemoryStat]
+    lines: list[str]
+
+    def summary(self, limit: int = 10) -> list[str]:
+        """Retourne un résumé lisible : modules dont l'allocation a le plus augmenté."""
+        out = [
+            f"Mesure sur {self.duration_s:.0f} s, mémoire tracée : {self.traced_current / 1024:.0f} Kio "
+            f"(pic {self.traced_peak / 1024:.0f} Kio)",
+        ]
+        for stat in self.modules[:limit]:
+            out.append(f"  {stat.size_diff / 1024:+9.1f} Kio ({stat.count_diff:+d} blocs)  {stat.module}")
+        return out
+
+    def report(self) -> str:
+        """Retourne le rapport complet (modules puis lignes d'allocation)."""
+        parts = ["# Croissance par module", *self.summary(limit=len(self.modules)), "", "# Lignes d'allocation"]
+        parts.extend(self.lines)
+        return "\n".join(parts) + "\n"
+
+
+def _module_index() -> dict[str, str]:
+    index: dict[str, str] = {}
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if file:
+            index[str(Path(file).resolve())] = name
+    return index
+
+
+def _module_for(filename: str, index: dict[str, str]) -> str:
+    try:
+        return index.get(str(Path(filename).resolve()), filename)
+    except OSError:
+        return filename
+
+
+def compare_snapshots(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, *, duration_s: float, limit: int = 30
+) -> MemoryDiff:
+    """Compare deux instantanés : croissance agrégée par module et lignes d'allocation les plus en hausse."""
+    filters = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    )
+    before = before.filter_traces(filters)
+    after = after.filter_traces(filters)
+
+    index = _module_index()
+    sizes: Counter[str] = Counter()
+    size_diffs: Counter[str] = Counter()
+    count_diffs: Counter[str] = Counter()
+    for stat in after.compare_to(before, "filename"):
+        module = _module_for(stat.traceback[0].filename, index)
+        sizes[module] += stat.size
+        size_diffs[module] += stat.size_diff
+        count_diffs[module] += stat.count_diff
+
+    modules = [MemoryStat(m, sizes[m], size_diffs[m], count_diffs[m]) for m in sizes]
+    modules.sort(key=lambda s: s.size_diff, reverse=True)
+
+    lines = [str(stat) for stat in after.compare_to(before, "lineno")[:limit]]
+    current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+    return MemoryDiff(duration_s=duration_s, traced_current=current, traced_peak=peak, modules=modules, lines=lines)
+
+
+async def memory_diff(duration: float) -> MemoryDiff:
+    """Prend deux instantanés `tracemalloc` à `duration` secondes d'intervalle et les compare par module."""
+    async with _LOCK:
+        started_here = not tracemalloc.is_tracing()
+        if started_here:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        try:
+            start = time.perf_counter()
+            before = await asyncio.to_thread(tracemalloc.take_snapshot)
+            await asyncio.sleep(duration)
+            after = await asyncio.to_thread(tracemalloc.take_snapshot)
+            elapsed = time.perf_counter() - start
+            return await asyncio.to_thread(compare_snapshots, before, after, duration_s=elapsed)
+        finally:
+            if started_here:
+                tracemalloc.stop()
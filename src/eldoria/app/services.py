@@ -2,13 +2,14 @@
 
 from dataclasses import dataclass, fields
 
+from eldoria.features.bootstrap.bootstrap_service import BootstrapService
 from eldoria.features.duel.duel_service import DuelService
 from eldoria.features.role.role_service import RoleService
 from eldoria.features.save.save_service import SaveService
 from eldoria.features.temp_voice.temp_voice_service import TempVoiceService
+from eldoria.features.ticketing.ticketing_service import TicketingService
 from eldoria.features.welcome.welcome_service import WelcomeService
 from eldoria.features.xp.xp_service import XpService
-from eldoria.features.ticketing.ticketing_service import TicketingService
 
 
 @dataclass(slots=True) 
@@ -22,6 +23,7 @@ class Services:
     welcome: WelcomeService
     xp: XpService
     ticketing: TicketingService
+    bootstrap: BootstrapService
 
     def __len__(self) -> int:
         """Retourne le nombre de services définis dans cette classe."""
@@ -7,9 +7,13 @@ from typing import Any
 
 from eldoria.app.bot import EldoriaBot
 from eldoria.app.extensions import EXTENSIONS
-from eldoria.app.run_tests import run_tests
+from eldoria.app.http_stats import install_http_stats
+from eldoria.app.profiler import get_profiler
+from eldoria.app.run_tests import run_tests_cached
 from eldoria.app.services import Services
+from eldoria.config import STARTUP_TESTS
 from eldoria.db.schema import init_db
+from eldoria.features.bootstrap.bootstrap_service import BootstrapService
 from eldoria.features.duel.duel_service import DuelService
 from eldoria.features.duel.games import init_games
 from eldoria.features.role.role_service import RoleService
@@ -30,22 +34,37 @@ def step(name: str, action: Callable[[], Any], *, critical: bool = True, logger:
     start = time.perf_counter()
     if logger is None : 
         logger = log
+    profiler = get_profiler()
     try:
         result = action()
         ms = (time.perf_counter() - start) * 1000
         label = f"{name} ({result})" if result is not None else name
         logger.info("✅ %-53s %8.1f ms", label, ms)
+        if profiler is not None:
+            profiler.record_step(name, ms)
     except Exception:
         ms = (time.perf_counter() - start) * 1000
         logger.exception("❌ %-50s %8.1f ms", name, ms)
+        if profiler is not None:
+            profiler.record_step(name, ms, ok=False)
         if critical:
             raise
 
 def load_extensions(bot: EldoriaBot) -> int:
     """Charge les extensions définies dans EXTENSIONS et retourne le nombre d'extensions chargées."""
+    profiler = get_profiler()
     count = 0
     for ext in EXTENSIONS:
-        bot.load_extension(ext)
+        if profiler is None:
+            bot.load_extension(ext)
+        else:
+            start = time.perf_counter()
+            try:
+                bot.load_extension(ext)
+            except Exception:
+                profiler.record_extension(ext, (time.perf_counter() - start) * 1000, ok=False)
+                raise
+            profiler.record_extension(ext, (time.perf_counter() - start) * 1000)
         count += 1
     return count
 
@@ -59,17 +78,26 @@ def init_services(bot: EldoriaBot) -> int:
         welcome=WelcomeService(),
         xp=XpService(),
         ticketing=TicketingService(),
+        bootstrap=BootstrapService(),
     ))
     return len(bot.services)
 
+def backfill_duel_stats(bot: EldoriaBot) -> int | None:
+    """Reconstruit les statistiques de duel à partir des duels existants si elles sont vides, et retourne le nombre de lignes écrites."""
+    return bot.services.duel.backfill_stats()
+
 def startup(bot: EldoriaBot) -> None:
     """Exécute les différentes étapes de démarrage du bot en utilisant la fonction step pour mesurer le temps d'exécution et gérer les exceptions."""
-    step("Tests", lambda: run_tests(logger=log), critical=False)
+    # En mode "background", les tests sont lancés après on_ready (cog Core) pour ne pas retarder la connexion
+    if STARTUP_TESTS == "blocking":
+        step("Tests", lambda: run_tests_cached(logger=log), critical=False)
 
     step("Initialisation des services", lambda: init_services(bot), critical=False)
+    step("Instrumentation des appels REST", lambda: install_http_stats(bot), critical=False)
     step("Initialisation des extensions", lambda: load_extensions(bot))
     step("Initialisation de la base de données", init_db)
     step("Nettoyage des channels temporaires", lambda: cleanup_temp_channels(bot), critical=False)
     step("Initialisation des jeux de duel", init_games, critical=False)
+    step("Statistiques de duel", lambda: backfill_duel_stats(bot), critical=False)
     step("Initialisation UI duel", init_duel_ui, critical=False)
     step("Initialisation UI ticketing", lambda: init_ticket_ui(bot), critical=False)
@@ -83,6 +83,55 @@ AUTO_SAVE_TZ: Final[str] = os.getenv("AUTO_SAVE_TZ") or "UTC"
 
 AUTO_SAVE_ENABLED: Final[bool] = AUTO_SAVE_TIME is not None and AUTO_SAVE_TIME.strip() != ""
 
+# Copies locales des sauvegardes compressées (les plus récentes sont conservées)
+BACKUP_DIR: Final[str] = os.getenv("BACKUP_DIR") or "./data/backups"
+_BACKUP_KEEP = env_int_optional("BACKUP_KEEP")
+BACKUP_KEEP: Final[int] = 7 if _BACKUP_KEEP is None else max(1, _BACKUP_KEEP)
+# Taille maximale (Mio) d'une pièce jointe de sauvegarde ; au-delà, la sauvegarde est envoyée en plusieurs parties
+_BACKUP_CHUNK_MB = env_int_optional("BACKUP_CHUNK_MB")
+BACKUP_CHUNK_MB: Final[int] = 8 if _BACKUP_CHUNK_MB is None else max(1, _BACKUP_CHUNK_MB)
+
+
+# === Maintenance de la base ===
+# Heure quotidienne (HH:MM, fuseau AUTO_SAVE_TZ) : purges de rétention, statistiques du planificateur, vacuum incrémental.
+# "off" désactive la maintenance planifiée.
+DB_MAINTENANCE_TIME: Final[str] = (os.getenv("DB_MAINTENANCE_TIME") or "04:30").strip()
+DB_MAINTENANCE_ENABLED: Final[bool] = DB_MAINTENANCE_TIME.lower() != "off"
+# Nombre maximal de pages libres rendues au système par maintenance (0 : pas de vacuum)
+_DB_VACUUM_PAGES = env_int_optional("DB_VACUUM_PAGES")
+DB_VACUUM_PAGES: Final[int] = 2000 if _DB_VACUUM_PAGES is None else max(0, _DB_VACUUM_PAGES)
+# Progrès vocaux sans activité depuis N jours (remis à zéro de toute façon au prochain passage en vocal)
+_VOICE_PROGRESS_RETENTION_DAYS = env_int_optional("VOICE_PROGRESS_RETENTION_DAYS")
+VOICE_PROGRESS_RETENTION_DAYS: Final[int] = (
+    7 if _VOICE_PROGRESS_RETENTION_DAYS is None else max(1, _VOICE_PROGRESS_RETENTION_DAYS)
+)
+# Tickets fermés depuis plus de N jours (0 : conservés indéfiniment)
+_CLOSED_TICKETS_RETENTION_DAYS = env_int_optional("CLOSED_TICKETS_RETENTION_DAYS")
+CLOSED_TICKETS_RETENTION_DAYS: Final[int] = (
+    90 if _CLOSED_TICKETS_RETENTION_DAYS is None else max(0, _CLOSED_TICKETS_RETENTION_DAYS)
+)
+
+
+# === Tests au démarrage ===
+# off : jamais lancés ; background : après on_ready, dans un thread (défaut) ; blocking : avant la connexion à Discord.
+# Dans tous les cas, un build déjà testé (même hash de src/ et tests/) réutilise le résultat en cache.
+STARTUP_TESTS_MODES: Final[tuple[str, ...]] = ("off", "background", "blocking")
+STARTUP_TESTS: Final[str] = (os.getenv("STARTUP_TESTS") or "background").strip().lower()
+if STARTUP_TESTS not in STARTUP_TESTS_MODES:
+    raise InvalidEnvVar("STARTUP_TESTS", " | ".join(STARTUP_TESTS_MODES))
+
+
+# === Métriques ===
+# Endpoint HTTP Prometheus optionnel (`GET /metrics`), désactivé si METRICS_PORT est absent.
+METRICS_PORT: Final[int | None] = env_int_optional("METRICS_PORT")
+METRICS_HOST: Final[str] = os.getenv("METRICS_HOST") or "127.0.0.1"
+
+
+# === Surveillance de la boucle asyncio ===
+# Seuil (ms) au-delà duquel un callback qui bloque la boucle est capturé et attribué ; 0 désactive la surveillance.
+_LOOP_WATCHDOG_MS = env_int_optional("LOOP_WATCHDOG_MS")
+LOOP_WATCHDOG_MS: Final[int] = 250 if _LOOP_WATCHDOG_MS is None else max(0, _LOOP_WATCHDOG_MS)
+
 
 # === Logs ===
 LOG_PATH: Final[str] = "logs/bot.log"
@@ -91,4 +140,15 @@ def get_log_admin_id() -> int:
     """Récupère l'ID de l'admin pour les logs, ou lève une exception si la feature est activée mais que l'ID est manquant."""
     if MY_ID is None:
         raise MissingEnvVar("ADMIN_USER_ID")
-    return MY_ID
\ No newline at end of file
+    return MY_ID
+
+
+# === Diagnostics (commandes réservées à l'admin) ===
+DIAGNOSTICS_ENABLED: Final[bool] = MY_ID is not None
+
+
+def get_diagnostics_admin_id() -> int:
+    """Récupère l'ID de l'admin pour les commandes de diagnostic, ou lève une exception s'il est manquant."""
+    if MY_ID is None:
+        raise MissingEnvVar("ADMIN_USER_ID")
+    return MY_ID
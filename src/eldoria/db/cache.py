@@ -0,0 +1,123 @@
+"""Caches mémoire par guild des tables de configuration lues sur les chemins chauds.
+
+Chaque cache conserve, pour une guild, l'état complet d'une table (config XP, niveaux, rôles secrets...).
+Les repos invalident l'entrée de la guild à chaque écriture ; le préchargement au démarrage remplit les
+caches pour toutes les guilds avec une seule requête par table. Le module retient aussi les guilds dont les
+configurations par défaut sont garanties en base, pour que les chemins chauds n'aient pas à les réécrire.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class GuildCache(Generic[V]):
+    """Cache en lecture traversante indexé par guild_id.
+
+    Un compteur de génération, incrémenté à chaque invalidation, empêche une lecture commencée avant
+    une écriture de réinsérer une valeur périmée.
+    """
+
+    __slots__ = ("name", "hits", "misses", "_entries", "_generation")
+
+    def __init__(self, name: str) -> None:
+        """Initialise un cache vide nommé d'après la table qu'il reflète."""
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[int, V] = {}
+        self._generation = 0
+
+    def __len__(self) -> int:
+        """Retourne le nombre de guilds présentes dans le cache."""
+        return len(self._entries)
+
+    def __contains__(self, guild_id: object) -> bool:
+        """Indique si la guild est présente dans le cache."""
+        return guild_id in self._entries
+
+    def peek(self, guild_id: int) -> V | None:
+        """Retourne la valeur en cache sans la charger (None si absente)."""
+        return self._entries.get(int(guild_id))
+
+    def get_or_load(self, guild_id: int, loader: Callable[[int], V]) -> V:
+        """Retourne la valeur en cache, ou la charge via `loader(guild_id)` et la mémorise."""
+        gid = int(guild_id)
+        try:
+            value = self._entries[gid]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        generation = self._generation
+        value = loader(gid)
+        if generation == self._generation:
+            self._entries[gid] = value
+        return value
+
+    def fill(self, entries: Mapping[int, V]) -> None:
+        """Remplace les entrées des guilds fournies (préchargement groupé)."""
+        for gid, value in entries.items():
+            self._entries[int(gid)] = value
+
+    def invalidate(self, guild_id: int) -> None:
+        """Retire la guild du cache : la prochaine lecture rechargera son état depuis la base."""
+        self._generation += 1
+        self._entries.pop(int(guild_id), None)
+
+    def clear(self) -> None:
+        """Vide entièrement le cache (ex: base remplacée)."""
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Retourne la taille et les compteurs hits/misses du cache."""
+        return {"guilds": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_CACHES: dict[str, GuildCache[Any]] = {}
+# Guilds dont les configurations par défaut (XP, bienvenue, ticketing) sont garanties en base
+_BOOTSTRAPPED: set[int] = set()
+
+
+def guild_cache(name: str) -> GuildCache[Any]:
+    """Retourne le cache nommé `name`, en le créant au premier appel."""
+    cache = _CACHES.get(name)
+    if cache is None:
+        cache = _CACHES[name] = GuildCache(name)
+    return cache
+
+
+def mark_bootstrapped(guild_ids: Iterable[int]) -> None:
+    """Retient que les configurations par défaut de ces guilds viennent d'être garanties en base."""
+    _BOOTSTRAPPED.update(int(gid) for gid in guild_ids)
+
+
+def is_bootstrapped(guild_id: int) -> bool:
+    """Indique si les configurations par défaut de la guild sont garanties en base (sans accès à la base)."""
+    return int(guild_id) in _BOOTSTRAPPED
+
+
+def invalidate_guild(guild_id: int) -> None:
+    """Retire une guild de tous les caches et des guilds initialisées (ex: guild quittée)."""
+    _BOOTSTRAPPED.discard(int(guild_id))
+    for cache in _CACHES.values():
+        cache.invalidate(guild_id)
+
+
+def clear_all() -> None:
+    """Vide tous les caches et oublie les guilds initialisées (ex: base restaurée depuis une sauvegarde)."""
+    _BOOTSTRAPPED.clear()
+    for cache in _CACHES.values():
+        cache.clear()
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """Retourne les statistiques de chaque cache, par nom."""
+    return {name: cache.stats() for name, cache in sorted(_CACHES.items())}
@@ -3,7 +3,7 @@
 import os
 import sqlite3
 import threading
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from contextlib import contextmanager
 
 DB_PATH = "./data/eldoria.db"
@@ -25,3 +25,28 @@ def get_conn() -> Iterator[sqlite3.Connection]:
             conn.commit()
         finally:
             conn.close()
+
+
+def upsert_sql(
+    table: str,
+    keys: Mapping[str, object],
+    fields: Mapping[str, object],
+    *,
+    defaults: Mapping[str, object] | None = None,
+) -> tuple[str, tuple[object, ...]]:
+    """Construit un upsert en une seule requête et retourne (sql, paramètres).
+
+    La ligne est créée avec les clés, les `defaults` et les `fields` si elle est absente ; sinon seuls les `fields`
+    sont mis à jour. Sans champ, la ligne est seulement créée (ON CONFLICT DO NOTHING).
+    Les noms de table et de colonnes viennent du code, jamais de l'utilisateur.
+    """
+    values = {**keys, **(defaults or {}), **fields}
+    if fields:
+        action = "DO UPDATE SET " + ", ".join(f"{col}=excluded.{col}" for col in fields)
+    else:
+        action = "DO NOTHING"
+    sql = (
+        f"INSERT INTO {table}({', '.join(values)}) VALUES ({', '.join('?' for _ in values)}) "
+        f"ON CONFLICT({', '.join(keys)}) {action}"
+    )
+    return sql, tuple(values.values())
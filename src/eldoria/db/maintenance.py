@@ -1,33 +1,232 @@
-"""Module de maintenance de la base de données SQLite, incluant des fonctions pour sauvegarder et remplacer le fichier de la base de données."""
+"""Module de maintenance de la base de données SQLite, incluant des fonctions pour sauvegarder et remplacer le fichier de la base de données.
+
+La sauvegarde est faite en ligne : `sqlite3.Connection.backup` copie la base par lots de pages, en dormant
+entre deux lots, sans prendre `_DB_LOCK`. Les autres connexions du bot continuent de lire et d'écrire entre
+les lots ; une écriture pendant la copie la fait repartir du début. Au-delà de `BACKUP_MAX_RESTARTS`
+redémarrages (base très active), la fin de la copie est faite d'un seul tenant sous le verrou.
+
+La restauration (`restore_db_file`) fait tout le travail coûteux sur le fichier entrant, hors du verrou :
+contrôle d'intégrité, vérification de la version de schéma puis migration vers le schéma courant. Seul
+l'échange du fichier (`os.replace`, atomique) et l'invalidation des états en mémoire (`on_swapped`) se font
+sous `_DB_LOCK` : aucune requête ne peut voir la nouvelle base avec les caches de l'ancienne.
+
+La maintenance périodique (`run_maintenance`) purge les lignes périmées, met à jour les statistiques du
+planificateur (`ANALYZE` la première fois, `PRAGMA optimize` ensuite) puis rend au système les pages libres
+par lots (`PRAGMA incremental_vacuum`), en relâchant le verrou entre deux étapes. La conversion unique d'une
+ancienne base en `auto_vacuum = INCREMENTAL` (VACUUM complet) est faite au démarrage par `schema.apply_schema`,
+jamais ici.
+"""
 import errno
+import logging
 import os
 import shutil
 import sqlite3
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 
+from eldoria.db import schema
 from eldoria.db.connection import _DB_LOCK, DB_PATH
+from eldoria.exceptions.general import InvalidDatabaseFile
 
+log = logging.getLogger(__name__)
 
-def backup_to_file(dst_path: str) -> None:
-    """Crée une copie de la base de données SQLite à l'emplacement spécifié."""
-    with _DB_LOCK:
+BACKUP_PAGES_PER_STEP = 256
+BACKUP_STEP_SLEEP = 0.005
+BACKUP_MAX_RESTARTS = 5
+
+# Lignes examinées par index lors de la mise à jour des statistiques (borne la durée d'ANALYZE)
+OPTIMIZE_ANALYSIS_LIMIT = 1000
+VACUUM_PAGES_PER_STEP = 200
+
+
+@dataclass(slots=True)
+class BackupStats:
+    """Bilan d'une sauvegarde en ligne : pages copiées, lots, redémarrages et durée."""
+
+    pages: int = 0
+    page_size: int = 0
+    steps: int = 0
+    restarts: int = 0
+    seconds: float = 0.0
+    locked: bool = False
+
+    @property
+    def size(self) -> int:
+        """Taille de la base copiée, en octets."""
+        return self.pages * self.page_size
+
+    @property
+    def throughput(self) -> float:
+        """Débit de la copie, en octets par seconde."""
+        return self.size / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass(slots=True)
+class RestoreReport:
+    """Bilan d'une restauration : contrôle effectué, versions de schéma avant/après migration et durée."""
+
+    check: str = "quick_check"
+    from_version: int = 0
+    to_version: int = 0
+    seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class MaintenanceReport:
+    """Bilan d'une maintenance : lignes purgées par table, statistiques, pages rendues et taille du fichier."""
+
+    purged: dict[str, int] = field(default_factory=dict)
+    analyzed: bool = False
+    vacuumed_pages: int = 0
+    free_pages: int = 0
+    size_before: int = 0
+    size_after: int = 0
+    seconds: float = 0.0
+
+    @property
+    def reclaimed(self) -> int:
+        """Octets rendus au système de fichiers."""
+        return max(0, self.size_before - self.size_after)
+
+
+class _TooManyRestarts(Exception):
+    """Interrompt une sauvegarde en ligne qui redémarre trop souvent."""
+
+
+def backup_to_file(
+    dst_path: str,
+    *,
+    pages: int = BACKUP_PAGES_PER_STEP,
+    sleep: float = BACKUP_STEP_SLEEP,
+    max_restarts: int = BACKUP_MAX_RESTARTS,
+    progress: Callable[[int, int], None] | None = None,
+) -> BackupStats:
+    """Crée une copie de la base de données SQLite à l'emplacement spécifié, par lots de `pages` pages.
+
+    `progress(copiées, total)` est appelé après chaque lot. Retourne le bilan de la copie (débit, redémarrages).
+    """
+    stats = BackupStats()
+    started = time.perf_counter()
+    last_remaining: int | None = None
+
+    def on_step(_status: int, remaining: int, total: int) -> None:
+        nonlocal last_remaining
+        stats.steps += 1
+        stats.pages = total
+        if last_remaining is not None and remaining >= last_remaining:
+            # Pas de progression : source modifiée par une autre connexion, la copie est repartie du début
+            stats.restarts += 1
+            if stats.restarts > max_restarts and remaining > 0:
+                raise _TooManyRestarts()
+        last_remaining = remaining
+        if progress is not None:
+            progress(total - remaining, total)
+
+    conn = sqlite3.connect(DB_PATH)
+    try:
         # checkpoint WAL au cas où
-        conn = sqlite3.connect(DB_PATH)
         try:
-            conn.execute("PRAGMA wal_checkpoint(FULL);")
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE);")
         except sqlite3.DatabaseError:
             pass
 
         bck = sqlite3.connect(dst_path)
         try:
-            conn.backup(bck)
+            try:
+                conn.backup(bck, pages=pages, progress=on_step, sleep=sleep)
+            except _TooManyRestarts:
+                with _DB_LOCK:
+                    conn.backup(bck)
+                stats.locked = True
+            stats.page_size = int(conn.execute("PRAGMA page_size;").fetchone()[0])
         finally:
             bck.close()
-            conn.close()
+    finally:
+        conn.close()
+
+    stats.seconds = time.perf_counter() - started
+    log.info(
+        "✅ Sauvegarde en ligne : %d pages (%.1f Mio) en %.2f s, %.1f Mio/s, %d lots, %d redémarrage(s)%s",
+        stats.pages,
+        stats.size / 1024 / 1024,
+        stats.seconds,
+        stats.throughput / 1024 / 1024,
+        stats.steps,
+        stats.restarts,
+        ", terminée sous verrou" if stats.locked else "",
+    )
+    return stats
+
+
+def validate_db_file(path: str, *, full: bool = False) -> int:
+    """Vérifie qu'un fichier est une base Eldoria saine et retourne sa version de schéma (`PRAGMA user_version`).
+
+    `full=True` fait un `integrity_check` complet au lieu du `quick_check` (qui ne vérifie pas les index).
+    Lève InvalidDatabaseFile si la base est corrompue, plus récente que le bot ou sans aucune table connue.
+    """
+    check = "integrity_check" if full else "quick_check"
+    conn = sqlite3.connect(path)
+    try:
+        try:
+            problems = [str(r[0]) for r in conn.execute(f"PRAGMA {check}(5);").fetchall()]
+            version = int(conn.execute("PRAGMA user_version;").fetchone()[0])
+            tables = {str(r[0]) for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        except sqlite3.DatabaseError as e:
+            raise InvalidDatabaseFile("fichier illisible") from e
+    finally:
+        conn.close()
+
+    if problems != ["ok"]:
+        raise InvalidDatabaseFile(f"{check} en échec ({problems[0]})")
+    if version > schema.SCHEMA_VERSION:
+        raise InvalidDatabaseFile(f"schéma v{version} plus récent que celui du bot (v{schema.SCHEMA_VERSION})")
+    if not tables & schema.table_names():
+        raise InvalidDatabaseFile("aucune table Eldoria")
+    return version
+
+
+def migrate_db_file(path: str) -> int:
+    """Applique le schéma courant (tables, colonnes manquantes, version) à un fichier hors ligne et retourne la nouvelle version."""
+    conn = sqlite3.connect(path)
+    try:
+        schema.apply_schema(conn)
+        conn.commit()
+        return int(conn.execute("PRAGMA user_version;").fetchone()[0])
+    finally:
+        conn.close()
+
 
-def replace_db_file(new_db_path: str) -> None:
+def restore_db_file(
+    new_db_path: str, *, full_check: bool = False, on_swapped: Callable[[], None] | None = None
+) -> RestoreReport:
+    """Valide, migre puis installe une base entrante à la place de la base courante.
+
+    Le contrôle et la migration portent sur le fichier entrant, sans verrou : le bot continue de servir
+    l'ancienne base. `on_swapped` (ex: vidage des caches) est appelé sous le verrou juste après l'échange.
+    """
+    started = time.perf_counter()
+    report = RestoreReport(check="integrity_check" if full_check else "quick_check")
+    report.from_version = validate_db_file(new_db_path, full=full_check)
+    report.to_version = migrate_db_file(new_db_path)
+    replace_db_file(new_db_path, on_swapped=on_swapped)
+    report.seconds = time.perf_counter() - started
+    log.info(
+        "✅ Base restaurée (%s ok, schéma v%d → v%d) en %.2f s",
+        report.check,
+        report.from_version,
+        report.to_version,
+        report.seconds,
+    )
+    return report
+
+
+def replace_db_file(new_db_path: str, *, on_swapped: Callable[[], None] | None = None) -> None:
     """Remplace le fichier de la base de données SQLite par celui spécifié.
     
     Effectue des vérifications pour s'assurer que le nouveau fichier est une base de données SQLite valide avant de remplacer l'ancien.
+    `on_swapped` est appelé sous le verrou une fois le fichier en place.
     """
     with _DB_LOCK:
         test = sqlite3.connect(new_db_path)
@@ -54,3 +253,110 @@ def replace_db_file(new_db_path: str) -> None:
                     pass
             else:
                 raise
+
+        if on_swapped is not None:
+            on_swapped()
+
+
+# -------------------- Maintenance périodique --------------------
+
+@contextmanager
+def _maintenance_conn() -> Iterator[sqlite3.Connection]:
+    """Connexion en autocommit (nécessaire à VACUUM) tenue sous le verrou de la base."""
+    with _DB_LOCK:
+        conn = sqlite3.connect(DB_PATH, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def _pragma_int(conn: sqlite3.Connection, name: str) -> int:
+    return int(conn.execute(f"PRAGMA {name};").fetchone()[0])
+
+
+def _db_size() -> int:
+    try:
+        return os.path.getsize(DB_PATH)
+    except OSError:
+        return 0
+
+
+def optimize_db(*, analysis_limit: int = OPTIMIZE_ANALYSIS_LIMIT) -> bool:
+    """Met à jour les statistiques du planificateur de requêtes, et retourne True si un ANALYZE complet a été fait.
+
+    Sans statistiques (`sqlite_stat1` absente), toutes les tables sont analysées ; ensuite, `PRAGMA optimize`
+    ne réanalyse que les tables qui en ont besoin.
+    """
+    with _maintenance_conn() as conn:
+        conn.execute(f"PRAGMA analysis_limit = {int(analysis_limit)};")
+        has_stats = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone() is not None
+        conn.execute("PRAGMA optimize;" if has_stats else "ANALYZE;")
+    return not has_stats
+
+
+def incremental_vacuum(max_pages: int, *, step: int = VACUUM_PAGES_PER_STEP) -> int:
+    """Rend au système jusqu'à `max_pages` pages libres par lots de `step`, et retourne le nombre de pages rendues.
+
+    Sans effet sur une base pas encore convertie en `auto_vacuum = INCREMENTAL` (conversion faite au démarrage).
+    """
+    if max_pages <= 0:
+        return 0
+
+    with _maintenance_conn() as conn:
+        if _pragma_int(conn, "auto_vacuum") != schema.AUTO_VACUUM_INCREMENTAL:
+            log.warning("⚠️ Base sans auto_vacuum incrémental : vacuum ignoré jusqu'au prochain démarrage")
+            return 0
+
+    released = 0
+    while released < max_pages:
+        with _maintenance_conn() as conn:
+            free = _pragma_int(conn, "freelist_count")
+            if free == 0:
+                break
+            conn.execute(f"PRAGMA incremental_vacuum({min(step, max_pages - released)});").fetchall()
+            done = free - _pragma_int(conn, "freelist_count")
+        if done <= 0:
+            break
+        released += done
+    return released
+
+
+def run_maintenance(
+    *,
+    purges: Mapping[str, Callable[[sqlite3.Connection], int]],
+    vacuum_pages: int,
+    analysis_limit: int = OPTIMIZE_ANALYSIS_LIMIT,
+) -> MaintenanceReport:
+    """Purge les lignes périmées, met à jour les statistiques du planificateur puis rend les pages libres.
+
+    `purges` associe un nom de table à une fonction de purge (appelée avec une connexion, retourne le nombre
+    de lignes supprimées). Chaque étape prend le verrou séparément : le bot continue de servir entre deux.
+    """
+    started = time.perf_counter()
+    report = MaintenanceReport(size_before=_db_size())
+
+    for table, purge in purges.items():
+        try:
+            with _maintenance_conn() as conn:
+                report.purged[table] = purge(conn)
+        except sqlite3.DatabaseError:
+            log.exception("❌ Purge de %s impossible", table)
+
+    report.analyzed = optimize_db(analysis_limit=analysis_limit)
+    report.vacuumed_pages = incremental_vacuum(vacuum_pages)
+    with _maintenance_conn() as conn:
+        report.free_pages = _pragma_int(conn, "freelist_count")
+
+    report.size_after = _db_size()
+    report.seconds = time.perf_counter() - started
+    log.info(
+        "✅ Maintenance de la base en %.2f s : %s, %s, %d pages rendues (%.1f Kio récupérés), %d pages libres restantes",
+        report.seconds,
+        ", ".join(f"{table} -{n}" for table, n in report.purged.items()) or "aucune purge",
+        "ANALYZE complet" if report.analyzed else "PRAGMA optimize",
+        report.vacuumed_pages,
+        report.reclaimed / 1024,
+        report.free_pages,
+    )
+    return report
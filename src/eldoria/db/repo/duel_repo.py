@@ -126,7 +126,7 @@ def update_duel_if_status(
                 conn=conn2,
             )
 
-    _execute_in_conn(conn, """
+    cursor = _execute_in_conn(conn, """
             UPDATE duels
             SET
                 message_id  = COALESCE(?, message_id),
@@ -139,8 +139,8 @@ def update_duel_if_status(
             AND status=?
         """, (message_id, game_type, stake_xp, expires_at, finished_at, payload, duel_id, required_status))
 
-    changes = _execute_in_conn(conn, "SELECT changes()").fetchone()[0]
-    return changes == 1
+    # rowcount de l'UPDATE lui-même : pas de second aller-retour SELECT changes()
+    return cursor.rowcount == 1
 
 
 def transition_status(
@@ -156,7 +156,7 @@ def transition_status(
         with get_conn() as conn2:
             return transition_status(duel_id, from_status, to_status, expires_at, conn=conn2)
 
-    _execute_in_conn(conn, """
+    cursor = _execute_in_conn(conn, """
             UPDATE duels
             SET 
                 status=?,
@@ -165,8 +165,7 @@ def transition_status(
             AND status =?
         """, (to_status, expires_at, duel_id, from_status))
 
-    changes = _execute_in_conn(conn, "SELECT changes()").fetchone()[0]
-    return changes == 1
+    return cursor.rowcount == 1
 
 def update_payload_if_unchanged(
     duel_id: int,
@@ -180,7 +179,7 @@ def update_payload_if_unchanged(
         with get_conn() as conn2:
             return update_payload_if_unchanged(duel_id, old_payload_json, new_payload_json, conn=conn2)
 
-    _execute_in_conn(conn, """
+    cursor = _execute_in_conn(conn, """
             UPDATE duels 
             SET payload=? 
             WHERE duel_id=? 
@@ -188,8 +187,7 @@ def update_payload_if_unchanged(
             AND COALESCE(payload, '') = COALESCE(?, '')
         """, (new_payload_json, duel_id, old_payload_json))
 
-    changes = _execute_in_conn(conn, "SELECT changes()").fetchone()[0]
-    return changes == 1
+    return cursor.rowcount == 1
 
 
 def list_expired_duels(now_ts: int, *, conn: Connection | None = None) -> list[Row]:
@@ -208,6 +206,23 @@ def list_expired_duels(now_ts: int, *, conn: Connection | None = None) -> list[R
     return rows
 
 
+def list_duels_with_status(statuses: tuple[str, ...], *, conn: Connection | None = None) -> list[Row]:
+    """Retourne la liste des duels dont le status fait partie de ceux fournis, triés par identifiant."""
+    if not statuses:
+        return []
+    if conn is None:
+        with get_conn() as conn2:
+            return list_duels_with_status(statuses, conn=conn2)
+    placeholders = ",".join("?" for _ in statuses)
+    rows = _execute_in_conn(conn, f"""
+            SELECT *
+            FROM duels
+            WHERE status IN ({placeholders})
+            ORDER BY duel_id ASC
+        """, tuple(statuses)).fetchall()
+    return rows
+
+
 def cleanup_duels(cutoff_short: int, cutoff_finished: int, *, conn: Connection | None = None) -> None:
     """Supprime les duels dont la date de fin est dépassée depuis longtemps."""
     if conn is None:
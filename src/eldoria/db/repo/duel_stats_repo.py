@@ -0,0 +1,163 @@
+"""Module de gestion des statistiques de duel pré-agrégées.
+
+Contient les fonctions nécessaires pour incrémenter, lire, classer et reconstruire les statistiques de duel
+par membre (victoires, défaites, égalités, XP gagnée/perdue) dans la base de données.
+Ces statistiques survivent au nettoyage de la table `duels`.
+"""
+
+from collections.abc import Iterable
+from sqlite3 import Connection
+from typing import Any
+
+from eldoria.db.connection import get_conn
+
+DUEL_STATS_COLUMNS: tuple[str, ...] = ("wins", "losses", "draws", "expired", "xp_won", "xp_lost")
+
+
+def ds_increment(
+    guild_id: int,
+    user_id: int,
+    *,
+    wins: int = 0,
+    losses: int = 0,
+    draws: int = 0,
+    expired: int = 0,
+    xp_won: int = 0,
+    xp_lost: int = 0,
+    played_at: int = 0,
+    conn: Connection | None = None,
+) -> None:
+    """Incrémente les statistiques de duel d'un membre (crée la ligne si absente).
+
+    Prévu pour être appelé dans la même transaction que la fin du duel (paramètre `conn`).
+    """
+    if conn is None:
+        with get_conn() as conn2:
+            return ds_increment(
+                guild_id,
+                user_id,
+                wins=wins,
+                losses=losses,
+                draws=draws,
+                expired=expired,
+                xp_won=xp_won,
+                xp_lost=xp_lost,
+                played_at=played_at,
+                conn=conn2,
+            )
+
+    conn.execute(
+        """
+        INSERT INTO duel_stats(guild_id, user_id, wins, losses, draws, expired, xp_won, xp_lost, last_duel_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(guild_id, user_id) DO UPDATE SET
+            wins         = duel_stats.wins    + excluded.wins,
+            losses       = duel_stats.losses  + excluded.losses,
+            draws        = duel_stats.draws   + excluded.draws,
+            expired      = duel_stats.expired + excluded.expired,
+            xp_won       = duel_stats.xp_won  + excluded.xp_won,
+            xp_lost      = duel_stats.xp_lost + excluded.xp_lost,
+            last_duel_at = MAX(duel_stats.last_duel_at, excluded.last_duel_at)
+        """,
+        (guild_id, user_id, wins, losses, draws, expired, xp_won, xp_lost, played_at),
+    )
+    return None
+
+
+def ds_get_stats(guild_id: int, user_id: int, *, conn: Connection | None = None) -> dict[str, int]:
+    """Retourne les statistiques de duel d'un membre (toutes à 0 si le membre n'a jamais joué)."""
+    if conn is None:
+        with get_conn() as conn2:
+            return ds_get_stats(guild_id, user_id, conn=conn2)
+
+    row = conn.execute(
+        """
+        SELECT wins, losses, draws, expired, xp_won, xp_lost, last_duel_at
+        FROM duel_stats
+        WHERE guild_id = ? AND user_id = ?
+        """,
+        (guild_id, user_id),
+    ).fetchone()
+
+    if not row:
+        return {**dict.fromkeys(DUEL_STATS_COLUMNS, 0), "last_duel_at": 0}
+
+    wins, losses, draws, expired, xp_won, xp_lost, last_duel_at = row
+    return {
+        "wins": int(wins),
+        "losses": int(losses),
+        "draws": int(draws),
+        "expired": int(expired),
+        "xp_won": int(xp_won),
+        "xp_lost": int(xp_lost),
+        "last_duel_at": int(last_duel_at),
+    }
+
+
+def ds_list_leaderboard(
+    guild_id: int,
+    limit: int = 100,
+    offset: int = 0,
+    *,
+    conn: Connection | None = None,
+) -> list[tuple[int, int, int, int, int, int]]:
+    """Retourne le classement des duels d'un serveur : [(user_id, wins, losses, draws, xp_won, xp_lost)].
+
+    Trié par victoires, puis par XP nette gagnée. Les membres n'ayant joué que des duels expirés sont exclus.
+    """
+    if conn is None:
+        with get_conn() as conn2:
+            return ds_list_leaderboard(guild_id, limit, offset, conn=conn2)
+
+    rows = conn.execute(
+        """
+        SELECT user_id, wins, losses, draws, xp_won, xp_lost
+        FROM duel_stats
+        WHERE guild_id = ?
+          AND (wins + losses + draws) > 0
+        ORDER BY wins DESC, (xp_won - xp_lost) DESC, user_id ASC
+        LIMIT ? OFFSET ?
+        """,
+        (guild_id, limit, offset),
+    ).fetchall()
+    return [(int(r[0]), int(r[1]), int(r[2]), int(r[3]), int(r[4]), int(r[5])) for r in rows]
+
+
+def ds_is_empty(*, conn: Connection | None = None) -> bool:
+    """Retourne True si aucune statistique de duel n'est enregistrée (tous serveurs confondus)."""
+    if conn is None:
+        with get_conn() as conn2:
+            return ds_is_empty(conn=conn2)
+
+    row = conn.execute("SELECT EXISTS(SELECT 1 FROM duel_stats)").fetchone()
+    return not bool(row[0])
+
+
+def ds_replace_all(rows: Iterable[dict[str, Any]], *, conn: Connection | None = None) -> int:
+    """Remplace l'intégralité de la table des statistiques par les lignes fournies, et retourne le nombre de lignes écrites.
+
+    Chaque ligne contient `guild_id`, `user_id`, les compteurs de DUEL_STATS_COLUMNS et `last_duel_at`.
+    """
+    if conn is None:
+        with get_conn() as conn2:
+            return ds_replace_all(rows, conn=conn2)
+
+    params = [
+        (
+            int(r["guild_id"]),
+            int(r["user_id"]),
+            *(int(r.get(col, 0)) for col in DUEL_STATS_COLUMNS),
+            int(r.get("last_duel_at", 0)),
+        )
+        for r in rows
+    ]
+
+    conn.execute("DELETE FROM duel_stats")
+    conn.executemany(
+        """
+        INSERT INTO duel_stats(guild_id, user_id, wins, losses, draws, expired, xp_won, xp_lost, last_duel_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        params,
+    )
+    return len(params)
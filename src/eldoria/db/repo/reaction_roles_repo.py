@@ -5,8 +5,14 @@ Contenant les fonctions nécessaires pour créer, récupérer, mettre à jour et
 
 from __future__ import annotations
 
+from sqlite3 import Connection
+
+from eldoria.db.cache import guild_cache
 from eldoria.db.connection import get_conn
 
+# Cache par guild : {(message_id, emoji): role_id}
+_CACHE = guild_cache("reaction_roles")
+
 # ---------- Reaction roles --------
 
 def rr_upsert(guild_id: int, message_id: int, emoji: str, role_id: int) -> None:
@@ -17,6 +23,7 @@ def rr_upsert(guild_id: int, message_id: int, emoji: str, role_id: int) -> None:
             VALUES (?, ?, ?, ?)
             ON CONFLICT(guild_id, message_id, emoji) DO UPDATE SET role_id=excluded.role_id
         """, (guild_id, message_id, emoji, role_id))
+    _CACHE.invalidate(guild_id)
 
 
 def rr_delete(guild_id: int, message_id: int, emoji: str) -> None:
@@ -26,6 +33,7 @@ def rr_delete(guild_id: int, message_id: int, emoji: str) -> None:
             DELETE FROM reaction_roles
             WHERE guild_id=? AND message_id=? AND emoji=?
         """, (guild_id, message_id, emoji))
+    _CACHE.invalidate(guild_id)
 
 
 def rr_delete_message(guild_id: int, message_id: int) -> None:
@@ -35,6 +43,7 @@ def rr_delete_message(guild_id: int, message_id: int) -> None:
             DELETE FROM reaction_roles
             WHERE guild_id=? AND message_id=?
         """, (guild_id, message_id))
+    _CACHE.invalidate(guild_id)
 
 
 def rr_get_role_id(guild_id: int, message_id: int, emoji: str) -> int | None:
@@ -47,6 +56,34 @@ def rr_get_role_id(guild_id: int, message_id: int, emoji: str) -> int | None:
     return row[0] if row else None
 
 
+def _load_guild_rules(guild_id: int) -> dict[tuple[int, str], int]:
+    """Charge toutes les règles de rôles par réaction d'une guild sous forme {(message_id, emoji): role_id}."""
+    with get_conn() as conn:
+        rows = conn.execute("""
+            SELECT message_id, emoji, role_id
+            FROM reaction_roles
+            WHERE guild_id=?
+        """, (guild_id,)).fetchall()
+    return {(int(message_id), emoji): int(role_id) for (message_id, emoji, role_id) in rows}
+
+
+def rr_get_role_id_cached(guild_id: int, message_id: int, emoji: str) -> int | None:
+    """Comme `rr_get_role_id`, servi depuis le cache des règles de la guild (chargé au premier accès)."""
+    return _CACHE.get_or_load(guild_id, _load_guild_rules).get((int(message_id), emoji))
+
+
+def rr_load_all(*, conn: Connection | None = None) -> dict[int, dict[tuple[int, str], int]]:
+    """Retourne {guild_id: {(message_id, emoji): role_id}} pour toutes les guilds, en une seule requête."""
+    if conn is None:
+        with get_conn() as conn2:
+            return rr_load_all(conn=conn2)
+    rows = conn.execute("SELECT guild_id, message_id, emoji, role_id FROM reaction_roles").fetchall()
+    grouped: dict[int, dict[tuple[int, str], int]] = {}
+    for guild_id, message_id, emoji, role_id in rows:
+        grouped.setdefault(int(guild_id), {})[(int(message_id), emoji)] = int(role_id)
+    return grouped
+
+
 def rr_list_by_message(guild_id: int, message_id: int) -> dict[str, int]:
     """Retourne toutes les règles de rôles par réaction d'un message sous forme {emoji: role_id}."""
     with get_conn() as conn:
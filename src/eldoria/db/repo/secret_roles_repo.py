@@ -5,8 +5,14 @@ Contenant les fonctions nécessaires pour créer, récupérer, mettre à jour et
 
 from __future__ import annotations
 
+from sqlite3 import Connection
+
+from eldoria.db.cache import guild_cache
 from eldoria.db.connection import get_conn
 
+# Cache par guild : {(channel_id, phrase): role_id}
+_CACHE = guild_cache("secret_roles")
+
 # ---------- Secret roles ----------
 
 def sr_upsert(guild_id: int, channel_id: int, phrase: str, role_id: int) -> None:
@@ -17,6 +23,7 @@ def sr_upsert(guild_id: int, channel_id: int, phrase: str, role_id: int) -> None
             VALUES (?, ?, ?, ?)
             ON CONFLICT(guild_id, channel_id, phrase) DO UPDATE SET role_id=excluded.role_id
         """, (guild_id, channel_id, phrase, role_id))
+    _CACHE.invalidate(guild_id)
 
 
 def sr_delete(guild_id: int, channel_id: int, phrase: str) -> None:
@@ -26,6 +33,7 @@ def sr_delete(guild_id: int, channel_id: int, phrase: str) -> None:
             DELETE FROM secret_roles
             WHERE guild_id=? AND channel_id=? AND phrase=?
         """, (guild_id, channel_id, phrase))
+    _CACHE.invalidate(guild_id)
 
 
 def sr_match(guild_id: int, channel_id: int, phrase: str) -> int | None:
@@ -38,6 +46,34 @@ def sr_match(guild_id: int, channel_id: int, phrase: str) -> int | None:
     return row[0] if row else None
 
 
+def _load_guild_rules(guild_id: int) -> dict[tuple[int, str], int]:
+    """Charge toutes les règles de rôles secrets d'une guild sous forme {(channel_id, phrase): role_id}."""
+    with get_conn() as conn:
+        rows = conn.execute("""
+            SELECT channel_id, phrase, role_id
+            FROM secret_roles
+            WHERE guild_id=?
+        """, (guild_id,)).fetchall()
+    return {(int(channel_id), phrase): int(role_id) for (channel_id, phrase, role_id) in rows}
+
+
+def sr_match_cached(guild_id: int, channel_id: int, phrase: str) -> int | None:
+    """Comme `sr_match`, servi depuis le cache des règles de la guild (chargé au premier accès)."""
+    return _CACHE.get_or_load(guild_id, _load_guild_rules).get((int(channel_id), phrase))
+
+
+def sr_load_all(*, conn: Connection | None = None) -> dict[int, dict[tuple[int, str], int]]:
+    """Retourne {guild_id: {(channel_id, phrase): role_id}} pour toutes les guilds, en une seule requête."""
+    if conn is None:
+        with get_conn() as conn2:
+            return sr_load_all(conn=conn2)
+    rows = conn.execute("SELECT guild_id, channel_id, phrase, role_id FROM secret_roles").fetchall()
+    grouped: dict[int, dict[tuple[int, str], int]] = {}
+    for guild_id, channel_id, phrase, role_id in rows:
+        grouped.setdefault(int(guild_id), {})[(int(channel_id), phrase)] = int(role_id)
+    return grouped
+
+
 def sr_list_messages(guild_id: int, channel_id: int) -> list[str]:
     """Lister toutes les phrases configurées pour les rôles secrets d'un salon, triées alphabétiquement."""
     with get_conn() as conn:
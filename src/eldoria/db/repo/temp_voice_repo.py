@@ -6,8 +6,15 @@ et leurs salons actifs dans la base de données.
 
 from __future__ import annotations
 
+from sqlite3 import Connection
+
+from eldoria.db.cache import guild_cache
 from eldoria.db.connection import get_conn
 
+# Caches par guild : {parent_channel_id: user_limit} et {channel_id: parent_channel_id}
+_PARENTS_CACHE = guild_cache("temp_voice_parents")
+_ACTIVE_CACHE = guild_cache("temp_voice_active")
+
 # ---------- Temp voice ------------
 
 def tv_upsert_parent(guild_id: int, parent_channel_id: int, user_limit: int) -> None:
@@ -18,6 +25,7 @@ def tv_upsert_parent(guild_id: int, parent_channel_id: int, user_limit: int) ->
             VALUES (?, ?, ?)
             ON CONFLICT(guild_id, parent_channel_id) DO UPDATE SET user_limit=excluded.user_limit
         """, (guild_id, parent_channel_id, user_limit))
+    _PARENTS_CACHE.invalidate(guild_id)
 
 
 def tv_get_parent(guild_id: int, parent_channel_id: int) -> int | None:
@@ -48,6 +56,7 @@ def tv_add_active(guild_id: int, parent_channel_id: int, channel_id: int) -> Non
             INSERT OR IGNORE INTO temp_voice_active(guild_id, parent_channel_id, channel_id)
             VALUES (?, ?, ?)
         """, (guild_id, parent_channel_id, channel_id))
+    _ACTIVE_CACHE.invalidate(guild_id)
 
 
 def tv_remove_active(guild_id: int, parent_channel_id: int, channel_id: int) -> None:
@@ -57,6 +66,7 @@ def tv_remove_active(guild_id: int, parent_channel_id: int, channel_id: int) ->
             DELETE FROM temp_voice_active
             WHERE guild_id=? AND parent_channel_id=? AND channel_id=?
         """, (guild_id, parent_channel_id, channel_id))
+    _ACTIVE_CACHE.invalidate(guild_id)
 
 
 def tv_list_active(guild_id: int, parent_channel_id: int) -> list[int]:
@@ -86,6 +96,7 @@ def tv_delete_parent(guild_id: int, parent_channel_id: int) -> None:
             DELETE FROM temp_voice_parents
             WHERE guild_id=? AND parent_channel_id=?
         """, (guild_id, parent_channel_id))
+    _PARENTS_CACHE.invalidate(guild_id)
 
 
 def tv_list_parents(guild_id: int) -> list[tuple[int, int]]:
@@ -97,3 +108,47 @@ def tv_list_parents(guild_id: int) -> list[tuple[int, int]]:
             WHERE guild_id=?
         """, (guild_id,)).fetchall()
     return rows
+
+
+def _load_guild_parents(guild_id: int) -> dict[int, int]:
+    """Charge les parents configurés d'une guild sous forme {parent_channel_id: user_limit}."""
+    return {int(parent_id): int(limit) for (parent_id, limit) in tv_list_parents(guild_id)}
+
+
+def _load_guild_active(guild_id: int) -> dict[int, int]:
+    """Charge les salons temporaires actifs d'une guild sous forme {channel_id: parent_channel_id}."""
+    return {int(channel_id): int(parent_id) for (parent_id, channel_id) in tv_list_active_all(guild_id)}
+
+
+def tv_get_parent_cached(guild_id: int, parent_channel_id: int) -> int | None:
+    """Comme `tv_get_parent`, servi depuis le cache des parents de la guild."""
+    return _PARENTS_CACHE.get_or_load(guild_id, _load_guild_parents).get(int(parent_channel_id))
+
+
+def tv_find_parent_of_active_cached(guild_id: int, channel_id: int) -> int | None:
+    """Comme `tv_find_parent_of_active`, servi depuis le cache des salons actifs de la guild."""
+    return _ACTIVE_CACHE.get_or_load(guild_id, _load_guild_active).get(int(channel_id))
+
+
+def tv_load_all_parents(*, conn: Connection | None = None) -> dict[int, dict[int, int]]:
+    """Retourne {guild_id: {parent_channel_id: user_limit}} pour toutes les guilds, en une seule requête."""
+    if conn is None:
+        with get_conn() as conn2:
+            return tv_load_all_parents(conn=conn2)
+    rows = conn.execute("SELECT guild_id, parent_channel_id, user_limit FROM temp_voice_parents").fetchall()
+    grouped: dict[int, dict[int, int]] = {}
+    for guild_id, parent_id, limit in rows:
+        grouped.setdefault(int(guild_id), {})[int(parent_id)] = int(limit)
+    return grouped
+
+
+def tv_load_all_active(*, conn: Connection | None = None) -> dict[int, dict[int, int]]:
+    """Retourne {guild_id: {channel_id: parent_channel_id}} pour toutes les guilds, en une seule requête."""
+    if conn is None:
+        with get_conn() as conn2:
+            return tv_load_all_active(conn=conn2)
+    rows = conn.execute("SELECT guild_id, parent_channel_id, channel_id FROM temp_voice_active").fetchall()
+    grouped: dict[int, dict[int, int]] = {}
+    for guild_id, parent_id, channel_id in rows:
+        grouped.setdefault(int(guild_id), {})[int(channel_id)] = int(parent_id)
+    return grouped
@@ -5,10 +5,16 @@ Stocke l'état (enabled) ainsi que les IDs de category et du channel "ouvert".
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from sqlite3 import Connection
 from typing import Any
 
+from eldoria.db.cache import guild_cache
 from eldoria.db.connection import get_conn
 
+# Cache par guild : {"enabled": bool, "category_id": int, "open_channel_id": int}
+_CONFIG_CACHE = guild_cache("ticketing_config")
+
 
 def tk_ensure_defaults(
     guild_id: int, *, enabled: bool = False, category_id: int = 0, open_channel_id: int = 0
@@ -23,6 +29,22 @@ def tk_ensure_defaults(
         )
 
 
+def tk_ensure_defaults_many(guild_ids: Iterable[int], *, conn: Connection | None = None) -> None:
+    """Crée la config de ticketing désactivée si absente pour plusieurs guilds, en une seule requête."""
+    if conn is None:
+        with get_conn() as conn2:
+            return tk_ensure_defaults_many(guild_ids, conn=conn2)
+
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO ticketing_config(guild_id, enabled, category_id, open_channel_id)
+        VALUES (?, 0, 0, 0)
+        """,
+        [(int(gid),) for gid in guild_ids],
+    )
+    return None
+
+
 def tk_get_config(guild_id: int) -> dict[str, Any]:
     with get_conn() as conn:
         row = conn.execute(
@@ -37,6 +59,25 @@ def tk_get_config(guild_id: int) -> dict[str, Any]:
     return {"enabled": bool(row[0]), "category_id": int(row[1]), "open_channel_id": int(row[2])}
 
 
+def tk_get_config_cached(guild_id: int) -> dict[str, Any]:
+    """Comme `tk_get_config`, servi depuis le cache de la guild (chargé au premier accès)."""
+    return dict(_CONFIG_CACHE.get_or_load(guild_id, tk_get_config))
+
+
+def tk_load_all_configs(*, conn: Connection | None = None) -> dict[int, dict[str, Any]]:
+    """Retourne {guild_id: config} pour toutes les guilds, en une seule requête."""
+    if conn is None:
+        with get_conn() as conn2:
+            return tk_load_all_configs(conn=conn2)
+    rows = conn.execute(
+        "SELECT guild_id, enabled, category_id, open_channel_id FROM ticketing_config"
+    ).fetchall()
+    return {
+        int(gid): {"enabled": bool(enabled), "category_id": int(cat), "open_channel_id": int(open_id)}
+        for (gid, enabled, cat, open_id) in rows
+    }
+
+
 def tk_set_config(
     guild_id: int,
     *,
@@ -73,6 +114,7 @@ def tk_set_config(
         conn.execute(
             f"UPDATE ticketing_config SET {', '.join(sets)} WHERE guild_id=?", (*params, guild_id)
         )
+    _CONFIG_CACHE.invalidate(guild_id)
 
 
 def tk_set_enabled(guild_id: int, enabled: bool) -> None:
@@ -114,6 +156,7 @@ def tk_get_open_channel_id(guild_id: int) -> int:
 def tk_delete_config(guild_id: int) -> None:
     with get_conn() as conn:
         conn.execute("DELETE FROM ticketing_config WHERE guild_id=?", (guild_id,))
+    _CONFIG_CACHE.invalidate(guild_id)
 
 
 def tk_allocate_ticket_number(guild_id: int) -> int:
@@ -153,3 +196,18 @@ def tk_record_ticket(
             """,
             (guild_id, ticket_number, channel_id, owner_id, created_at),
         )
+
+
+def tk_purge_closed_before(cutoff_ts: int, *, conn: Connection | None = None) -> int:
+    """Supprime les tickets fermés avant `cutoff_ts`, et retourne le nombre de lignes supprimées.
+
+    Les numéros restent réservés : la séquence du serveur n'est pas touchée.
+    """
+    if conn is None:
+        with get_conn() as conn2:
+            return tk_purge_closed_before(cutoff_ts, conn=conn2)
+    cur = conn.execute(
+        "DELETE FROM tickets WHERE status = 'CLOSED' AND closed_at IS NOT NULL AND closed_at < ?",
+        (int(cutoff_ts),),
+    )
+    return int(cur.rowcount)
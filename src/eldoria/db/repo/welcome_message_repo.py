@@ -7,9 +7,15 @@ et leur historique dans la base de données.
 from __future__ import annotations
 
 import time
+from collections.abc import Iterable
+from sqlite3 import Connection
 from typing import Any
 
-from eldoria.db.connection import get_conn
+from eldoria.db.cache import guild_cache
+from eldoria.db.connection import get_conn, upsert_sql
+
+# Cache par guild : {"enabled": bool, "channel_id": int}
+_CONFIG_CACHE = guild_cache("welcome_config")
 
 # ------------ Welcome message -----------
 
@@ -25,6 +31,22 @@ def wm_ensure_defaults(guild_id: int, *, enabled: bool = False, channel_id: int
         )
 
 
+def wm_ensure_defaults_many(guild_ids: Iterable[int], *, conn: Connection | None = None) -> None:
+    """Crée la ligne de config désactivée si absente pour plusieurs guilds, en une seule requête."""
+    if conn is None:
+        with get_conn() as conn2:
+            return wm_ensure_defaults_many(guild_ids, conn=conn2)
+
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO welcome_config(guild_id, enabled, channel_id)
+        VALUES (?, 0, 0)
+        """,
+        [(int(gid),) for gid in guild_ids],
+    )
+    return None
+
+
 def wm_get_config(guild_id: int) -> dict[str, Any]:
     """Retourne {"enabled": bool, "channel_id": int} et crée la config si absente."""
     with get_conn() as conn:
@@ -41,6 +63,20 @@ def wm_get_config(guild_id: int) -> dict[str, Any]:
     return {"enabled": bool(row[0]), "channel_id": int(row[1])}
 
 
+def wm_get_config_cached(guild_id: int) -> dict[str, Any]:
+    """Comme `wm_get_config`, servi depuis le cache de la guild (chargé au premier accès)."""
+    return dict(_CONFIG_CACHE.get_or_load(guild_id, wm_get_config))
+
+
+def wm_load_all_configs(*, conn: Connection | None = None) -> dict[int, dict[str, Any]]:
+    """Retourne {guild_id: config} pour toutes les guilds, en une seule requête."""
+    if conn is None:
+        with get_conn() as conn2:
+            return wm_load_all_configs(conn=conn2)
+    rows = conn.execute("SELECT guild_id, enabled, channel_id FROM welcome_config").fetchall()
+    return {int(gid): {"enabled": bool(enabled), "channel_id": int(cid)} for (gid, enabled, cid) in rows}
+
+
 def wm_set_config(
     guild_id: int,
     *,
@@ -48,33 +84,21 @@ def wm_set_config(
     channel_id: int | None = None,
 ) -> None:
     """Update partiel (enabled et/ou channel_id). Crée la ligne si absente."""
-    sets: list[str] = []
-    params: list[int] = []
+    fields: dict[str, int] = {}
 
     if enabled is not None:
-        sets.append("enabled=?")
-        params.append(1 if bool(enabled) else 0)
+        fields["enabled"] = 1 if bool(enabled) else 0
 
     if channel_id is not None:
-        sets.append("channel_id=?")
-        params.append(int(channel_id))
+        fields["channel_id"] = int(channel_id)
 
-    if not sets:
+    if not fields:
         return
 
     with get_conn() as conn:
-        # s'assure que la ligne existe (channel_id NOT NULL)
-        conn.execute(
-            """
-            INSERT OR IGNORE INTO welcome_config(guild_id, enabled, channel_id)
-            VALUES (?, 0, 0)
-            """,
-            (guild_id,),
-        )
-        conn.execute(
-            f"UPDATE welcome_config SET {', '.join(sets)} WHERE guild_id=?",
-            (*params, guild_id),
-        )
+        # création si absente (channel_id NOT NULL) et mise à jour partielle en une seule requête
+        conn.execute(*upsert_sql("welcome_config", {"guild_id": guild_id}, fields, defaults={"enabled": 0, "channel_id": 0}))
+    _CONFIG_CACHE.invalidate(guild_id)
 
 
 def wm_set_enabled(guild_id: int, enabled: bool) -> None:
@@ -111,6 +135,7 @@ def wm_delete_config(guild_id: int) -> None:
     """Optionnel: reset complet de la config de bienvenue pour une guild."""
     with get_conn() as conn:
         conn.execute("DELETE FROM welcome_config WHERE guild_id=?", (guild_id,))
+    _CONFIG_CACHE.invalidate(guild_id)
 
 
 # ------------ Welcome message history (anti-répétition) -----------
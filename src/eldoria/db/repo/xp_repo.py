@@ -4,13 +4,65 @@ Contenant les fonctions nécessaires pour créer, récupérer, mettre à jour et
 les niveaux et les progrès vocaux dans la base de données.
 """
 
+from collections.abc import Iterable
 from sqlite3 import Connection
 
-from eldoria.db.connection import get_conn
+from eldoria.db.cache import guild_cache
+from eldoria.db.connection import get_conn, upsert_sql
 from eldoria.defaults import XP_CONFIG_DEFAULTS, XP_LEVELS_DEFAULTS
 
+# Caches par guild : config XP (dict) et niveaux ((level, xp_required, role_id), ... triés)
+_CONFIG_CACHE = guild_cache("xp_config")
+_LEVELS_CACHE = guild_cache("xp_levels")
 
 # ------------ XP system -----------
+_XP_CONFIG_COLUMNS = (
+    "enabled, points_per_message, cooldown_seconds, bonus_percent, karuta_k_small_percent, "
+    "voice_enabled, voice_xp_per_interval, voice_interval_seconds, voice_daily_cap_xp, "
+    "voice_levelup_channel_id"
+)
+
+_XP_CONFIG_INSERT_SQL = """
+    INSERT OR IGNORE INTO xp_config(
+      guild_id,
+      enabled,
+      points_per_message,
+      cooldown_seconds,
+      bonus_percent,
+      karuta_k_small_percent,
+
+      voice_enabled,
+      voice_xp_per_interval,
+      voice_interval_seconds,
+      voice_daily_cap_xp,
+      voice_levelup_channel_id
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_XP_LEVEL_INSERT_SQL = """
+    INSERT OR IGNORE INTO xp_levels(guild_id, level, xp_required, role_id)
+    VALUES (?, ?, ?, NULL)
+"""
+
+
+def _xp_config_default_values() -> tuple[int, ...]:
+    """Valeurs de config XP par défaut (defaults.py), dans l'ordre des colonnes de `_XP_CONFIG_INSERT_SQL`."""
+    return (
+        1 if bool(XP_CONFIG_DEFAULTS["enabled"]) else 0,
+        int(XP_CONFIG_DEFAULTS["points_per_message"]),
+        int(XP_CONFIG_DEFAULTS["cooldown_seconds"]),
+        int(XP_CONFIG_DEFAULTS["bonus_percent"]),
+        int(XP_CONFIG_DEFAULTS["karuta_k_small_percent"]),
+
+        1 if bool(XP_CONFIG_DEFAULTS.get("voice_enabled", True)) else 0,
+        int(XP_CONFIG_DEFAULTS.get("voice_xp_per_interval", 1)),
+        int(XP_CONFIG_DEFAULTS.get("voice_interval_seconds", 180)),
+        int(XP_CONFIG_DEFAULTS.get("voice_daily_cap_xp", 100)),
+        int(XP_CONFIG_DEFAULTS.get("voice_levelup_channel_id", 0)),
+    )
+
+
 def xp_ensure_defaults(guild_id: int, default_levels: dict[int, int] | None = None) -> None:
     """Crée la config et les niveaux par défaut si absents.
 
@@ -23,49 +75,58 @@ def xp_ensure_defaults(guild_id: int, default_levels: dict[int, int] | None = No
     with get_conn() as conn:
         # Crée une ligne de config si absente.
         # On insère explicitement les valeurs de defaults.py pour ne pas dépendre des DEFAULT SQL.
-        conn.execute(
-            """
-            INSERT OR IGNORE INTO xp_config(
-              guild_id,
-              enabled,
-              points_per_message,
-              cooldown_seconds,
-              bonus_percent,
-              karuta_k_small_percent,
-
-              voice_enabled,
-              voice_xp_per_interval,
-              voice_interval_seconds,
-              voice_daily_cap_xp,
-              voice_levelup_channel_id
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                guild_id,
-                1 if bool(XP_CONFIG_DEFAULTS["enabled"]) else 0,
-                int(XP_CONFIG_DEFAULTS["points_per_message"]),
-                int(XP_CONFIG_DEFAULTS["cooldown_seconds"]),
-                int(XP_CONFIG_DEFAULTS["bonus_percent"]),
-                int(XP_CONFIG_DEFAULTS["karuta_k_small_percent"]),
-
-                1 if bool(XP_CONFIG_DEFAULTS.get("voice_enabled", True)) else 0,
-                int(XP_CONFIG_DEFAULTS.get("voice_xp_per_interval", 1)),
-                int(XP_CONFIG_DEFAULTS.get("voice_interval_seconds", 180)),
-                int(XP_CONFIG_DEFAULTS.get("voice_daily_cap_xp", 100)),
-                int(XP_CONFIG_DEFAULTS.get("voice_levelup_channel_id", 0)),
-            ),
-        )
+        conn.execute(_XP_CONFIG_INSERT_SQL, (guild_id, *_xp_config_default_values()))
 
         # Crée les niveaux si absents
         for lvl, xp_req in default_levels.items():
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO xp_levels(guild_id, level, xp_required, role_id)
-                VALUES (?, ?, ?, NULL)
-                """,
-                (guild_id, int(lvl), int(xp_req)),
-            )
+            conn.execute(_XP_LEVEL_INSERT_SQL, (guild_id, int(lvl), int(xp_req)))
+    _LEVELS_CACHE.invalidate(guild_id)
+
+
+def xp_ensure_defaults_many(
+    guild_ids: Iterable[int],
+    default_levels: dict[int, int] | None = None,
+    *,
+    conn: Connection | None = None,
+) -> None:
+    """Crée la config et les niveaux par défaut si absents pour plusieurs guilds, en une seule transaction."""
+    if conn is None:
+        with get_conn() as conn2:
+            return xp_ensure_defaults_many(guild_ids, default_levels, conn=conn2)
+
+    ids = [int(gid) for gid in guild_ids]
+    if not ids:
+        return None
+
+    if default_levels is None:
+        default_levels = dict(XP_LEVELS_DEFAULTS)
+
+    config_values = _xp_config_default_values()
+    conn.executemany(_XP_CONFIG_INSERT_SQL, [(gid, *config_values) for gid in ids])
+    conn.executemany(
+        _XP_LEVEL_INSERT_SQL,
+        [(gid, int(lvl), int(xp_req)) for gid in ids for lvl, xp_req in default_levels.items()],
+    )
+    for gid in ids:
+        _LEVELS_CACHE.invalidate(gid)
+    return None
+
+
+def _xp_config_from_row(row: tuple) -> dict:
+    """Convertit une ligne (colonnes de `_XP_CONFIG_COLUMNS`) en dict de configuration."""
+    return {
+        "enabled": bool(row[0]),
+        "points_per_message": int(row[1]),
+        "cooldown_seconds": int(row[2]),
+        "bonus_percent": int(row[3]),
+        "karuta_k_small_percent": int(row[4]),
+
+        "voice_enabled": bool(row[5]),
+        "voice_xp_per_interval": int(row[6]),
+        "voice_interval_seconds": int(row[7]),
+        "voice_daily_cap_xp": int(row[8]),
+        "voice_levelup_channel_id": int(row[9]),
+    }
 
 
 def xp_get_config(guild_id: int) -> dict:
@@ -75,12 +136,7 @@ def xp_get_config(guild_id: int) -> dict:
     """
     with get_conn() as conn:
         row = conn.execute(
-            """
-            SELECT enabled, points_per_message, cooldown_seconds, bonus_percent, karuta_k_small_percent,
-                   voice_enabled, voice_xp_per_interval, voice_interval_seconds, voice_daily_cap_xp,
-                   voice_levelup_channel_id
-            FROM xp_config WHERE guild_id=?
-            """,
+            f"SELECT {_XP_CONFIG_COLUMNS} FROM xp_config WHERE guild_id=?",
             (guild_id,),
         ).fetchone()
     if not row:
@@ -119,19 +175,21 @@ def xp_get_config(guild_id: int) -> dict:
                 ),
             )
         return dict(XP_CONFIG_DEFAULTS)
-    return {
-        "enabled": bool(row[0]),
-        "points_per_message": int(row[1]),
-        "cooldown_seconds": int(row[2]),
-        "bonus_percent": int(row[3]),
-        "karuta_k_small_percent": int(row[4]),
+    return _xp_config_from_row(row)
 
-        "voice_enabled": bool(row[5]),
-        "voice_xp_per_interval": int(row[6]),
-        "voice_interval_seconds": int(row[7]),
-        "voice_daily_cap_xp": int(row[8]),
-        "voice_levelup_channel_id": int(row[9]),
-    }
+
+def xp_get_config_cached(guild_id: int) -> dict:
+    """Comme `xp_get_config`, servi depuis le cache de la guild (chargé au premier accès)."""
+    return dict(_CONFIG_CACHE.get_or_load(guild_id, xp_get_config))
+
+
+def xp_load_all_configs(*, conn: Connection | None = None) -> dict[int, dict]:
+    """Retourne {guild_id: config} pour toutes les guilds, en une seule requête."""
+    if conn is None:
+        with get_conn() as conn2:
+            return xp_load_all_configs(conn=conn2)
+    rows = conn.execute(f"SELECT guild_id, {_XP_CONFIG_COLUMNS} FROM xp_config").fetchall()
+    return {int(row[0]): _xp_config_from_row(tuple(row)[1:]) for row in rows}
 
 
 def xp_set_config(
@@ -223,6 +281,7 @@ def xp_set_config(
             f"UPDATE xp_config SET {', '.join(sets)} WHERE guild_id=?",
             (*params, guild_id),
         )
+    _CONFIG_CACHE.invalidate(guild_id)
 
 
 # ------------ Vocal XP progress -----------
@@ -268,34 +327,31 @@ def xp_voice_upsert_progress(
     xp_today: int | None = None,
 ) -> None:
     """Update partiel du progrès vocal d'un utilisateur. Crée la ligne si absente."""
-    sets = []
-    params: list[object] = []
+    fields: dict[str, object] = {}
     if day_key is not None:
-        sets.append("day_key=?")
-        params.append(str(day_key))
+        fields["day_key"] = str(day_key)
     if last_tick_ts is not None:
-        sets.append("last_tick_ts=?")
-        params.append(int(last_tick_ts))
+        fields["last_tick_ts"] = int(last_tick_ts)
     if buffer_seconds is not None:
-        sets.append("buffer_seconds=?")
-        params.append(int(buffer_seconds))
+        fields["buffer_seconds"] = int(buffer_seconds)
     if bonus_cents is not None:
-        sets.append("bonus_cents=?")
-        params.append(int(bonus_cents))
+        fields["bonus_cents"] = int(bonus_cents)
     if xp_today is not None:
-        sets.append("xp_today=?")
-        params.append(int(xp_today))
+        fields["xp_today"] = int(xp_today)
 
     with get_conn() as conn:
-        conn.execute(
-            "INSERT OR IGNORE INTO xp_voice_progress(guild_id, user_id) VALUES (?, ?)",
-            (guild_id, user_id),
-        )
-        if sets:
-            conn.execute(
-                f"UPDATE xp_voice_progress SET {', '.join(sets)} WHERE guild_id=? AND user_id=?",
-                (*params, guild_id, user_id),
-            )
+        conn.execute(*upsert_sql("xp_voice_progress", {"guild_id": guild_id, "user_id": user_id}, fields))
+
+def xp_voice_purge_before(day_key: str, *, conn: Connection | None = None) -> int:
+    """Supprime les progrès vocaux dont le dernier jour actif (YYYYMMDD) est antérieur à `day_key`, et retourne le nombre de lignes supprimées.
+
+    Une ligne d'un jour passé est remise à zéro au prochain passage en vocal : la supprimer ne change rien au calcul.
+    """
+    if conn is None:
+        with get_conn() as conn2:
+            return xp_voice_purge_before(day_key, conn=conn2)
+    cur = conn.execute("DELETE FROM xp_voice_progress WHERE day_key < ?", (str(day_key),))
+    return int(cur.rowcount)
 
 def xp_is_enabled(guild_id: int) -> bool:
     """Retourne True si le système d'XP est activé pour la guild, ou False sinon."""
@@ -307,6 +363,14 @@ def xp_is_enabled(guild_id: int) -> bool:
     return bool(row[0]) if row else False
 
 
+def xp_is_enabled_cached(guild_id: int) -> bool:
+    """Comme `xp_is_enabled`, lu depuis la config en cache quand elle est présente."""
+    cfg = _CONFIG_CACHE.peek(guild_id)
+    if cfg is None:
+        return xp_is_enabled(guild_id)
+    return bool(cfg["enabled"])
+
+
 def xp_get_levels(guild_id: int) -> list[tuple[int, int]]:
     """Retourne [(level, xp_required), ...] trié."""
     with get_conn() as conn:
@@ -326,6 +390,43 @@ def xp_get_levels_with_roles(guild_id: int) -> list[tuple[int, int, int | None]]
     return [(int(l), int(x), (int(r) if r is not None else None)) for (l, x, r) in rows]
 
 
+def _load_levels_entry(guild_id: int) -> tuple[tuple[int, int, int | None], ...]:
+    """Charge l'entrée de cache des niveaux d'une guild."""
+    return tuple(xp_get_levels_with_roles(guild_id))
+
+
+def xp_get_levels_with_roles_cached(guild_id: int) -> list[tuple[int, int, int | None]]:
+    """Comme `xp_get_levels_with_roles`, servi depuis le cache de la guild."""
+    return list(_LEVELS_CACHE.get_or_load(guild_id, _load_levels_entry))
+
+
+def xp_get_levels_cached(guild_id: int) -> list[tuple[int, int]]:
+    """Comme `xp_get_levels`, servi depuis le cache de la guild."""
+    return [(lvl, xp_req) for (lvl, xp_req, _) in _LEVELS_CACHE.get_or_load(guild_id, _load_levels_entry)]
+
+
+def xp_get_role_ids_cached(guild_id: int) -> dict[int, int]:
+    """Comme `xp_get_role_ids`, servi depuis le cache de la guild."""
+    entry = _LEVELS_CACHE.get_or_load(guild_id, _load_levels_entry)
+    return {lvl: role_id for (lvl, _, role_id) in entry if role_id is not None}
+
+
+def xp_load_all_levels(*, conn: Connection | None = None) -> dict[int, tuple[tuple[int, int, int | None], ...]]:
+    """Retourne {guild_id: ((level, xp_required, role_id), ...)} pour toutes les guilds, en une seule requête."""
+    if conn is None:
+        with get_conn() as conn2:
+            return xp_load_all_levels(conn=conn2)
+    rows = conn.execute(
+        "SELECT guild_id, level, xp_required, role_id FROM xp_levels ORDER BY guild_id, level"
+    ).fetchall()
+    grouped: dict[int, list[tuple[int, int, int | None]]] = {}
+    for gid, lvl, xp_req, role_id in rows:
+        grouped.setdefault(int(gid), []).append(
+            (int(lvl), int(xp_req), int(role_id) if role_id is not None else None)
+        )
+    return {gid: tuple(levels) for gid, levels in grouped.items()}
+
+
 def xp_set_level_threshold(guild_id: int, level: int, xp_required: int) -> None:
     """Lie (ou met à jour) le xp_required pour un niveau donné.
     
@@ -340,6 +441,7 @@ def xp_set_level_threshold(guild_id: int, level: int, xp_required: int) -> None:
             """,
             (guild_id, int(level), int(xp_required)),
         )
+    _LEVELS_CACHE.invalidate(guild_id)
 
 
 def xp_upsert_role_id(guild_id: int, level: int, role_id: int) -> None:
@@ -356,6 +458,7 @@ def xp_upsert_role_id(guild_id: int, level: int, role_id: int) -> None:
             """,
             (guild_id, int(level), int(role_id)),
         )
+    _LEVELS_CACHE.invalidate(guild_id)
 
 def xp_get_role_ids(guild_id: int) -> dict[int, int]:
     """Retourne {level: role_id} pour les niveaux qui ont un role_id non NULL."""
@@ -381,25 +484,15 @@ def xp_get_member(guild_id: int, user_id: int, *, conn: Connection | None = None
 
 def xp_set_member(guild_id: int, user_id: int, *, xp: int | None = None, last_xp_ts: int | None = None) -> None:
     """Update partiel de l'XP et du timestamp d'un membre. Crée la ligne si absente."""
-    sets = []
-    params = []
+    fields: dict[str, int] = {}
     if xp is not None:
-        sets.append("xp=?")
-        params.append(int(xp))
+        fields["xp"] = int(xp)
     if last_xp_ts is not None:
-        sets.append("last_xp_ts=?")
-        params.append(int(last_xp_ts))
-    if not sets:
+        fields["last_xp_ts"] = int(last_xp_ts)
+    if not fields:
         return
     with get_conn() as conn:
-        conn.execute(
-            "INSERT OR IGNORE INTO xp_members(guild_id, user_id) VALUES (?, ?)",
-            (guild_id, user_id),
-        )
-        conn.execute(
-            f"UPDATE xp_members SET {', '.join(sets)} WHERE guild_id=? AND user_id=?",
-            (*params, guild_id, user_id),
-        )
+        conn.execute(*upsert_sql("xp_members", {"guild_id": guild_id, "user_id": user_id}, fields))
 
 
 def xp_add_xp(
@@ -415,22 +508,17 @@ def xp_add_xp(
         with get_conn() as conn2:
             return xp_add_xp(guild_id, user_id, delta, set_last_xp_ts=set_last_xp_ts, conn=conn2)
 
-    conn.execute(
-        "INSERT OR IGNORE INTO xp_members(guild_id, user_id) VALUES (?, ?)",
-        (guild_id, user_id),
-    )
-    conn.execute(
-        "UPDATE xp_members SET xp = MAX(xp + ?, 0) WHERE guild_id=? AND user_id=?",
-        (int(delta), guild_id, user_id),
-    )
-    if set_last_xp_ts is not None:
-        conn.execute(
-            "UPDATE xp_members SET last_xp_ts=? WHERE guild_id=? AND user_id=?",
-            (int(set_last_xp_ts), guild_id, user_id),
-        )
+    # Une seule requête : création de la ligne si absente, ajout borné à 0 et lecture du nouvel XP
     row = conn.execute(
-        "SELECT xp FROM xp_members WHERE guild_id=? AND user_id=?",
-        (guild_id, user_id),
+        """
+        INSERT INTO xp_members(guild_id, user_id, xp, last_xp_ts)
+        VALUES (?1, ?2, MAX(?3, 0), COALESCE(?4, 0))
+        ON CONFLICT(guild_id, user_id) DO UPDATE SET
+            xp = MAX(xp + ?3, 0),
+            last_xp_ts = COALESCE(?4, last_xp_ts)
+        RETURNING xp
+        """,
+        (guild_id, user_id, int(delta), None if set_last_xp_ts is None else int(set_last_xp_ts)),
     ).fetchone()
     return int(row[0]) if row else 0
 
@@ -1,70 +1,41 @@
 """Module de définition du schéma de la base de données SQLite et de la logique de migration douce pour les anciennes versions."""
 
+import logging
+import re
+import time
 from sqlite3 import Connection
 
 from eldoria.db.connection import get_conn
 
+log = logging.getLogger(__name__)
 
-def _table_columns(conn: Connection, table: str) -> set[str]:
-    """Retourne la liste des colonnes d'une table (SQLite)."""
-    rows = conn.execute(f"PRAGMA table_info({table});").fetchall()
-    return {str(r[1]) for r in rows}
+# Version du schéma applicatif, enregistrée dans `PRAGMA user_version` (une base plus récente que le code est refusée à la restauration)
+SCHEMA_VERSION = 2
 
+# Tables à clé primaire composite, toujours lues par leur clé : stockées sans rowid (v2)
+WITHOUT_ROWID_TABLES: tuple[str, ...] = (
+    "reaction_roles",
+    "secret_roles",
+    "temp_voice_parents",
+    "temp_voice_active",
+    "xp_levels",
+    "xp_members",
+    "xp_voice_progress",
+)
+REBUILD_BATCH_ROWS = 5000
+AUTO_VACUUM_INCREMENTAL = 2
 
-def migrate_db() -> None:
-    """Effectue les migrations nécessaires pour mettre à jour une base de données existante vers le schéma actuel, sans perdre les données."""
-    with get_conn() as conn:
-        # --- xp_config : ajout des colonnes vocal si elles n'existent pas ---
-        cols = _table_columns(conn, "xp_config")
-        if cols:
-            # (name, sql_type, default_value)
-            wanted = [
-                ("voice_enabled", "INTEGER", "1"),
-                ("voice_xp_per_interval", "INTEGER", "1"),
-                ("voice_interval_seconds", "INTEGER", "180"),
-                ("voice_daily_cap_xp", "INTEGER", "100"),
-                ("voice_levelup_channel_id", "INTEGER", "0"),
-            ]
-
-            for name, sql_type, dflt in wanted:
-                if name not in cols:
-                    # NOT NULL + DEFAULT non-null est accepté par SQLite lors d'un ADD COLUMN
-                    conn.execute(
-                        f"ALTER TABLE xp_config ADD COLUMN {name} {sql_type} NOT NULL DEFAULT {dflt};"
-                    )
-
-            # Sécurise les vieilles lignes où SQLite pourrait laisser NULL
-            conn.execute("UPDATE xp_config SET voice_enabled=COALESCE(voice_enabled, 1);")
-            conn.execute("UPDATE xp_config SET voice_xp_per_interval=COALESCE(voice_xp_per_interval, 1);")
-            conn.execute("UPDATE xp_config SET voice_interval_seconds=COALESCE(voice_interval_seconds, 180);")
-            conn.execute("UPDATE xp_config SET voice_daily_cap_xp=COALESCE(voice_daily_cap_xp, 100);")
-            conn.execute("UPDATE xp_config SET voice_levelup_channel_id=COALESCE(voice_levelup_channel_id, 0);")
-
-        # --- tickets : conserve le numéro public pour les bases existantes ---
-        ticket_cols = _table_columns(conn, "tickets")
-        if ticket_cols and "ticket_number" not in ticket_cols:
-            # Nullable uniquement pour permettre la migration d'éventuelles anciennes lignes.
-            conn.execute("ALTER TABLE tickets ADD COLUMN ticket_number INTEGER;")
-
-        if ticket_cols:
-            conn.execute(
-                """
-                CREATE UNIQUE INDEX IF NOT EXISTS idx_tickets_guild_number
-                ON tickets(guild_id, ticket_number);
-                """
-            )
+SCHEMA_SQL = """
+        -- Sans effet sur une base existante : apply_schema la convertit une fois au démarrage (VACUUM)
+        PRAGMA auto_vacuum = INCREMENTAL;
 
-def init_db() -> None:
-    """Initialise la base de données en créant les tables nécessaires si elles n'existent pas, et effectue les migrations douces pour les anciennes versions."""
-    with get_conn() as conn:
-        conn.executescript("""
         CREATE TABLE IF NOT EXISTS reaction_roles (
 			guild_id    INTEGER NOT NULL,
 			message_id  INTEGER NOT NULL,
 			emoji       TEXT    NOT NULL,
 			role_id     INTEGER NOT NULL,
 			PRIMARY KEY (guild_id, message_id, emoji)
-        );
+        ) WITHOUT ROWID;
 
         CREATE TABLE IF NOT EXISTS secret_roles (
 			guild_id    INTEGER NOT NULL,
@@ -72,21 +43,21 @@ def init_db() -> None:
 			phrase      TEXT    NOT NULL,
 			role_id     INTEGER NOT NULL,
 			PRIMARY KEY (guild_id, channel_id, phrase)
-        );
+        ) WITHOUT ROWID;
 
         CREATE TABLE IF NOT EXISTS temp_voice_parents (
 			guild_id           INTEGER NOT NULL,
 			parent_channel_id  INTEGER NOT NULL,
 			user_limit         INTEGER NOT NULL,
 			PRIMARY KEY (guild_id, parent_channel_id)
-        );
+        ) WITHOUT ROWID;
 
         CREATE TABLE IF NOT EXISTS temp_voice_active (
 			guild_id           INTEGER NOT NULL,
 			parent_channel_id  INTEGER NOT NULL,
 			channel_id         INTEGER NOT NULL,
 			PRIMARY KEY (guild_id, parent_channel_id, channel_id)
-        );
+        ) WITHOUT ROWID;
 
         -- -------------------- Welcome message system --------------------          
         CREATE TABLE IF NOT EXISTS welcome_config (
@@ -133,7 +104,7 @@ def init_db() -> None:
 			xp_required   INTEGER NOT NULL,
 			role_id       INTEGER,              -- NULL tant que le rôle n'est pas créé/lié
 			PRIMARY KEY (guild_id, level)
-        );
+        ) WITHOUT ROWID;
 
         CREATE TABLE IF NOT EXISTS xp_members (
 			guild_id        INTEGER NOT NULL,
@@ -141,7 +112,7 @@ def init_db() -> None:
 			xp              INTEGER NOT NULL DEFAULT 0,
 			last_xp_ts      INTEGER NOT NULL DEFAULT 0,
 			PRIMARY KEY (guild_id, user_id)
-        );
+        ) WITHOUT ROWID;
 
         -- Progress vocal (cap journalier + buffer)
         CREATE TABLE IF NOT EXISTS xp_voice_progress (
@@ -153,7 +124,7 @@ def init_db() -> None:
 			bonus_cents     INTEGER NOT NULL DEFAULT 0,
 			xp_today        INTEGER NOT NULL DEFAULT 0,
 			PRIMARY KEY (guild_id, user_id)
-        );
+        ) WITHOUT ROWID;
                            
 		-- -------------------- Duel system --------------------
         CREATE TABLE IF NOT EXISTS duels (
@@ -180,6 +151,24 @@ def init_db() -> None:
         CREATE INDEX IF NOT EXISTS idx_duels_message
             ON duels(guild_id, channel_id, message_id);
 
+        -- Statistiques pré-agrégées par membre (conservées après le nettoyage des duels)
+        CREATE TABLE IF NOT EXISTS duel_stats (
+            guild_id        INTEGER NOT NULL,
+            user_id         INTEGER NOT NULL,
+            wins            INTEGER NOT NULL DEFAULT 0,
+            losses          INTEGER NOT NULL DEFAULT 0,
+            draws           INTEGER NOT NULL DEFAULT 0,
+            expired         INTEGER NOT NULL DEFAULT 0,
+            xp_won          INTEGER NOT NULL DEFAULT 0,
+            xp_lost         INTEGER NOT NULL DEFAULT 0,
+            last_duel_at    INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (guild_id, user_id)
+        );
+
+        -- Accélère le classement des duels par serveur
+        CREATE INDEX IF NOT EXISTS idx_duel_stats_leaderboard
+            ON duel_stats(guild_id, wins DESC);
+
         -- -------------------- Ticketing system --------------------
         CREATE TABLE IF NOT EXISTS ticketing_config (
             guild_id        INTEGER NOT NULL PRIMARY KEY,
@@ -206,10 +195,173 @@ def init_db() -> None:
             closed_at       INTEGER,
             UNIQUE (guild_id, ticket_number)
         );
-        """)
+        """
+
+
+def _table_columns(conn: Connection, table: str) -> set[str]:
+    """Retourne la liste des colonnes d'une table (SQLite)."""
+    rows = conn.execute(f"PRAGMA table_info({table});").fetchall()
+    return {str(r[1]) for r in rows}
+
+
+def migrate_conn(conn: Connection) -> None:
+    """Effectue, sur la connexion fournie, les migrations douces d'une base existante vers le schéma actuel, sans perdre les données."""
+    # --- xp_config : ajout des colonnes vocal si elles n'existent pas ---
+    cols = _table_columns(conn, "xp_config")
+    if cols:
+        # (name, sql_type, default_value)
+        wanted = [
+            ("voice_enabled", "INTEGER", "1"),
+            ("voice_xp_per_interval", "INTEGER", "1"),
+            ("voice_interval_seconds", "INTEGER", "180"),
+            ("voice_daily_cap_xp", "INTEGER", "100"),
+            ("voice_levelup_channel_id", "INTEGER", "0"),
+        ]
+
+        for name, sql_type, dflt in wanted:
+            if name not in cols:
+                # NOT NULL + DEFAULT non-null est accepté par SQLite lors d'un ADD COLUMN
+                conn.execute(
+                    f"ALTER TABLE xp_config ADD COLUMN {name} {sql_type} NOT NULL DEFAULT {dflt};"
+                )
+
+        # Sécurise les vieilles lignes où SQLite pourrait laisser NULL
+        conn.execute("UPDATE xp_config SET voice_enabled=COALESCE(voice_enabled, 1);")
+        conn.execute("UPDATE xp_config SET voice_xp_per_interval=COALESCE(voice_xp_per_interval, 1);")
+        conn.execute("UPDATE xp_config SET voice_interval_seconds=COALESCE(voice_interval_seconds, 180);")
+        conn.execute("UPDATE xp_config SET voice_daily_cap_xp=COALESCE(voice_daily_cap_xp, 100);")
+        conn.execute("UPDATE xp_config SET voice_levelup_channel_id=COALESCE(voice_levelup_channel_id, 0);")
 
-    # Migration douce pour DB déjà en prod (ajout de colonnes/tables manquantes)
-    migrate_db()
+    # --- tickets : conserve le numéro public pour les bases existantes ---
+    ticket_cols = _table_columns(conn, "tickets")
+    if ticket_cols and "ticket_number" not in ticket_cols:
+        # Nullable uniquement pour permettre la migration d'éventuelles anciennes lignes.
+        conn.execute("ALTER TABLE tickets ADD COLUMN ticket_number INTEGER;")
+
+    if ticket_cols:
+        conn.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_tickets_guild_number
+            ON tickets(guild_id, ticket_number);
+            """
+        )
+
+
+def _user_version(conn: Connection) -> int:
+    return int(conn.execute("PRAGMA user_version;").fetchone()[0])
+
+
+def _create_statement(table: str) -> str:
+    """Retourne le `CREATE TABLE` d'une table tel que défini par le schéma courant."""
+    match = re.search(rf"CREATE TABLE IF NOT EXISTS {table} \(.*?\)( WITHOUT ROWID)?;", SCHEMA_SQL, re.S)
+    if match is None:
+        raise KeyError(table)
+    return match.group(0)
+
+
+def _has_rowid(conn: Connection, table: str) -> bool:
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+    return row is not None and "WITHOUT ROWID" not in str(row[0]).upper()
+
+
+def rebuild_without_rowid(conn: Connection, table: str, *, batch_rows: int = REBUILD_BATCH_ROWS) -> int:
+    """Reconstruit une table à rowid en table WITHOUT ROWID (copie par lots puis échange), et retourne le nombre de lignes copiées.
+
+    La copie et l'échange se font dans un même point de sauvegarde : en cas d'échec, l'ancienne table reste en place.
+    """
+    tmp = f"{table}__rebuild"
+    conn.execute(f"SAVEPOINT rebuild_{table};")
+    try:
+        conn.execute(f"DROP TABLE IF EXISTS {tmp};")
+        conn.execute(_create_statement(table).replace(f"IF NOT EXISTS {table} ", f"{tmp} ", 1))
+        # Colonnes communes : une colonne absente de l'ancienne table prend sa valeur par défaut
+        columns = ", ".join(sorted(_table_columns(conn, tmp) & _table_columns(conn, table)))
+        copied = 0
+        last_rowid = -1
+        while True:
+            row = conn.execute(
+                f"""
+                SELECT COUNT(*), MAX(rowid) FROM (
+                    SELECT rowid FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT ?
+                )
+                """,
+                (last_rowid, batch_rows),
+            ).fetchone()
+            if not row[0]:
+                break
+            conn.execute(
+                f"INSERT INTO {tmp}({columns}) SELECT {columns} FROM {table} WHERE rowid > ? AND rowid <= ?",
+                (last_rowid, row[1]),
+            )
+            copied += int(row[0])
+            last_rowid = int(row[1])
+        conn.execute(f"DROP TABLE {table};")
+        conn.execute(f"ALTER TABLE {tmp} RENAME TO {table};")
+    except BaseException:
+        conn.execute(f"ROLLBACK TO rebuild_{table};")
+        conn.execute(f"RELEASE rebuild_{table};")
+        raise
+    conn.execute(f"RELEASE rebuild_{table};")
+    return copied
+
+
+def migrate_without_rowid(conn: Connection) -> dict[str, int]:
+    """Migration v2 : reconstruit en WITHOUT ROWID les tables à clé composite encore stockées avec rowid.
+
+    Retourne le nombre de lignes copiées par table reconstruite.
+    """
+    return {table: rebuild_without_rowid(conn, table) for table in WITHOUT_ROWID_TABLES if _has_rowid(conn, table)}
+
+
+def enable_incremental_vacuum(conn: Connection) -> bool:
+    """Passe en `auto_vacuum = INCREMENTAL` une base créée sans, et retourne True si elle a été convertie.
+
+    La conversion demande un VACUUM complet (réécriture de tout le fichier) : elle n'est faite qu'une fois, avant
+    la connexion au gateway, pour que la maintenance quotidienne ne fasse ensuite que des vacuums incrémentaux bornés.
+    """
+    if int(conn.execute("PRAGMA auto_vacuum;").fetchone()[0]) == AUTO_VACUUM_INCREMENTAL:
+        return False
+    # VACUUM est impossible dans une transaction ouverte
+    if conn.in_transaction:
+        conn.commit()
+    started = time.perf_counter()
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+    conn.execute("VACUUM;")
+    log.info("🔁 Base convertie en auto_vacuum incrémental en %.2f s (VACUUM complet, une seule fois)", time.perf_counter() - started)
+    return True
+
+
+def migrate_db() -> None:
+    """Effectue les migrations nécessaires pour mettre à jour une base de données existante vers le schéma actuel, sans perdre les données."""
+    with get_conn() as conn:
+        migrate_conn(conn)
+
+
+def apply_schema(conn: Connection) -> None:
+    """Crée les tables manquantes puis migre la base ouverte par `conn` (ex: fichier restauré, avant sa mise en place)."""
+    conn.executescript(SCHEMA_SQL)
+    migrate_conn(conn)
+    if _user_version(conn) < 2:
+        rebuilt = migrate_without_rowid(conn)
+        if rebuilt:
+            log.info(
+                "🔁 Tables reconstruites sans rowid : %s",
+                ", ".join(f"{table} ({rows} lignes)" for table, rows in rebuilt.items()),
+            )
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
+    enable_incremental_vacuum(conn)
+
+
+def table_names() -> frozenset[str]:
+    """Retourne les noms des tables définies par le schéma."""
+    return frozenset(re.findall(r"CREATE TABLE IF NOT EXISTS (\w+)", SCHEMA_SQL))
+
+
+def init_db() -> None:
+    """Initialise la base de données en créant les tables nécessaires si elles n'existent pas, et effectue les migrations douces pour les anciennes versions."""
+    with get_conn() as conn:
+        # Migration douce pour DB déjà en prod (ajout de colonnes/tables manquantes)
+        apply_schema(conn)
 
     # NB: les valeurs par défaut pour les niveaux/config XP
     # sont initialisées côté bot (au démarrage) car on a besoin
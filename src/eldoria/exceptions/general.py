@@ -42,6 +42,22 @@ class InvalidMessageId(AppError):
 class DatabaseRestoreError(AppError):
     """Erreur lors du remplacement de la base de données."""
 
+class InvalidDatabaseFile(AppError):
+    """La base de données fournie pour une restauration est corrompue ou incompatible avec le schéma du bot."""
+
+    def __init__(self, reason: str) -> None:
+        """Initialise l'exception avec la raison du rejet."""
+        super().__init__(f"Base de données refusée : {reason}")
+        self.reason = reason
+
+class InvalidBackupManifest(AppError):
+    """Le manifeste d'une sauvegarde en plusieurs parties est invalide, ou une partie est manquante ou corrompue."""
+
+    def __init__(self, reason: str) -> None:
+        """Initialise l'exception avec la raison du rejet."""
+        super().__init__(f"Manifeste de sauvegarde invalide : {reason}")
+        self.reason = reason
+
 class LogFileNotFound(AppError):
     """Le fichier de log est introuvable."""
 
@@ -23,6 +23,12 @@ def general_error_message(e: exc.AppError) -> str:
         
         case exc.DatabaseRestoreError():
             return "❌ Une erreur est survenue lors du remplacement de la base de données."
+
+        case exc.InvalidDatabaseFile(reason=reason):
+            return f"❌ Base de données refusée : {reason}."
+
+        case exc.InvalidBackupManifest(reason=reason):
+            return f"❌ Sauvegarde en plusieurs parties invalide : {reason}."
         
         case exc.GuildNotFound(guild_id=guild_id):
             return f"❌ Impossible de retrouver le serveur {guild_id}."
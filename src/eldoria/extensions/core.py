@@ -3,24 +3,38 @@
 Gère les événements fondamentaux tels que la connexion, les messages, les commandes de base (help, ping, version) et les erreurs d'application.
 """
 
+import asyncio
 import logging
+import math
 import time
 
 import discord
 from discord.ext import commands
 
 from eldoria.app.bot import EldoriaBot
+from eldoria.app.profiler import finish_profiling, get_profiler
+from eldoria.app.run_tests import run_tests_in_background
+from eldoria.config import LOOP_WATCHDOG_MS, METRICS_HOST, METRICS_PORT, STARTUP_TESTS
 from eldoria.exceptions.base import AppError
 from eldoria.exceptions.general import XpDisabled
 from eldoria.exceptions.ui.messages import app_error_message
-from eldoria.ui.help.view import send_help_menu
 from eldoria.ui.version.embeds import build_version_embed
 from eldoria.ui.xp.embeds.status import build_xp_status_embed
+from eldoria.utils import metrics
 from eldoria.utils.interactions import reply_ephemeral, reply_ephemeral_embed
+from eldoria.utils.lazy import lazy_import
 from eldoria.utils.mentions import level_mention
 
 log = logging.getLogger(__name__)
 
+# Menu d'aide : chargé au premier /help (index des commandes + JSON d'aide)
+send_help_menu = lazy_import("eldoria.ui.help.view", "send_help_menu")
+# Registre des ressources JSON : chargé à on_ready, pour le préchargement
+preload_resources = lazy_import("eldoria.json_tools.resources", "preload_resources")
+# Synchronisation des commandes et watchdog de boucle : utilisés une fois, à on_ready
+sync_commands_if_changed = lazy_import("eldoria.app.command_sync", "sync_commands_if_changed")
+start_watchdog = lazy_import("eldoria.app.loop_watchdog", "start_watchdog")
+
 class Core(commands.Cog):
     """Cog de base pour le bot Eldoria.
     
@@ -32,8 +46,25 @@ class Core(commands.Cog):
         self.bot = bot
         self.xp = self.bot.services.xp
         self.role = self.bot.services.role
+        self._tests_task: asyncio.Task | None = None
+        self._metrics_server: asyncio.Server | None = None
+        metrics.register_collector(self._collect_metrics)
+
+    def _collect_metrics(self) -> None:
+        """Met à jour les jauges calculées à la demande (guilds connectées, latence du gateway)."""
+        metrics.REGISTRY.gauge("eldoria_guilds", "Nombre de serveurs connectés.").set(len(self.bot.guilds))
+        latency = getattr(self.bot, "latency", None)
+        if isinstance(latency, (int, float)) and math.isfinite(latency):
+            metrics.REGISTRY.gauge("eldoria_gateway_latency_seconds", "Latence du heartbeat du gateway.").set(latency)
 
     # -------------------- Lifecycle --------------------
+    @commands.Cog.listener()
+    async def on_connect(self) -> None:
+        """Événement déclenché à la connexion au gateway : marque le premier événement gateway en mode profilage."""
+        profiler = get_profiler()
+        if profiler is not None:
+            profiler.mark("on_connect")
+
     @commands.Cog.listener()
     async def on_ready(self) -> None:
         """Événement déclenché lorsque le bot est prêt et connecté à Discord. Synchronise les commandes et affiche les temps de chargement."""
@@ -41,11 +72,20 @@ class Core(commands.Cog):
             return
         self.bot._booted = True
 
+        profiler = get_profiler()
+        if profiler is not None:
+            profiler.mark("on_ready")
+
         try:
-            await self.bot.sync_commands()
+            # Évite les appels REST de synchronisation quand l'arbre de commandes n'a pas changé
+            await sync_commands_if_changed(self.bot)
         except Exception:
             log.exception("Erreur lors de la synchronisation des commandes")
             
+        self._bootstrap_guilds()
+        self._warm_caches()
+        self._preload_resources()
+
         started_at = getattr(self.bot, "_started_at", time.perf_counter())
         discord_started_at = getattr(self.bot, "_discord_started_at", time.perf_counter())
         
@@ -56,8 +96,77 @@ class Core(commands.Cog):
         log.info("✅ %s %.2fs", "Bot opérationnel en", total_time)
         log.info("🤖 Connecté en tant que %s (%d guilds)", self.bot.user, len(self.bot.guilds))
 
+        if profiler is not None:
+            profiler.mark("commandes synchronisées")
+            finish_profiling()
+
+        if LOOP_WATCHDOG_MS > 0:
+            start_watchdog(LOOP_WATCHDOG_MS)
+
+        if METRICS_PORT is not None and self._metrics_server is None:
+            await self._start_metrics_server()
+
+        # Auto-tests hors du chemin critique : lancés dans un thread une fois le bot opérationnel
+        if STARTUP_TESTS == "background":
+            self._tests_task = asyncio.create_task(run_tests_in_background(logger=log))
+
+    def _bootstrap_guilds(self) -> None:
+        """Crée en une transaction les configurations par défaut manquantes de toutes les guilds connues."""
+        start = time.perf_counter()
+        try:
+            guild_ids = [g.id for g in self.bot.guilds]
+            count = self.bot.services.bootstrap.bootstrap_guilds(guild_ids)
+        except Exception:
+            log.exception("❌ %-50s %8.1f ms", "Initialisation des guilds", (time.perf_counter() - start) * 1000)
+            return
+        log.info("✅ %-53s %8.1f ms", f"Initialisation des guilds ({count})", (time.perf_counter() - start) * 1000)
+
+    async def _start_metrics_server(self) -> None:
+        """Démarre l'endpoint HTTP des métriques (erreurs journalisées, sans bloquer le démarrage)."""
+        try:
+            self._metrics_server = await metrics.start_http_server(METRICS_PORT, METRICS_HOST)
+        except OSError:
+            log.exception("❌ Impossible d'exposer les métriques sur %s:%s", METRICS_HOST, METRICS_PORT)
+
+    def _warm_caches(self) -> None:
+        """Précharge les caches de configuration de toutes les guilds connues (une requête par table)."""
+        start = time.perf_counter()
+        try:
+            report = self.bot.services.bootstrap.warm_caches(g.id for g in self.bot.guilds)
+        except Exception:
+            log.exception("❌ %-50s %8.1f ms", "Préchargement des caches", (time.perf_counter() - start) * 1000)
+            return
+        label = f"Préchargement des caches ({report.total_rows} lignes, {len(report.rows)} tables)"
+        log.info("✅ %-53s %8.1f ms", label, report.ms)
+        log.debug("Lignes préchargées par table : %s", report.rows)
+
+    def _preload_resources(self) -> None:
+        """Compile les ressources JSON (duels, help, bienvenue) : les commandes ne lisent plus aucun fichier."""
+        start = time.perf_counter()
+        try:
+            loaded = preload_resources()
+        except Exception:
+            log.exception("❌ %-50s %8.1f ms", "Compilation des ressources JSON", (time.perf_counter() - start) * 1000)
+            return
+        label = f"Compilation des ressources JSON ({sum(loaded.values())}/{len(loaded)})"
+        log.info("✅ %-53s %8.1f ms", label, (time.perf_counter() - start) * 1000)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        """Événement déclenché à l'arrivée sur un serveur : crée ses configurations par défaut."""
+        try:
+            self.bot.services.bootstrap.ensure_guild(guild.id)
+        except Exception:
+            log.exception("Erreur lors de l'initialisation de la guild %s", guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        """Événement déclenché au départ d'un serveur : l'oublie (réinitialisé s'il est rejoint à nouveau)."""
+        self.bot.services.bootstrap.forget(guild.id)
+
     # -------------------- Messages (router) --------------------
     @commands.Cog.listener()
+    @metrics.timed_event("on_message")
     async def on_message(self, message: discord.Message) -> None:
         """Événement déclenché à la réception d'un message.
         
@@ -136,6 +245,17 @@ class Core(commands.Cog):
         await ctx.followup.send(embed=embed, files=files, ephemeral=True)
 
 
+    # -------------------- Métriques des commandes --------------------
+    @commands.Cog.listener()
+    async def on_application_command(self, ctx: discord.ApplicationContext) -> None:
+        """Événement déclenché à la réception d'une commande slash : démarre la mesure de sa durée."""
+        metrics.command_started(ctx)
+
+    @commands.Cog.listener()
+    async def on_application_command_completion(self, ctx: discord.ApplicationContext) -> None:
+        """Événement déclenché à la fin réussie d'une commande slash : enregistre sa durée."""
+        metrics.command_finished(ctx, "ok")
+
     # -------------------- Errors --------------------
     @commands.Cog.listener()
     async def on_application_command_error(self, interaction: discord.Interaction, error: Exception) -> None:
@@ -144,6 +264,7 @@ class Core(commands.Cog):
         Gère les erreurs courantes telles que les permissions manquantes, les rôles requis, les vérifications échouées,
         et fournit des messages d'erreur clairs et adaptés à l'utilisateur.
         """
+        metrics.command_finished(interaction, "error")
         err = getattr(error, "original", error)
 
         # --- Cas particulier : XP désactivé -> embed ---
@@ -0,0 +1,98 @@
+"""Cog de maintenance quotidienne de la base de données SQLite.
+
+Une fois par jour, à une heure creuse (`DB_MAINTENANCE_TIME`), purge les lignes périmées (progrès vocaux
+inactifs, tickets fermés anciens), met à jour les statistiques du planificateur de requêtes et rend au
+système les pages libres par vacuum incrémental. Tout le travail se fait dans un thread.
+"""
+import asyncio
+import logging
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
+
+from discord.ext import commands, tasks
+
+from eldoria.app.bot import EldoriaBot
+from eldoria.config import (
+    AUTO_SAVE_TZ,
+    CLOSED_TICKETS_RETENTION_DAYS,
+    DB_MAINTENANCE_ENABLED,
+    DB_MAINTENANCE_TIME,
+    DB_VACUUM_PAGES,
+    VOICE_PROGRESS_RETENTION_DAYS,
+)
+from eldoria.utils.metrics import timed_loop
+
+log = logging.getLogger(__name__)
+
+
+class DbMaintenance(commands.Cog):
+    """Cog de maintenance quotidienne de la base : purges de rétention, statistiques et vacuum incrémental."""
+
+    def __init__(self, bot: EldoriaBot) -> None:
+        """Initialise le cog avec le service de sauvegarde et démarre la loop si l'horaire est valide."""
+        self.bot = bot
+        self.save = self.bot.services.save
+        self._last_run_date = None
+
+        self._maintenance_time = self._parse_time(DB_MAINTENANCE_TIME) if DB_MAINTENANCE_ENABLED else None
+        if self._maintenance_time is not None:
+            self.daily_maintenance.start()
+
+    def _parse_time(self, value: str) -> time | None:
+        """Parse un horaire HH:MM et retourne un datetime.time avec tzinfo."""
+        try:
+            hh, mm = value.strip().split(":", 1)
+            return time(hour=int(hh), minute=int(mm), tzinfo=ZoneInfo(AUTO_SAVE_TZ))
+        except Exception:
+            log.warning(
+                "Configuration DB_MAINTENANCE_TIME invalide (%s). "
+                "Format attendu : HH:MM (ex: 04:30) ou off. "
+                "La maintenance de la base est désactivée.",
+                value,
+            )
+            return None
+
+    async def run_maintenance(self) -> None:
+        """Lance une maintenance complète de la base dans un thread (les erreurs sont journalisées)."""
+        try:
+            await asyncio.to_thread(
+                self.save.run_maintenance,
+                vacuum_pages=DB_VACUUM_PAGES,
+                voice_retention_days=VOICE_PROGRESS_RETENTION_DAYS,
+                tickets_retention_days=CLOSED_TICKETS_RETENTION_DAYS,
+            )
+        except Exception:
+            log.exception("❌ Échec de la maintenance de la base")
+
+    # -------- Loop --------
+    @tasks.loop(minutes=1)
+    @timed_loop("db_maintenance")
+    async def daily_maintenance(self) -> None:
+        """Lance la maintenance une fois par jour à l'heure configurée."""
+        configured_time = self._maintenance_time
+        if configured_time is None:
+            return
+
+        now = datetime.now(tz=configured_time.tzinfo)
+        if now.hour != configured_time.hour or now.minute != configured_time.minute:
+            return
+
+        # Évite les doublons (boucle qui repasse plusieurs fois dans la même minute)
+        if self._last_run_date == now.date():
+            return
+        self._last_run_date = now.date()
+
+        await self.run_maintenance()
+
+    @daily_maintenance.before_loop
+    async def _wait_until_ready(self) -> None:
+        await self.bot.wait_until_ready()
+
+    def cog_unload(self) -> None:
+        """Arrête la loop de maintenance lors du déchargement du cog."""
+        self.daily_maintenance.cancel()
+
+
+def setup(bot: EldoriaBot) -> None:
+    """Fonction de setup pour ajouter le cog DbMaintenance au bot."""
+    bot.add_cog(DbMaintenance(bot))
@@ -0,0 +1,177 @@
+"""Module pour les commandes de diagnostic et d'exploitation du bot Eldoria (réservées à l'admin)."""
+
+import io
+import logging
+
+import discord
+from discord.ext import commands
+
+from eldoria.app.bot import EldoriaBot
+from eldoria.config import DIAGNOSTICS_ENABLED, SAVE_GUILD_ID, get_diagnostics_admin_id
+from eldoria.utils import metrics
+from eldoria.utils.guards import require_feature_enabled, require_specific_user_id
+from eldoria.utils.lazy import lazy_import
+
+log = logging.getLogger(__name__)
+
+# Outils de diagnostic : chargés seulement quand l'admin lance la commande correspondante
+sync_commands_if_changed = lazy_import("eldoria.app.command_sync", "sync_commands_if_changed")
+get_rest_stats = lazy_import("eldoria.app.http_stats", "get_rest_stats")
+get_watchdog = lazy_import("eldoria.app.loop_watchdog", "get_watchdog")
+sample_stacks = lazy_import("eldoria.app.runtime_profiler", "sample_stacks")
+memory_diff = lazy_import("eldoria.app.runtime_profiler", "memory_diff")
+profiling_busy = lazy_import("eldoria.app.runtime_profiler", "profiling_busy")
+
+
+class Diagnostics(commands.Cog):
+    """Cog regroupant les commandes de diagnostic du bot (synchronisation des commandes...)."""
+
+    def __init__(self, bot: EldoriaBot) -> None:
+        """Initialise le cog Diagnostics avec une référence au bot."""
+        self.bot = bot
+
+        self.diagnostics_enabled: bool = DIAGNOSTICS_ENABLED
+        if self.diagnostics_enabled:
+            self.admin_user_id: int = get_diagnostics_admin_id()
+
+    def _require_admin(self, ctx: discord.ApplicationContext) -> None:
+        """Vérifie que les diagnostics sont activés et que l'utilisateur est l'admin du bot."""
+        require_feature_enabled(self.diagnostics_enabled, "diagnostics")
+        require_specific_user_id(ctx, self.admin_user_id)
+
+    # === Commands ===
+    @commands.slash_command(
+        name="sync_commands",
+        description="(Admin) Synchronise les commandes slash avec Discord.",
+        guild_ids=[SAVE_GUILD_ID] if SAVE_GUILD_ID else None,
+    )
+    @discord.option(
+        "force", bool, description="Ignorer le hash et forcer un remplacement complet.", required=False, default=False
+    )
+    async def sync_commands_command(self, ctx: discord.ApplicationContext, force: bool = False) -> None:
+        """Commande slash /sync_commands : synchronise les commandes si l'arbre a changé, ou systématiquement avec `force`."""
+        await ctx.defer(ephemeral=True)
+        self._require_admin(ctx)
+
+        log.info("Synchronisation des commandes demandée par %s (force=%s)", ctx.user.name, force)
+        synced = await sync_commands_if_changed(self.bot, force=force)
+
+        if synced:
+            await ctx.followup.send("✅ Commandes synchronisées avec Discord.", ephemeral=True)
+        else:
+            await ctx.followup.send(
+                "⏭️ Commandes inchangées depuis la dernière synchronisation. Utilise `force` pour forcer.",
+                ephemeral=True,
+            )
+
+    @commands.slash_command(
+        name="metrics",
+        description="(Admin) Affiche la latence des handlers et le débit des événements.",
+        guild_ids=[SAVE_GUILD_ID] if SAVE_GUILD_ID else None,
+    )
+    async def metrics_command(self, ctx: discord.ApplicationContext) -> None:
+        """Commande slash /metrics : résumé p99/débit et export Prometheus complet en pièce jointe."""
+        await ctx.defer(ephemeral=True)
+        self._require_admin(ctx)
+
+        export = discord.File(io.BytesIO(metrics.render_prometheus().encode("utf-8")), filename="metrics.txt")
+        summary = "\n".join(metrics.summarize()) or "Aucune mesure enregistrée pour l'instant."
+        await ctx.followup.send(f"```\n{summary[:1900]}\n```", file=export, ephemeral=True)
+
+    @commands.slash_command(
+        name="loop_lag",
+        description="(Admin) Affiche le retard de la boucle asyncio et les pires appels bloquants.",
+        guild_ids=[SAVE_GUILD_ID] if SAVE_GUILD_ID else None,
+    )
+    async def loop_lag_command(self, ctx: discord.ApplicationContext) -> None:
+        """Commande slash /loop_lag : quantiles du retard de la boucle, pires blocages et pile du pire."""
+        await ctx.defer(ephemeral=True)
+        self._require_admin(ctx)
+
+        watchdog = get_watchdog()
+        if watchdog is None:
+            await ctx.followup.send("⏭️ Surveillance de la boucle désactivée (`LOOP_WATCHDOG_MS=0`).", ephemeral=True)
+            return
+
+        summary = "\n".join(watchdog.summary())
+        offenders = watchdog.top_offenders(1)
+        if not offenders:
+            await ctx.followup.send(f"```\n{summary[:1900]}\n```", ephemeral=True)
+            return
+
+        stack = discord.File(io.BytesIO(offenders[0].last_stack.encode("utf-8")), filename="loop_lag_stack.txt")
+        await ctx.followup.send(f"```\n{summary[:1900]}\n```", file=stack, ephemeral=True)
+
+    @commands.slash_command(
+        name="rest_stats",
+        description="(Admin) Affiche les appels REST Discord par route, feature et guild, et les limites de débit.",
+        guild_ids=[SAVE_GUILD_ID] if SAVE_GUILD_ID else None,
+    )
+    @discord.option("guild_id", str, description="Limiter les routes à un serveur (ID).", required=False, default=None)
+    async def rest_stats_command(self, ctx: discord.ApplicationContext, guild_id: str | None = None) -> None:
+        """Commande slash /rest_stats : routes les plus appelées (globalement ou pour un serveur), features et 429."""
+        await ctx.defer(ephemeral=True)
+        self._require_admin(ctx)
+
+        try:
+            gid = int(guild_id) if guild_id else None
+        except ValueError:
+            await ctx.followup.send("❌ ID de serveur invalide.", ephemeral=True)
+            return
+
+        summary = "\n".join(get_rest_stats().summary(gid))
+        await ctx.followup.send(f"```\n{summary[:1900]}\n```", ephemeral=True)
+
+    @commands.slash_command(
+        name="profile",
+        description="(Admin) Échantillonne les piles du bot pendant quelques secondes (piles repliées pour flamegraph).",
+        guild_ids=[SAVE_GUILD_ID] if SAVE_GUILD_ID else None,
+    )
+    @discord.option(
+        "duration", int, description="Durée en secondes (1-60).", required=False, default=10, min_value=1, max_value=60
+    )
+    @discord.option(
+        "all_threads", bool, description="Échantillonner tous les threads, pas seulement la boucle.", required=False, default=False
+    )
+    async def profile_command(self, ctx: discord.ApplicationContext, duration: int = 10, all_threads: bool = False) -> None:
+        """Commande slash /profile : profil par échantillonnage, renvoyé en piles repliées."""
+        await ctx.defer(ephemeral=True)
+        self._require_admin(ctx)
+        if profiling_busy():
+            await ctx.followup.send("⏭️ Un profilage est déjà en cours.", ephemeral=True)
+            return
+
+        log.info("Profilage par échantillonnage demandé par %s (%d s, tous threads=%s)", ctx.user.name, duration, all_threads)
+        profile = await sample_stacks(duration, all_threads=all_threads)
+
+        summary = "\n".join(profile.summary())
+        export = discord.File(io.BytesIO(profile.collapsed().encode("utf-8")), filename="profile.collapsed.txt")
+        await ctx.followup.send(f"```\n{summary[:1900]}\n```", file=export, ephemeral=True)
+
+    @commands.slash_command(
+        name="memory_snapshot",
+        description="(Admin) Compare deux instantanés mémoire (tracemalloc) pris à quelques secondes d'intervalle.",
+        guild_ids=[SAVE_GUILD_ID] if SAVE_GUILD_ID else None,
+    )
+    @discord.option(
+        "duration", int, description="Intervalle en secondes (5-300).", required=False, default=30, min_value=5, max_value=300
+    )
+    async def memory_snapshot_command(self, ctx: discord.ApplicationContext, duration: int = 30) -> None:
+        """Commande slash /memory_snapshot : croissance des allocations par module pendant l'intervalle."""
+        await ctx.defer(ephemeral=True)
+        self._require_admin(ctx)
+        if profiling_busy():
+            await ctx.followup.send("⏭️ Un profilage est déjà en cours.", ephemeral=True)
+            return
+
+        log.info("Instantané mémoire demandé par %s (%d s)", ctx.user.name, duration)
+        diff = await memory_diff(duration)
+
+        summary = "\n".join(diff.summary())
+        export = discord.File(io.BytesIO(diff.report().encode("utf-8")), filename="memory_diff.txt")
+        await ctx.followup.send(f"```\n{summary[:1900]}\n```", file=export, ephemeral=True)
+
+
+def setup(bot: EldoriaBot) -> None:
+    """Fonction de setup pour ajouter le cog Diagnostics au bot."""
+    bot.add_cog(Diagnostics(bot))
@@ -4,21 +4,34 @@ Permet de défier un autre membre, d'accepter ou refuser le duel, et gère les r
 ainsi que les conséquences sur l'XP des joueurs.
 Inclut également une loop pour annuler les duels expirés et mettre à jour l'interface utilisateur en conséquence.
 """
+import asyncio
 import logging
+from collections import defaultdict
 
 import discord
 from discord.ext import commands, tasks
 
 from eldoria.app.bot import EldoriaBot
 from eldoria.exceptions.base import AppError
+from eldoria.ui.common.pagination import Paginator
+from eldoria.ui.duels.dispatcher import dispatch_duel_interaction
 from eldoria.ui.duels.flow.home import HomeView, build_home_duels_embed
 from eldoria.ui.duels.result.expired import build_expired_duels_embed
-from eldoria.utils.discord_utils import get_member_by_id_or_raise, get_text_or_thread_channel
+from eldoria.utils.discord_utils import get_member_by_id_or_raise, get_partial_message
 from eldoria.utils.guards import require_guild_ctx, require_not_bot, require_not_self
+from eldoria.utils.lazy import lazy_import
+from eldoria.utils.metrics import timed_loop
 from eldoria.utils.timestamp import now_ts
 
 log = logging.getLogger(__name__)
 
+# Embeds de statistiques : chargés à la première commande /duel_stats ou /duel_leaderboard
+build_duel_stats_embed = lazy_import("eldoria.ui.duels.stats", "build_duel_stats_embed")
+build_duel_leaderboard_embed = lazy_import("eldoria.ui.duels.stats", "build_duel_leaderboard_embed")
+
+# Nombre maximal de salons dont les messages de duels expirés sont édités en parallèle.
+EXPIRED_UI_MAX_CONCURRENCY = 4
+
 class Duels(commands.Cog):
     """Cog gérant les duels entre membres, avec des paris d'XP.
     
@@ -38,11 +51,13 @@ class Duels(commands.Cog):
 
     # -------------------- Loops --------------------
     @tasks.loop(hours=24)
+    @timed_loop("duel_maintenance")
     async def maintenance_cleanup(self) -> None:
         """Loop de maintenance quotidienne pour nettoyer les duels expirés et autres données obsolètes."""
         self.duel.cleanup_old_duels(now_ts())
 
     @tasks.loop(seconds=15)
+    @timed_loop("duel_expiration")
     async def clear_expired_duels_loop(self) -> None:
         """Loop régulière pour annuler les duels expirés.
         
@@ -52,30 +67,24 @@ class Duels(commands.Cog):
         # 1) Service (DB) : transition vers EXPIRED + refunds éventuels
         expired = self.duel.cancel_expired_duels()
 
-        # 2) UI : éditer uniquement les messages associés
+        if not expired:
+            return
+
+        # 2) UI : éditer uniquement les messages associés.
+        # Regroupés par salon : séquentiel dans un même salon (même bucket de rate limit),
+        # salons différents en parallèle avec une concurrence bornée.
+        by_channel: dict[int, list[dict]] = defaultdict(list)
         for info in expired:
-            try:
-                await self._apply_expired_ui(info)
-            except AppError as e:
-                log.warning(
-                    "Une erreur s'est produite lors de l'application de l'UI des duels expirés (duel_id=%s)",
-                    info.get("duel_id"),
-                    exc_info=e,
-                )
-                continue
-
-            except Exception:
-                log.exception(
-                    "Une erreur inattendue s'est produite lors de l'application de l'UI des duels expirés (duel_id=%s)",
-                    info.get("duel_id"),
-                )
-                continue
-            
-            if info.get("xp_changed"):
-                guild = self.bot.get_guild(info["guild_id"])
-                if guild is None:
-                    continue
-                await self.xp.sync_xp_roles_for_users(guild, info.get("sync_roles_user_ids", []))
+            by_channel[int(info.get("channel_id") or 0)].append(info)
+
+        semaphore = asyncio.Semaphore(EXPIRED_UI_MAX_CONCURRENCY)
+
+        async def _process_channel(infos: list[dict]) -> None:
+            async with semaphore:
+                for info in infos:
+                    await self._process_expired(info)
+
+        await asyncio.gather(*(_process_channel(infos) for infos in by_channel.values()))
 
 
     @maintenance_cleanup.before_loop
@@ -88,7 +97,43 @@ class Duels(commands.Cog):
         """Attente que le bot soit prêt avant de démarrer la loop de nettoyage des duels expirés."""
         await self.bot.wait_until_ready()
 
+    # -------------------- Events --------------------
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction) -> None:
+        """Route les clics sur les boutons de duel (`custom_id` = `duel:<id>:<action>[:<arg>]`) vers leur handler.
+
+        Les boutons de duel ne sont portés par aucune view enregistrée : ils restent actifs après un redémarrage.
+        """
+        await dispatch_duel_interaction(interaction, self.bot)
+
     # -------------------- Helpers --------------------
+    async def _process_expired(self, info: dict) -> None:
+        """Applique l'UI d'un duel expiré puis resynchronise les rôles XP si l'XP a changé (erreurs journalisées, jamais propagées)."""
+        try:
+            await self._apply_expired_ui(info)
+        except discord.NotFound:
+            log.info("Message du duel expiré introuvable, édition ignorée (duel_id=%s)", info.get("duel_id"))
+            return
+        except AppError as e:
+            log.warning(
+                "Une erreur s'est produite lors de l'application de l'UI des duels expirés (duel_id=%s)",
+                info.get("duel_id"),
+                exc_info=e,
+            )
+            return
+        except Exception:
+            log.exception(
+                "Une erreur inattendue s'est produite lors de l'application de l'UI des duels expirés (duel_id=%s)",
+                info.get("duel_id"),
+            )
+            return
+
+        if info.get("xp_changed"):
+            guild = self.bot.get_guild(info["guild_id"])
+            if guild is None:
+                return
+            await self.xp.sync_xp_roles_for_users(guild, info.get("sync_roles_user_ids", []))
+
     async def _apply_expired_ui(self, info: dict) -> None:
         """Édite le message du duel pour afficher l'état EXPIRED.
 
@@ -115,10 +160,8 @@ class Duels(commands.Cog):
             game_type=str(info.get("game_type") or ""),
         )
 
-        channel = await get_text_or_thread_channel(bot=self.bot, channel_id=int(channel_id))
-        message = await channel.fetch_message(int(message_id))
-
-        # On supprime les boutons : view=None
+        # Message partiel : aucun GET (ni salon ni message), un seul PATCH. On supprime les boutons : view=None
+        message = get_partial_message(self.bot, int(channel_id), int(message_id))
         await message.edit(content="", embed=embed, view=None)
 
 
@@ -152,6 +195,44 @@ class Duels(commands.Cog):
         embed, files = await build_home_duels_embed(expires_at)
         await ctx.followup.send(embed=embed, files=files, view=HomeView(bot=self.bot, duel_id=duel_id), ephemeral=True)
 
+    @commands.slash_command(name="duel_stats", description="Affiche les statistiques de duel d'un membre.")
+    @discord.option("member", discord.Member, description="Membre dont afficher les statistiques (toi par défaut)", required=False)
+    async def duel_stats_command(self, ctx: discord.ApplicationContext, member: discord.Member | None = None) -> None:
+        """Commande slash /duel_stats : affiche les statistiques de duel d'un membre (ou de l'utilisateur).
+
+        Lit les statistiques pré-agrégées (victoires, défaites, égalités, XP gagnée/perdue) et affiche un embed récapitulatif.
+        """
+        await ctx.defer(ephemeral=True)
+
+        guild, _channel = require_guild_ctx(ctx)
+        user = member or ctx.user
+
+        stats = self.duel.get_stats(guild.id, user.id)
+        embed, files = await build_duel_stats_embed(user=user, stats=stats)
+        await ctx.followup.send(embed=embed, files=files, ephemeral=True)
+
+    @commands.slash_command(name="duel_leaderboard", description="Affiche le classement des duels du serveur.")
+    async def duel_leaderboard_command(self, ctx: discord.ApplicationContext) -> None:
+        """Commande slash /duel_leaderboard : affiche le classement des duels du serveur.
+
+        Lit les statistiques pré-agrégées et affiche un embed paginé classant les membres par nombre de victoires.
+        """
+        await ctx.defer(ephemeral=True)
+
+        guild, _channel = require_guild_ctx(ctx)
+        guild_id = guild.id
+
+        items = self.duel.get_leaderboard(guild_id, limit=200, offset=0)
+
+        paginator = Paginator(
+            items=items,
+            embed_generator=build_duel_leaderboard_embed,
+            identifiant_for_embed=guild_id,
+            bot=self.bot,
+        )
+        embed, files = await paginator.create_embed()
+        await ctx.followup.send(embed=embed, files=files, view=paginator)
+
 def setup(bot: EldoriaBot) -> None:
     """Fonction d'initialisation du cog Duels, appelée lors du chargement de l'extension."""
     bot.add_cog(Duels(bot))
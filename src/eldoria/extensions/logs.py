@@ -1,5 +1,9 @@
 """Module pour les commandes liées aux logs du bot Eldoria."""
+import asyncio
+import gzip
+import io
 import logging
+from datetime import datetime, timedelta
 
 import discord
 from discord.ext import commands
@@ -7,10 +11,23 @@ from discord.ext import commands
 from eldoria.app.bot import EldoriaBot
 from eldoria.config import LOG_ENABLED, SAVE_GUILD_ID, get_log_admin_id
 from eldoria.utils.guards import require_feature_enabled, require_specific_user_id
-from eldoria.utils.reader import tail_lines
+from eldoria.utils.reader import LogQuery, search_logs, tail_lines
 
 log = logging.getLogger(__name__)
 
+# Au-delà de cette taille, le résultat est envoyé compressé (gzip)
+GZIP_THRESHOLD_BYTES = 256 * 1024
+LOG_LEVEL_CHOICES = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+
+def _build_attachment(content: str, filename: str) -> discord.File:
+    """Construit la pièce jointe du résultat, compressée en gzip si elle est volumineuse."""
+    data = content.encode("utf-8", errors="replace")
+    if len(data) > GZIP_THRESHOLD_BYTES:
+        return discord.File(fp=io.BytesIO(gzip.compress(data)), filename=f"{filename}.gz")
+    return discord.File(fp=io.BytesIO(data), filename=filename)
+
+
 class Logs(commands.Cog):
     """Cog pour les commandes liées aux logs du bot."""
 
@@ -49,25 +66,60 @@ class Logs(commands.Cog):
 
 
     # === Commands ===
-    @commands.slash_command(name="logs", description="Envoie la fin du dernier fichier de log du bot dans ce salon.", 
+    @commands.slash_command(name="logs", description="Envoie la fin des logs du bot, éventuellement filtrés, dans ce salon.", 
                             guild_ids=[SAVE_GUILD_ID] if SAVE_GUILD_ID else None)
-    async def logs_command(self, ctx: discord.ApplicationContext) -> None:
-        """Commande slash pour envoyer la fin du dernier fichier de log du bot dans le salon."""
+    @discord.option("lines", int, description="Nombre de lignes (ou d'enregistrements si filtré).", required=False, default=200, min_value=1, max_value=5000)
+    @discord.option("level", str, description="Niveau minimal.", required=False, default=None, choices=LOG_LEVEL_CHOICES)
+    @discord.option("logger", str, description="Préfixe du nom de logger (ex: eldoria.extensions.xp_voice).", required=False, default=None)
+    @discord.option("text", str, description="Texte recherché (insensible à la casse).", required=False, default=None)
+    @discord.option("since_minutes", int, description="Seulement les logs des N dernières minutes.", required=False, default=None, min_value=1)
+    @discord.option("until_minutes", int, description="Seulement les logs antérieurs à N minutes.", required=False, default=None, min_value=0)
+    async def logs_command(
+        self,
+        ctx: discord.ApplicationContext,
+        lines: int = 200,
+        level: str | None = None,
+        logger: str | None = None,
+        text: str | None = None,
+        since_minutes: int | None = None,
+        until_minutes: int | None = None,
+    ) -> None:
+        """Commande slash pour envoyer la fin des logs du bot (fichiers de rotation compris), filtrés à la demande.
+
+        La lecture se fait à rebours depuis la fin des fichiers, dans un thread ; les gros résultats sont envoyés compressés.
+        """
         await ctx.defer(ephemeral=True)
         
         require_feature_enabled(self._enabled(), "logs")
         require_specific_user_id(ctx, self.admin_user_id)
         
         log.info("Utilisation de la commande logs par %s", ctx.user.name)
-        
-        content = tail_lines()
+
+        now = datetime.now()
+        query = LogQuery(
+            level=level,
+            logger=logger,
+            text=text,
+            since=now - timedelta(minutes=since_minutes) if since_minutes is not None else None,
+            until=now - timedelta(minutes=until_minutes) if until_minutes is not None else None,
+            limit=lines,
+        )
+
+        if query.is_filtered():
+            records = await asyncio.to_thread(search_logs, query)
+            if not records:
+                await ctx.followup.send("Aucun enregistrement ne correspond à ces critères.", ephemeral=True)
+                return
+            content = "\n".join(r.text for r in records)
+            filename = "bot.log.search.txt"
+        else:
+            content = await asyncio.to_thread(tail_lines, maxlen=lines)
+            filename = "bot.log.tail.txt"
 
         # Discord limite ~2000 chars / message
         if len(content) > 1900:
             # renvoyer en fichier texte si trop long
-            import io
-            data = content.encode("utf-8", errors="replace")
-            file = discord.File(fp=io.BytesIO(data), filename="bot.log.tail.txt")
+            file = await asyncio.to_thread(_build_attachment, content, filename)
             await ctx.followup.send(file=file, ephemeral=True)
         else:
             await ctx.followup.send(f"```text\n{content}\n```", ephemeral=True)
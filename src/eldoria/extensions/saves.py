@@ -1,13 +1,20 @@
 """Cog de gestion des sauvegardes de la base de données SQLite.
 
-Permet d'envoyer une copie du fichier .db dans un channel Discord à la demande ou automatiquement à un horaire défini.
+Permet d'envoyer une copie compressée du fichier .db dans un channel Discord à la demande ou automatiquement à un horaire défini
+(l'envoi automatique est ignoré si la base n'a pas changé depuis la dernière sauvegarde envoyée).
 Inclut des commandes pour faire une sauvegarde manuelle et pour remplacer la base de données par un fichier .db fourni via un message Discord.
+Une sauvegarde plus grosse que la limite des pièces jointes est envoyée en plusieurs parties suivies d'un manifeste,
+que `/insert_db` sait réassembler.
 """
 import asyncio
+import io
 import logging
 import os
+import shutil
+from dataclasses import replace
 from datetime import datetime, time
 from pathlib import Path
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 import discord
@@ -18,16 +25,23 @@ from eldoria.config import (
     AUTO_SAVE_ENABLED,
     AUTO_SAVE_TIME,
     AUTO_SAVE_TZ,
+    BACKUP_CHUNK_MB,
+    BACKUP_DIR,
+    BACKUP_KEEP,
     SAVE_ENABLED,
     SAVE_GUILD_ID,
     get_save_admin_id,
     get_save_channel_id,
     get_save_guild_id,
 )
-from eldoria.exceptions.general import InvalidMessageId
+from eldoria.exceptions.general import InvalidBackupManifest, InvalidMessageId
 from eldoria.utils.db_validation import is_valid_sqlite_db
 from eldoria.utils.discord_utils import get_text_or_thread_channel
 from eldoria.utils.guards import require_feature_enabled, require_specific_user_id
+from eldoria.utils.metrics import timed_loop
+
+if TYPE_CHECKING:
+    from eldoria.features.save.save_service import BackupArtifact
 
 log = logging.getLogger(__name__)
 
@@ -84,42 +98,134 @@ class Saves(commands.Cog):
             )
             return None
 
-    async def _send_db_backup(self, *, channel: discord.abc.Messageable, reason: str) -> None:
-        """Fait une sauvegarde temporaire et envoie le .db dans le channel."""
+    async def _send_db_backup(self, *, channel: discord.abc.Messageable, reason: str, force: bool = True) -> bool:
+        """Crée une sauvegarde compressée et l'envoie dans le channel.
+
+        Sans `force`, l'envoi est ignoré si le contenu de la base est identique à celui de la dernière sauvegarde envoyée.
+        Retourne True si une sauvegarde a été envoyée.
+        """
         db_path = self.save.get_db_path()
 
         if not os.path.exists(db_path):
             log.warning("Sauvegarde DB impossible : fichier introuvable (%s)", db_path)
             await channel.send("Fichier DB introuvable !")
-            return
-
-        tmp_backup = "./temp_eldoria_backup.db"
+            return False
 
         try:
-            await asyncio.to_thread(self.save.backup_to_file, tmp_backup)
+            artifact = await asyncio.to_thread(self.save.create_backup, BACKUP_DIR, BACKUP_KEEP)
         except Exception:
-            log.exception("Échec lors de la création de la sauvegarde temporaire.")
-            return
+            log.exception("Échec lors de la création de la sauvegarde.")
+            return False
 
-        filename = f"Eldoria_{datetime.now().strftime('%Y%m%d')}.db"
+        if not force and artifact.sha256 == self.save.last_uploaded_hash(BACKUP_DIR):
+            log.info("⏭️ Sauvegarde non envoyée : base inchangée depuis le dernier envoi (%s)", artifact.short_hash)
+            return False
 
         try:
-            with open(tmp_backup, "rb") as f:
-                await channel.send(
-                    content=reason,
-                    file=discord.File(f, filename=filename),
-                )
+            chunk_size = self._chunk_size(channel)
+            if artifact.size <= chunk_size:
+                with open(artifact.path, "rb") as f:
+                    await channel.send(
+                        content=reason,
+                        file=discord.File(f, filename=artifact.filename),
+                    )
+            else:
+                await self._send_chunked_backup(channel=channel, artifact=artifact, reason=reason, chunk_size=chunk_size)
         except Exception:
             log.exception("Échec lors de l'envoi du fichier de sauvegarde.")
-            return
+            return False
+
+        self.save.mark_uploaded(BACKUP_DIR, artifact.sha256)
+        log.info(
+            "✅ Sauvegarde envoyée : %s (%.1f Kio, %.1f Kio non compressée)",
+            artifact.filename,
+            artifact.size / 1024,
+            artifact.raw_size / 1024,
+        )
+        return True
+
+    def _chunk_size(self, channel: discord.abc.Messageable) -> int:
+        """Taille maximale d'une pièce jointe de sauvegarde : `BACKUP_CHUNK_MB`, bornée par la limite de la guild."""
+        chunk_size = BACKUP_CHUNK_MB * 1024 * 1024
+        limit = getattr(getattr(channel, "guild", None), "filesize_limit", None)
+        if isinstance(limit, int) and limit > 0:
+            chunk_size = min(chunk_size, limit)
+        return chunk_size
+
+    async def _send_chunked_backup(
+        self, *, channel: discord.abc.Messageable, artifact: "BackupArtifact", reason: str, chunk_size: int
+    ) -> None:
+        """Envoie une sauvegarde en plusieurs parties (un message par partie), puis son manifeste."""
+        parts_dir = Path(BACKUP_DIR) / ".upload"
+        parts = await asyncio.to_thread(self.save.split_backup, artifact, str(parts_dir), chunk_size)
+        try:
+            sent = []
+            for chunk, path in parts:
+                with open(path, "rb") as f:
+                    msg = await channel.send(
+                        content=f"Partie {chunk.index + 1}/{len(parts)} de {artifact.filename}",
+                        file=discord.File(f, filename=chunk.filename),
+                    )
+                sent.append(replace(chunk, message_id=msg.id))
+            manifest = await asyncio.to_thread(self.save.build_manifest, artifact, sent)
+            await channel.send(
+                content=f"{reason}\nSauvegarde en {len(parts)} parties : `/insert_db` avec l'id de ce message pour la restaurer.",
+                file=discord.File(io.BytesIO(manifest.to_json().encode("utf-8")), filename=manifest.filename),
+            )
         finally:
-            try:
-                os.remove(tmp_backup)
-            except OSError:
-                log.warning("Impossible de supprimer le fichier temporaire (%s)", tmp_backup)
+            shutil.rmtree(parts_dir, ignore_errors=True)
+
+    async def _download_backup(self, *, attachment: discord.Attachment, data_dir: Path) -> Path:
+        """Télécharge une sauvegarde `.db` (ou `.db.gz`, décompressée) à côté de la base et retourne le fichier `.db`."""
+        tmp_new = data_dir / f"temp_{attachment.filename}"
+        await attachment.save(tmp_new)
+        if not tmp_new.name.lower().endswith(".gz"):
+            return tmp_new
+
+        tmp_gz, tmp_new = tmp_new, tmp_new.with_name(tmp_new.name[:-3])
+        try:
+            await asyncio.to_thread(self.save.decompress_backup, str(tmp_gz), str(tmp_new))
+        except Exception:
+            tmp_new.unlink(missing_ok=True)
+            raise
+        finally:
+            tmp_gz.unlink(missing_ok=True)
+        return tmp_new
+
+    async def _assemble_chunked_backup(
+        self, *, channel: discord.abc.Messageable, manifest_attachment: discord.Attachment, data_dir: Path
+    ) -> Path:
+        """Télécharge sur disque les parties listées par un manifeste, les vérifie et réassemble la base dans `data_dir`."""
+        parts_dir = data_dir / "temp_restore_parts"
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            manifest_path = parts_dir / manifest_attachment.filename
+            await manifest_attachment.save(manifest_path)
+            text = await asyncio.to_thread(manifest_path.read_text, "utf-8")
+            manifest = self.save.parse_manifest(text)
+
+            parts: list[Path] = []
+            for chunk in manifest.chunks:
+                if chunk.message_id is None:
+                    raise InvalidBackupManifest(f"message de la partie {chunk.index + 1} inconnu")
+                part_msg = await channel.fetch_message(chunk.message_id)
+                part = next((a for a in getattr(part_msg, "attachments", None) or [] if a.filename == chunk.filename), None)
+                if part is None:
+                    raise InvalidBackupManifest(f"partie {chunk.index + 1} introuvable")
+                path = parts_dir / chunk.filename
+                await part.save(path)
+                parts.append(path)
+
+            tmp_new = data_dir / f"temp_{manifest.db_filename}"
+            await asyncio.to_thread(self.save.assemble_backup, manifest, parts, str(tmp_new))
+            log.info("✅ Sauvegarde en %d parties réassemblée et vérifiée (%s)", len(parts), manifest.archive)
+            return tmp_new
+        finally:
+            shutil.rmtree(parts_dir, ignore_errors=True)
 
     # -------- Loop --------
     @tasks.loop(minutes=1)
+    @timed_loop("auto_save")
     async def auto_save(self) -> None:
         """Envoie automatiquement la DB une fois par jour à l'heure configurée."""
         if not self._enabled() or not self._auto_enabled():
@@ -144,6 +250,7 @@ class Saves(commands.Cog):
         await self._send_db_backup(
             channel=channel,
             reason="Sauvegarde automatique quotidienne du fichier SQLite.",
+            force=False,
         )
 
         self._last_auto_save_date = now.date()
@@ -181,19 +288,22 @@ class Saves(commands.Cog):
             await ctx.followup.send(content="❌ DB introuvable.")
             return
 
-        await self._send_db_backup(
+        sent = await self._send_db_backup(
             channel=channel,
             reason="Sauvegarde du fichier SQLite suite à une demande.",
         )
 
+        if not sent:
+            await ctx.followup.send(content="❌ Échec de la sauvegarde (voir les logs).")
+            return
         await ctx.followup.send(content="✅ DB bien envoyée !")
 
 
     @commands.slash_command(name="insert_db", description="Remplace la base de données SQLite par celle fournie (message_id dans le channel de save)", 
                             guild_ids=[SAVE_GUILD_ID] if SAVE_GUILD_ID else None,)
-    @discord.option("message_id", str, description="Id du message contenant le fichier .db")
+    @discord.option("message_id", str, description="Id du message contenant le fichier .db ou .db.gz")
     async def insert_db_command(self, ctx: discord.ApplicationContext, message_id: str) -> None:
-        """Commande slash /insert_db : remplace la base de données SQLite par un fichier .db fourni via un message Discord.
+        """Commande slash /insert_db : remplace la base de données SQLite par un fichier .db (ou .db.gz) fourni via un message Discord.
         
         Vérifie les permissions de l'utilisateur, la configuration de la fonctionnalité, la validité du message et du fichier attaché,
         puis remplace la base de données par le nouveau fichier après vérification qu'il s'agit d'une base de données SQLite valide.
@@ -214,21 +324,29 @@ class Saves(commands.Cog):
             return
 
         attachment = msg.attachments[0]
+        is_manifest = self.save.is_manifest_filename(attachment.filename)
 
-        if not await is_valid_sqlite_db(attachment):
-            await ctx.followup.send(content="❌ Le fichier fourni n'est pas une base de données SQLite valide (.db).")
+        if not is_manifest and not await is_valid_sqlite_db(attachment):
+            await ctx.followup.send(content="❌ Le fichier fourni n'est pas une base de données SQLite valide (.db ou .db.gz).")
             return
 
         db_path = Path(self.save.get_db_path())  # convertit en Path
         data_dir = db_path.parent
         data_dir.mkdir(parents=True, exist_ok=True)
 
-        tmp_new = data_dir / f"temp_{attachment.filename}"
-        await attachment.save(tmp_new)
+        if is_manifest:
+            tmp_new = await self._assemble_chunked_backup(channel=channel, manifest_attachment=attachment, data_dir=data_dir)
+        else:
+            tmp_new = await self._download_backup(attachment=attachment, data_dir=data_dir)
 
         try:
-            await asyncio.to_thread(self.save.replace_db_file, str(tmp_new))
-            self.save.init_db()
+            # Contrôle d'intégrité, migration et échange hors de la boucle ; les caches de l'ancienne base
+            # sont vidés sous le verrou de la base, dans la foulée de l'échange
+            await asyncio.to_thread(self.save.restore_db_file, str(tmp_new), self.bot.services.bootstrap.reset)
+            # La nouvelle base peut ne pas contenir les configurations par défaut des guilds actuelles
+            guild_ids = [g.id for g in self.bot.guilds]
+            await asyncio.to_thread(self.bot.services.bootstrap.bootstrap_guilds, guild_ids)
+            await asyncio.to_thread(self.bot.services.bootstrap.warm_caches, guild_ids)
         finally:
             if tmp_new.exists():
                 try:
@@ -12,12 +12,17 @@ from discord.ext import commands
 from eldoria.app.bot import EldoriaBot
 from eldoria.features.temp_voice.naming import build_temp_voice_channel_name
 from eldoria.ui.common.pagination import Paginator
-from eldoria.ui.temp_voice.home import TempVoiceHomeView, build_tempvoice_home_embed
 from eldoria.ui.temp_voice.list import build_list_temp_voice_parents_embed
 from eldoria.utils.guards import require_guild_ctx
+from eldoria.utils.lazy import lazy_import
+from eldoria.utils.metrics import timed_event
 
 log = logging.getLogger(__name__)
 
+# Panel de configuration (ajout / retrait des parents) : chargé à la première ouverture
+TempVoiceHomeView = lazy_import("eldoria.ui.temp_voice.home", "TempVoiceHomeView")
+build_tempvoice_home_embed = lazy_import("eldoria.ui.temp_voice.home", "build_tempvoice_home_embed")
+
 class TempVoice(commands.Cog):
     """Cog de gestion des salons vocaux temporaires.
     
@@ -38,6 +43,7 @@ class TempVoice(commands.Cog):
 
     # -------------------- Events --------------------
     @commands.Cog.listener()
+    @timed_event("on_voice_state_update")
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState) -> None:
         """Événement déclenché lorsqu'un utilisateur rejoint, quitte ou se déplace entre des salons vocaux.
         
@@ -10,12 +10,15 @@ import discord
 from discord.ext import commands
 
 from eldoria.app.bot import EldoriaBot
-from eldoria.ui.ticketing.panel import TicketingAdminView
 from eldoria.ui.ticketing.create_view import TicketCreateView
 from eldoria.utils.guards import require_guild_ctx
+from eldoria.utils.lazy import lazy_import
 
 log = logging.getLogger(__name__)
 
+# Panel de configuration : chargé à la première ouverture
+TicketingAdminView = lazy_import("eldoria.ui.ticketing.panel", "TicketingAdminView")
+
 
 class Ticketing(commands.Cog):
     def __init__(self, bot: EldoriaBot) -> None:
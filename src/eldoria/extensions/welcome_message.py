@@ -10,11 +10,14 @@ from discord.ext import commands
 
 from eldoria.app.bot import EldoriaBot
 from eldoria.ui.welcome.embeds import build_welcome_embed
-from eldoria.ui.welcome.panel import WelcomePanelView
 from eldoria.utils.guards import require_guild_ctx
+from eldoria.utils.lazy import lazy_import
 
 log = logging.getLogger(__name__)
 
+# Panel de configuration : chargé à la première ouverture
+WelcomePanelView = lazy_import("eldoria.ui.welcome.panel", "WelcomePanelView")
+
 class WelcomeMessage(commands.Cog):
     """Cog de gestion des messages de bienvenue, permettant d'envoyer un message personnalisé lorsqu'un nouveau membre rejoint un serveur.
     
@@ -14,16 +14,19 @@ from discord.ext import commands
 
 from eldoria.app.bot import EldoriaBot
 from eldoria.ui.common.pagination import Paginator
-from eldoria.ui.xp.admin.menu import XpAdminMenuView
 from eldoria.ui.xp.embeds.leaderboard import build_list_xp_embed
 from eldoria.ui.xp.embeds.profile import build_xp_profile_embed
 from eldoria.ui.xp.embeds.roles import build_xp_roles_embed
 from eldoria.ui.xp.embeds.status import build_xp_status_embed
 from eldoria.utils.guards import require_guild_ctx, require_not_bot
+from eldoria.utils.lazy import lazy_import
 from eldoria.utils.mentions import level_label
 
 log = logging.getLogger(__name__)
 
+# Panel admin XP (menus, modals, niveaux) : chargé à la première ouverture
+XpAdminMenuView = lazy_import("eldoria.ui.xp.admin.menu", "XpAdminMenuView")
+
 LEVEL_RE = re.compile(r"^level\s*(\d+)\b", re.IGNORECASE)
 
 class Xp(commands.Cog):
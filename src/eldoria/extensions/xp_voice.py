@@ -11,6 +11,7 @@ from discord.ext import commands, tasks
 
 from eldoria.app.bot import EldoriaBot
 from eldoria.utils.mentions import level_mention
+from eldoria.utils.metrics import timed_event, timed_loop
 from eldoria.utils.timestamp import now_ts
 
 log = logging.getLogger(__name__)
@@ -73,6 +74,7 @@ class XpVoice(commands.Cog):
             log.exception("Erreur lors de l'arrêt de la loop de vérification régulière pour l'XP vocal.")
 
     @tasks.loop(minutes=1)
+    @timed_loop("voice_xp")
     async def voice_xp_loop(self) -> None:
         """Boucle régulière pour attribuer de l'XP aux membres présents dans les salons vocaux.
         
@@ -170,6 +172,7 @@ class XpVoice(commands.Cog):
         await self.bot.wait_until_ready()
 
     @commands.Cog.listener()
+    @timed_event("on_voice_state_update")
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState) -> None:
         """Évite les gains pendant les périodes inéligibles.
 
@@ -0,0 +1,36 @@
+"""Initialisation groupée des configurations par défaut des guilds (XP, bienvenue, ticketing).
+
+Les guilds déjà initialisées sont retenues par `eldoria.db.cache` pour que les chemins chauds (commandes /xp,
+événements vocaux, boucle d'XP vocal) n'aient plus à réécrire leurs valeurs par défaut à chaque appel.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from eldoria.db import cache
+from eldoria.db.connection import get_conn
+from eldoria.db.repo import ticketing_repo, welcome_message_repo, xp_repo
+
+
+def bootstrap_guilds(guild_ids: Iterable[int]) -> int:
+    """Crée en une seule transaction les configurations par défaut manquantes des guilds, et retourne le nombre de guilds traitées."""
+    ids = sorted({int(gid) for gid in guild_ids})
+    if not ids:
+        return 0
+
+    with get_conn() as conn:
+        xp_repo.xp_ensure_defaults_many(ids, conn=conn)
+        welcome_message_repo.wm_ensure_defaults_many(ids, conn=conn)
+        ticketing_repo.tk_ensure_defaults_many(ids, conn=conn)
+
+    cache.mark_bootstrapped(ids)
+    return len(ids)
+
+
+def ensure_guild(guild_id: int) -> bool:
+    """Initialise la guild si ce n'est pas déjà fait, et retourne True si une écriture a eu lieu."""
+    if cache.is_bootstrapped(guild_id):
+        return False
+    bootstrap_guilds([guild_id])
+    return True
@@ -0,0 +1,73 @@
+"""Préchargement des caches par guild (eldoria.db.cache) avec une requête par table.
+
+Sans préchargement, chaque guild paie une requête par table au premier événement qui la concerne :
+après un redémarrage, la première minute de trafic est nettement plus lente que le régime établi.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from eldoria.db.cache import guild_cache
+from eldoria.db.connection import get_conn
+from eldoria.db.repo import (
+    reaction_roles_repo,
+    secret_roles_repo,
+    temp_voice_repo,
+    ticketing_repo,
+    welcome_message_repo,
+    xp_repo,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheWarmup:
+    """Résultat d'un préchargement : lignes chargées par table, guilds couvertes et durée."""
+
+    rows: dict[str, int]
+    guilds: int
+    ms: float
+
+    @property
+    def total_rows(self) -> int:
+        """Nombre total de lignes chargées, toutes tables confondues."""
+        return sum(self.rows.values())
+
+
+def _one_row(_value: Any) -> int:
+    return 1
+
+
+# (cache, chargement groupé, valeur d'une guild sans ligne ou None pour la laisser au chargement paresseux, lignes par entrée)
+# Les configs absentes ne sont pas préremplies : leur lecture paresseuse crée la ligne par défaut.
+_TABLES: tuple[tuple[str, Callable[..., dict[int, Any]], Callable[[], Any] | None, Callable[[Any], int]], ...] = (
+    ("xp_config", xp_repo.xp_load_all_configs, None, _one_row),
+    ("xp_levels", xp_repo.xp_load_all_levels, tuple, len),
+    ("secret_roles", secret_roles_repo.sr_load_all, dict, len),
+    ("reaction_roles", reaction_roles_repo.rr_load_all, dict, len),
+    ("temp_voice_parents", temp_voice_repo.tv_load_all_parents, dict, len),
+    ("temp_voice_active", temp_voice_repo.tv_load_all_active, dict, len),
+    ("welcome_config", welcome_message_repo.wm_load_all_configs, None, _one_row),
+    ("ticketing_config", ticketing_repo.tk_load_all_configs, None, _one_row),
+)
+
+
+def warm_caches(guild_ids: Iterable[int]) -> CacheWarmup:
+    """Charge en mémoire l'état de chaque table pour les guilds fournies (une requête par table, une transaction)."""
+    ids = {int(gid) for gid in guild_ids}
+    rows: dict[str, int] = {}
+    start = time.perf_counter()
+
+    with get_conn() as conn:
+        for name, load_all, empty, count in _TABLES:
+            data = load_all(conn=conn)
+            entries = {gid: data[gid] for gid in ids if gid in data}
+            if empty is not None:
+                entries.update({gid: empty() for gid in ids - entries.keys()})
+            guild_cache(name).fill(entries)
+            rows[name] = sum(count(value) for value in entries.values())
+
+    return CacheWarmup(rows=rows, guilds=len(ids), ms=(time.perf_counter() - start) * 1000)
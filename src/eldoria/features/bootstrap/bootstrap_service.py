@@ -0,0 +1,49 @@
+"""Service d'initialisation des guilds : garantit une fois par guild les configurations par défaut de toutes les fonctionnalités."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from eldoria.db import cache
+from eldoria.utils.lazy import lazy_import
+from eldoria.utils.metrics import instrument_service
+
+if TYPE_CHECKING:
+    from eldoria.features.bootstrap._internal.warmup import CacheWarmup
+
+# Initialisation et préchargement : chargés au premier on_ready / guild rejointe, pas au chargement des extensions
+bootstrap_guilds = lazy_import("eldoria.features.bootstrap._internal.guilds", "bootstrap_guilds")
+ensure_guild = lazy_import("eldoria.features.bootstrap._internal.guilds", "ensure_guild")
+warm_caches = lazy_import("eldoria.features.bootstrap._internal.warmup", "warm_caches")
+
+
+@instrument_service("bootstrap")
+@dataclass(slots=True)
+class BootstrapService:
+    """Façade applicative de l'initialisation des guilds (au démarrage et à l'arrivée sur un serveur)."""
+
+    def bootstrap_guilds(self, guild_ids: Iterable[int]) -> int:
+        """Crée en une transaction les configurations par défaut manquantes, et retourne le nombre de guilds traitées."""
+        return bootstrap_guilds(guild_ids)
+
+    def warm_caches(self, guild_ids: Iterable[int]) -> CacheWarmup:
+        """Précharge les caches de configuration des guilds (une requête par table) et retourne le bilan."""
+        return warm_caches(guild_ids)
+
+    def ensure_guild(self, guild_id: int) -> bool:
+        """Initialise la guild si nécessaire (sans accès à la base si c'est déjà fait)."""
+        return ensure_guild(guild_id)
+
+    def is_bootstrapped(self, guild_id: int) -> bool:
+        """Indique si la guild a déjà été initialisée dans ce processus."""
+        return cache.is_bootstrapped(guild_id)
+
+    def forget(self, guild_id: int) -> None:
+        """Oublie une guild et ses caches (elle sera réinitialisée si le bot la rejoint à nouveau)."""
+        cache.invalidate_guild(guild_id)
+
+    def reset(self) -> None:
+        """Oublie toutes les guilds et vide les caches (à appeler après un remplacement de la base)."""
+        cache.clear_all()
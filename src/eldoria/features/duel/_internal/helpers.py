@@ -9,6 +9,7 @@ from eldoria.db.repo.duel_repo import get_duel_by_id, transition_status, update_
 from eldoria.db.repo.xp_repo import xp_add_xp, xp_get_member
 from eldoria.exceptions import duel as exc
 from eldoria.features.duel import constants
+from eldoria.features.duel._internal.stats import record_duel_result
 from eldoria.utils.timestamp import now_ts
 
 
@@ -33,7 +34,7 @@ def finish_duel(duel_id: int, result: str, *, ignore_expired: bool=False) -> Non
     player_b_id = duel["player_b_id"]
     stake_xp = duel["stake_xp"]
 
-    # Transaction: status + payout + finished_at dans la même connexion
+    # Transaction: status + payout + finished_at + statistiques dans la même connexion
     with get_conn() as conn:
         if not transition_status(
             duel_id,
@@ -57,14 +58,17 @@ def finish_duel(duel_id: int, result: str, *, ignore_expired: bool=False) -> Non
             case _:
                 raise exc.InvalidResult(result)
 
+        finished_at = now_ts()
         if not update_duel_if_status(
             duel_id,
             required_status=constants.DUEL_STATUS_FINISHED,
-            finished_at=now_ts(),
+            finished_at=finished_at,
             conn=conn,
         ):
             raise exc.DuelNotFinished(duel_id, constants.DUEL_STATUS_FINISHED)
-        
+
+        # Statistiques pré-agrégées : même transaction que le payout
+        record_duel_result(guild_id, player_a_id, player_b_id, result, stake_xp, finished_at, conn=conn)
 
 
 
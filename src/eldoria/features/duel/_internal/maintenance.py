@@ -1,13 +1,15 @@
 """Module de fonctions de maintenance pour les duels, notamment la gestion de l'expiration des duels et le nettoyage des anciens duels dans la base de données."""
 
 import logging
+from sqlite3 import Row
 from typing import Any
 
 from eldoria.db.connection import get_conn
 from eldoria.db.repo import duel_repo
+from eldoria.db.repo.duel_stats_repo import DUEL_STATS_COLUMNS, ds_is_empty, ds_replace_all
 from eldoria.exceptions.duel import DuelAlreadyHandled, DuelNotFinishable
 from eldoria.features.duel import constants
-from eldoria.features.duel._internal import helpers
+from eldoria.features.duel._internal import helpers, stats
 from eldoria.features.duel._internal.gameplay import (
     is_duel_complete_for_game,
     resolve_duel_for_game,
@@ -80,10 +82,12 @@ def cancel_expired_duels() -> list[dict[str, Any]]:
             ):
                 continue
 
+            # Même horodatage pour la colonne et les statistiques : la reconstruction relit `finished_at`
+            finished_at = now_ts()
             duel_repo.update_duel_if_status(
                 duel_id,
                 required_status=constants.DUEL_STATUS_EXPIRED,
-                finished_at=now_ts(),
+                finished_at=finished_at,
                 conn=conn,
             )
 
@@ -114,6 +118,7 @@ def cancel_expired_duels() -> list[dict[str, Any]]:
             stake_xp = duel["stake_xp"]
 
             helpers.modify_xp_for_players(guild_id, player_a_id, player_b_id, stake_xp, conn=conn)
+            stats.record_duel_expired(guild_id, player_a_id, player_b_id, finished_at, conn=conn)
 
     return expired
 
@@ -127,3 +132,70 @@ def cleanup_old_duels(now_ts: int) -> None:
         cutoff_short=cutoff_short,
         cutoff_finished=cutoff_finished,
     )
+
+
+def _was_accepted(duel: Row) -> bool:
+    """Retourne True si un duel expiré avait été accepté (la baseline XP n'est posée qu'à l'acceptation)."""
+    return "xp_baseline" in helpers.load_payload_any(duel)
+
+
+def rebuild_duel_stats() -> int:
+    """Reconstruit entièrement la table des statistiques à partir des duels FINISHED/EXPIRED encore en base.
+
+    Retourne le nombre de lignes (membres) écrites. Les duels dont le résultat ne peut pas être résolu sont ignorés.
+    """
+    with get_conn() as conn:
+        duels = duel_repo.list_duels_with_status(
+            (constants.DUEL_STATUS_FINISHED, constants.DUEL_STATUS_EXPIRED),
+            conn=conn,
+        )
+
+        totals: dict[tuple[int, int], dict[str, int]] = {}
+
+        def add(guild_id: int, user_id: int, deltas: dict[str, int], played_at: int) -> None:
+            row = totals.setdefault(
+                (guild_id, user_id),
+                {**dict.fromkeys(DUEL_STATS_COLUMNS, 0), "last_duel_at": 0},
+            )
+            for key, value in deltas.items():
+                row[key] += value
+            row["last_duel_at"] = max(row["last_duel_at"], played_at)
+
+        for duel in duels:
+            guild_id = int(duel["guild_id"])
+            player_a_id = int(duel["player_a_id"])
+            player_b_id = int(duel["player_b_id"])
+            played_at = int(duel["finished_at"] or 0)
+
+            if duel["status"] == constants.DUEL_STATUS_EXPIRED:
+                if _was_accepted(duel):
+                    add(guild_id, player_a_id, {"expired": 1}, played_at)
+                    add(guild_id, player_b_id, {"expired": 1}, played_at)
+                continue
+
+            try:
+                if not is_duel_complete_for_game(duel):
+                    continue
+                result = resolve_duel_for_game(duel)
+                deltas_a, deltas_b = stats.result_deltas(result, int(duel["stake_xp"] or 0))
+            except Exception:
+                log.warning("Duel ignoré lors de la reconstruction des statistiques (duel_id=%s)", duel["duel_id"])
+                continue
+
+            add(guild_id, player_a_id, deltas_a, played_at)
+            add(guild_id, player_b_id, deltas_b, played_at)
+
+        return ds_replace_all(
+            ({"guild_id": gid, "user_id": uid, **row} for (gid, uid), row in totals.items()),
+            conn=conn,
+        )
+
+
+def backfill_duel_stats_if_empty() -> int | None:
+    """Reconstruit les statistiques uniquement si la table est vide (première mise en service).
+
+    Retourne le nombre de lignes écrites, ou None si les statistiques existaient déjà.
+    """
+    if not ds_is_empty():
+        return None
+    return rebuild_duel_stats()
@@ -0,0 +1,66 @@
+"""Module interne gérant les statistiques de duel pré-agrégées (victoires, défaites, égalités, XP gagnée/perdue).
+
+Les statistiques sont incrémentées dans la même transaction que la fin (ou l'expiration) d'un duel.
+La reconstruction à partir des duels encore présents en base (backfill) est gérée par le module de maintenance.
+"""
+
+from sqlite3 import Connection
+
+from eldoria.db.repo.duel_stats_repo import ds_get_stats, ds_increment, ds_list_leaderboard
+from eldoria.exceptions import duel as exc
+from eldoria.features.duel import constants
+
+
+def result_deltas(result: str, stake_xp: int) -> tuple[dict[str, int], dict[str, int]]:
+    """Retourne les incréments de statistiques (joueur A, joueur B) pour un résultat de duel."""
+    match result:
+        case constants.DUEL_RESULT_WIN_A:
+            return {"wins": 1, "xp_won": stake_xp}, {"losses": 1, "xp_lost": stake_xp}
+        case constants.DUEL_RESULT_WIN_B:
+            return {"losses": 1, "xp_lost": stake_xp}, {"wins": 1, "xp_won": stake_xp}
+        case constants.DUEL_RESULT_DRAW:
+            return {"draws": 1}, {"draws": 1}
+        case _:
+            raise exc.InvalidResult(result)
+
+
+def record_duel_result(
+    guild_id: int,
+    player_a_id: int,
+    player_b_id: int,
+    result: str,
+    stake_xp: int,
+    played_at: int,
+    *,
+    conn: Connection,
+) -> None:
+    """Incrémente les statistiques des 2 joueurs pour un duel terminé, dans la transaction fournie."""
+    deltas_a, deltas_b = result_deltas(result, int(stake_xp or 0))
+    ds_increment(guild_id, player_a_id, **deltas_a, played_at=played_at, conn=conn)
+    ds_increment(guild_id, player_b_id, **deltas_b, played_at=played_at, conn=conn)
+
+
+def record_duel_expired(
+    guild_id: int,
+    player_a_id: int,
+    player_b_id: int,
+    played_at: int,
+    *,
+    conn: Connection,
+) -> None:
+    """Incrémente le compteur de duels expirés (mise remboursée) des 2 joueurs, dans la transaction fournie."""
+    ds_increment(guild_id, player_a_id, expired=1, played_at=played_at, conn=conn)
+    ds_increment(guild_id, player_b_id, expired=1, played_at=played_at, conn=conn)
+
+
+def get_player_stats(guild_id: int, user_id: int) -> dict[str, int]:
+    """Retourne les statistiques de duel d'un membre, enrichies du nombre de duels joués et du solde d'XP."""
+    stats = ds_get_stats(guild_id, user_id)
+    stats["played"] = stats["wins"] + stats["losses"] + stats["draws"]
+    stats["xp_net"] = stats["xp_won"] - stats["xp_lost"]
+    return stats
+
+
+def get_leaderboard(guild_id: int, limit: int = 100, offset: int = 0) -> list[tuple[int, int, int, int, int, int]]:
+    """Retourne le classement des duels d'un serveur : [(user_id, wins, losses, draws, xp_won, xp_lost)]."""
+    return ds_list_leaderboard(guild_id, limit, offset)
@@ -1,16 +1,19 @@
 """Service de gestion des duels.
 
 Ce service expose les différentes fonctionnalités liées aux duels, telles que la création de duels,
-la configuration, l'acceptation/refus, le déroulement des jeux, et la maintenance des duels (annulation des duels expirés, nettoyage des anciens duels).
+la configuration, l'acceptation/refus, le déroulement des jeux, les statistiques des joueurs,
+et la maintenance des duels (annulation des duels expirés, nettoyage des anciens duels).
 C'est l'interface principale utilisée par les autres parties du bot pour interagir avec le système de duels.
 """
 
 from dataclasses import dataclass
 from typing import Any
 
-from eldoria.features.duel._internal import flow, gameplay, helpers, maintenance
+from eldoria.features.duel._internal import flow, gameplay, helpers, maintenance, stats
+from eldoria.utils.metrics import instrument_service
 
 
+@instrument_service("duel")
 @dataclass(slots=True)
 class DuelService:
     """Service de gestion des duels, exposant les différentes fonctionnalités liées aux duels."""
@@ -54,3 +57,19 @@ class DuelService:
     def get_allowed_stakes(self, duel_id: int) -> list[int]:
         """Retourne la liste des mises en XP autorisées pour un duel donné, c'est à dire les mises pour lesquelles les 2 joueurs ont suffisamment d'XP."""
         return helpers.get_allowed_stakes(duel_id)
+
+    def get_stats(self, guild_id: int, user_id: int) -> dict[str, int]:
+        """Retourne les statistiques de duel d'un membre (victoires, défaites, égalités, expirés, XP gagnée/perdue, duels joués, solde d'XP)."""
+        return stats.get_player_stats(guild_id, user_id)
+
+    def get_leaderboard(self, guild_id: int, limit: int = 100, offset: int = 0) -> list[tuple[int, int, int, int, int, int]]:
+        """Retourne le classement des duels d'un serveur : [(user_id, wins, losses, draws, xp_won, xp_lost)]."""
+        return stats.get_leaderboard(guild_id, limit, offset)
+
+    def rebuild_stats(self) -> int:
+        """Reconstruit entièrement les statistiques de duel à partir des duels encore en base, et retourne le nombre de lignes écrites."""
+        return maintenance.rebuild_duel_stats()
+
+    def backfill_stats(self) -> int | None:
+        """Reconstruit les statistiques de duel uniquement si elles sont vides, et retourne le nombre de lignes écrites (None si rien à faire)."""
+        return maintenance.backfill_duel_stats_if_empty()
@@ -213,7 +213,7 @@ class RPSGame:
         C'est à dire que les 2 joueurs ont joué leur coup et que le résultat peut être déterminé.
         """
         payload = load_rps_payload(duel)
-        return payload[rps.RPS_PAYLOAD_A_MOVE] is not None and payload[rps.RPS_PAYLOAD_B_MOVE] is not None
+        return payload.get(rps.RPS_PAYLOAD_A_MOVE) is not None and payload.get(rps.RPS_PAYLOAD_B_MOVE) is not None
 
     @staticmethod
     def resolve(duel: Row) -> str:
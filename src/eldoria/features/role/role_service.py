@@ -3,8 +3,10 @@
 from dataclasses import dataclass
 
 from eldoria.db.repo import reaction_roles_repo, secret_roles_repo
+from eldoria.utils.metrics import instrument_service
 
 
+@instrument_service("role")
 @dataclass(slots=True)
 class RoleService:
     """Service métier regroupant la gestion des rôles secrets et des rôles par réaction."""
@@ -13,7 +15,7 @@ class RoleService:
 
     def sr_match(self, guild_id: int, channel_id: int, phrase: str) -> int | None:
         """Retourne l'ID du rôle associé à une phrase secrète si elle existe."""
-        return secret_roles_repo.sr_match(guild_id, channel_id, phrase)
+        return secret_roles_repo.sr_match_cached(guild_id, channel_id, phrase)
     
     def sr_list_messages(self, guild_id: int, channel_id: int) -> list[str]:
         """Liste toutes les phrases secrètes configurées pour un salon."""
@@ -47,7 +49,7 @@ class RoleService:
     
     def rr_get_role_id(self, guild_id: int, message_id: int, emoji: str) -> int | None:
         """Retourne l'ID du rôle associé à un emoji sur un message."""
-        return reaction_roles_repo.rr_get_role_id(guild_id, message_id, emoji)
+        return reaction_roles_repo.rr_get_role_id_cached(guild_id, message_id, emoji)
     
     def rr_list_by_message(self, guild_id: int, message_id: int) -> dict[str, int]:
         """Liste les rôles par réaction d'un message sous forme {emoji: role_id}."""
@@ -0,0 +1,175 @@
+"""Artefacts de sauvegarde de la base : instantané compressé en flux, nommé par empreinte, copies locales tournantes.
+
+L'instantané SQLite est lu par blocs : chaque bloc alimente à la fois le SHA-256 du contenu et le flux gzip,
+sans jamais charger la base en mémoire. L'empreinte sert au nom de l'artefact
+(`Eldoria_AAAAMMJJ_<empreinte>.db.gz`) et à la détection de changement : un instantané dont l'empreinte est
+celle du dernier envoi n'a pas besoin d'être renvoyé, et un contenu déjà présent localement (quelle que soit
+la date de son artefact) n'est pas recopié : les jours sans activité ne remplissent pas la rotation de doublons.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from eldoria.db import maintenance
+
+log = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+HASH_LENGTH = 12
+ARTIFACT_PREFIX = "Eldoria_"
+ARTIFACT_SUFFIX = ".db.gz"
+MANIFEST_SUFFIX = ".manifest.json"
+LAST_UPLOAD_MARKER = "last_upload.sha256"
+_SNAPSHOT_NAME = ".snapshot.db"
+
+
+@dataclass(frozen=True, slots=True)
+class BackupArtifact:
+    """Sauvegarde compressée prête à l'envoi : chemin local, empreinte du contenu et tailles."""
+
+    path: Path
+    sha256: str
+    raw_size: int
+    size: int
+    schema_version: int = 0
+
+    @property
+    def filename(self) -> str:
+        """Nom du fichier (utilisé tel quel pour la pièce jointe)."""
+        return self.path.name
+
+    @property
+    def short_hash(self) -> str:
+        """Préfixe de l'empreinte utilisé dans le nom de l'artefact."""
+        return self.sha256[:HASH_LENGTH]
+
+
+def artifact_name(sha256: str, when: datetime) -> str:
+    """Retourne le nom d'un artefact : date de la sauvegarde et préfixe de l'empreinte du contenu."""
+    return f"{ARTIFACT_PREFIX}{when:%Y%m%d}_{sha256[:HASH_LENGTH]}{ARTIFACT_SUFFIX}"
+
+
+def read_schema_version(db_path: Path) -> int:
+    """Retourne la version de schéma applicative (`PRAGMA user_version`) d'un fichier de base."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return int(conn.execute("PRAGMA user_version;").fetchone()[0])
+    finally:
+        conn.close()
+
+
+def compress_file(src: Path, dst: Path) -> tuple[str, int]:
+    """Compresse `src` en gzip dans `dst` par blocs et retourne (SHA-256 du contenu non compressé, taille lue).
+
+    La sortie est déterministe (ni horodatage ni nom dans l'en-tête gzip) : un même contenu donne le même fichier.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(src, "rb") as fin, open(dst, "wb") as raw, gzip.GzipFile(
+        filename="", mode="wb", fileobj=raw, mtime=0
+    ) as fout:
+        while chunk := fin.read(CHUNK_SIZE):
+            digest.update(chunk)
+            fout.write(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def decompress_file(src: Path, dst: Path) -> None:
+    """Décompresse le gzip `src` dans `dst` par blocs."""
+    with gzip.open(src, "rb") as fin, open(dst, "wb") as fout:
+        shutil.copyfileobj(fin, fout, CHUNK_SIZE)
+
+
+def list_artifacts(backup_dir: Path) -> list[Path]:
+    """Retourne les artefacts du dossier de sauvegarde, du plus récent au plus ancien."""
+    if not backup_dir.is_dir():
+        return []
+    files = [p for p in backup_dir.iterdir() if p.name.startswith(ARTIFACT_PREFIX) and p.name.endswith(ARTIFACT_SUFFIX)]
+    return sorted(files, key=lambda p: (p.stat().st_mtime, p.name), reverse=True)
+
+
+def find_artifact(backup_dir: Path, sha256: str) -> Path | None:
+    """Retourne l'artefact local dont le nom porte ce préfixe d'empreinte (contenu identique), quelle que soit sa date."""
+    suffix = f"_{sha256[:HASH_LENGTH]}{ARTIFACT_SUFFIX}"
+    return next((p for p in list_artifacts(backup_dir) if p.name.endswith(suffix)), None)
+
+
+def rotate(backup_dir: Path, keep: int) -> list[Path]:
+    """Supprime les artefacts au-delà des `keep` plus récents et retourne les fichiers supprimés."""
+    removed: list[Path] = []
+    for path in list_artifacts(backup_dir)[max(keep, 1):]:
+        try:
+            path.unlink()
+            removed.append(path)
+        except OSError:
+            log.warning("⚠️ Impossible de supprimer l'ancienne sauvegarde %s", path)
+    return removed
+
+
+def create_backup(
+    backup_dir: Path,
+    *,
+    keep: int,
+    when: datetime | None = None,
+    snapshot: Callable[[str], None] | None = None,
+) -> BackupArtifact:
+    """Prend un instantané de la base, le compresse dans `backup_dir` sous un nom dérivé de son empreinte, puis fait tourner les copies locales.
+
+    `snapshot(dst)` écrit l'instantané (par défaut `maintenance.backup_to_file`). Si un artefact de même
+    empreinte existe déjà (contenu identique, même d'un jour précédent), il est réutilisé et rafraîchi : il
+    redevient le plus récent pour la rotation, sans copie supplémentaire.
+    """
+    snapshot = snapshot or maintenance.backup_to_file
+    backup_dir.mkdir(parents=True, exist_ok=True)
+    when = when or datetime.now()
+    snapshot_path = backup_dir / _SNAPSHOT_NAME
+    partial = backup_dir / f"{_SNAPSHOT_NAME}.gz.part"
+    try:
+        snapshot(str(snapshot_path))
+        schema_version = read_schema_version(snapshot_path)
+        sha256, raw_size = compress_file(snapshot_path, partial)
+        existing = find_artifact(backup_dir, sha256)
+        if existing is not None:
+            dst = existing
+            partial.unlink()
+            os.utime(dst)
+        else:
+            dst = backup_dir / artifact_name(sha256, when)
+            os.replace(partial, dst)
+    finally:
+        for leftover in (snapshot_path, partial):
+            try:
+                leftover.unlink(missing_ok=True)
+            except OSError:
+                log.warning("⚠️ Impossible de supprimer le fichier temporaire %s", leftover)
+
+    rotate(backup_dir, keep)
+    return BackupArtifact(
+        path=dst, sha256=sha256, raw_size=raw_size, size=dst.stat().st_size, schema_version=schema_version
+    )
+
+
+def last_uploaded_hash(backup_dir: Path) -> str | None:
+    """Retourne l'empreinte de la dernière sauvegarde envoyée, ou None si aucune n'est connue."""
+    try:
+        value = (backup_dir / LAST_UPLOAD_MARKER).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return value or None
+
+
+def mark_uploaded(backup_dir: Path, sha256: str) -> None:
+    """Enregistre l'empreinte de la sauvegarde qui vient d'être envoyée."""
+    backup_dir.mkdir(parents=True, exist_ok=True)
+    (backup_dir / LAST_UPLOAD_MARKER).write_text(sha256 + "\n", encoding="utf-8")
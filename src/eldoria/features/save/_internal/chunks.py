@@ -0,0 +1,211 @@
+"""Sauvegardes en plusieurs parties : découpage de l'archive compressée, manifeste et réassemblage vérifié.
+
+Quand l'archive `.db.gz` dépasse la taille maximale d'une pièce jointe, elle est découpée en parties de taille
+fixe (`<archive>.part001`, ...), envoyées une par message. Un manifeste JSON, envoyé en dernier, décrit
+l'ensemble : ordre, taille et SHA-256 de chaque partie (avec l'id du message qui la porte), empreintes de
+l'archive et de la base décompressée, version de schéma. La restauration télécharge les parties sur disque,
+les vérifie une à une, les concatène puis décompresse en vérifiant chaque empreinte, sans jamais charger
+l'archive en mémoire.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, replace
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from eldoria.exceptions.general import InvalidBackupManifest
+from eldoria.features.save._internal.archive import (
+    ARTIFACT_SUFFIX,
+    CHUNK_SIZE,
+    MANIFEST_SUFFIX,
+    BackupArtifact,
+)
+
+MANIFEST_FORMAT = "eldoria-backup"
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class BackupChunk:
+    """Partie d'une archive de sauvegarde : position, nom, taille, empreinte et message qui la porte."""
+
+    index: int
+    filename: str
+    size: int
+    sha256: str
+    message_id: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BackupManifest:
+    """Description d'une sauvegarde en plusieurs parties, envoyée après les parties."""
+
+    archive: str
+    archive_sha256: str
+    archive_size: int
+    db_sha256: str
+    db_size: int
+    schema_version: int
+    created_at: str
+    chunks: tuple[BackupChunk, ...]
+
+    @property
+    def filename(self) -> str:
+        """Nom de la pièce jointe du manifeste (`Eldoria_AAAAMMJJ_<empreinte>.manifest.json`)."""
+        return self.archive.removesuffix(ARTIFACT_SUFFIX) + MANIFEST_SUFFIX
+
+    @property
+    def db_filename(self) -> str:
+        """Nom du fichier `.db` obtenu après réassemblage."""
+        return self.archive.removesuffix(".gz")
+
+    def to_json(self) -> str:
+        """Sérialise le manifeste en JSON."""
+        data = {"format": MANIFEST_FORMAT, "version": MANIFEST_VERSION, **asdict(self)}
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, text: str) -> BackupManifest:
+        """Lit et valide un manifeste ; lève InvalidBackupManifest s'il est illisible ou incohérent."""
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise InvalidBackupManifest("JSON illisible") from e
+        if not isinstance(data, dict) or data.get("format") != MANIFEST_FORMAT:
+            raise InvalidBackupManifest("format inconnu")
+        if data.get("version") != MANIFEST_VERSION:
+            raise InvalidBackupManifest(f"version {data.get('version')!r} non supportée")
+        try:
+            chunks = tuple(
+                BackupChunk(
+                    index=int(c["index"]),
+                    filename=str(c["filename"]),
+                    size=int(c["size"]),
+                    sha256=str(c["sha256"]),
+                    message_id=None if c.get("message_id") is None else int(c["message_id"]),
+                )
+                for c in data["chunks"]
+            )
+            manifest = cls(
+                archive=str(data["archive"]),
+                archive_sha256=str(data["archive_sha256"]),
+                archive_size=int(data["archive_size"]),
+                db_sha256=str(data["db_sha256"]),
+                db_size=int(data["db_size"]),
+                schema_version=int(data["schema_version"]),
+                created_at=str(data["created_at"]),
+                chunks=chunks,
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidBackupManifest("champ manquant ou invalide") from e
+
+        if [c.index for c in manifest.chunks] != list(range(len(manifest.chunks))) or not manifest.chunks:
+            raise InvalidBackupManifest("parties manquantes ou dans le désordre")
+        if sum(c.size for c in manifest.chunks) != manifest.archive_size:
+            raise InvalidBackupManifest("taille des parties incohérente avec l'archive")
+        return manifest
+
+
+def chunk_filename(archive: str, index: int) -> str:
+    """Retourne le nom de la partie `index` (0-based) d'une archive."""
+    return f"{archive}.part{index + 1:03d}"
+
+
+def split_file(src: Path, dst_dir: Path, chunk_size: int) -> list[tuple[BackupChunk, Path]]:
+    """Découpe `src` en parties de `chunk_size` octets au plus dans `dst_dir`, par blocs, et retourne chaque partie avec son fichier."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size doit être positif")
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    parts: list[tuple[BackupChunk, Path]] = []
+    with open(src, "rb") as fin:
+        while block := fin.read(min(CHUNK_SIZE, chunk_size)):
+            index = len(parts)
+            path = dst_dir / chunk_filename(src.name, index)
+            digest = hashlib.sha256()
+            size = 0
+            with open(path, "wb") as fout:
+                while block:
+                    digest.update(block)
+                    fout.write(block)
+                    size += len(block)
+                    block = fin.read(min(CHUNK_SIZE, chunk_size - size))
+            parts.append((BackupChunk(index=index, filename=path.name, size=size, sha256=digest.hexdigest()), path))
+    return parts
+
+
+def build_manifest(artifact: BackupArtifact, chunks: Sequence[BackupChunk]) -> BackupManifest:
+    """Construit le manifeste d'une archive à partir de ses parties (avec les ids de message une fois envoyées)."""
+    archive_digest = hashlib.sha256()
+    with open(artifact.path, "rb") as f:
+        while block := f.read(CHUNK_SIZE):
+            archive_digest.update(block)
+    return BackupManifest(
+        archive=artifact.filename,
+        archive_sha256=archive_digest.hexdigest(),
+        archive_size=artifact.size,
+        db_sha256=artifact.sha256,
+        db_size=artifact.raw_size,
+        schema_version=artifact.schema_version,
+        created_at=datetime.now(UTC).isoformat(timespec="seconds"),
+        chunks=tuple(sorted(chunks, key=lambda c: c.index)),
+    )
+
+
+def with_message_id(chunk: BackupChunk, message_id: int) -> BackupChunk:
+    """Retourne la partie annotée avec l'id du message qui la porte."""
+    return replace(chunk, message_id=message_id)
+
+
+def _copy_verified(src: Path, fout: BinaryIO, chunk: BackupChunk, archive_digest: Any) -> None:
+    digest = hashlib.sha256()
+    size = 0
+    with open(src, "rb") as fin:
+        while block := fin.read(CHUNK_SIZE):
+            digest.update(block)
+            archive_digest.update(block)
+            fout.write(block)
+            size += len(block)
+    if size != chunk.size or digest.hexdigest() != chunk.sha256:
+        raise InvalidBackupManifest(f"partie {chunk.index + 1} corrompue")
+
+
+def assemble(manifest: BackupManifest, parts: Sequence[Path], dst_db: Path) -> None:
+    """Réassemble les parties (dans l'ordre du manifeste) et décompresse la base dans `dst_db`, en vérifiant chaque empreinte.
+
+    En cas d'échec, les fichiers intermédiaires et `dst_db` sont supprimés.
+    """
+    if len(parts) != len(manifest.chunks):
+        raise InvalidBackupManifest(f"{len(parts)} parties reçues sur {len(manifest.chunks)}")
+
+    archive_path = dst_db.with_name(dst_db.name + ".gz.part")
+    try:
+        archive_digest = hashlib.sha256()
+        with open(archive_path, "wb") as fout:
+            for chunk, path in zip(manifest.chunks, parts, strict=True):
+                _copy_verified(path, fout, chunk, archive_digest)
+        if archive_digest.hexdigest() != manifest.archive_sha256:
+            raise InvalidBackupManifest("empreinte de l'archive incorrecte")
+
+        db_digest = hashlib.sha256()
+        size = 0
+        try:
+            with gzip.open(archive_path, "rb") as fin, open(dst_db, "wb") as fout:
+                while block := fin.read(CHUNK_SIZE):
+                    db_digest.update(block)
+                    fout.write(block)
+                    size += len(block)
+        except (OSError, EOFError) as e:
+            raise InvalidBackupManifest("archive illisible") from e
+        if size != manifest.db_size or db_digest.hexdigest() != manifest.db_sha256:
+            raise InvalidBackupManifest("empreinte de la base incorrecte")
+    except BaseException:
+        dst_db.unlink(missing_ok=True)
+        raise
+    finally:
+        archive_path.unlink(missing_ok=True)
@@ -1,12 +1,38 @@
 """Service métier regroupant les opérations de sauvegarde et de maintenance de la base de données, notamment les backups et l'initialisation du schéma."""
 
+from __future__ import annotations
+
 import sqlite3
+from collections.abc import Callable
 from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from eldoria.db import connection, maintenance, schema
-from eldoria.exceptions.general import DatabaseRestoreError
+from eldoria.db.repo import ticketing_repo, xp_repo
+from eldoria.exceptions.general import DatabaseRestoreError, InvalidDatabaseFile
+from eldoria.utils.lazy import lazy_import
+from eldoria.utils.metrics import instrument_service
+from eldoria.utils.timestamp import day_key_utc, now_ts
+
+if TYPE_CHECKING:
+    from eldoria.features.save._internal.archive import BackupArtifact
+    from eldoria.features.save._internal.chunks import BackupChunk, BackupManifest
+
+# Archives compressées : chargées à la première sauvegarde ou restauration, pas au chargement des extensions
+create_backup = lazy_import("eldoria.features.save._internal.archive", "create_backup")
+last_uploaded_hash = lazy_import("eldoria.features.save._internal.archive", "last_uploaded_hash")
+mark_uploaded = lazy_import("eldoria.features.save._internal.archive", "mark_uploaded")
+decompress_file = lazy_import("eldoria.features.save._internal.archive", "decompress_file")
 
+# Sauvegardes en plusieurs parties : chargées seulement quand la base dépasse la taille d'une pièce jointe
+split_file = lazy_import("eldoria.features.save._internal.chunks", "split_file")
+build_manifest = lazy_import("eldoria.features.save._internal.chunks", "build_manifest")
+parse_manifest = lazy_import("eldoria.features.save._internal.chunks", "BackupManifest")
+assemble = lazy_import("eldoria.features.save._internal.chunks", "assemble")
 
+
+@instrument_service("save")
 @dataclass(slots=True)
 class SaveService:
     """Service métier regroupant les opérations de sauvegarde et de maintenance de la base de données, notamment les backups et l'initialisation du schéma."""
@@ -15,9 +41,47 @@ class SaveService:
         """Retourne le chemin du fichier de base de données SQLite utilisé par le bot."""
         return connection.DB_PATH
     
-    def backup_to_file(self, dst_path: str) -> None:
-        """Crée une sauvegarde de la base de données actuelle dans un fichier à l'emplacement spécifié."""
+    def backup_to_file(self, dst_path: str) -> maintenance.BackupStats:
+        """Crée une sauvegarde en ligne de la base de données actuelle dans un fichier à l'emplacement spécifié."""
         return maintenance.backup_to_file(dst_path)
+
+    def create_backup(self, backup_dir: str, keep: int) -> BackupArtifact:
+        """Crée une sauvegarde compressée nommée par empreinte dans `backup_dir` et ne garde que les `keep` plus récentes."""
+        return create_backup(Path(backup_dir), keep=keep)
+
+    def last_uploaded_hash(self, backup_dir: str) -> str | None:
+        """Retourne l'empreinte de la dernière sauvegarde envoyée (None si inconnue)."""
+        return last_uploaded_hash(Path(backup_dir))
+
+    def mark_uploaded(self, backup_dir: str, sha256: str) -> None:
+        """Enregistre l'empreinte de la sauvegarde qui vient d'être envoyée."""
+        return mark_uploaded(Path(backup_dir), sha256)
+
+    def decompress_backup(self, src_path: str, dst_path: str) -> None:
+        """Décompresse une sauvegarde `.db.gz` vers un fichier `.db`."""
+        return decompress_file(Path(src_path), Path(dst_path))
+
+    def split_backup(self, artifact: BackupArtifact, parts_dir: str, chunk_size: int) -> list[tuple[BackupChunk, Path]]:
+        """Découpe une sauvegarde compressée en parties de `chunk_size` octets au plus dans `parts_dir`."""
+        return split_file(artifact.path, Path(parts_dir), chunk_size)
+
+    def build_manifest(self, artifact: BackupArtifact, parts: list[BackupChunk]) -> BackupManifest:
+        """Construit le manifeste d'une sauvegarde en plusieurs parties."""
+        return build_manifest(artifact, parts)
+
+    def is_manifest_filename(self, filename: str) -> bool:
+        """Indique si une pièce jointe est le manifeste d'une sauvegarde en plusieurs parties."""
+        from eldoria.features.save._internal.archive import MANIFEST_SUFFIX
+
+        return filename.lower().endswith(MANIFEST_SUFFIX)
+
+    def parse_manifest(self, text: str) -> BackupManifest:
+        """Lit et valide le manifeste d'une sauvegarde en plusieurs parties."""
+        return parse_manifest.from_json(text)
+
+    def assemble_backup(self, manifest: BackupManifest, parts: list[Path], dst_path: str) -> None:
+        """Réassemble et vérifie une sauvegarde en plusieurs parties dans le fichier `.db` `dst_path`."""
+        return assemble(manifest, parts, Path(dst_path))
     
     def replace_db_file(self, new_db_path: str) -> None:
         """Remplace le fichier de base de données actuel par un nouveau fichier de base de données (par exemple pour restaurer une sauvegarde)."""
@@ -26,6 +90,42 @@ class SaveService:
         except (OSError, sqlite3.DatabaseError) as e:
             raise DatabaseRestoreError() from e
         
+    def restore_db_file(
+        self, new_db_path: str, on_swapped: Callable[[], None] | None = None, *, full_check: bool = False
+    ) -> maintenance.RestoreReport:
+        """Vérifie, migre puis installe une base entrante ; `on_swapped` invalide les états en mémoire juste après l'échange.
+
+        Opération bloquante (contrôle d'intégrité, migration) : à exécuter hors de la boucle asyncio.
+        """
+        try:
+            return maintenance.restore_db_file(new_db_path, full_check=full_check, on_swapped=on_swapped)
+        except InvalidDatabaseFile:
+            raise
+        except (OSError, sqlite3.DatabaseError) as e:
+            raise DatabaseRestoreError() from e
+
+    def run_maintenance(
+        self,
+        *,
+        vacuum_pages: int,
+        voice_retention_days: int,
+        tickets_retention_days: int,
+        now: int | None = None,
+    ) -> maintenance.MaintenanceReport:
+        """Purge les progrès vocaux inactifs et les vieux tickets fermés, met à jour les statistiques et rend les pages libres.
+
+        `tickets_retention_days=0` conserve les tickets. Opération bloquante : à exécuter hors de la boucle asyncio.
+        """
+        now = now_ts() if now is None else now
+        voice_cutoff = day_key_utc(now - voice_retention_days * 86400)
+        purges: dict[str, Callable[[sqlite3.Connection], int]] = {
+            "xp_voice_progress": lambda conn: xp_repo.xp_voice_purge_before(voice_cutoff, conn=conn),
+        }
+        if tickets_retention_days > 0:
+            tickets_cutoff = now - tickets_retention_days * 86400
+            purges["tickets"] = lambda conn: ticketing_repo.tk_purge_closed_before(tickets_cutoff, conn=conn)
+        return maintenance.run_maintenance(purges=purges, vacuum_pages=vacuum_pages)
+
     def init_db(self) -> None:
         """Initialise le schéma de la base de données en créant les tables nécessaires si elles n'existent pas déjà."""
         return schema.init_db()
\ No newline at end of file
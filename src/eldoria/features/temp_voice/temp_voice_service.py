@@ -3,15 +3,17 @@
 from dataclasses import dataclass
 
 from eldoria.db.repo import temp_voice_repo
+from eldoria.utils.metrics import instrument_service
 
 
+@instrument_service("temp_voice")
 @dataclass(slots=True)
 class TempVoiceService:
     """Service métier pour la gestion des salons vocaux temporaires."""
 
     def find_parent_of_active(self, guild_id: int, channel_id: int) -> int | None:
         """Retourne l'identifiant du parent associé à un salon vocal temporaire actif."""
-        return temp_voice_repo.tv_find_parent_of_active(guild_id, channel_id)
+        return temp_voice_repo.tv_find_parent_of_active_cached(guild_id, channel_id)
     
     def remove_active(self, guild_id: int, parent_channel_id: int, channel_id: int) -> None:
         """Supprime un salon vocal temporaire de la liste des salons actifs."""
@@ -19,7 +21,7 @@ class TempVoiceService:
     
     def get_parent(self, guild_id: int, parent_channel_id: int) -> int | None:
         """Récupère la limite d'utilisateurs configurée pour un parent de salons temporaires."""
-        return temp_voice_repo.tv_get_parent(guild_id, parent_channel_id)
+        return temp_voice_repo.tv_get_parent_cached(guild_id, parent_channel_id)
     
     def add_active(self, guild_id: int, parent_channel_id: int, channel_id: int) -> None:
         """Ajoute un salon vocal temporaire à la liste des salons actifs."""
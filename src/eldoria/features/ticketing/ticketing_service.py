@@ -7,8 +7,10 @@ from dataclasses import dataclass
 from typing import Any
 
 from eldoria.db.repo import ticketing_repo
+from eldoria.utils.metrics import instrument_service
 
 
+@instrument_service("ticketing")
 @dataclass(slots=True)
 class TicketingService:
     """Service simple pour gérer la configuration du ticketing."""
@@ -26,7 +28,7 @@ class TicketingService:
         )
 
     def get_config(self, guild_id: int) -> dict[str, Any]:
-        return ticketing_repo.tk_get_config(guild_id)
+        return ticketing_repo.tk_get_config_cached(guild_id)
 
     def set_config(
         self,
@@ -2,7 +2,10 @@
 
 from eldoria.db.repo import welcome_message_repo
 from eldoria.features.welcome._internal.welcome_picker import pick_welcome_message
-from eldoria.json_tools.welcome_json import load_welcome_json
+from eldoria.utils.lazy import lazy_import
+
+# Pool compilé depuis welcome_message.json : chargé au préchargement des ressources ou à la première arrivée
+get_welcome_pool = lazy_import("eldoria.json_tools.welcome_json", "get_welcome_pool")
 
 
 def get_welcome_message(
@@ -13,8 +16,8 @@ def get_welcome_message(
         recent_limit: int = 10,
     ) -> tuple[str, str, list[str]]:
         """Retourne un message de bienvenue à envoyer pour un nouvel arrivant, en fonction de la configuration JSON et de l'historique récent."""
-        # 1) Charger le JSON
-        data = load_welcome_json()
+        # 1) Pool compilé (aucune lecture du JSON ici)
+        pool = get_welcome_pool()
 
         # 2) Lire l'historique récent (DB)
         recent_keys = (
@@ -25,7 +28,7 @@ def get_welcome_message(
 
         # 3) Choisir le message (logique pure)
         title, msg, emojis, chosen_key = pick_welcome_message(
-            data=data,
+            pool=pool,
             user=user,
             server=server,
             recent_keys=recent_keys,
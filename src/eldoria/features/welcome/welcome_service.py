@@ -5,8 +5,10 @@ from typing import Any
 
 from eldoria.db.repo import welcome_message_repo
 from eldoria.features.welcome._internal import welcome_getter
+from eldoria.utils.metrics import instrument_service
 
 
+@instrument_service("welcome")
 @dataclass(slots=True)
 class WelcomeService:
     """Service métier pour la gestion des messages de bienvenue et de l'historique anti-répétition."""
@@ -19,7 +21,7 @@ class WelcomeService:
 
     def get_config(self, guild_id: int) -> dict[str, Any]:
         """Retourne la configuration de bienvenue (enabled + channel_id), en la créant si absente."""
-        return welcome_message_repo.wm_get_config(guild_id)
+        return welcome_message_repo.wm_get_config_cached(guild_id)
 
     def set_config(
         self,
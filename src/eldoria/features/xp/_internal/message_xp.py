@@ -5,7 +5,12 @@ Gère l'attribution d'XP lors de la création d'un message, en fonction de la co
 
 import discord
 
-from eldoria.db.repo.xp_repo import xp_add_xp, xp_get_config, xp_get_levels, xp_get_member
+from eldoria.db.repo.xp_repo import (
+    xp_add_xp,
+    xp_get_config_cached,
+    xp_get_levels_cached,
+    xp_get_member,
+)
 from eldoria.features.xp._internal.config import XpConfig
 from eldoria.features.xp._internal.tags import has_active_server_tag_for_guild
 from eldoria.features.xp.levels import compute_level
@@ -27,7 +32,7 @@ async def handle_message_xp(message: discord.Message) -> tuple[int, int, int] |
     guild = message.guild
     member = require_member(message.author)
 
-    config_raw = xp_get_config(guild.id)
+    config_raw = xp_get_config_cached(guild.id)
     config = XpConfig(**config_raw)
 
     # XP global switch (par guilde)
@@ -59,7 +64,7 @@ async def handle_message_xp(message: discord.Message) -> tuple[int, int, int] |
 
     new_xp = xp_add_xp(guild.id, member.id, gained, set_last_xp_ts=now)
 
-    levels = xp_get_levels(guild.id)
+    levels = xp_get_levels_cached(guild.id)
     old_lvl = compute_level(old_xp, levels)
     new_lvl = compute_level(new_xp, levels)
 
@@ -5,10 +5,9 @@ import discord
 from eldoria.db.repo import xp_repo
 from eldoria.features.xp._internal.config import XpConfig
 from eldoria.features.xp._internal.tags import has_active_server_tag_for_guild
-from eldoria.features.xp._internal.time import day_key_utc
 from eldoria.features.xp.levels import compute_level
 from eldoria.features.xp.roles import sync_member_level_roles
-from eldoria.utils.timestamp import now_ts
+from eldoria.utils.timestamp import day_key_utc, now_ts
 
 
 def is_voice_member_active(member: discord.Member) -> bool:
@@ -43,7 +42,7 @@ async def tick_voice_xp_for_member(guild: discord.Guild, member: discord.Member)
     if member.bot:
         return None
 
-    config_raw = xp_repo.xp_get_config(guild.id)
+    config_raw = xp_repo.xp_get_config_cached(guild.id)
     config = XpConfig(**config_raw)
 
     if not config.enabled or not config.voice_enabled:
@@ -139,7 +138,7 @@ async def tick_voice_xp_for_member(guild: discord.Guild, member: discord.Member)
     old_xp, _ = xp_repo.xp_get_member(guild.id, member.id)
     new_xp = xp_repo.xp_add_xp(guild.id, member.id, int(total_gain))
 
-    levels = xp_repo.xp_get_levels(guild.id)
+    levels = xp_repo.xp_get_levels_cached(guild.id)
     old_lvl = compute_level(old_xp, levels)
     new_lvl = compute_level(new_xp, levels)
 
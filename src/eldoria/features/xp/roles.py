@@ -2,7 +2,12 @@
 
 import discord
 
-from eldoria.db.repo.xp_repo import xp_get_levels, xp_get_member, xp_get_role_ids, xp_is_enabled
+from eldoria.db.repo.xp_repo import (
+    xp_get_levels_cached,
+    xp_get_member,
+    xp_get_role_ids_cached,
+    xp_is_enabled_cached,
+)
 from eldoria.defaults import XP_LEVELS_DEFAULTS
 from eldoria.features.xp.levels import compute_level
 from eldoria.utils.discord_utils import get_member_by_id_or_raise
@@ -16,13 +21,13 @@ async def sync_member_level_roles(guild: discord.Guild, member: discord.Member,
     if xp is None:
         xp, _ = xp_get_member(guild.id, member.id)
 
-    levels = xp_get_levels(guild.id)
+    levels = xp_get_levels_cached(guild.id)
     if not levels:
         # fallback (normalement impossible si ensure_guild_xp_setup est appelé)
         levels = list(XP_LEVELS_DEFAULTS.items())
 
     current_lvl = compute_level(xp, levels)
-    role_ids = xp_get_role_ids(guild.id)
+    role_ids = xp_get_role_ids_cached(guild.id)
     if not role_ids:
         return
 
@@ -49,7 +54,7 @@ async def sync_xp_roles_for_users(guild: discord.Guild, user_ids: list[int]) ->
     pour appliquer rétroactivement les changements à tous les membres.
     """
     # Si ton système XP peut être OFF par guilde
-    if not xp_is_enabled(guild.id):
+    if not xp_is_enabled_cached(guild.id):
         return
 
     for uid in user_ids:
@@ -68,7 +73,7 @@ def get_xp_role_ids(guild_id: int | None) -> dict[int, int]:
         return {}
 
     try:
-        return xp_get_role_ids(guild_id) or {}
+        return xp_get_role_ids_cached(guild_id) or {}
     except Exception:
         # sécurité : l'UI ne doit jamais planter à cause de la DB
         return {}
\ No newline at end of file
@@ -7,6 +7,7 @@ from typing import Any
 
 import discord
 
+from eldoria.db import cache
 from eldoria.db.repo import xp_repo
 from eldoria.exceptions.general import XpDisabled
 from eldoria.features.xp import levels, roles
@@ -16,8 +17,10 @@ from eldoria.features.xp._internal import (
     snapshot,
     voice_xp,
 )
+from eldoria.utils.metrics import instrument_service
 
 
+@instrument_service("xp")
 @dataclass(slots=True)
 class XpService:
     """Façade applicative du système XP (messages, vocal, niveaux, rôles et configuration)."""
@@ -42,28 +45,30 @@ class XpService:
 
     def is_enabled(self, guild_id: int) -> bool:
         """Retourne True si XP activé, sinon False (sans lever)."""
-        return xp_repo.xp_is_enabled(guild_id)
+        return xp_repo.xp_is_enabled_cached(guild_id)
 
     def require_enabled(self, guild_id: int) -> None:
         """Lève XpDisabled si le système XP est désactivé."""
-        if not xp_repo.xp_is_enabled(guild_id):
+        if not xp_repo.xp_is_enabled_cached(guild_id):
             raise XpDisabled(guild_id)
     
     def ensure_defaults(self, guild_id: int, default_levels: dict[int, int] | None = None) -> None:
-        """Initialise la configuration XP par défaut si absente."""
+        """Initialise la configuration XP par défaut si absente (aucune écriture si la guild est déjà initialisée)."""
+        if default_levels is None and cache.is_bootstrapped(guild_id):
+            return None
         return xp_repo.xp_ensure_defaults(guild_id, default_levels)
     
     def get_config(self, guild_id: int) -> dict:
         """Retourne la configuration XP d'une guilde."""
-        return xp_repo.xp_get_config(guild_id)
+        return xp_repo.xp_get_config_cached(guild_id)
     
     def get_role_ids(self, guild_id: int) -> dict[int, int]:
         """Retourne les rôles associés aux niveaux XP."""
-        return xp_repo.xp_get_role_ids(guild_id)
+        return xp_repo.xp_get_role_ids_cached(guild_id)
     
     def get_levels_with_roles(self, guild_id: int) -> list[tuple[int, int, int | None]]:
         """Retourne les niveaux avec leurs seuils et rôles associés."""
-        return xp_repo.xp_get_levels_with_roles(guild_id)
+        return xp_repo.xp_get_levels_with_roles_cached(guild_id)
 
     def set_level_threshold(self, guild_id: int, level: int, xp_required: int) -> None:
         """Définit le seuil d'XP requis pour un niveau."""
@@ -75,7 +80,7 @@ class XpService:
     
     def get_levels(self, guild_id: int) -> list[tuple[int, int]]:
         """Retourne la liste des niveaux et leurs seuils XP."""
-        return xp_repo.xp_get_levels(guild_id)
+        return xp_repo.xp_get_levels_cached(guild_id)
 
     def add_xp(
         self,
@@ -1,60 +1,67 @@
-"""Module de gestion du JSON de configuration des duels."""
+"""Module de gestion du JSON de configuration des duels.
 
-import json
+`resources/json/duels.json` est compilé une fois en `DuelTexts` (cf. eldoria.json_tools.resources) :
+les textes des embeds de duels sont lus en mémoire, sans relire le fichier.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
+from eldoria.json_tools.resources import json_resource
 
-def load_duels_json() -> dict[str, Any]:
-    """Charge le fichier resources/json/duels.json.
-    
-    Renvoie le JSON brut (dict).
-    """
-    try:
-        with open("./resources/json/duels.json", encoding="utf-8") as file:
-            data = json.load(file)
-            return data if isinstance(data, dict) else {}
-    except FileNotFoundError:
-        return {}
-    except Exception:
-        return {}
+DEFAULT_TITLE = "⚔️ Duel d'XP"
+DEFAULT_DESCRIPTION = (
+    "Défie un autre joueur dans un mini-jeu avec une mise en XP.\n"
+    "Choisis un jeu et une mise, puis envoie une invitation."
+)
+UNKNOWN_GAME = (
+    "🎮 Jeu inconnu",
+    "Ce jeu n'est pas disponible ou n'est pas encore documenté."
+)
 
 
-def get_duel_embed_data() -> dict[str, Any]:
-    """Retourne un dict NORMALISÉ, directement exploitable pour les embeds de duels, à partir du contenu de duels.json.
+@dataclass(frozen=True, slots=True)
+class GameText:
+    """Nom et description d'un jeu de duel."""
 
-    {
-        "title": str,
-        "description": str,
-        "games": {
-            "game_type": {
-            "name": str,
-            "description": str
-            }
-        }
-    }
-    """
-    data = load_duels_json() or {}
-
-    # ---- title
-    title = data.get("title")
-    if not isinstance(title, str) or not title.strip():
-        title = "⚔️ Duel d'XP"
-    else:
-        title = title.strip()
-
-    # ---- description
-    description = data.get("description")
-    if not isinstance(description, str) or not description.strip():
-        description = (
-            "Défie un autre joueur dans un mini-jeu avec une mise en XP.\n"
-            "Choisis un jeu et une mise, puis envoie une invitation."
-        )
-    else:
-        description = description.strip()
-
-    # ---- games
+    name: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class DuelTexts:
+    """Textes normalisés des embeds de duels : titre, description et jeux par game_type."""
+
+    title: str
+    description: str
+    games: MappingProxyType[str, GameText]
+
+
+_FALLBACK_GAMES = {
+    "RPS": GameText(
+        name="✊📄✂️ Pierre • Feuille • Ciseaux",
+        description=(
+            "Chaque joueur choisit un coup en secret.\n\n"
+            "✊ bat ✂️ • ✂️ bat 📄 • 📄 bat ✊\n"
+            "Même coup = égalité."
+        ),
+    )
+}
+
+
+def _text(value: Any, default: str) -> str:
+    if not isinstance(value, str) or not value.strip():
+        return default
+    return value.strip()
+
+
+def compile_duel_texts(data: dict[str, Any]) -> DuelTexts:
+    """Normalise le contenu de duels.json : textes nettoyés, jeux invalides écartés, jeu RPS par défaut si aucun jeu valide."""
+    games: dict[str, GameText] = {}
     games_raw = data.get("games", {})
-    games: dict[str, dict[str, str]] = {}
 
     if isinstance(games_raw, dict):
         for game_key, g in games_raw.items():
@@ -71,46 +78,51 @@ def get_duel_embed_data() -> dict[str, Any]:
             if not isinstance(desc, str) or not desc.strip():
                 continue
 
-            games[game_key] = {
-                "name": name.strip(),
-                "description": desc.strip(),
-            }
+            games[game_key] = GameText(name=name.strip(), description=desc.strip())
+
+    return DuelTexts(
+        title=_text(data.get("title"), DEFAULT_TITLE),
+        description=_text(data.get("description"), DEFAULT_DESCRIPTION),
+        games=MappingProxyType(games or dict(_FALLBACK_GAMES)),
+    )
+
+
+_DUELS = json_resource("duels.json", compile_duel_texts)
+
+
+def get_duel_texts() -> DuelTexts:
+    """Retourne les textes de duels compilés (rechargés en arrière-plan si duels.json change)."""
+    return _DUELS.get()
+
+
+def get_duel_embed_data() -> dict[str, Any]:
+    """Retourne un dict NORMALISÉ, directement exploitable pour les embeds de duels, à partir du contenu de duels.json.
 
-    # ---- fallback minimal
-    if not games:
-        games = {
-            "RPS": {
-                "name": "✊📄✂️ Pierre • Feuille • Ciseaux",
-                "description": (
-                    "Chaque joueur choisit un coup en secret.\n\n"
-                    "✊ bat ✂️ • ✂️ bat 📄 • 📄 bat ✊\n"
-                    "Même coup = égalité."
-                ),
+    {
+        "title": str,
+        "description": str,
+        "games": {
+            "game_type": {
+            "name": str,
+            "description": str
             }
         }
-
+    }
+    """
+    texts = get_duel_texts()
     return {
-        "title": title,
-        "description": description,
-        "games": games,
+        "title": texts.title,
+        "description": texts.description,
+        "games": {key: {"name": g.name, "description": g.description} for key, g in texts.games.items()},
     }
 
+
 def get_game_text(game_key: str) -> tuple[str, str]:
     """Retourne (game_name, game_description) pour un game_key (ex: 'RPS').
 
     Fallback safe si le jeu n'existe pas.
     """
-    data = get_duel_embed_data()
-    games = data.get("games", {})
-
-    g = games.get(str(game_key))
-    if isinstance(g, dict):
-        name = g.get("name")
-        desc = g.get("description")
-        if isinstance(name, str) and name.strip() and isinstance(desc, str) and desc.strip():
-            return name.strip(), desc.strip()
-
-    return (
-        "🎮 Jeu inconnu",
-        "Ce jeu n'est pas disponible ou n'est pas encore documenté."
-    )
\ No newline at end of file
+    game = get_duel_texts().games.get(str(game_key))
+    if game is None:
+        return UNKNOWN_GAME
+    return game.name, game.description
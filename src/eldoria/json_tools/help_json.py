@@ -1,39 +1,47 @@
-"""Module de gestion du JSON de configuration de la commande help."""
+"""Module de gestion du JSON de configuration de la commande help.
 
-import json
+`resources/json/help.json` est compilé une fois en `HelpConfig` (cf. eldoria.json_tools.resources).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
+from eldoria.json_tools.resources import json_resource
 
-def load_help_json(path: str = "./resources/json/help.json") -> dict[str, Any]:
-    """Charge le fichier help.json et renvoie le JSON brut."""
-    try:
-        with open(path, encoding="utf-8") as file:
-            data = json.load(file)
-            return data if isinstance(data, dict) else {}
-    except FileNotFoundError:
-        return {}
-    except Exception:
-        return {}
 
+@dataclass(frozen=True, slots=True)
+class HelpConfig:
+    """Config help normalisée et immuable : descriptions des commandes, catégories et descriptions des catégories."""
 
-def load_help_config() -> tuple[dict[str, str], dict[str, list[str]], dict[str, str]]:
-    """Normalise la config help depuis help.json.
+    help_infos: MappingProxyType[str, str]
+    categories: MappingProxyType[str, tuple[str, ...]]
+    category_descriptions: MappingProxyType[str, str]
+
+
+def _freeze(
+    help_infos: dict[str, Any], categories: dict[str, Any], cat_desc: dict[str, Any]
+) -> HelpConfig:
+    return HelpConfig(
+        help_infos=MappingProxyType(dict(help_infos)),
+        categories=MappingProxyType({cat: tuple(cmds or ()) for cat, cmds in categories.items()}),
+        category_descriptions=MappingProxyType(dict(cat_desc)),
+    )
+
+
+def compile_help_config(help_data: dict[str, Any]) -> HelpConfig:
+    """Normalise la config help depuis le contenu de help.json.
 
-    Retourne:
-    - help_infos: {cmd_name: description}
-    - categories: {category_name: [cmd_name, ...]}
-    - category_descriptions: {category_name: description}
-    
     Formats supportés:
     1) Nouveau (recommandé):
        {"categories": {"Nom": {"description": "...", "commands": {"cmd": "desc"}}}}
     2) Ancien: {"commands": {...}, "categories": {...}, "category_descriptions": {...}}
     3) Très ancien: {"cmd_name": "description", ...}
     """
-    help_data = load_help_json() or {}
-
     # 1) Format structuré
-    if isinstance(help_data, dict) and "categories" in help_data and isinstance(help_data.get("categories"), dict):
+    if "categories" in help_data and isinstance(help_data.get("categories"), dict):
         cats_obj = help_data.get("categories", {})
         structured = True
         help_infos: dict[str, str] = {}
@@ -56,14 +64,39 @@ def load_help_config() -> tuple[dict[str, str], dict[str, list[str]], dict[str,
                     help_infos[cmd_name] = cmd_desc
 
         if structured:
-            return help_infos, categories, cat_desc
+            return _freeze(help_infos, categories, cat_desc)
 
     # 2) Format intermédiaire
-    if isinstance(help_data, dict) and "commands" in help_data:
-        help_infos = dict(help_data.get("commands", {}) or {})
-        categories = dict(help_data.get("categories", {}) or {})
-        cat_desc = dict(help_data.get("category_descriptions", {}) or {})
-        return help_infos, categories, cat_desc
+    if "commands" in help_data:
+        return _freeze(
+            help_data.get("commands", {}) or {},
+            help_data.get("categories", {}) or {},
+            help_data.get("category_descriptions", {}) or {},
+        )
 
     # 3) Format legacy
-    return dict(help_data or {}), {}, {}
+    return _freeze(help_data, {}, {})
+
+
+_HELP = json_resource("help.json", compile_help_config)
+
+
+def get_help_config() -> HelpConfig:
+    """Retourne la config help compilée (rechargée en arrière-plan si help.json change)."""
+    return _HELP.get()
+
+
+def load_help_config() -> tuple[dict[str, str], dict[str, list[str]], dict[str, str]]:
+    """Retourne une copie modifiable de la config help.
+
+    Retourne:
+    - help_infos: {cmd_name: description}
+    - categories: {category_name: [cmd_name, ...]}
+    - category_descriptions: {category_name: description}
+    """
+    config = get_help_config()
+    return (
+        dict(config.help_infos),
+        {cat: list(cmds) for cat, cmds in config.categories.items()},
+        dict(config.category_descriptions),
+    )
@@ -0,0 +1,172 @@
+"""Registre des ressources JSON (`resources/json`) compilées une seule fois en structures immuables.
+
+Chaque fichier est lu et normalisé au premier chargement (préchargé au démarrage), puis servi depuis la
+mémoire : aucun parsing JSON sur le chemin d'une commande ou d'un événement. Une lecture vérifie au plus
+toutes les `CHECK_INTERVAL` secondes la date de modification et la taille du fichier (un `stat`) ; si
+elles ont changé, le fichier est relu dans un thread et la version compilée remplacée d'un bloc.
+Si la nouvelle version est illisible ou ne se compile pas, la dernière version valide est conservée.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RESOURCES_DIR = Path("./resources/json")
+CHECK_INTERVAL = 2.0
+
+# Modules qui déclarent une ressource à leur import (préchargés hors du chargement des extensions)
+RESOURCE_MODULES = (
+    "eldoria.json_tools.duels_json",
+    "eldoria.json_tools.help_json",
+    "eldoria.json_tools.welcome_json",
+)
+
+_Signature = tuple[int, int]
+
+
+def _signature(path: Path) -> _Signature | None:
+    """Retourne (mtime en ns, taille) du fichier, ou None s'il est absent."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def read_json_object(path: Path) -> dict[str, Any]:
+    """Lit un fichier JSON dont la racine doit être un objet ; lève OSError ou ValueError sinon."""
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    if not isinstance(data, dict):
+        raise ValueError("la racine du JSON doit être un objet")
+    return data
+
+
+class JsonResource(Generic[T]):
+    """Fichier JSON compilé par `compile(données brutes)` en une valeur immuable, rechargé quand il change.
+
+    Un fichier absent au premier chargement donne `compile({})` (valeurs par défaut).
+    """
+
+    __slots__ = (
+        "path",
+        "compile",
+        "check_interval",
+        "loads",
+        "failures",
+        "_value",
+        "_signature",
+        "_checked_at",
+        "_lock",
+        "_reload_thread",
+    )
+
+    def __init__(self, path: Path, compile: Callable[[dict[str, Any]], T], *, check_interval: float = CHECK_INTERVAL) -> None:
+        """Déclare la ressource sans lire le fichier (chargement au premier accès ou au préchargement)."""
+        self.path = Path(path)
+        self.compile = compile
+        self.check_interval = check_interval
+        self.loads = 0
+        self.failures = 0
+        self._value: T | None = None
+        self._signature: _Signature | None = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._reload_thread: threading.Thread | None = None
+
+    @property
+    def loaded(self) -> bool:
+        """Indique si une version compilée est disponible."""
+        return self._value is not None
+
+    def get(self) -> T:
+        """Retourne la version compilée courante ; lance un rechargement en arrière-plan si le fichier a changé."""
+        value = self._value
+        if value is None:
+            self.load()
+            return self._value  # type: ignore[return-value]
+        self._check_for_changes()
+        return value
+
+    def load(self) -> bool:
+        """Lit et compile le fichier maintenant ; retourne False (version précédente conservée) si c'est impossible."""
+        with self._lock:
+            signature = _signature(self.path)
+            self._checked_at = time.monotonic()
+            try:
+                if signature is None and self._value is None:
+                    # Fichier absent au démarrage : valeurs par défaut, sans erreur
+                    value = self.compile({})
+                else:
+                    value = self.compile(read_json_object(self.path))
+            except Exception:
+                # Fichier illisible, mais aussi JSON valide de forme inattendue qui fait échouer la compilation
+                self.failures += 1
+                # Le fichier fautif n'est pas relu tant qu'il ne change pas à nouveau
+                self._signature = signature
+                if self._value is None:
+                    self._value = self.compile({})
+                    log.warning("⚠️ Ressource %s illisible ou invalide : valeurs par défaut utilisées", self.path, exc_info=True)
+                else:
+                    log.warning("⚠️ Ressource %s illisible ou invalide : dernière version valide conservée", self.path, exc_info=True)
+                return False
+
+            self._value = value
+            self._signature = signature
+            self.loads += 1
+            return True
+
+    def _check_for_changes(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        if _signature(self.path) == self._signature:
+            return
+        thread = self._reload_thread
+        if thread is not None and thread.is_alive():
+            return
+        self._reload_thread = threading.Thread(target=self._reload, name=f"resource:{self.path.name}", daemon=True)
+        self._reload_thread.start()
+
+    def _reload(self) -> None:
+        if self.load():
+            log.info("🔁 Ressource %s rechargée", self.path)
+
+    def reset(self) -> None:
+        """Oublie la version compilée : le prochain accès relit le fichier."""
+        with self._lock:
+            self._value = None
+            self._signature = None
+            self._checked_at = 0.0
+
+
+_RESOURCES: dict[str, JsonResource[Any]] = {}
+
+
+def json_resource(filename: str, compile: Callable[[dict[str, Any]], T]) -> JsonResource[T]:
+    """Déclare (ou retourne) la ressource `RESOURCES_DIR/filename` compilée par `compile`."""
+    resource = _RESOURCES.get(filename)
+    if resource is None:
+        resource = _RESOURCES[filename] = JsonResource(RESOURCES_DIR / filename, compile)
+    return resource
+
+
+def preload_resources() -> dict[str, bool]:
+    """Importe les modules de ressources et compile chaque fichier ; retourne le succès du chargement par fichier."""
+    for module in RESOURCE_MODULES:
+        importlib.import_module(module)
+    return {name: resource.load() for name, resource in sorted(_RESOURCES.items())}
+
@@ -1,17 +1,68 @@
-"""Module de gestion du JSON de configuration du message de bienvenue."""
+"""Module de gestion du JSON de configuration du message de bienvenue.
 
-import json
+`resources/json/welcome_message.json` est compilé une fois en `WelcomePool` (cf. eldoria.json_tools.resources) :
+le tirage d'un message à chaque arrivée se fait sur le pool en mémoire.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
+from eldoria.json_tools.resources import json_resource
+
+
+@dataclass(frozen=True, slots=True)
+class WelcomeMessage:
+    """Message de bienvenue tirable : titre de son pack, texte brut (placeholders {user}/{server}) et emojis du pack."""
+
+    title: str
+    text: str
+    emojis: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class WelcomePool:
+    """Pool des messages de bienvenue valides, par clé (ex: w01), dans l'ordre du fichier."""
+
+    messages: MappingProxyType[str, WelcomeMessage]
+    keys: tuple[str, ...]
+
+
+def compile_welcome_pool(data: dict[str, Any]) -> WelcomePool:
+    """Construit le pool à partir des packs de welcome_message.json (packs et messages invalides ignorés)."""
+    packs = data.get("packs", [])
+    pool: dict[str, WelcomeMessage] = {}
+
+    if isinstance(packs, list):
+        for pack in packs:
+            if not isinstance(pack, dict):
+                continue
+
+            title = pack.get("title", "")
+            msgs = pack.get("messages", {})
+            emojis_raw = pack.get("emojis", [])
+
+            if not isinstance(title, str) or not title.strip():
+                continue
+            if not isinstance(msgs, dict) or not msgs:
+                continue
+
+            emojis: tuple[str, ...] = ()
+            if isinstance(emojis_raw, list):
+                emojis = tuple(e for e in emojis_raw if isinstance(e, str) and e.strip())
+
+            for k, v in msgs.items():
+                if isinstance(k, str) and isinstance(v, str) and v.strip():
+                    pool[str(k)] = WelcomeMessage(title=title.strip(), text=v, emojis=emojis)
+
+    return WelcomePool(messages=MappingProxyType(pool), keys=tuple(pool))
+
+
+_WELCOME = json_resource("welcome_message.json", compile_welcome_pool)
 
-def load_welcome_json(path: str = "./resources/json/welcome_message.json") -> dict[str, Any]:
-    """Charge le fichier welcome_message.json et renvoie le JSON brut."""
-    try:
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, dict) else {}
-    except FileNotFoundError:
-        return {}
-    except Exception:
-        return {}
 
+def get_welcome_pool() -> WelcomePool:
+    """Retourne le pool de messages compilé (rechargé en arrière-plan si welcome_message.json change)."""
+    return _WELCOME.get()
@@ -4,8 +4,20 @@ from __future__ import annotations
 
 
 def init_duel_ui() -> None:
-    """Initialise les composants de l'interface utilisateur pour les duels."""
+    """Initialise les composants de l'interface utilisateur pour les duels.
+
+    Enregistre les handlers des boutons (routés par `custom_id`) puis les jeux.
+    """
     # Import local pour éviter un import circulaire
+    from .dispatcher import ACTION_ACCEPT, ACTION_GAME, ACTION_REFUSE, ACTION_STAKE, register_action
+    from .flow.config import handle_stake_choice
+    from .flow.home import handle_game_choice
+    from .flow.invite import handle_accept, handle_refuse
     from .games import rps as rps_ui
-    
-    rps_ui.register()
\ No newline at end of file
+
+    register_action(ACTION_GAME, handle_game_choice)
+    register_action(ACTION_STAKE, handle_stake_choice)
+    register_action(ACTION_ACCEPT, handle_accept)
+    register_action(ACTION_REFUSE, handle_refuse)
+
+    rps_ui.register()
@@ -0,0 +1,113 @@
+"""Module de routage des boutons de duel par `custom_id`.
+
+Les boutons des duels ne sont portés par aucun objet View vivant : chaque bouton encode
+`duel:<duel_id>:<action>[:<arg>]` dans son `custom_id`, et un dispatcher unique (écoute `on_interaction`
+dans le cog Duels) retrouve le handler de l'action. L'état est relu depuis le duel en base par le service,
+ce qui garde une mémoire constante quel que soit le nombre de duels ouverts, et les boutons restent
+fonctionnels après un redémarrage.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import discord
+
+from eldoria.app.bot import EldoriaBot
+
+log = logging.getLogger(__name__)
+
+CUSTOM_ID_PREFIX = "duel"
+
+ACTION_GAME = "game"
+ACTION_STAKE = "stake"
+ACTION_ACCEPT = "accept"
+ACTION_REFUSE = "refuse"
+
+# handler(interaction, bot, duel_id, arg)
+DuelActionHandler = Callable[[discord.Interaction, EldoriaBot, int, str | None], Awaitable[None]]
+
+_HANDLERS: dict[str, DuelActionHandler] = {}
+
+
+def build_custom_id(duel_id: int, action: str, arg: Any = None) -> str:
+    """Construit le `custom_id` d'un bouton de duel : `duel:<duel_id>:<action>[:<arg>]` (100 caractères max)."""
+    custom_id = f"{CUSTOM_ID_PREFIX}:{int(duel_id)}:{action}"
+    if arg is not None:
+        custom_id = f"{custom_id}:{arg}"
+    return custom_id[:100]
+
+
+def parse_custom_id(custom_id: str | None) -> tuple[int, str, str | None] | None:
+    """Décode un `custom_id` de duel en (duel_id, action, arg), ou None s'il n'appartient pas aux duels."""
+    if not custom_id:
+        return None
+
+    parts = custom_id.split(":", 3)
+    if len(parts) < 3 or parts[0] != CUSTOM_ID_PREFIX or not parts[1].isdigit() or not parts[2]:
+        return None
+
+    arg = parts[3] if len(parts) == 4 else None
+    return int(parts[1]), parts[2], arg
+
+
+def register_action(action: str, handler: DuelActionHandler) -> None:
+    """Enregistre le handler d'une action de bouton de duel."""
+    _HANDLERS[str(action)] = handler
+
+
+def require_action(action: str) -> DuelActionHandler | None:
+    """Retourne le handler d'une action de bouton de duel, ou None si aucun n'est enregistré."""
+    return _HANDLERS.get(str(action))
+
+
+async def dispatch_duel_interaction(interaction: discord.Interaction, bot: EldoriaBot) -> bool:
+    """Route une interaction de composant vers le handler de duel correspondant.
+
+    Retourne True si l'interaction concernait un bouton de duel (traitée ou non), False sinon.
+    """
+    data = interaction.data or {}
+    parsed = parse_custom_id(data.get("custom_id") if isinstance(data, dict) else None)
+    if parsed is None:
+        return False
+
+    duel_id, action, arg = parsed
+    handler = require_action(action)
+    if handler is None:
+        log.warning("Action de duel inconnue (custom_id=%s)", data.get("custom_id"))
+        return True
+
+    try:
+        await handler(interaction, bot, duel_id, arg)
+    except Exception:
+        log.exception("Erreur lors du traitement d'un bouton de duel (duel_id=%s, action=%s)", duel_id, action)
+    return True
+
+
+class DuelComponentsView(discord.ui.View):
+    """View de mise en page uniquement : porte les boutons de duel, sans callback ni état.
+
+    Elle n'est jamais enregistrée auprès du bot (`is_dispatchable` → False) : aucun objet ne reste en mémoire
+    par message, les clics sont routés par `dispatch_duel_interaction` via le `custom_id`.
+    """
+
+    def __init__(self) -> None:
+        """Initialise une view sans timeout (les boutons restent valides tant que le duel l'est)."""
+        super().__init__(timeout=None)
+
+    def add_button(
+        self,
+        *,
+        label: str,
+        custom_id: str,
+        style: discord.ButtonStyle = discord.ButtonStyle.secondary,
+        disabled: bool = False,
+    ) -> None:
+        """Ajoute un bouton routé par `custom_id`."""
+        self.add_item(discord.ui.Button(label=label, style=style, custom_id=custom_id, disabled=disabled))
+
+    def is_dispatchable(self) -> bool:
+        """Empêche l'enregistrement de la view dans le ViewStore du bot."""
+        return False
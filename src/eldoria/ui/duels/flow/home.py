@@ -5,10 +5,13 @@ import discord
 from eldoria.app.bot import EldoriaBot
 from eldoria.exceptions.duel import DuelError
 from eldoria.exceptions.ui.duel_ui import duel_error_message
-from eldoria.json_tools.duels_json import get_duel_embed_data
 from eldoria.ui.common.embeds.colors import EMBED_COLOUR_PRIMARY
 from eldoria.ui.common.embeds.images import common_files, decorate
+from eldoria.ui.duels.dispatcher import ACTION_GAME, DuelComponentsView, build_custom_id
 from eldoria.ui.duels.flow.config import StakeXpView, build_config_stake_duels_embed
+from eldoria.utils.lazy import lazy_import
+
+get_duel_embed_data = lazy_import("eldoria.json_tools.duels_json", "get_duel_embed_data")
 
 
 async def build_home_duels_embed(expires_at: int) -> tuple[discord.Embed, list[discord.File]]:
@@ -40,43 +43,33 @@ async def build_home_duels_embed(expires_at: int) -> tuple[discord.Embed, list[d
     return embed, files
 
 
-class HomeView(discord.ui.View):
-    """View pour la configuration du type de jeu du duel."""
+class HomeView(DuelComponentsView):
+    """View pour la configuration du type de jeu du duel (boutons `duel:<id>:game:<game_key>`)."""
 
     def __init__(self, bot: EldoriaBot, duel_id: int) -> None:
         """Initialise la view avec les boutons de choix du type de jeu."""
-        super().__init__(timeout=600)
-        self.bot = bot
+        super().__init__()
         self.duel_id = duel_id
-        self.duel = bot.services.duel
 
         data = get_duel_embed_data()
         games = data.get("games", {})
 
         for game_key, game in games.items():
             label = game.get("name", str(game_key))[:80]  # Discord limite label à 80
-
-            btn = discord.ui.Button(
-                label=label,
-                style=discord.ButtonStyle.secondary
-            )
-
-            # IMPORTANT: on capture game_key avec une valeur par défaut
-            async def on_click(interaction: discord.Interaction, gk: str = game_key) -> None:
-                """Gère le clic sur un bouton de type de jeu."""
-                await interaction.response.defer()
-                try : 
-                    snapshot = self.duel.configure_game_type(self.duel_id, gk)
-                except DuelError as e:
-                    await interaction.edit_original_response(content=duel_error_message(e), embeds=[], attachments=[], view=None)
-                    return
-                
-                expires_at = snapshot["duel"]["expires_at"]
-                embed, files = await build_config_stake_duels_embed(expires_at)
-                await interaction.edit_original_response(
-                    embed=embed, files=files, view=StakeXpView(duel_id=self.duel_id, bot=self.bot)
-                    )
-                
-
-            btn.callback = on_click
-            self.add_item(btn)
\ No newline at end of file
+            self.add_button(label=label, custom_id=build_custom_id(duel_id, ACTION_GAME, game_key))
+
+
+async def handle_game_choice(interaction: discord.Interaction, bot: EldoriaBot, duel_id: int, game_key: str | None) -> None:
+    """Gère le clic sur un bouton de type de jeu : configure le jeu puis affiche le choix de la mise."""
+    await interaction.response.defer()
+    try :
+        snapshot = bot.services.duel.configure_game_type(duel_id, str(game_key or ""))
+    except DuelError as e:
+        await interaction.edit_original_response(content=duel_error_message(e), embeds=[], attachments=[], view=None)
+        return
+
+    expires_at = snapshot["duel"]["expires_at"]
+    embed, files = await build_config_stake_duels_embed(expires_at)
+    await interaction.edit_original_response(
+        embed=embed, files=files, view=StakeXpView(duel_id=duel_id, bot=bot)
+        )
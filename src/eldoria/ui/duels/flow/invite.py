@@ -5,9 +5,14 @@ import discord
 from eldoria.app.bot import EldoriaBot
 from eldoria.exceptions.duel import DuelError
 from eldoria.exceptions.ui.duel_ui import duel_error_message
-from eldoria.json_tools.duels_json import get_game_text
 from eldoria.ui.common.embeds.colors import EMBED_COLOUR_PRIMARY
 from eldoria.ui.common.embeds.images import common_thumb, decorate_thumb_only
+from eldoria.ui.duels.dispatcher import (
+    ACTION_ACCEPT,
+    ACTION_REFUSE,
+    DuelComponentsView,
+    build_custom_id,
+)
 from eldoria.ui.duels.render import render_duel_message
 from eldoria.ui.duels.result.refuse import build_refuse_duels_embed
 from eldoria.utils.discord_utils import (
@@ -16,6 +21,9 @@ from eldoria.utils.discord_utils import (
     require_guild,
     require_user_id,
 )
+from eldoria.utils.lazy import lazy_import
+
+get_game_text = lazy_import("eldoria.json_tools.duels_json", "get_game_text")
 
 
 async def build_invite_duels_embed(
@@ -64,71 +72,69 @@ async def build_invite_duels_embed(
 
 
 
-class InviteView(discord.ui.View):
-    """View pour l'invitation au duel, avec les boutons Accepter et Refuser."""
+class InviteView(DuelComponentsView):
+    """View pour l'invitation au duel, avec les boutons Accepter (`duel:<id>:accept`) et Refuser (`duel:<id>:refuse`)."""
 
     def __init__(self, bot: EldoriaBot, duel_id: int) -> None:
         """Initialise la view avec les boutons Accepter et Refuser."""
-        super().__init__(timeout=300)
-        self.bot = bot
+        super().__init__()
         self.duel_id = duel_id
-        self.duel = bot.services.duel
-        
-    @discord.ui.button(label="✅ Accepter", style=discord.ButtonStyle.secondary)
-    async def accept(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
-        """Gère le clic sur le bouton Accepter."""
-        await interaction.response.defer()
-
-        try:
-            snapshot = self.duel.accept_duel(duel_id=self.duel_id, user_id=require_user_id(interaction=interaction))
-            snapshot.get("duel")
-        except DuelError as e:
-            await interaction.followup.send(content=duel_error_message(e), ephemeral=True)
-            return
-
-        guild = require_guild(interaction=interaction)
-
-        try:
-            embed, _, view = await render_duel_message(snapshot=snapshot, guild=guild, bot=self.bot)
-        except Exception:
-            # fallback minimal si jamais un renderer n'existe pas encore
-            await interaction.followup.send(content="Le duel a été accepté, mais l'UI du jeu n'est pas encore prête.", ephemeral=True)
-            return
-
-        msg = interaction.message
-        if msg is None:
-            await interaction.followup.send(content="Impossible de modifier le message (message introuvable).", ephemeral=True)
-            return
-
-        # On édite le message d'invite (celui avec les boutons accepter/refuser)
-        await msg.edit(content=msg.content or "", embed=embed, view=view)
-
-
-    @discord.ui.button(label="❌ Refuser", style=discord.ButtonStyle.secondary)
-    async def refuse(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
-        """Gère le clic sur le bouton Refuser."""
-        await interaction.response.defer()
-
-        try:
-            snapshot = self.duel.refuse_duel(duel_id=self.duel_id, user_id=require_user_id(interaction=interaction))
-        except DuelError as e:
-            await interaction.followup.send(content=duel_error_message(e), ephemeral=True)
-            return
-        
-        player_b_id = snapshot["duel"]["player_b"]
-        guild = require_guild(interaction=interaction)
-        
-        try:
-            player_b = await get_member_by_id_or_raise(guild, player_b_id)
-        except ValueError:
-            await interaction.edit_original_response(content="Un des participants n'a pas pu être trouvé.", embeds=[], attachments=[], view=None)
-            return
-        
-        embed, _ = await build_refuse_duels_embed(player_b=player_b)
-        
-        message_id = snapshot["duel"]["message_id"]
-        channel_id = snapshot["duel"]["channel_id"]
-        channel = await get_text_or_thread_channel(bot=self.bot, channel_id=channel_id)
-        message = await channel.fetch_message(message_id) 
-
-        await message.edit( content="", embed=embed, view=None)
\ No newline at end of file
+        self.add_button(label="✅ Accepter", custom_id=build_custom_id(duel_id, ACTION_ACCEPT))
+        self.add_button(label="❌ Refuser", custom_id=build_custom_id(duel_id, ACTION_REFUSE))
+
+
+async def handle_accept(interaction: discord.Interaction, bot: EldoriaBot, duel_id: int, _arg: str | None) -> None:
+    """Gère le clic sur le bouton Accepter."""
+    await interaction.response.defer()
+
+    try:
+        snapshot = bot.services.duel.accept_duel(duel_id=duel_id, user_id=require_user_id(interaction=interaction))
+    except DuelError as e:
+        await interaction.followup.send(content=duel_error_message(e), ephemeral=True)
+        return
+
+    guild = require_guild(interaction=interaction)
+
+    try:
+        embed, _, view = await render_duel_message(snapshot=snapshot, guild=guild, bot=bot)
+    except Exception:
+        # fallback minimal si jamais un renderer n'existe pas encore
+        await interaction.followup.send(content="Le duel a été accepté, mais l'UI du jeu n'est pas encore prête.", ephemeral=True)
+        return
+
+    msg = interaction.message
+    if msg is None:
+        await interaction.followup.send(content="Impossible de modifier le message (message introuvable).", ephemeral=True)
+        return
+
+    # On édite le message d'invite (celui avec les boutons accepter/refuser)
+    await msg.edit(content=msg.content or "", embed=embed, view=view)
+
+
+async def handle_refuse(interaction: discord.Interaction, bot: EldoriaBot, duel_id: int, _arg: str | None) -> None:
+    """Gère le clic sur le bouton Refuser."""
+    await interaction.response.defer()
+
+    try:
+        snapshot = bot.services.duel.refuse_duel(duel_id=duel_id, user_id=require_user_id(interaction=interaction))
+    except DuelError as e:
+        await interaction.followup.send(content=duel_error_message(e), ephemeral=True)
+        return
+
+    player_b_id = snapshot["duel"]["player_b"]
+    guild = require_guild(interaction=interaction)
+
+    try:
+        player_b = await get_member_by_id_or_raise(guild, player_b_id)
+    except ValueError:
+        await interaction.edit_original_response(content="Un des participants n'a pas pu être trouvé.", embeds=[], attachments=[], view=None)
+        return
+
+    embed, _ = await build_refuse_duels_embed(player_b=player_b)
+
+    message_id = snapshot["duel"]["message_id"]
+    channel_id = snapshot["duel"]["channel_id"]
+    channel = await get_text_or_thread_channel(bot=bot, channel_id=channel_id)
+    message = await channel.fetch_message(message_id)
+
+    await message.edit( content="", embed=embed, view=None)
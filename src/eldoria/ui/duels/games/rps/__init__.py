@@ -1,9 +1,12 @@
 """Module d'initialisation du jeu Pierre-Feuille-Ciseaux pour les duels."""
 import eldoria.features.duel.constants as constants
 from eldoria.ui.duels.games.rps.renderer import render_rps
+from eldoria.ui.duels.games.rps.view import ACTION_RPS, handle_rps_move
 
 
 def register() -> None:
-    """Enregistre le renderer du jeu Pierre-Feuille-Ciseaux."""
+    """Enregistre le renderer et le handler des boutons du jeu Pierre-Feuille-Ciseaux."""
+    from eldoria.ui.duels.dispatcher import register_action
     from eldoria.ui.duels.registry import register_renderer
     register_renderer(constants.GAME_RPS, render_rps)
+    register_action(ACTION_RPS, handle_rps_move)
@@ -13,46 +13,43 @@ from eldoria.features.duel.games.rps.rps_constants import (
     RPS_MOVE_SCISSORS,
 )
 from eldoria.ui.duels.apply import apply_duel_snapshot
+from eldoria.ui.duels.dispatcher import DuelComponentsView, build_custom_id
 from eldoria.utils.discord_utils import require_user_id
 
+# Action des boutons : `duel:<id>:rps:<move>`
+ACTION_RPS = "rps"
 
-class RpsView(discord.ui.View):
+RPS_BUTTONS: list[tuple[str, str]] = [
+    ("🪨 Pierre", RPS_MOVE_ROCK),
+    ("📄 Feuille", RPS_MOVE_PAPER),
+    ("✂️ Ciseaux", RPS_MOVE_SCISSORS),
+]
+
+
+class RpsView(DuelComponentsView):
     """View pour le jeu Pierre-Papier-Ciseaux dans les duels."""
 
     def __init__(self, *, bot: EldoriaBot, duel_id: int) -> None:
         """Initialise la view avec les boutons pour jouer au Pierre-Papier-Ciseaux."""
-        super().__init__(timeout=600)
-        self.bot = bot
+        super().__init__()
         self.duel_id = duel_id
-        self.duel = self.bot.services.duel
-
-    async def _play(self, interaction: discord.Interaction, move: str) -> None:
-        await interaction.response.defer()
-
-        try:
-            snapshot = self.duel.play_game_action(
-                duel_id=self.duel_id,
-                user_id=require_user_id(interaction=interaction),
-                action={"move": move},
-            )
-        except DuelError as e:
-            await interaction.followup.send(content=duel_error_message(e), ephemeral=True)
-            return
-
-        # re-render the same message
-        await apply_duel_snapshot(interaction=interaction, snapshot=snapshot, bot=self.bot)
-
-    @discord.ui.button(label="🪨 Pierre", style=discord.ButtonStyle.secondary)
-    async def rock(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
-        """Gère le clic sur le bouton Pierre."""
-        await self._play(interaction, RPS_MOVE_ROCK)
-
-    @discord.ui.button(label="📄 Feuille", style=discord.ButtonStyle.secondary)
-    async def paper(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
-        """Gère le clic sur le bouton Feuille."""
-        await self._play(interaction, RPS_MOVE_PAPER)
-
-    @discord.ui.button(label="✂️ Ciseaux", style=discord.ButtonStyle.secondary)
-    async def scissors(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
-        """Gère le clic sur le bouton Ciseaux."""
-        await self._play(interaction, RPS_MOVE_SCISSORS)
+        for label, move in RPS_BUTTONS:
+            self.add_button(label=label, custom_id=build_custom_id(duel_id, ACTION_RPS, move))
+
+
+async def handle_rps_move(interaction: discord.Interaction, bot: EldoriaBot, duel_id: int, move: str | None) -> None:
+    """Gère le clic sur un bouton de coup : joue le coup puis re-rend le message du duel."""
+    await interaction.response.defer()
+
+    try:
+        snapshot = bot.services.duel.play_game_action(
+            duel_id=duel_id,
+            user_id=require_user_id(interaction=interaction),
+            action={"move": move},
+        )
+    except DuelError as e:
+        await interaction.followup.send(content=duel_error_message(e), ephemeral=True)
+        return
+
+    # re-render the same message
+    await apply_duel_snapshot(interaction=interaction, snapshot=snapshot, bot=bot)
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import discord
 
-from eldoria.json_tools.duels_json import get_game_text
 from eldoria.ui.common.embeds.colors import EMBED_COLOUR_VALIDATION
 from eldoria.ui.common.embeds.images import common_thumb, decorate_thumb_only
+from eldoria.utils.lazy import lazy_import
+
+get_game_text = lazy_import("eldoria.json_tools.duels_json", "get_game_text")
 
 
 async def build_game_result_base_embed(
@@ -0,0 +1,112 @@
+"""Module des embeds pour les statistiques et le classement des duels."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TypeAlias
+
+import discord
+
+from eldoria.app.bot import EldoriaBot
+from eldoria.ui.common.embeds.colors import EMBED_COLOUR_PRIMARY
+from eldoria.ui.common.embeds.images import common_files, decorate
+
+DuelLeaderboardItem: TypeAlias = tuple[int, int, int, int, int, int]
+
+
+def _win_rate(wins: int, played: int) -> str:
+    """Retourne le taux de victoire formaté (ex: "62 %"), ou "—" si aucun duel joué."""
+    if played <= 0:
+        return "—"
+    return f"{round(100 * wins / played)} %"
+
+
+async def build_duel_stats_embed(
+    *,
+    user: discord.User | discord.Member,
+    stats: dict[str, int],
+) -> tuple[discord.Embed, list[discord.File]]:
+    """Construit l'embed des statistiques de duel d'un membre."""
+    played = int(stats.get("played", 0))
+    wins = int(stats.get("wins", 0))
+    xp_net = int(stats.get("xp_net", 0))
+
+    embed = discord.Embed(
+        title="⚔️ Statistiques de duel",
+        colour=EMBED_COLOUR_PRIMARY,
+    )
+    embed.set_author(
+        name=user.display_name,
+        icon_url=user.display_avatar.url if user.display_avatar else None,
+    )
+
+    if played == 0 and not stats.get("expired"):
+        embed.description = "Aucun duel joué pour le moment."
+    else:
+        embed.add_field(
+            name="Bilan",
+            value=(
+                f"Victoires : **{wins}**\n"
+                f"Défaites : **{stats.get('losses', 0)}**\n"
+                f"Égalités : **{stats.get('draws', 0)}**\n"
+                f"Expirés : **{stats.get('expired', 0)}**"
+            ),
+            inline=True,
+        )
+        embed.add_field(
+            name="XP",
+            value=(
+                f"Gagnée : **{stats.get('xp_won', 0)} XP**\n"
+                f"Perdue : **{stats.get('xp_lost', 0)} XP**\n"
+                f"Solde : **{xp_net:+d} XP**"
+            ),
+            inline=True,
+        )
+        embed.add_field(
+            name="Taux de victoire",
+            value=f"**{_win_rate(wins, played)}** sur {played} duel(s)",
+            inline=False,
+        )
+
+    decorate(embed, None, None)
+    files = common_files(None, None)
+    return embed, files
+
+
+async def build_duel_leaderboard_embed(
+    items: Sequence[DuelLeaderboardItem],
+    current_page: int,
+    total_pages: int,
+    guild_id: int,
+    bot: EldoriaBot,
+) -> tuple[discord.Embed, list[discord.File]]:
+    """Génère l'embed du classement des duels.
+
+    `items` est au format list[(user_id, wins, losses, draws, xp_won, xp_lost)].
+    """
+    embed = discord.Embed(
+        title="Classement des duels",
+        description="Membres classés par nombre de victoires.",
+        colour=EMBED_COLOUR_PRIMARY,
+    )
+
+    guild = bot.get_guild(guild_id) if guild_id else None
+
+    if not items:
+        embed.add_field(name="Aucun duel", value="Personne n'a encore terminé de duel.", inline=False)
+    else:
+        lines = []
+        rank_start = current_page * 10 + 1
+        for idx, (user_id, wins, losses, draws, xp_won, xp_lost) in enumerate(items, start=rank_start):
+            member = guild.get_member(user_id) if guild else None
+            name = member.display_name if member else f"ID {user_id}"
+            lines.append(
+                f"**{idx}.** {name} — **{wins}V** / {losses}D / {draws}N — {xp_won - xp_lost:+d} XP"
+            )
+        embed.add_field(name="Duellistes", value="\n".join(lines), inline=False)
+
+    embed.set_footer(text=f"Page {current_page + 1}/{max(total_pages, 1)}")
+
+    decorate(embed, None, None)
+    files = common_files(None, None)
+    return embed, files
@@ -18,7 +18,8 @@ def build_command_index(bot: object) -> tuple[list[tuple[str, object]], dict[str
     - pairs: [(qualified_name, cmd_obj), ...] incluant groupes + sous-commandes
     - cmd_map: {qualified_name: cmd_obj}
     """
-    cmds = getattr(bot, "application_commands", None) or []
+    # Repli sur l'arbre local si les commandes enregistrées n'ont pas pu être relues (synchronisation évitée)
+    cmds = getattr(bot, "application_commands", None) or getattr(bot, "pending_application_commands", None) or []
 
     def _children(cmd: object) -> list[object]:
         # Compat multi-versions (discord.py / pycord): on tente plusieurs attributs.
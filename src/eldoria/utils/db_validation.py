@@ -1,5 +1,8 @@
 """Utilitaires pour la validation de fichiers de base de données SQLite."""
 
+import asyncio
+import gzip
+import shutil
 import sqlite3
 import tempfile
 import time
@@ -8,9 +11,27 @@ from pathlib import Path
 import discord
 
 
+def _gunzip(src: Path, dst: Path) -> None:
+    with gzip.open(src, "rb") as fin, open(dst, "wb") as fout:
+        shutil.copyfileobj(fin, fout, 1024 * 1024)
+
+
+def _unlink_with_retry(path: Path) -> None:
+    for _ in range(5):
+        try:
+            path.unlink()
+            break
+        except FileNotFoundError:
+            break
+        except PermissionError:
+            time.sleep(0.05)
+
+
 async def is_valid_sqlite_db(attachment: discord.Attachment) -> bool:
-    """Vérifie si un fichier attaché est une base de données SQLite valide."""
-    if not attachment.filename.lower().endswith(".db"):
+    """Vérifie si un fichier attaché est une base de données SQLite valide (`.db`, ou `.db.gz` décompressé au préalable)."""
+    filename = attachment.filename.lower()
+    compressed = filename.endswith(".db.gz")
+    if not filename.endswith(".db") and not compressed:
         return False
 
     tmp = tempfile.NamedTemporaryFile(delete=False)
@@ -19,9 +40,16 @@ async def is_valid_sqlite_db(attachment: discord.Attachment) -> bool:
 
     await attachment.save(tmp_path)
 
+    db_path = tmp_path
     conn: sqlite3.Connection | None = None
     try:
-        conn = sqlite3.connect(str(tmp_path))
+        if compressed:
+            db_path = tmp_path.with_name(tmp_path.name + ".db")
+            try:
+                await asyncio.to_thread(_gunzip, tmp_path, db_path)
+            except (OSError, EOFError):
+                return False
+        conn = sqlite3.connect(str(db_path))
         conn.execute("PRAGMA schema_version;")
         return True
     except sqlite3.DatabaseError:
@@ -33,11 +61,6 @@ async def is_valid_sqlite_db(attachment: discord.Attachment) -> bool:
         except Exception:
             pass
 
-        for _ in range(5):
-            try:
-                tmp_path.unlink()
-                break
-            except FileNotFoundError:
-                break
-            except PermissionError:
-                time.sleep(0.05)
+        _unlink_with_retry(tmp_path)
+        if db_path != tmp_path:
+            _unlink_with_retry(db_path)
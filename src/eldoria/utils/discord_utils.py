@@ -79,6 +79,15 @@ async def get_text_or_thread_channel(bot: discord.Client, channel_id: int) -> di
     return channel
 
 
+def get_partial_message(bot: discord.Client, channel_id: int, message_id: int) -> discord.PartialMessage:
+    """Retourne un message partiel (channel_id, message_id) sans aucun appel REST.
+
+    Permet d'éditer ou supprimer un message connu sans résoudre le canal ni fetch le message :
+    seule l'action elle-même (PATCH/DELETE) part vers l'API, et lève `discord.NotFound` si le message n'existe plus.
+    """
+    return bot.get_partial_messageable(channel_id).get_partial_message(message_id)
+
+
 def require_guild(interaction: discord.Interaction) -> discord.Guild:
     """Extrait le serveur d'une interaction, ou lève une exception si elle n'est pas dans un contexte de serveur."""
     if interaction.guild is None:
@@ -0,0 +1,51 @@
+"""Utilitaires d'import paresseux : les modules UI lourds (panels admin, aide...) ne sont chargés qu'au premier usage."""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+
+class LazyImport:
+    """Référence vers `module.attr` importée au premier appel ou au premier accès d'attribut.
+
+    S'utilise comme l'objet importé (`View(...)`, `await build_embed(...)`), tout en gardant un nom de module
+    remplaçable par monkeypatch dans les tests.
+    """
+
+    __slots__ = ("_module", "_attr", "_target")
+
+    def __init__(self, module: str, attr: str) -> None:
+        """Initialise la référence paresseuse vers `module.attr` sans rien importer."""
+        self._module = module
+        self._attr = attr
+        self._target: Any = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Retourne True si le module cible a déjà été importé via cette référence."""
+        return self._target is not None
+
+    def resolve(self) -> Any:
+        """Importe le module cible (une seule fois) et retourne l'objet référencé."""
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._attr)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Appelle l'objet référencé (construction de view, fonction d'embed...)."""
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Délègue l'accès aux attributs à l'objet référencé."""
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        """Représentation lisible pour les logs et le débogage."""
+        state = "chargé" if self.is_loaded else "non chargé"
+        return f"<LazyImport {self._module}.{self._attr} ({state})>"
+
+
+def lazy_import(module: str, attr: str) -> Any:
+    """Retourne une référence paresseuse vers `module.attr` (importé au premier usage)."""
+    return LazyImport(module, attr)
@@ -0,0 +1,529 @@
+"""Registre de métriques en mémoire (compteurs, jauges, histogrammes) exporté au format texte Prometheus.
+
+Instrumentation prévue :
+- événements Discord (`timed_event`) : nombre, erreurs et durée par handler ;
+- commandes slash (`command_started` / `command_finished`, appelés par le cog Core) ;
+- itérations des `tasks.loop` (`timed_loop`) ;
+- appels de services (`instrument_service`, décorateur de classe).
+
+L'export se fait via `render_prometheus()`, la commande admin `/metrics` ou un endpoint HTTP local
+optionnel (`METRICS_PORT`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+log = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+C = TypeVar("C", bound=type)
+
+# Bornes (en secondes) adaptées à des handlers Discord : de la milliseconde à la dizaine de secondes
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base commune : nom, aide, labels et verrou (les services peuvent être appelés depuis des threads)."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        """Initialise la métrique avec son nom Prometheus, sa description et ses noms de labels."""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Labels attendus pour {self.name} : {self.labelnames}, reçus : {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def samples(self) -> list[tuple[str, str, float]]:
+        """Retourne les échantillons (suffixe, labels formatés, valeur) à exporter."""
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Remet la métrique à zéro."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Compteur monotone (total d'événements, d'erreurs...)."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        """Initialise un compteur vide."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Incrémente le compteur pour la combinaison de labels donnée."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Retourne la valeur courante pour une combinaison de labels (0 si jamais incrémentée)."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[tuple[str, str, float]]:
+        """Retourne un échantillon par combinaison de labels."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [("", _format_labels(self.labelnames, key), value) for key, value in items]
+
+    def reset(self) -> None:
+        """Remet le compteur à zéro."""
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """Jauge (valeur instantanée : guilds connectées, latence du gateway...)."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        """Initialise une jauge vide."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Fixe la valeur de la jauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Augmente la jauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Diminue la jauge."""
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        """Retourne la valeur courante (0 si jamais fixée)."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[tuple[str, str, float]]:
+        """Retourne un échantillon par combinaison de labels."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [("", _format_labels(self.labelnames, key), value) for key, value in items]
+
+    def reset(self) -> None:
+        """Vide la jauge."""
+        with self._lock:
+            self._values.clear()
+
+
+class _HistogramState:
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.buckets = [0] * size
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(_Metric):
+    """Histogramme à bornes fixes (durées), avec estimation des quantiles comme `histogram_quantile`."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialise un histogramme vide avec des bornes croissantes (la borne +Inf est implicite)."""
+        super().__init__(name, documentation, labelnames)
+        self.bounds = tuple(sorted(float(b) for b in buckets))
+        self._states: dict[tuple[str, ...], _HistogramState] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Enregistre une observation (en secondes pour les durées)."""
+        key = self._key(labels)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = _HistogramState(len(self.bounds))
+            i = bisect_left(self.bounds, value)
+            if i < len(self.bounds):
+                state.buckets[i] += 1
+            state.count += 1
+            state.sum += value
+
+    def count(self, **labels: Any) -> int:
+        """Retourne le nombre d'observations pour une combinaison de labels."""
+        state = self._states.get(self._key(labels))
+        return state.count if state else 0
+
+    def quantile(self, q: float, **labels: Any) -> float | None:
+        """Estime le quantile `q` (0-1) par interpolation linéaire dans le bucket concerné (None sans observation)."""
+        state = self._states.get(self._key(labels))
+        if state is None or state.count == 0:
+            return None
+        rank = q * state.count
+        cumulative = 0
+        lower = 0.0
+        for bound, n in zip(self.bounds, state.buckets, strict=True):
+            if n and cumulative + n >= rank:
+                return lower + (bound - lower) * ((rank - cumulative) / n)
+            cumulative += n
+            lower = bound
+        # Au-delà de la dernière borne : on ne peut pas faire mieux que la dernière borne connue
+        return self.bounds[-1] if self.bounds else None
+
+    def label_sets(self) -> list[dict[str, str]]:
+        """Retourne les combinaisons de labels observées."""
+        with self._lock:
+            keys = sorted(self._states)
+        return [dict(zip(self.labelnames, key, strict=True)) for key in keys]
+
+    def samples(self) -> list[tuple[str, str, float]]:
+        """Retourne les échantillons `_bucket` (cumulés), `_sum` et `_count` par combinaison de labels."""
+        out: list[tuple[str, str, float]] = []
+        with self._lock:
+            items = sorted((key, list(s.buckets), s.count, s.sum) for key, s in self._states.items())
+        for key, buckets, count, total in items:
+            cumulative = 0
+            for bound, n in zip(self.bounds, buckets, strict=True):
+                cumulative += n
+                le = f'le="{_format_value(bound)}"'
+                out.append(("_bucket", _format_labels(self.labelnames, key, le), cumulative))
+            out.append(("_bucket", _format_labels(self.labelnames, key, 'le="+Inf"'), count))
+            out.append(("_sum", _format_labels(self.labelnames, key), total))
+            out.append(("_count", _format_labels(self.labelnames, key), count))
+        return out
+
+    def reset(self) -> None:
+        """Vide l'histogramme."""
+        with self._lock:
+            self._states.clear()
+
+
+class MetricsRegistry:
+    """Ensemble des métriques du processus, avec des collecteurs appelés juste avant chaque export."""
+
+    def __init__(self) -> None:
+        """Initialise un registre vide."""
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self.started_at = time.time()
+
+    def _get_or_create(self, cls: type[_Metric], name: str, documentation: str, **kwargs: Any) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, documentation, **kwargs)
+        elif not isinstance(metric, cls):
+            raise ValueError(f"La métrique {name} existe déjà avec un autre type ({metric.kind})")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        """Retourne le compteur `name`, en le créant au premier appel."""
+        return self._get_or_create(Counter, name, documentation, labelnames=labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        """Retourne la jauge `name`, en la créant au premier appel."""
+        return self._get_or_create(Gauge, name, documentation, labelnames=labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Retourne l'histogramme `name`, en le créant au premier appel."""
+        return self._get_or_create(Histogram, name, documentation, labelnames=labelnames, buckets=buckets)
+
+    def register_collector(self, collector: Callable[[], None]) -> None:
+        """Ajoute une fonction appelée avant chaque export (mise à jour des jauges calculées à la demande)."""
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def collect(self) -> None:
+        """Exécute les collecteurs (une erreur de collecteur n'empêche pas l'export)."""
+        for collector in list(self._collectors):
+            try:
+                collector()
+            except Exception:
+                log.warning("⚠️ Collecteur de métriques en erreur : %r", collector, exc_info=True)
+
+    def render_prometheus(self) -> str:
+        """Retourne toutes les métriques au format texte d'exposition Prometheus (0.0.4)."""
+        self.collect()
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{name}{suffix}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Remet toutes les métriques à zéro (les définitions et collecteurs sont conservés)."""
+        for metric in self._metrics.values():
+            metric.reset()
+        self.started_at = time.time()
+
+
+REGISTRY = MetricsRegistry()
+
+EVENTS_TOTAL = REGISTRY.counter(
+    "eldoria_events_total", "Événements Discord traités, par événement et handler.", ("event", "handler")
+)
+EVENT_ERRORS_TOTAL = REGISTRY.counter(
+    "eldoria_event_errors_total", "Handlers d'événements terminés par une exception.", ("event", "handler")
+)
+EVENT_SECONDS = REGISTRY.histogram(
+    "eldoria_event_duration_seconds", "Durée des handlers d'événements Discord.", ("event", "handler")
+)
+COMMANDS_TOTAL = REGISTRY.counter(
+    "eldoria_commands_total", "Commandes slash exécutées, par commande et statut.", ("command", "status")
+)
+COMMAND_SECONDS = REGISTRY.histogram(
+    "eldoria_command_duration_seconds", "Durée des commandes slash (de la réception à la fin).", ("command",)
+)
+LOOP_ITERATIONS_TOTAL = REGISTRY.counter(
+    "eldoria_loop_iterations_total", "Itérations des tâches périodiques, par tâche et statut.", ("loop", "status")
+)
+LOOP_SECONDS = REGISTRY.histogram(
+    "eldoria_loop_duration_seconds", "Durée d'une itération de tâche périodique.", ("loop",)
+)
+SERVICE_CALLS_TOTAL = REGISTRY.counter(
+    "eldoria_service_calls_total", "Appels aux services, par service, méthode et statut.", ("service", "method", "status")
+)
+SERVICE_SECONDS = REGISTRY.histogram(
+    "eldoria_service_call_duration_seconds", "Durée des appels aux services.", ("service", "method")
+)
+
+
+def render_prometheus() -> str:
+    """Retourne les métriques du registre global au format texte Prometheus."""
+    return REGISTRY.render_prometheus()
+
+
+# -------------------- Décorateurs d'instrumentation --------------------
+
+def timed_event(event: str) -> Callable[[F], F]:
+    """Décore un listener asynchrone : compte ses appels, ses erreurs et mesure sa durée."""
+
+    def decorator(fn: F) -> F:
+        handler = fn.__qualname__
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            except BaseException:
+                EVENT_ERRORS_TOTAL.inc(event=event, handler=handler)
+                raise
+            finally:
+                EVENTS_TOTAL.inc(event=event, handler=handler)
+                EVENT_SECONDS.observe(time.perf_counter() - start, event=event, handler=handler)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def timed_loop(name: str) -> Callable[[F], F]:
+    """Décore le corps d'une `tasks.loop` : compte les itérations (ok / error) et mesure leur durée."""
+
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            status = "error"
+            try:
+                result = await fn(*args, **kwargs)
+                status = "ok"
+                return result
+            finally:
+                LOOP_ITERATIONS_TOTAL.inc(loop=name, status=status)
+                LOOP_SECONDS.observe(time.perf_counter() - start, loop=name)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _wrap_service_method(service: str, method: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            status = "error"
+            try:
+                result = await fn(*args, **kwargs)
+                status = "ok"
+                return result
+            finally:
+                SERVICE_CALLS_TOTAL.inc(service=service, method=method, status=status)
+                SERVICE_SECONDS.observe(time.perf_counter() - start, service=service, method=method)
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        status = "error"
+        try:
+            result = fn(*args, **kwargs)
+            status = "ok"
+            return result
+        finally:
+            SERVICE_CALLS_TOTAL.inc(service=service, method=method, status=status)
+            SERVICE_SECONDS.observe(time.perf_counter() - start, service=service, method=method)
+
+    return wrapper
+
+
+def instrument_service(service: str) -> Callable[[C], C]:
+    """Décorateur de classe : instrumente chaque méthode publique d'un service (appels, erreurs, durée)."""
+
+    def decorator(cls: C) -> C:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not inspect.isfunction(value):
+                continue
+            setattr(cls, attr, _wrap_service_method(service, attr, value))
+        return cls
+
+    return decorator
+
+
+# -------------------- Commandes slash --------------------
+
+_MAX_PENDING_COMMANDS = 1024
+_PENDING_COMMANDS: dict[int, tuple[str, float]] = {}
+
+
+def _command_name(ctx: Any) -> str:
+    command = getattr(ctx, "command", None)
+    name = getattr(command, "qualified_name", None) or getattr(command, "name", None)
+    return str(name) if name else "inconnue"
+
+
+def command_started(ctx: Any) -> None:
+    """Note le début d'une commande slash (appelé depuis `on_application_command`)."""
+    if len(_PENDING_COMMANDS) >= _MAX_PENDING_COMMANDS:
+        # Commandes jamais terminées (interaction perdue...) : on oublie la plus ancienne
+        _PENDING_COMMANDS.pop(next(iter(_PENDING_COMMANDS)))
+    _PENDING_COMMANDS[id(ctx)] = (_command_name(ctx), time.perf_counter())
+
+
+def command_finished(ctx: Any, status: str) -> None:
+    """Enregistre la fin d'une commande slash (`ok` ou `error`) et sa durée si son début a été noté."""
+    pending = _PENDING_COMMANDS.pop(id(ctx), None)
+    name = pending[0] if pending else _command_name(ctx)
+    COMMANDS_TOTAL.inc(command=name, status=status)
+    if pending is not None:
+        COMMAND_SECONDS.observe(time.perf_counter() - pending[1], command=name)
+
+
+# -------------------- Résumé lisible --------------------
+
+def summarize(*, quantile: float = 0.99) -> list[str]:
+    """Retourne un résumé lisible : débit par minute et latence au quantile donné des événements, commandes et tâches."""
+    uptime_min = max((time.time() - REGISTRY.started_at) / 60, 1e-9)
+    lines: list[str] = []
+    for title, histogram in (
+        ("Événements", EVENT_SECONDS),
+        ("Commandes", COMMAND_SECONDS),
+        ("Tâches", LOOP_SECONDS),
+        ("Services", SERVICE_SECONDS),
+    ):
+        label_sets = histogram.label_sets()
+        if not label_sets:
+            continue
+        lines.append(f"{title} :")
+        rows = []
+        for labels in label_sets:
+            count = histogram.count(**labels)
+            q = histogram.quantile(quantile, **labels) or 0.0
+            rows.append((q, " / ".join(labels.values()), count))
+        for q, name, count in sorted(rows, reverse=True)[:10]:
+            lines.append(f"  {name} : {count / uptime_min:.1f}/min, p{int(quantile * 100)} {q * 1000:.1f} ms")
+    return lines
+
+
+# -------------------- Endpoint HTTP (optionnel) --------------------
+
+async def _handle_http(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+        # Les en-têtes sont ignorés, mais lus jusqu'à la ligne vide
+        while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+            pass
+        parts = request_line.decode("latin-1").split()
+        if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] in ("/metrics", "/"):
+            body = render_prometheus().encode("utf-8")
+            status = "200 OK"
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body = b"not found\n"
+            status = "404 Not Found"
+            content_type = "text/plain; charset=utf-8"
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+    except (TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_http_server(port: int, host: str = "127.0.0.1") -> asyncio.Server:
+    """Démarre l'endpoint HTTP d'export (`GET /metrics`) sur l'hôte et le port donnés."""
+    server = await asyncio.start_server(_handle_http, host, port)
+    log.info("📈 Métriques exposées sur http://%s:%s/metrics", host, port)
+    return server
+
+
+def register_collector(collector: Callable[[], None]) -> None:
+    """Ajoute un collecteur au registre global (voir `MetricsRegistry.register_collector`)."""
+    REGISTRY.register_collector(collector)
+
@@ -1,20 +1,190 @@
-"""Utilitaires pour la lecture de fichiers, notamment les logs du bot."""
+"""Utilitaires pour la lecture de fichiers, notamment les logs du bot.
 
+Les logs sont lus à rebours, par blocs depuis la fin du fichier : lire la fin de `bot.log` coûte la taille
+du résultat et non celle du fichier. La lecture enchaîne sur les fichiers de rotation (`bot.log.1` …
+`bot.log.5`) quand le fichier courant ne suffit pas.
+"""
 
-from collections import deque
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 
 from eldoria.config import LOG_PATH
 from eldoria.exceptions.general import LogFileNotFound
 
+BLOCK_SIZE = 64 * 1024
+MAX_ROTATED_FILES = 5
+
+# En-tête d'un enregistrement (cf. eldoria.app.logging) : "31/12/2025  23:59:59  WARNING     eldoria.x - message"
+_RECORD_HEADER = re.compile(r"^(\d{2}/\d{2}/\d{4}  \d{2}:\d{2}:\d{2})  (\w+)\s+(\S+)\s+- ")
+_TIMESTAMP_FORMAT = "%d/%m/%Y  %H:%M:%S"
+
+
+def iter_lines_reverse(path: str | Path, block_size: int = BLOCK_SIZE) -> Iterator[str]:
+    """Parcourt les lignes d'un fichier de la dernière à la première (sans fin de ligne).
+
+    Le fichier est lu par blocs depuis la fin ; les lignes sont découpées sur les octets avant décodage,
+    ce qui évite de couper un caractère UTF-8 à la frontière de deux blocs.
+    """
+    with open(path, "rb") as f:
+        position = f.seek(0, 2)
+        pending = b""
+        at_end = True
+        while position > 0:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            parts = (f.read(size) + pending).split(b"\n")
+            # Le début du bloc peut être une ligne incomplète : complétée par le bloc précédent
+            pending = parts.pop(0)
+            if at_end and parts and parts[-1] == b"":
+                parts.pop()  # fichier terminé par une fin de ligne
+            at_end = False
+            for line in reversed(parts):
+                yield line.decode("utf-8", errors="replace")
+        if pending or not at_end:
+            yield pending.decode("utf-8", errors="replace")
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return False
+        f.seek(-1, 2)
+        return f.read(1) == b"\n"
+
+
+def log_files(path: str = LOG_PATH, max_rotated: int = MAX_ROTATED_FILES) -> list[Path]:
+    """Retourne le fichier de log et ses rotations existantes, du plus récent au plus ancien."""
+    base = Path(path)
+    candidates = [base, *(base.with_name(f"{base.name}.{i}") for i in range(1, max_rotated + 1))]
+    return [p for p in candidates if p.exists()]
 
-def tail_lines(path: str = LOG_PATH, maxlen: int = 200) -> str:
-    """Lit les n dernières lignes d'un fichier de log et les retourne sous forme de chaîne de caractères."""
+
+def _iter_files_reverse(files: Iterable[Path]) -> Iterator[str]:
+    for file in files:
+        yield from iter_lines_reverse(file)
+
+
+def tail_lines(path: str = LOG_PATH, maxlen: int = 200, *, include_rotated: bool = True) -> str:
+    """Lit les n dernières lignes d'un fichier de log et les retourne sous forme de chaîne de caractères.
+
+    Si le fichier vient de tourner et contient moins de `maxlen` lignes, la lecture continue dans les rotations.
+    """
     p = Path(path)
     if not p.exists():
         raise LogFileNotFound()
 
-    with p.open("r", encoding="utf-8", errors="replace") as f:
-        last = deque(f, maxlen=maxlen)
+    files = log_files(path) if include_rotated else [p]
+    last: list[str] = []
+    for line in _iter_files_reverse(files):
+        if len(last) >= maxlen:
+            break
+        last.append(line)
+    last.reverse()
+
+    return "\n".join(last) + ("\n" if last and _ends_with_newline(p) else "")
+
+
+# -------------------- Recherche dans les logs --------------------
+
+@dataclass(frozen=True, slots=True)
+class LogRecordText:
+    """Enregistrement de log relu depuis le fichier (en-tête + lignes de suite, ex: traceback)."""
+
+    text: str
+    timestamp: datetime | None
+    level: str | None
+    logger: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class LogQuery:
+    """Critères de recherche dans les logs (tous optionnels) et nombre maximal d'enregistrements retournés."""
+
+    level: str | None = None
+    logger: str | None = None
+    text: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+    limit: int = 200
+
+    def is_filtered(self) -> bool:
+        """Indique si au moins un critère de filtrage est défini."""
+        return any(v is not None for v in (self.level, self.logger, self.text, self.since, self.until))
+
+    def matches(self, record: LogRecordText) -> bool:
+        """Indique si l'enregistrement satisfait tous les critères."""
+        if self.level is not None and (record.level is None or _level_no(record.level) < _level_no(self.level)):
+            return False
+        if self.logger is not None and (record.logger is None or not record.logger.startswith(self.logger)):
+            return False
+        if self.text is not None and self.text.lower() not in record.text.lower():
+            return False
+        if self.since is not None and (record.timestamp is None or record.timestamp < self.since):
+            return False
+        if self.until is not None and (record.timestamp is None or record.timestamp > self.until):
+            return False
+        return True
+
+
+def _level_no(name: str) -> int:
+    return logging.getLevelNamesMapping().get(name.upper(), 0)
+
+
+def _parse_header(line: str) -> tuple[datetime, str, str] | None:
+    match = _RECORD_HEADER.match(line)
+    if match is None:
+        return None
+    try:
+        timestamp = datetime.strptime(match.group(1), _TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+    return timestamp, match.group(2), match.group(3)
+
+
+def iter_records_reverse(files: Iterable[Path]) -> Iterator[LogRecordText]:
+    """Parcourt les enregistrements de log du plus récent au plus ancien (lignes de suite rattachées à leur en-tête)."""
+    continuation: list[str] = []
+    for file in files:
+        for line in iter_lines_reverse(file):
+            header = _parse_header(line)
+            if header is None:
+                continuation.append(line)
+                continue
+            timestamp, level, logger = header
+            lines = [line, *reversed(continuation)]
+            continuation = []
+            yield LogRecordText("\n".join(lines), timestamp, level, logger)
+        # Lignes sans en-tête en tête de fichier (marqueur de démarrage, lignes vides...)
+        if continuation:
+            text = "\n".join(reversed(continuation))
+            continuation = []
+            if text.strip():
+                yield LogRecordText(text, None, None, None)
+
+
+def search_logs(query: LogQuery, path: str = LOG_PATH) -> list[LogRecordText]:
+    """Retourne les `query.limit` enregistrements les plus récents qui satisfont la requête (ordre chronologique).
+
+    Les fichiers de rotation sont parcourus si nécessaire ; la lecture s'arrête dès que la limite est atteinte
+    ou que les enregistrements deviennent antérieurs à `query.since`.
+    """
+    if not Path(path).exists():
+        raise LogFileNotFound()
 
-    return "".join(last)
\ No newline at end of file
+    found: list[LogRecordText] = []
+    for record in iter_records_reverse(log_files(path)):
+        if query.since is not None and record.timestamp is not None and record.timestamp < query.since:
+            break
+        if query.matches(record):
+            found.append(record)
+            if len(found) >= query.limit:
+                break
+    found.reverse()
+    return found
@@ -1,6 +1,11 @@
-"""Utilitaires pour la gestion des timestamps, avec des fonctions pour obtenir le timestamp actuel et ajouter une durée à un timestamp donné."""
+"""Utilitaires pour la gestion des timestamps, avec des fonctions pour obtenir le timestamp actuel, ajouter une durée à un timestamp donné et calculer une clé de jour."""
 
 from datetime import UTC, datetime
+from zoneinfo import ZoneInfo
+
+from eldoria.config import AUTO_SAVE_TZ
+
+TIMEZONE = ZoneInfo(AUTO_SAVE_TZ)
 
 
 def now_ts() -> int:
@@ -12,4 +17,13 @@ def add_duration(timestamp:int, *, seconds:int = 0, minutes:int = 0, hours:int =
     if seconds < 0 or minutes < 0 or hours < 0 or days < 0:
         raise ValueError("Durée négative interdite")
 
-    return timestamp + seconds + (minutes * 60) + (hours * 3600) + (days * 86400)
\ No newline at end of file
+    return timestamp + seconds + (minutes * 60) + (hours * 3600) + (days * 86400)
+
+
+def day_key_utc(ts: int | None = None) -> str:
+    """Retourne une clé de jour au format YYYYMMDD, à partir d'un timestamp donné ou du timestamp actuel.
+
+    Le jour est celui du fuseau AUTO_SAVE_TZ (progrès d'XP vocal quotidien et purge de rétention associée).
+    """
+    dt = datetime.fromtimestamp(ts if ts is not None else now_ts(), tz=TIMEZONE)
+    return dt.strftime("%Y%m%d")
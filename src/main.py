@@ -3,13 +3,26 @@
 Lance le bot en important l'application (setup + events + commandes) depuis eldoria.app.
 """
 
-import logging
 import time
 
-from eldoria.app.app import main
-from eldoria.app.logging import setup_logging
+_process_started_at = time.perf_counter()
+
+# Le profileur doit être installé avant tout autre import du bot pour mesurer les temps d'import
+# (.env chargé ici pour que STARTUP_PROFILE y soit lu, comme les autres variables)
+from dotenv import load_dotenv  # noqa: E402
+
+from eldoria.app.profiler import start_profiling_from_env  # noqa: E402
+
+load_dotenv()
+
+start_profiling_from_env(_process_started_at)
+
+import logging  # noqa: E402
+
+from eldoria.app.app import main  # noqa: E402
+from eldoria.app.logging import setup_logging  # noqa: E402
 
 if __name__ == "__main__":
-    started_at = time.perf_counter()
+    started_at = _process_started_at
     setup_logging(logging.INFO)
     main(started_at)
@@ -102,6 +102,12 @@ def install_discord_stub() -> None:
         id: int = 0
         content: str = ""
 
+    class PartialMessage:
+        id: int = 0
+
+    class PartialMessageable:
+        id: int = 0
+
     class Role:
         id: int = 0
         name: str = ""
@@ -502,6 +508,8 @@ def install_discord_stub() -> None:
     discord_mod.Member = Member
     discord_mod.User = User
     discord_mod.Message = Message
+    discord_mod.PartialMessage = PartialMessage
+    discord_mod.PartialMessageable = PartialMessageable
     discord_mod.Role = Role
     discord_mod.Interaction = Interaction
     discord_mod.ApplicationContext = ApplicationContext
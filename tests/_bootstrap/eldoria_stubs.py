@@ -32,6 +32,21 @@ def install_eldoria_stubs(mp: MonkeyPatch) -> None:
     if eldoria_pkg is None:
         eldoria_pkg = importlib.import_module("eldoria")
 
+    # --- modules réels (sans dépendance UI) importés par les cogs : chargés avant de stubber
+    # leurs packages parents, sinon ils deviennent introuvables quand le test tourne seul.
+    real_modules = {
+        name: importlib.import_module(name)
+        for name in (
+            "eldoria.app.command_sync",
+            "eldoria.app.loop_watchdog",
+            "eldoria.app.profiler",
+            "eldoria.app.run_tests",
+            "eldoria.config",
+            "eldoria.utils.lazy",
+            "eldoria.utils.metrics",
+        )
+    }
+
     # --- packages parents (stubbés)
     app_pkg = make_pkg("eldoria.app")
     exc_pkg = make_pkg("eldoria.exceptions")
@@ -50,6 +65,11 @@ def install_eldoria_stubs(mp: MonkeyPatch) -> None:
     ui_pkg.help = help_pkg
     ui_pkg.version = version_pkg
 
+    for name, module in real_modules.items():
+        parent, _, attr = name.rpartition(".")
+        mp.setitem(sys.modules, name, module)
+        setattr(sys.modules[parent], attr, module)
+
     # --- eldoria.app.bot
     bot_mod = ModuleType("eldoria.app.bot")
 
@@ -19,6 +19,7 @@ from tests._fakes.discord_channels import (
     FakeCategory,
     FakeChannel,
     FakeFetchMessageChannel,
+    FakePartialMessageable,
     FakeReactionChannel,
     FakeTextChannel,
     FakeVoiceChannel,
@@ -54,6 +55,7 @@ from tests._fakes.eldoria_services import (
     Conn,
     ConnCM,
     Cursor,
+    FakeBootstrapService,
     FakeBotGuild,
     FakeConn,
     FakeConnCM,
@@ -74,6 +76,7 @@ from tests._fakes.eldoria_services import (
     make_db_error,
     make_services_class,
     make_tests_path,
+    traced_schema_conn,
 )
 
 __all__ = [
@@ -100,6 +103,7 @@ __all__ = [
     "FakeTextChannel",
     "FakeVoiceChannel",
     "FakeFetchMessageChannel",
+    "FakePartialMessageable",
     "FakeReactionChannel",
     # interactions
     "FakeInteraction",
@@ -117,6 +121,7 @@ __all__ = [
     "make_discord_intents",
     "FakeLog",
     # services
+    "FakeBootstrapService",
     "FakeServices",
     "FakeXpService",
     "FakeDuelService",
@@ -141,4 +146,5 @@ __all__ = [
     "Cursor",
     "ConnCM",
     "make_db_error",
+    "traced_schema_conn",
 ]
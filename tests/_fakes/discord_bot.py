@@ -110,7 +110,7 @@ Il couvre:
         xp_service=None,
         temp_voice=None,
     ):
-        from tests._fakes.eldoria_services import FakeServices
+        from tests._fakes.eldoria_services import FakeBootstrapService, FakeServices
 
         # Compat: certains tests historiques instancient FakeBot(duel) ou FakeBot(temp_voice).
         if args:
@@ -162,23 +162,30 @@ Il couvre:
                 role=SimpleNamespace(
                     sr_match=MagicMock(return_value=None),
                 ),
+                bootstrap=FakeBootstrapService(),
             )
         self.services = services
 
         self.user = FakeBotUser(user_id)
 
         # Some tests expect these attributes.
-        self.guilds = [object(), object()]
+        self.guilds = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
         self.latency = 0.123
 
         # Common discord.py-ish methods mocked
         self.sync_commands = AsyncMock()
         self.process_commands = AsyncMock()
         self.add_cog = MagicMock()
+        self.http = SimpleNamespace(
+            get_global_commands=AsyncMock(return_value=[]),
+            get_guild_commands=AsyncMock(return_value=[]),
+        )
+        self._application_commands: dict[int, object] = {}
 
         # Internal registries used by a few tests
         self._guilds: dict[int, object] = {}
         self._channels: dict[int, object] = {}
+        self.partial_channels: dict[int, object] = {}
         self._waited = 0
 
         # Certaines suites (saves) injectent un "guild" unique.
@@ -194,6 +201,10 @@ Il couvre:
         self.loaded: list[str] = []
         self._services = services
 
+    @property
+    def application_commands(self) -> list[object]:
+        return list(self._application_commands.values())
+
     # --- app helpers ---
     def set_started_at(self, started_at: float):
         self.started_at = started_at
@@ -217,6 +228,14 @@ Il couvre:
     async def fetch_channel(self, channel_id: int):
         return self._channels[channel_id]
 
+    def get_partial_messageable(self, channel_id: int, **_kwargs):
+        from tests._fakes.discord_channels import FakePartialMessageable
+
+        channel = self.partial_channels.get(channel_id)
+        if channel is None:
+            channel = self.partial_channels[channel_id] = FakePartialMessageable(channel_id)
+        return channel
+
     async def wait_until_ready(self):
         self._waited += 1
 
@@ -179,6 +179,20 @@ class FakeFetchMessageChannel(FakeChannel):
         return self.message
 
 
+class FakePartialMessageable:
+    """Équivalent de ``discord.PartialMessageable`` : aucun fetch, messages partiels mémorisés par id."""
+
+    def __init__(self, channel_id: int):
+        self.id = channel_id
+        self.messages: dict[int, FakeMessage] = {}
+
+    def get_partial_message(self, message_id: int) -> FakeMessage:
+        message = self.messages.get(message_id)
+        if message is None:
+            message = self.messages[message_id] = FakeMessage(message_id=message_id, channel=self)
+        return message
+
+
 class FakeReactionChannel(discord.TextChannel):  # type: ignore[misc]
     """TextChannel qui sait fetch un message (utilisé par ReactionRoles)."""
 
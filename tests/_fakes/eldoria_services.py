@@ -2,6 +2,7 @@ from __future__ import annotations
 
 """Fakes de services Eldoria partagés par plusieurs tests."""
 
+import sqlite3
 from datetime import datetime
 from types import SimpleNamespace
 from typing import Any
@@ -11,8 +12,50 @@ class FakeServices(SimpleNamespace):
     """Conteneur de services.
 
     On peut l'initialiser avec des kwargs: FakeServices(xp=..., duel=...).
+    `bootstrap` est fourni par défaut (FakeBootstrapService).
     """
 
+    def __init__(self, **kwargs: Any):
+        kwargs.setdefault("bootstrap", FakeBootstrapService())
+        super().__init__(**kwargs)
+
+
+class FakeBootstrapService:
+    """BootstrapService en mémoire : enregistre les guilds initialisées / oubliées."""
+
+    def __init__(self):
+        self.bootstrapped: set[int] = set()
+        self.calls: list[tuple] = []
+
+    def bootstrap_guilds(self, guild_ids):
+        ids = {int(g) for g in guild_ids}
+        self.calls.append(("bootstrap_guilds", sorted(ids)))
+        self.bootstrapped |= ids
+        return len(ids)
+
+    def warm_caches(self, guild_ids):
+        ids = sorted({int(g) for g in guild_ids})
+        self.calls.append(("warm_caches", ids))
+        return SimpleNamespace(rows={"xp_config": len(ids)}, guilds=len(ids), ms=0.0, total_rows=len(ids))
+
+    def ensure_guild(self, guild_id):
+        self.calls.append(("ensure_guild", guild_id))
+        if guild_id in self.bootstrapped:
+            return False
+        self.bootstrapped.add(guild_id)
+        return True
+
+    def is_bootstrapped(self, guild_id):
+        return guild_id in self.bootstrapped
+
+    def forget(self, guild_id):
+        self.calls.append(("forget", guild_id))
+        self.bootstrapped.discard(guild_id)
+
+    def reset(self):
+        self.calls.append(("reset",))
+        self.bootstrapped.clear()
+
 
 class FakeXpService:
     def __init__(self):
@@ -235,9 +278,23 @@ class FakeDuelService:
         self._cancel_return: list[dict] = []
         self._new_duel_side_effect: BaseException | None = None
 
+        # Statistiques / classement
+        self.get_stats_calls: list[tuple[int, int]] = []
+        self.get_leaderboard_calls: list[tuple[int, int, int]] = []
+        self.stats_return: dict[str, int] = {"wins": 0, "losses": 0, "draws": 0, "played": 0}
+        self.leaderboard_return: list[tuple[int, int, int, int, int, int]] = []
+
     def cleanup_old_duels(self, ts):
         self.cleanup_calls.append(ts)
 
+    def get_stats(self, guild_id, user_id):
+        self.get_stats_calls.append((guild_id, user_id))
+        return dict(self.stats_return)
+
+    def get_leaderboard(self, guild_id, limit=100, offset=0):
+        self.get_leaderboard_calls.append((guild_id, limit, offset))
+        return list(self.leaderboard_return)
+
     def cancel_expired_duels(self):
         self.cancel_calls += 1
         return list(self._cancel_return)
@@ -375,8 +432,15 @@ class FakeSaveService:
         self._db_path = db_path
         self.backup_calls: list[str] = []
         self.replace_calls: list[str] = []
+        self.restore_calls: list[str] = []
+        self.maintenance_calls: list[dict[str, Any]] = []
         self.init_db_calls = 0
 
+        # Sauvegardes compressées : artefact retourné par create_backup (à définir par le test)
+        self.artifact: Any = None
+        self.uploaded_hash: str | None = None
+        self.decompress_calls: list[tuple[str, str]] = []
+
     # --- UI API ---
     def list_saves(self, guild_id: int):
         self.calls.append(("list_saves", guild_id))
@@ -399,9 +463,58 @@ class FakeSaveService:
     def backup_to_file(self, dst: str):
         self.backup_calls.append(dst)
 
+    def create_backup(self, backup_dir: str, keep: int):
+        self.backup_calls.append(backup_dir)
+        if self.artifact is None:
+            raise RuntimeError("no backup artifact configured")
+        return self.artifact
+
+    def last_uploaded_hash(self, backup_dir: str):
+        return self.uploaded_hash
+
+    def mark_uploaded(self, backup_dir: str, sha256: str):
+        self.uploaded_hash = sha256
+
+    def decompress_backup(self, src: str, dst: str):
+        self.decompress_calls.append((src, dst))
+
+    # Sauvegardes en plusieurs parties : logique réelle (sans état, sur fichiers)
+    def split_backup(self, artifact, parts_dir: str, chunk_size: int):
+        from pathlib import Path
+
+        from eldoria.features.save._internal import chunks
+        return chunks.split_file(artifact.path, Path(parts_dir), chunk_size)
+
+    def build_manifest(self, artifact, parts):
+        from eldoria.features.save._internal import chunks
+        return chunks.build_manifest(artifact, parts)
+
+    def is_manifest_filename(self, filename: str) -> bool:
+        return filename.lower().endswith(".manifest.json")
+
+    def parse_manifest(self, text: str):
+        from eldoria.features.save._internal import chunks
+        return chunks.BackupManifest.from_json(text)
+
+    def assemble_backup(self, manifest, parts, dst: str):
+        from pathlib import Path
+
+        from eldoria.features.save._internal import chunks
+        chunks.assemble(manifest, parts, Path(dst))
+
     def replace_db_file(self, tmp_new: str):
         self.replace_calls.append(tmp_new)
 
+    def restore_db_file(self, tmp_new: str, on_swapped=None, *, full_check: bool = False):
+        self.restore_calls.append(tmp_new)
+        if on_swapped is not None:
+            on_swapped()
+        return SimpleNamespace(check="quick_check", from_version=0, to_version=1, seconds=0.0)
+
+    def run_maintenance(self, **kwargs):
+        self.maintenance_calls.append(kwargs)
+        return SimpleNamespace(purged={}, analyzed=False, vacuumed_pages=0, reclaimed=0, seconds=0.0)
+
     def init_db(self):
         self.init_db_calls += 1
 
@@ -641,12 +754,13 @@ class FakeDuelError(Exception):
 
 
 class FakeCursor:
-    """Cursor minimaliste pour les repos (fetchone/fetchall/lastrowid)."""
+    """Cursor minimaliste pour les repos (fetchone/fetchall/lastrowid/rowcount)."""
 
-    def __init__(self, *, one: Any = None, all: Any = None, lastrowid: Any = None):
+    def __init__(self, *, one: Any = None, all: Any = None, lastrowid: Any = None, rowcount: int = -1):
         self._one = one
         self._all = all
         self.lastrowid = lastrowid
+        self.rowcount = rowcount
 
     def fetchone(self):
         return self._one
@@ -674,8 +788,8 @@ class FakeConn:
     def set_next_cursor(self, cursor: FakeCursor):
         self._next = cursor
 
-    def set_next(self, *, one=None, all=None, lastrowid=None):
-        self._next = FakeCursor(one=one, all=all, lastrowid=lastrowid)
+    def set_next(self, *, one=None, all=None, lastrowid=None, rowcount=-1):
+        self._next = FakeCursor(one=one, all=all, lastrowid=lastrowid, rowcount=rowcount)
 
     def execute(self, sql: str, params: tuple = ()):  # compat: params optionnels
         self.executed.append(sql)
@@ -704,6 +818,23 @@ class FakeConnCM:
         return False
 
 
+def traced_schema_conn() -> tuple[sqlite3.Connection, list[str]]:
+    """Connexion SQLite en mémoire au schéma courant et liste des requêtes exécutées ensuite.
+
+    Les BEGIN / COMMIT implicites du module sqlite3 ne sont pas comptés : la liste sert à vérifier
+    le nombre d'allers-retours d'une fonction de repo.
+    """
+    from eldoria.db import schema
+
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(schema.SCHEMA_SQL)
+    statements: list[str] = []
+    conn.set_trace_callback(
+        lambda sql: None if sql.startswith(("BEGIN", "COMMIT", "ROLLBACK")) else statements.append(sql)
+    )
+    return conn, statements
+
+
 def is_enterable(obj) -> bool:
     return hasattr(obj, "__enter__") and hasattr(obj, "__exit__")
 
@@ -746,7 +877,7 @@ class Conn:
     def close(self):
         self.closed += 1
 
-    def backup(self, other_conn):
+    def backup(self, other_conn, **kwargs):
         self.backup_calls.append(other_conn)
 
 
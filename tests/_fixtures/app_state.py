@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_app_state(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """Redirige les fichiers d'état du bot (data/*.json) vers un dossier temporaire propre à chaque test."""
+    from eldoria.app import command_sync
+
+    monkeypatch.setattr(command_sync, "COMMAND_SYNC_STATE_PATH", tmp_path / "command_sync.json")
+
+
+@pytest.fixture(autouse=True)
+def reset_bootstrapped_guilds():
+    """Vide l'ensemble en mémoire des guilds initialisées et les caches par guild avant et après chaque test."""
+    from eldoria.db import cache
+
+    cache.clear_all()
+    yield
+    cache.clear_all()
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Remet à zéro le registre global de métriques et les agrégats REST avant chaque test."""
+    from eldoria.app import http_stats
+    from eldoria.utils import metrics
+
+    metrics.REGISTRY.reset()
+    metrics._PENDING_COMMANDS.clear()
+    http_stats.reset_rest_stats()
+    yield
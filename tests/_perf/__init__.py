@@ -0,0 +1 @@
+"""Harnais de performance (simulation / charge) exécutables hors pytest."""
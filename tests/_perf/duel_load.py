@@ -0,0 +1,369 @@
+"""Harnais de simulation et de test de charge des duels.
+
+Pilote des milliers de duels concurrents via `DuelService` (création → configuration → invitation →
+acceptation → coups RPS simultanés → fin ou expiration) sur un vrai fichier SQLite, en s'appuyant
+sur les fakes de tests (bot, serveur, membres).
+
+Rapporte :
+- le débit (duels menés à terme par seconde) ;
+- la latence p50/p99/max par étape ;
+- les conflits CAS sur le payload (tentatives ratées, abandons) ;
+- le temps d'attente sur le verrou global de la base (`_DB_LOCK`).
+
+Usage (depuis la racine du dépôt) :
+
+    python -m tests._perf.duel_load --duels 2000 --workers 16
+    python -m tests._perf.duel_load --duels 500 --expire-ratio 0.2 --db ./duel_load.db --keep-db
+
+À lancer avant toute modification de `duel_repo` ou du protocole des jeux, et à comparer au run de référence.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from tests._bootstrap.discord_stub import install_discord_stub
+from tests._bootstrap.sys_path import add_src_to_syspath
+
+# Même bootstrap que tests/conftest.py quand le harnais est lancé hors pytest
+# (sous pytest, le stub discord est déjà installé : on ne le remplace pas).
+os.environ.setdefault("DISCORD_TOKEN", "TEST_TOKEN")
+add_src_to_syspath()
+if getattr(sys.modules.get("discord"), "__version__", None) != "0.0-stub":
+    install_discord_stub()
+
+from eldoria.db import connection  # noqa: E402
+from eldoria.db.repo import duel_repo  # noqa: E402
+from eldoria.db.repo.xp_repo import xp_ensure_defaults  # noqa: E402
+from eldoria.db.schema import init_db  # noqa: E402
+from eldoria.features.duel import constants  # noqa: E402
+from eldoria.features.duel.duel_service import DuelService  # noqa: E402
+from eldoria.features.duel.games import init_games  # noqa: E402
+from eldoria.features.duel.games.rps import rps as rps_mod  # noqa: E402
+from eldoria.features.duel.games.rps import rps_constants as rps  # noqa: E402
+from tests._fakes import FakeBot, FakeGuild, FakeMember  # noqa: E402
+
+DEFAULT_DB_PATH = Path(tempfile.gettempdir()) / "eldoria_duel_load.db"
+
+STEPS: tuple[str, ...] = ("create", "configure", "invite", "accept", "move", "move+finish", "expire")
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation
+# ---------------------------------------------------------------------------
+class TimedLock:
+    """Enveloppe un RLock et mesure le temps d'attente à chaque acquisition."""
+
+    def __init__(self, inner: Any) -> None:
+        self._inner = inner
+        self._guard = threading.Lock()
+        self.waits: list[float] = []
+
+    def __enter__(self) -> TimedLock:
+        start = time.perf_counter()
+        self._inner.acquire()
+        waited = time.perf_counter() - start
+        with self._guard:
+            self.waits.append(waited)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._inner.release()
+
+
+@dataclass
+class CasCounters:
+    """Compteurs des mises à jour conditionnelles (compare-and-swap) du payload des duels."""
+
+    attempts: int = 0
+    conflicts: int = 0
+    abandons: int = 0
+    _guard: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, ok: bool) -> None:
+        with self._guard:
+            self.attempts += 1
+            if not ok:
+                self.conflicts += 1
+
+    def abandon(self) -> None:
+        with self._guard:
+            self.abandons += 1
+
+
+@dataclass
+class LoadReport:
+    """Résultat d'un run de charge."""
+
+    duels: int
+    workers: int
+    wall_seconds: float
+    completed: int
+    expired: int
+    latencies: dict[str, list[float]]
+    errors: Counter[str]
+    cas: CasCounters
+    lock_waits: list[float]
+
+    @property
+    def throughput(self) -> float:
+        """Duels menés à terme (fin ou expiration) par seconde."""
+        if self.wall_seconds <= 0:
+            return 0.0
+        return (self.completed + self.expired) / self.wall_seconds
+
+    def format(self) -> str:
+        """Rend le rapport sous forme de tableau texte."""
+        lines = [
+            f"Duels: {self.duels}  workers: {self.workers}  durée: {self.wall_seconds:.2f} s",
+            f"Terminés: {self.completed}  expirés: {self.expired}  débit: {self.throughput:.1f} duels/s",
+            "",
+            f"{'étape':<12} {'n':>7} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+        ]
+        for step in STEPS:
+            values = self.latencies.get(step) or []
+            if not values:
+                continue
+            lines.append(
+                f"{step:<12} {len(values):>7} {percentile(values, 50) * 1000:>9.2f} "
+                f"{percentile(values, 99) * 1000:>9.2f} {max(values) * 1000:>9.2f}"
+            )
+
+        lines += [
+            "",
+            f"CAS payload: {self.cas.attempts} tentatives, {self.cas.conflicts} conflits, {self.cas.abandons} abandons",
+            (
+                f"Verrou DB: {len(self.lock_waits)} acquisitions, attente totale {sum(self.lock_waits):.3f} s, "
+                f"p99 {percentile(self.lock_waits, 99) * 1000:.2f} ms, max {max(self.lock_waits, default=0.0) * 1000:.2f} ms"
+            ),
+        ]
+        if self.errors:
+            lines.append("Erreurs: " + ", ".join(f"{k}={v}" for k, v in self.errors.most_common()))
+        return "\n".join(lines)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Percentile par rang le plus proche (0 si la liste est vide)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+@contextmanager
+def instrumented(cas: CasCounters) -> Iterator[TimedLock]:
+    """Installe les sondes (verrou DB + CAS) le temps du run, puis restaure les originaux."""
+    original_lock = connection._DB_LOCK
+    original_repo_cas = duel_repo.update_payload_if_unchanged
+    original_rps_cas = rps_mod.update_payload_if_unchanged
+    original_persist = rps_mod._persist_move_cas
+
+    def counting(fn: Callable[..., bool]) -> Callable[..., bool]:
+        def wrapper(*args: Any, **kwargs: Any) -> bool:
+            ok = fn(*args, **kwargs)
+            cas.record(ok)
+            return ok
+        return wrapper
+
+    def persist(*args: Any, **kwargs: Any) -> None:
+        try:
+            original_persist(*args, **kwargs)
+        except Exception:
+            cas.abandon()
+            raise
+
+    timed = TimedLock(original_lock)
+    connection._DB_LOCK = timed  # type: ignore[assignment]
+    duel_repo.update_payload_if_unchanged = counting(original_repo_cas)  # type: ignore[assignment]
+    rps_mod.update_payload_if_unchanged = counting(original_rps_cas)  # type: ignore[assignment]
+    rps_mod._persist_move_cas = persist  # type: ignore[assignment]
+    try:
+        yield timed
+    finally:
+        connection._DB_LOCK = original_lock
+        duel_repo.update_payload_if_unchanged = original_repo_cas  # type: ignore[assignment]
+        rps_mod.update_payload_if_unchanged = original_rps_cas  # type: ignore[assignment]
+        rps_mod._persist_move_cas = original_persist  # type: ignore[assignment]
+
+
+# ---------------------------------------------------------------------------
+# Scénario
+# ---------------------------------------------------------------------------
+def _prepare_db(db_path: Path, guild: FakeGuild, members: list[FakeMember], xp: int) -> None:
+    """Crée une base neuve, enregistre les jeux, et crédite l'XP des joueurs."""
+    for suffix in ("", "-journal", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    connection.DB_PATH = str(db_path)
+    init_db()
+    init_games()
+    xp_ensure_defaults(guild.id)
+
+    with connection.get_conn() as conn:
+        conn.executemany(
+            "INSERT INTO xp_members(guild_id, user_id, xp, last_xp_ts) VALUES (?, ?, ?, 0)",
+            [(guild.id, m.id, xp) for m in members],
+        )
+
+
+def run_load(
+    *,
+    duels: int = 1000,
+    workers: int = 16,
+    expire_ratio: float = 0.1,
+    db_path: Path | str = DEFAULT_DB_PATH,
+    seed: int = 0,
+    keep_db: bool = False,
+) -> LoadReport:
+    """Exécute le scénario de charge et retourne le rapport."""
+    rng = random.Random(seed)
+    db_path = Path(db_path)
+    guild = FakeGuild(1)
+    channel_id = 10
+    members = [FakeMember(1000 + i, guild) for i in range(2 * duels)]
+    for m in members:
+        guild.add_member(m)
+
+    previous_db_path = connection.DB_PATH
+    _prepare_db(db_path, guild, members, xp=10 * max(constants.STAKE_XP_DEFAULTS))
+
+    bot = FakeBot(duel_service=DuelService())
+    service: DuelService = bot.services.duel
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: Counter[str] = Counter()
+    guard = threading.Lock()
+    cas = CasCounters()
+
+    def timed(step: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Exécute une étape, enregistre sa latence, et retourne None en cas d'erreur (comptée)."""
+        start = time.perf_counter()
+        try:
+            result = fn(*args)
+        except Exception as e:
+            with guard:
+                errors[f"{step}:{type(e).__name__}"] += 1
+                latencies[step].append(time.perf_counter() - start)
+            return None
+
+        # Un coup qui termine le duel inclut la finalisation (XP + stats) : on le mesure à part.
+        if step == "move" and ((result or {}).get("game") or {}).get("state") == rps.RPS_STATE_FINISHED:
+            step = "move+finish"
+        with guard:
+            latencies[step].append(time.perf_counter() - start)
+        return result
+
+    def setup_duel(index: int) -> int | None:
+        player_a, player_b = members[2 * index], members[2 * index + 1]
+        snap = timed("create", service.new_duel, guild.id, channel_id, player_a.id, player_b.id)
+        if snap is None:
+            return None
+        duel_id = int(snap["duel"]["id"])
+        stake = rng.choice(constants.STAKE_XP_DEFAULTS)
+
+        def configure() -> dict[str, Any]:
+            service.configure_game_type(duel_id, constants.GAME_RPS)
+            return service.configure_stake_xp(duel_id, stake)
+
+        if timed("configure", configure) is None:
+            return None
+        if timed("invite", service.send_invite, duel_id, 900_000 + duel_id) is None:
+            return None
+        if timed("accept", service.accept_duel, duel_id, player_b.id) is None:
+            return None
+        return duel_id
+
+    def play(duel_id: int, user_id: int, move: str) -> None:
+        timed("move", service.play_game_action, duel_id, user_id, {"move": move})
+
+    started = time.perf_counter()
+    try:
+        with instrumented(cas) as lock, ThreadPoolExecutor(max_workers=workers) as pool:
+            duel_ids = [d for d in pool.map(setup_duel, range(duels)) if d is not None]
+
+            to_expire = set(rng.sample(duel_ids, k=int(len(duel_ids) * expire_ratio)))
+            moves = []
+            for index, duel_id in enumerate(duel_ids):
+                player_a, player_b = members[2 * index], members[2 * index + 1]
+                moves.append((duel_id, player_a.id, rng.choice(rps.RPS_MOVES)))
+                if duel_id not in to_expire:
+                    moves.append((duel_id, player_b.id, rng.choice(rps.RPS_MOVES)))
+
+            # Les 2 coups d'un même duel sont soumis côte à côte : ils s'exécutent en parallèle
+            # sur le pool et se disputent le CAS du payload.
+            list(pool.map(lambda m: play(*m), moves))
+
+            # Expiration : on avance l'échéance des duels restés incomplets, puis un passage de maintenance.
+            with connection.get_conn() as conn:
+                conn.executemany(
+                    "UPDATE duels SET expires_at = 0 WHERE duel_id = ?",
+                    [(d,) for d in to_expire],
+                )
+            expired = timed("expire", service.cancel_expired_duels) or []
+
+        wall = time.perf_counter() - started
+
+        with connection.get_conn() as conn:
+            completed = conn.execute(
+                "SELECT COUNT(*) FROM duels WHERE status = ?",
+                (constants.DUEL_STATUS_FINISHED,),
+            ).fetchone()[0]
+    finally:
+        connection.DB_PATH = previous_db_path
+        if not keep_db:
+            for suffix in ("", "-journal", "-wal", "-shm"):
+                Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+    return LoadReport(
+        duels=duels,
+        workers=workers,
+        wall_seconds=wall,
+        completed=int(completed),
+        expired=len(expired),
+        latencies=dict(latencies),
+        errors=errors,
+        cas=cas,
+        lock_waits=list(lock.waits),
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Simulation / test de charge des duels Eldoria.")
+    parser.add_argument("--duels", type=int, default=1000, help="Nombre de duels simulés.")
+    parser.add_argument("--workers", type=int, default=16, help="Nombre de threads concurrents.")
+    parser.add_argument("--expire-ratio", type=float, default=0.1, help="Part des duels laissés expirer (0..1).")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Fichier SQLite utilisé (recréé à chaque run).")
+    parser.add_argument("--seed", type=int, default=0, help="Graine aléatoire (coups, mises).")
+    parser.add_argument("--keep-db", action="store_true", help="Conserve le fichier SQLite après le run.")
+    args = parser.parse_args(argv)
+
+    report = run_load(
+        duels=args.duels,
+        workers=args.workers,
+        expire_ratio=args.expire_ratio,
+        db_path=args.db,
+        seed=args.seed,
+        keep_db=args.keep_db,
+    )
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
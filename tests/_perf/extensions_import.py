@@ -0,0 +1,60 @@
+"""Mesure du coût d'import des extensions (nombre de modules et temps), dans un processus neuf.
+
+Usage :
+    python -m tests._perf.extensions_import
+
+Affiche un JSON : temps d'import total, modules chargés, modules `eldoria.*` chargés, et modules `eldoria.*`
+que chaque extension ajoute à ceux déjà chargés par les précédentes.
+À lancer dans un interpréteur vierge : dans pytest, `sys.modules` est déjà rempli par les autres tests.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+import time
+from typing import Any
+
+os.environ.setdefault("DISCORD_TOKEN", "TEST_TOKEN")
+
+from tests._bootstrap.sys_path import add_src_to_syspath  # noqa: E402
+
+add_src_to_syspath()
+
+if getattr(sys.modules.get("discord"), "__version__", None) != "0.0-stub":
+    from tests._bootstrap.discord_stub import install_discord_stub
+
+    install_discord_stub()
+
+
+def measure() -> dict[str, Any]:
+    """Importe chaque module de `EXTENSIONS` (ce que fait `load_extension`) et mesure ce qui a été chargé."""
+    from eldoria.app.extensions import EXTENSIONS
+
+    before = set(sys.modules)
+    added_by: dict[str, list[str]] = {}
+    start = time.perf_counter()
+    for ext in EXTENSIONS:
+        seen = set(sys.modules)
+        importlib.import_module(ext)
+        added_by[ext] = sorted(name for name in set(sys.modules) - seen if name.startswith("eldoria."))
+    ms = (time.perf_counter() - start) * 1000
+
+    loaded = sorted(set(sys.modules) - before)
+    return {
+        "ms": ms,
+        "modules": len(loaded),
+        "eldoria_modules": [name for name in loaded if name.startswith("eldoria.")],
+        "added_by": added_by,
+    }
+
+
+def main() -> None:
+    """Point d'entrée CLI : affiche la mesure en JSON."""
+    print(json.dumps(measure()))
+
+
+if __name__ == "__main__":
+    main()
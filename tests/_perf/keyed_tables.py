@@ -0,0 +1,178 @@
+"""Banc de mesure des tables à clé composite : lectures ponctuelles et upserts, avant / après WITHOUT ROWID.
+
+Crée une base au schéma v1 (tables à rowid) peuplée de `--members` membres XP, mesure les lectures
+ponctuelles (`xp_get_member`) et les upserts (`xp_add_xp`) avec les requêtes réelles du repo, puis applique
+le schéma courant (reconstruction v2 en WITHOUT ROWID) et refait les mêmes mesures sur les mêmes données.
+La taille du fichier est relevée après un VACUUM, pour comparer des fichiers sans pages libres.
+
+Usage (depuis la racine du dépôt) :
+
+    python -m tests._perf.keyed_tables --members 50000 --ops 20000
+    python -m tests._perf.keyed_tables --members 5000 --db ./keyed.db --keep-db
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from tests._bootstrap.discord_stub import install_discord_stub
+from tests._bootstrap.sys_path import add_src_to_syspath
+
+# Même bootstrap que tests/conftest.py quand le banc est lancé hors pytest
+os.environ.setdefault("DISCORD_TOKEN", "TEST_TOKEN")
+add_src_to_syspath()
+if getattr(sys.modules.get("discord"), "__version__", None) != "0.0-stub":
+    install_discord_stub()
+
+from eldoria.db import schema  # noqa: E402
+from eldoria.db.repo import xp_repo  # noqa: E402
+
+DEFAULT_DB_PATH = Path(tempfile.gettempdir()) / "eldoria_keyed_tables.db"
+GUILDS = 20
+
+
+@dataclass
+class PhaseResult:
+    """Mesures d'une phase (schéma v1 à rowid, ou schéma courant)."""
+
+    label: str
+    lookups_per_s: float
+    upserts_per_s: float
+    size_bytes: int
+
+
+@dataclass
+class BenchReport:
+    """Résultat du banc : mêmes opérations avant et après la reconstruction."""
+
+    members: int
+    ops: int
+    rebuild_seconds: float
+    before: PhaseResult
+    after: PhaseResult
+
+    def format(self) -> str:
+        """Rend le rapport sous forme de tableau texte."""
+        lines = [
+            f"Membres : {self.members}  opérations par mesure : {self.ops}  reconstruction : {self.rebuild_seconds:.2f} s",
+            "",
+            f"{'schéma':<16} {'lectures/s':>12} {'upserts/s':>12} {'taille Kio':>12}",
+        ]
+        for phase in (self.before, self.after):
+            lines.append(
+                f"{phase.label:<16} {phase.lookups_per_s:>12.0f} {phase.upserts_per_s:>12.0f} {phase.size_bytes / 1024:>12.0f}"
+            )
+        return "\n".join(lines)
+
+
+def _keys(members: int) -> list[tuple[int, int]]:
+    return [(1 + i % GUILDS, 100_000 + i) for i in range(members)]
+
+
+def _create_v1_db(db_path: Path, members: int) -> None:
+    """Crée une base au schéma v1 : mêmes tables qu'aujourd'hui, toutes avec rowid."""
+    for suffix in ("", "-journal", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(schema.SCHEMA_SQL.replace(") WITHOUT ROWID;", ");"))
+        conn.executemany(
+            "INSERT INTO xp_members(guild_id, user_id, xp, last_xp_ts) VALUES (?, ?, ?, ?)",
+            [(gid, uid, uid % 5000, 0) for gid, uid in _keys(members)],
+        )
+        conn.execute("PRAGMA user_version = 1;")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _measure(db_path: Path, label: str, keys: list[tuple[int, int]], ops: int, rng: random.Random) -> PhaseResult:
+    lookups = [rng.choice(keys) for _ in range(ops)]
+    # Upserts : 90 % de membres existants, 10 % de nouveaux
+    upserts = [rng.choice(keys) if rng.random() < 0.9 else (1, 900_000 + i) for i in range(ops)]
+
+    conn = sqlite3.connect(db_path)
+    try:
+        start = time.perf_counter()
+        for gid, uid in lookups:
+            xp_repo.xp_get_member(gid, uid, conn=conn)
+        lookups_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for gid, uid in upserts:
+            xp_repo.xp_add_xp(gid, uid, 3, set_last_xp_ts=1, conn=conn)
+        conn.commit()
+        upserts_s = time.perf_counter() - start
+
+        conn.execute("VACUUM;")
+    finally:
+        conn.close()
+
+    return PhaseResult(
+        label=label,
+        lookups_per_s=ops / lookups_s if lookups_s > 0 else 0.0,
+        upserts_per_s=ops / upserts_s if upserts_s > 0 else 0.0,
+        size_bytes=db_path.stat().st_size,
+    )
+
+
+def run_bench(
+    *,
+    members: int = 20_000,
+    ops: int = 10_000,
+    db_path: Path | str = DEFAULT_DB_PATH,
+    seed: int = 0,
+    keep_db: bool = False,
+) -> BenchReport:
+    """Exécute le banc (v1 puis migration puis schéma courant) et retourne le rapport."""
+    db_path = Path(db_path)
+    keys = _keys(members)
+    _create_v1_db(db_path, members)
+    try:
+        before = _measure(db_path, "v1 (rowid)", keys, ops, random.Random(seed))
+
+        start = time.perf_counter()
+        conn = sqlite3.connect(db_path)
+        try:
+            schema.apply_schema(conn)
+            conn.commit()
+        finally:
+            conn.close()
+        rebuild_seconds = time.perf_counter() - start
+
+        # Mêmes tirages qu'avant la migration : seul le stockage change
+        after = _measure(db_path, f"v{schema.SCHEMA_VERSION} (sans rowid)", keys, ops, random.Random(seed))
+    finally:
+        if not keep_db:
+            for suffix in ("", "-journal"):
+                Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+    return BenchReport(members=members, ops=ops, rebuild_seconds=rebuild_seconds, before=before, after=after)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Banc lectures / upserts des tables à clé composite Eldoria.")
+    parser.add_argument("--members", type=int, default=20_000, help="Nombre de membres XP en base.")
+    parser.add_argument("--ops", type=int, default=10_000, help="Nombre de lectures et d'upserts par mesure.")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Fichier SQLite utilisé (recréé à chaque run).")
+    parser.add_argument("--seed", type=int, default=0, help="Graine aléatoire (clés tirées).")
+    parser.add_argument("--keep-db", action="store_true", help="Conserve le fichier SQLite après le run.")
+    args = parser.parse_args(argv)
+
+    report = run_bench(members=args.members, ops=args.ops, db_path=args.db, seed=args.seed, keep_db=args.keep_db)
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from eldoria.db import connection
+from eldoria.db.repo import duel_repo
+from tests._perf import duel_load
+
+
+def test_run_load_drives_duels_to_completion_and_restores_probes(tmp_path):
+    original_lock = connection._DB_LOCK
+    original_cas = duel_repo.update_payload_if_unchanged
+    original_db_path = connection.DB_PATH
+
+    report = duel_load.run_load(duels=12, workers=4, expire_ratio=0.25, db_path=tmp_path / "load.db")
+
+    assert report.completed + report.expired == 12
+    assert report.expired == 3
+    assert not report.errors
+    assert len(report.latencies["create"]) == 12
+    assert report.cas.attempts >= report.completed
+    assert report.lock_waits
+    assert "débit" in report.format()
+
+    # Sondes et base restaurées, fichier supprimé
+    assert connection._DB_LOCK is original_lock
+    assert duel_repo.update_payload_if_unchanged is original_cas
+    assert connection.DB_PATH == original_db_path
+    assert not (tmp_path / "load.db").exists()
+
+
+def test_percentile_nearest_rank():
+    values = [0.1, 0.2, 0.3, 0.4]
+
+    assert duel_load.percentile(values, 50) == 0.2
+    assert duel_load.percentile(values, 99) == 0.4
+    assert duel_load.percentile([], 99) == 0.0
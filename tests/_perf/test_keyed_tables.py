@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from tests._perf import keyed_tables
+
+
+def test_run_bench_measures_both_schemas_and_shrinks_the_file(tmp_path):
+    db = tmp_path / "keyed.db"
+
+    report = keyed_tables.run_bench(members=2000, ops=200, db_path=db)
+
+    for phase in (report.before, report.after):
+        assert phase.lookups_per_s > 0
+        assert phase.upserts_per_s > 0
+    # La clé n'est plus stockée deux fois (table + index automatique)
+    assert report.after.size_bytes < report.before.size_bytes
+    assert "sans rowid" in report.format()
+    assert not db.exists()
+
+
+def test_run_bench_keep_db_leaves_migrated_file(tmp_path):
+    import sqlite3
+
+    db = tmp_path / "keyed.db"
+
+    keyed_tables.run_bench(members=50, ops=10, db_path=db, keep_db=True)
+
+    conn = sqlite3.connect(db)
+    sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'xp_members'").fetchone()[0]
+    assert "WITHOUT ROWID" in sql
+    assert conn.execute("SELECT COUNT(*) FROM xp_members").fetchone()[0] >= 50
+    conn.close()
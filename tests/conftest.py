@@ -31,6 +31,8 @@ from tests._bootstrap.sys_path import add_src_to_syspath
 # et lève si DISCORD_TOKEN est manquant. En prod c'est normal, en tests on
 # injecte une valeur factice.
 os.environ.setdefault("DISCORD_TOKEN", "TEST_TOKEN")
+# Pas de thread de surveillance de la boucle asyncio pendant les tests (activé explicitement là où il est testé).
+os.environ["LOOP_WATCHDOG_MS"] = "0"
 
 # ------------------------------------------------------------
 # Bootstrap AVANT imports projet
@@ -46,6 +48,7 @@ force_real_mentions_module()
 pytest_plugins = [
     "tests._fixtures.sqlite",
     "tests._fixtures.discord_ui",
+    "tests._fixtures.app_state",
 ]
 
 # ------------------------------------------------------------
@@ -12,8 +12,9 @@ def test_create_bot_sets_required_intents(monkeypatch):
 
     created = {}
 
-    def fake_eldoria_bot(*, intents):
+    def fake_eldoria_bot(*, intents, **options):
         created["intents"] = intents
+        created["options"] = options
         return FakeBot(intents=intents)
 
     monkeypatch.setattr(mod, "EldoriaBot", fake_eldoria_bot, raising=True)
@@ -25,6 +26,8 @@ def test_create_bot_sets_required_intents(monkeypatch):
     assert intents_obj.guilds is True
     assert intents_obj.members is True
     assert created["intents"] is intents_obj
+    # La synchronisation automatique de py-cord (on_connect) est désactivée au profit de Core.on_ready
+    assert created["options"] == {"auto_sync_commands": False}
 
 
 def test_main_runs_even_when_token_empty(monkeypatch):
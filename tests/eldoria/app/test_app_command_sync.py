@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from eldoria.app import command_sync as mod
+from tests._fakes import FakeBot
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _cmd(name: str, *, description: str = "desc", guild_ids=None):
+    return SimpleNamespace(
+        name=name,
+        guild_ids=guild_ids,
+        type=1,
+        callback=lambda: None,
+        to_dict=lambda: {"name": name, "description": description, "options": []},
+    )
+
+
+def _bot(*commands, application_id: int = 42):
+    bot = FakeBot()
+    bot.pending_application_commands = list(commands)
+    bot.application_id = application_id
+    return bot
+
+
+def test_compute_commands_hash_is_order_independent_and_content_sensitive():
+    a, b = _cmd("ping"), _cmd("help", guild_ids=[2, 1])
+
+    h1 = mod.compute_commands_hash(_bot(a, b))
+
+    assert h1 == mod.compute_commands_hash(_bot(b, a))
+    assert h1 == mod.compute_commands_hash(_bot(a, _cmd("help", guild_ids=[1, 2])))
+    assert h1 != mod.compute_commands_hash(_bot(a, _cmd("help", description="autre", guild_ids=[1, 2])))
+    assert h1 != mod.compute_commands_hash(_bot(a, _cmd("help", guild_ids=[3])))
+
+
+@pytest.mark.asyncio
+async def test_sync_runs_once_then_skips_until_tree_changes():
+    bot = _bot(_cmd("ping"))
+
+    assert await mod.sync_commands_if_changed(bot) is True
+    assert await mod.sync_commands_if_changed(bot) is False
+    assert bot.sync_commands.await_count == 1
+
+    state = json.loads(mod.COMMAND_SYNC_STATE_PATH.read_text(encoding="utf-8"))
+    assert state["hash"] == mod.compute_commands_hash(bot)
+    assert state["application_id"] == 42
+
+    bot.pending_application_commands.append(_cmd("version"))
+    assert await mod.sync_commands_if_changed(bot) is True
+    assert bot.sync_commands.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_skipped_sync_attaches_registered_ids_and_populates_help_index():
+    from eldoria.ui.help.resolver import build_command_index
+
+    ping, xp = _cmd("ping"), _cmd("xp", guild_ids=[7])
+    bot = _bot(ping, xp)
+    await mod.sync_commands_if_changed(bot)
+
+    # Redémarrage : nouveaux objets commande, aucun id tant que rien n'est relu
+    ping, xp = _cmd("ping"), _cmd("xp", guild_ids=[7])
+    bot = _bot(ping, xp)
+    bot.http.get_global_commands.return_value = [{"id": "11", "name": "ping", "type": 1}, {"id": "12", "name": "old", "type": 1}]
+    bot.http.get_guild_commands.return_value = [{"id": "21", "name": "xp", "type": 1}]
+
+    assert await mod.sync_commands_if_changed(bot) is False
+
+    bot.sync_commands.assert_not_awaited()
+    bot.http.get_global_commands.assert_awaited_once_with(42)
+    bot.http.get_guild_commands.assert_awaited_once_with(42, 7)
+    assert (ping.id, xp.id) == (11, 21)
+    _, cmd_map = build_command_index(bot)
+    assert set(cmd_map) == {"ping", "xp"}
+
+
+@pytest.mark.asyncio
+async def test_skipped_sync_survives_failed_lookup_and_help_falls_back_to_local_tree():
+    from eldoria.ui.help.resolver import build_command_index
+
+    await mod.sync_commands_if_changed(_bot(_cmd("ping")))
+    bot = _bot(_cmd("ping"))
+    bot.http.get_global_commands.side_effect = RuntimeError("503")
+
+    assert await mod.sync_commands_if_changed(bot) is False
+
+    assert bot.application_commands == []
+    _, cmd_map = build_command_index(bot)
+    assert set(cmd_map) == {"ping"}
+
+
+@pytest.mark.asyncio
+async def test_sync_force_bypasses_hash():
+    bot = _bot(_cmd("ping"))
+    await mod.sync_commands_if_changed(bot)
+
+    assert await mod.sync_commands_if_changed(bot, force=True) is True
+    bot.sync_commands.assert_awaited_with(force=True)
+
+
+@pytest.mark.asyncio
+async def test_sync_resyncs_for_another_application():
+    await mod.sync_commands_if_changed(_bot(_cmd("ping"), application_id=1))
+    other = _bot(_cmd("ping"), application_id=2)
+
+    assert await mod.sync_commands_if_changed(other) is True
+
+
+@pytest.mark.asyncio
+async def test_sync_failure_does_not_store_hash():
+    bot = _bot(_cmd("ping"))
+    bot.sync_commands.side_effect = RuntimeError("429")
+
+    with pytest.raises(RuntimeError):
+        await mod.sync_commands_if_changed(bot)
+
+    assert mod.read_sync_state() is None
+
+
+@pytest.mark.asyncio
+async def test_sync_falls_back_to_full_sync_when_hash_fails():
+    def broken():
+        raise TypeError("not serializable")
+
+    bot = _bot(SimpleNamespace(name="x", guild_ids=None, to_dict=broken))
+
+    assert await mod.sync_commands_if_changed(bot) is True
+    bot.sync_commands.assert_awaited_once()
+
+
+def test_compute_commands_hash_ignores_order_of_contexts_and_integration_types():
+    def cmd(contexts, integration_types, sub_contexts):
+        payload = {
+            "name": "xp",
+            "contexts": contexts,
+            "integration_types": integration_types,
+            "options": [{"name": "sub", "type": 1, "contexts": sub_contexts, "options": [{"name": "a"}, {"name": "b"}]}],
+        }
+        return SimpleNamespace(name="xp", guild_ids=None, to_dict=lambda: payload)
+
+    h1 = mod.compute_commands_hash(_bot(cmd([0, 1, 2], [0, 1], [1, 0])))
+
+    assert h1 == mod.compute_commands_hash(_bot(cmd([2, 0, 1], [1, 0], [0, 1])))
+    # L'ordre des options reste significatif
+    swapped = cmd([0, 1, 2], [0, 1], [1, 0])
+    payload = swapped.to_dict()
+    payload["options"][0]["options"].reverse()
+    assert h1 != mod.compute_commands_hash(_bot(swapped))
+
+
+_HASH_SCRIPT = """
+from types import SimpleNamespace
+from tests._bootstrap.sys_path import add_src_to_syspath
+add_src_to_syspath()
+from eldoria.app.command_sync import compute_commands_hash
+
+ctx = {"guild", "bot_dm", "private_channel"}
+payload = {
+    "name": "xp",
+    "contexts": list(ctx),
+    "integration_types": list({"guild_install", "user_install"}),
+    "options": [{"name": "sub", "type": 1, "contexts": list(ctx), "options": []}],
+}
+bot = SimpleNamespace(pending_application_commands=[SimpleNamespace(name="xp", guild_ids=None, to_dict=lambda: payload)])
+print(payload["contexts"], compute_commands_hash(bot))
+"""
+
+
+def test_compute_commands_hash_is_stable_across_hash_seeds():
+    outputs = []
+    for seed in ("0", "1", "2", "3", "4", "5"):
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        out = subprocess.run(
+            [sys.executable, "-c", _HASH_SCRIPT], cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=30
+        )
+        assert out.returncode == 0, out.stderr
+        outputs.append(out.stdout.strip().rsplit(" ", 1))
+
+    # Les listes brutes changent d'ordre selon la graine, le hash non
+    assert len({order for order, _ in outputs}) > 1
+    assert len({digest for _, digest in outputs}) == 1
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Budget de chargement des extensions (processus neuf, discord stubé).
+# À relever consciemment si une extension a vraiment besoin d'un nouveau module au chargement.
+MAX_ELDORIA_MODULES = 130
+MAX_IMPORT_MS = 2000.0
+
+# Modules UI lourds qui ne doivent être chargés qu'au premier usage
+LAZY_UI_MODULES = (
+    "eldoria.ui.help.view",
+    "eldoria.ui.xp.admin.menu",
+    "eldoria.ui.ticketing.panel",
+    "eldoria.ui.welcome.panel",
+    "eldoria.ui.temp_voice.home",
+    "eldoria.ui.duels.stats",
+)
+
+# Ressources JSON : lues au préchargement de on_ready ou au premier usage
+LAZY_JSON_MODULES = (
+    "eldoria.json_tools.resources",
+    "eldoria.json_tools.welcome_json",
+    "eldoria.json_tools.duels_json",
+)
+
+# Outils d'exploitation : utilisés à on_ready ou par une commande de diagnostic
+LAZY_APP_MODULES = (
+    "eldoria.app.command_sync",
+    "eldoria.app.loop_watchdog",
+    "eldoria.app.http_stats",
+    "eldoria.app.runtime_profiler",
+)
+
+
+@pytest.fixture(scope="module")
+def extensions_import_report():
+    out = subprocess.run(
+        [sys.executable, "-m", "tests._perf.extensions_import"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert out.returncode == 0, out.stderr
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_loading_extensions_does_not_import_lazy_ui_modules(extensions_import_report):
+    loaded = set(extensions_import_report["eldoria_modules"])
+
+    assert loaded.isdisjoint(LAZY_UI_MODULES)
+
+
+def test_loading_extensions_does_not_import_json_resources(extensions_import_report):
+    loaded = set(extensions_import_report["eldoria_modules"])
+
+    assert loaded.isdisjoint(LAZY_JSON_MODULES)
+
+
+def test_loading_extensions_does_not_import_diagnostic_tools(extensions_import_report):
+    loaded = set(extensions_import_report["eldoria_modules"])
+
+    assert loaded.isdisjoint(LAZY_APP_MODULES)
+
+
+def test_loading_extensions_stays_under_module_and_time_budget(extensions_import_report):
+    assert len(extensions_import_report["eldoria_modules"]) <= MAX_ELDORIA_MODULES
+    assert extensions_import_report["ms"] <= MAX_IMPORT_MS
+
+
+
+def test_db_maintenance_extension_adds_no_module_of_its_own(extensions_import_report):
+    # La maintenance passe par `bot.services.save` au moment du job : son import ne doit rien tirer de neuf
+    added = extensions_import_report["added_by"]["eldoria.extensions.db_maintenance"]
+
+    assert added == ["eldoria.extensions.db_maintenance"]
@@ -0,0 +1,197 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from eldoria.app import http_stats as hs_mod
+
+
+@pytest.fixture()
+def http_logger():
+    logger = logging.getLogger(hs_mod.HTTP_LOGGER_NAME)
+    level, handlers, filters = logger.level, list(logger.handlers), list(logger.filters)
+    yield logger
+    logger.setLevel(level)
+    logger.handlers[:] = handlers
+    logger.filters[:] = filters
+
+
+def _route(method="POST", path="/channels/{channel_id}/messages", **params):
+    return SimpleNamespace(method=method, path=path, **params)
+
+
+def _bot(original, channels=None):
+    channels = channels or {}
+    return SimpleNamespace(http=SimpleNamespace(request=original), get_channel=channels.get)
+
+
+def _caller(module_name):
+    """Crée une coroutine `call(bot, route)` définie dans le module `module_name` (attribution par la pile)."""
+    namespace = {"__name__": module_name}
+    exec("async def call(bot, route):\n    return await bot.http.request(route)", namespace)
+    return namespace["call"]
+
+
+@pytest.mark.asyncio
+async def test_request_is_counted_per_route_feature_and_guild(http_logger):
+    async def original(route, *args, **kwargs):
+        return {"id": 1}
+
+    bot = _bot(original, {10: SimpleNamespace(guild=SimpleNamespace(id=42))})
+    assert hs_mod.install_http_stats(bot) is True
+
+    call = _caller("eldoria.extensions.xp_voice")
+    assert await call(bot, _route(channel_id=10)) == {"id": 1}
+    await call(bot, _route(method="PUT", path="/guilds/{guild_id}/members/{user_id}/roles/{role_id}", guild_id=7))
+
+    stats = hs_mod.get_rest_stats()
+    assert stats.routes[("POST", "/channels/{channel_id}/messages")] == 1
+    assert stats.features["extensions.xp_voice"] == 2
+    assert stats.top_routes(42) == [(("POST", "/channels/{channel_id}/messages"), 1)]
+    assert stats.top_routes(7) == [(("PUT", "/guilds/{guild_id}/members/{user_id}/roles/{role_id}"), 1)]
+    assert hs_mod.REST_REQUESTS_TOTAL.value(
+        method="POST", route="/channels/{channel_id}/messages", feature="extensions.xp_voice", status="ok"
+    ) == 1
+    assert hs_mod.REST_SECONDS.count(method="POST", route="/channels/{channel_id}/messages") == 1
+
+
+@pytest.mark.asyncio
+async def test_request_error_records_http_status(http_logger):
+    async def failing(route, *args, **kwargs):
+        err = RuntimeError("forbidden")
+        err.status = 403  # type: ignore[attr-defined]
+        raise err
+
+    bot = _bot(failing)
+    hs_mod.install_http_stats(bot)
+
+    with pytest.raises(RuntimeError):
+        await _caller("eldoria.features.role.role_service")(bot, _route(method="DELETE", path="/x"))
+
+    assert hs_mod.REST_REQUESTS_TOTAL.value(method="DELETE", route="/x", feature="features.role", status="403") == 1
+
+
+@pytest.mark.asyncio
+async def test_request_outside_eldoria_is_attributed_to_library(http_logger):
+    async def original(route, *args, **kwargs):
+        return None
+
+    bot = _bot(original)
+    hs_mod.install_http_stats(bot)
+
+    await _caller("discord.webhook")(bot, _route(path="/y"))
+
+    assert hs_mod.get_rest_stats().features == {"(bibliothèque)": 1}
+
+
+def test_install_is_idempotent_and_keeps_logger_level(http_logger):
+    http_logger.setLevel(logging.WARNING)
+    bot = _bot(lambda *a, **k: None)
+
+    assert hs_mod.install_http_stats(bot) is True
+    wrapped = bot.http.request
+    assert hs_mod.install_http_stats(bot) is False
+    assert bot.http.request is wrapped
+
+    info = http_logger.makeRecord(http_logger.name, logging.INFO, __file__, 1, "POST /x has returned 200", (), None)
+    debug_rl = http_logger.makeRecord(
+        http_logger.name, logging.DEBUG, __file__, 1, "A rate limit bucket has been exhausted (bucket: %s, retry: %s).", ("b", 1.5), None
+    )
+    assert http_logger.filter(info) is False
+    assert http_logger.filter(debug_rl) is True
+    assert sum(isinstance(h, hs_mod.RateLimitLogHandler) for h in http_logger.handlers) == 1
+
+
+# Séquences exactes de py-cord (HTTPClient.request) pour une réponse 429
+def _log_bucket_429(logger, retry_after, bucket="abc"):
+    logger.warning('We are being rate limited. Retrying in %.2f seconds. Handled under the bucket "%s"', retry_after, bucket)
+    logger.debug("Done sleeping for the rate limit. Retrying...")
+
+
+def _log_global_429(logger, retry_after, bucket="abc"):
+    logger.warning('We are being rate limited. Retrying in %.2f seconds. Handled under the bucket "%s"', retry_after, bucket)
+    logger.warning("Global rate limit has been hit. Retrying in %.2f seconds.", retry_after)
+    logger.debug("Done sleeping for the rate limit. Retrying...")
+    logger.debug("Global rate limit is now over.")
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_logs_are_attributed_to_current_call(http_logger):
+    async def original(route, *args, **kwargs):
+        logger = logging.getLogger(hs_mod.HTTP_LOGGER_NAME)
+        logger.debug("A rate limit bucket has been exhausted (bucket: %s, retry: %s).", "abc", "0.5")
+        _log_bucket_429(logger, 1.25)
+        return None
+
+    bot = _bot(original)
+    hs_mod.install_http_stats(bot)
+
+    await _caller("eldoria.extensions.temp_voice")(bot, _route(method="PATCH", path="/channels/{channel_id}"))
+
+    stats = hs_mod.get_rest_stats()
+    assert stats.rate_limited[("PATCH", "/channels/{channel_id}")] == 1
+    assert stats.global_rate_limits == 0
+    assert stats.wait_s == pytest.approx(1.75)
+    assert hs_mod.REST_RATE_LIMITED_TOTAL.value(route="/channels/{channel_id}", scope="bucket") == 1
+    assert hs_mod.REST_RATE_LIMITED_TOTAL.value(route="/channels/{channel_id}", scope="global") == 0
+    assert hs_mod.REST_RATE_LIMIT_WAIT_TOTAL.value(route="/channels/{channel_id}") == pytest.approx(1.75)
+
+
+@pytest.mark.asyncio
+async def test_global_429_replayed_from_pycord_logs_counts_one_global_hit_and_one_wait(http_logger):
+    async def original(route, *args, **kwargs):
+        logger = logging.getLogger(hs_mod.HTTP_LOGGER_NAME)
+        _log_global_429(logger, 2.0)
+        _log_bucket_429(logger, 0.5)
+        return None
+
+    bot = _bot(original)
+    hs_mod.install_http_stats(bot)
+
+    await _caller("eldoria.extensions.core")(bot, _route(path="/x"))
+
+    stats = hs_mod.get_rest_stats()
+    assert stats.rate_limited[("POST", "/x")] == 2
+    assert stats.global_rate_limits == 1
+    assert stats.wait_s == pytest.approx(2.5)
+    assert hs_mod.REST_RATE_LIMITED_TOTAL.value(route="/x", scope="global") == 1
+    assert hs_mod.REST_RATE_LIMITED_TOTAL.value(route="/x", scope="bucket") == 1
+    assert hs_mod.REST_RATE_LIMIT_WAIT_TOTAL.value(route="/x") == pytest.approx(2.5)
+
+
+def test_other_rate_limit_mentions_are_ignored():
+    handler = hs_mod.RateLimitLogHandler()
+    for msg in ("Done sleeping for the rate limit. Retrying...", "Global rate limit is now over.", "rate limit something"):
+        handler.emit(logging.LogRecord("discord.http", logging.DEBUG, __file__, 1, msg, (), None))
+
+    stats = hs_mod.get_rest_stats()
+    assert sum(stats.rate_limited.values()) == 0
+    assert stats.wait_s == 0
+
+
+def test_rate_limit_outside_request_is_counted_without_route():
+    handler = hs_mod.RateLimitLogHandler()
+    record = logging.LogRecord("discord.http", logging.WARNING, __file__, 1, "Global rate limit has been hit. Retrying in %.2f seconds.", (1.0,), None)
+
+    handler.emit(record)
+
+    assert hs_mod.get_rest_stats().rate_limited[("?", "?")] == 1
+
+
+def test_summary_lists_routes_features_and_guilds():
+    stats = hs_mod.get_rest_stats()
+    stats.record_call(hs_mod.RestCall("POST", "/a", "extensions.core", 1))
+    stats.record_call(hs_mod.RestCall("POST", "/a", "extensions.core", 1))
+    stats.record_call(hs_mod.RestCall("GET", "/b", "features.xp", 2))
+    stats.record_rate_limit(hs_mod.RestCall("POST", "/a", "extensions.core", 1), 1.0, hit=True, is_global=False)
+
+    text = "\n".join(stats.summary())
+    per_guild = "\n".join(stats.summary(2))
+
+    assert "Appels REST : 3" in text
+    assert "POST /a : 2, 429 : 1" in text
+    assert "extensions.core : 2" in text
+    assert "1 : 2" in text
+    assert "Routes (guild 2) :" in per_guild
+    assert "GET /b : 1" in per_guild
+    assert "POST /a" not in per_guild
@@ -1,10 +1,19 @@
 import logging
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from logging.handlers import QueueHandler, RotatingFileHandler
 
 import pytest
 
-from eldoria.app.logging import DiscordReconnectNoiseFilter, setup_logging
+from eldoria.app.logging import (
+    DeferredFormatQueueHandler,
+    DiscordReconnectNoiseFilter,
+    LogDeduplicator,
+    get_log_listener,
+    setup_logging,
+    stop_logging,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -14,17 +23,18 @@ def _reset_logging():
     root.handlers.clear()
     root.setLevel(logging.NOTSET)
     yield
+    stop_logging()
     root.handlers.clear()
     root.setLevel(logging.NOTSET)
 
 
 def _get_handlers():
-    root = logging.getLogger()
+    handlers = get_log_listener().handlers
     sh = next(
-        h for h in root.handlers
+        h for h in handlers
         if isinstance(h, logging.StreamHandler) and not isinstance(h, RotatingFileHandler)
     )
-    fh = next(h for h in root.handlers if isinstance(h, RotatingFileHandler))
+    fh = next(h for h in handlers if isinstance(h, RotatingFileHandler))
     return sh, fh
 
 
@@ -35,7 +45,8 @@ def test_setup_logging_sets_root_level_and_handlers(tmp_path):
 
     root = logging.getLogger()
     assert root.level == logging.DEBUG
-    assert len(root.handlers) == 2
+    assert len(root.handlers) == 1
+    assert isinstance(root.handlers[0], QueueHandler)
 
     sh, fh = _get_handlers()
 
@@ -71,31 +82,29 @@ def test_setup_logging_replaces_existing_handlers(tmp_path):
     # Le handler sentinelle doit être supprimé
     assert sentinel not in root.handlers
 
-    # Et on doit avoir nos 2 handlers (console + fichier)
-    assert any(
-        isinstance(h, logging.StreamHandler) and not isinstance(h, RotatingFileHandler)
-        for h in root.handlers
-    )
-    assert any(isinstance(h, RotatingFileHandler) for h in root.handlers)
+    # Et on doit avoir la file devant nos 2 handlers (console + fichier)
+    assert [type(h) for h in root.handlers] == [DeferredFormatQueueHandler]
+    sh, fh = _get_handlers()
+    assert isinstance(fh, RotatingFileHandler)
 
 
 def test_setup_logging_formatter_format_and_datefmt(tmp_path):
     setup_logging(level=logging.INFO, log_file=str(tmp_path / "bot.log"))
 
-    root = logging.getLogger()
-    for handler in root.handlers:
+    for handler in get_log_listener().handlers:
         formatter = handler.formatter
         assert formatter is not None
         assert formatter._fmt == "%(asctime)s  %(levelname)-10s  %(name)-30s - %(message)s"
         assert formatter.datefmt == "%d/%m/%Y  %H:%M:%S"
 
 
-def test_setup_logging_adds_noise_filter_to_handlers(tmp_path):
+def test_setup_logging_applies_noise_filter_once_before_queue(tmp_path):
     setup_logging(level=logging.INFO, log_file=str(tmp_path / "bot.log"))
 
-    root = logging.getLogger()
-    for handler in root.handlers:
-        assert any(isinstance(f, DiscordReconnectNoiseFilter) for f in handler.filters)
+    [queue_handler] = logging.getLogger().handlers
+    assert [type(f) for f in queue_handler.filters] == [DiscordReconnectNoiseFilter, LogDeduplicator]
+    for handler in get_log_listener().handlers:
+        assert not handler.filters
 
 
 def test_setup_logging_rotating_file_handler_config(tmp_path):
@@ -140,6 +149,7 @@ def test_noise_filter_prevents_reconnect_noise_from_being_written(tmp_path):
 
     logger = logging.getLogger("discord.client")
     logger.error("Attempting a reconnect in 1.66s")
+    stop_logging()
 
     text = log_file.read_text(encoding="utf-8")
 
@@ -160,4 +170,167 @@ def test_discord_reconnect_noise_filter_filters_expected_messages():
     assert f.filter(r1) is False
     assert f.filter(r2) is False
     assert f.filter(r3) is False
-    assert f.filter(r4) is True
\ No newline at end of file
+    assert f.filter(r4) is True
+
+def test_records_are_written_by_listener_thread_and_flushed_on_stop(tmp_path):
+    log_file = tmp_path / "bot.log"
+    setup_logging(level=logging.INFO, log_file=str(log_file))
+    _, fh = _get_handlers()
+    writer_threads = []
+    original_emit = fh.emit
+
+    def spy_emit(record):
+        writer_threads.append(threading.current_thread())
+        original_emit(record)
+
+    fh.emit = spy_emit
+    logging.getLogger("eldoria.test").info("message %s", "fusionné")
+    stop_logging()
+
+    assert "message fusionné" in log_file.read_text(encoding="utf-8")
+    assert writer_threads and threading.main_thread() not in writer_threads
+    assert get_log_listener() is None
+
+
+def test_exception_traceback_is_formatted_by_listener(tmp_path):
+    log_file = tmp_path / "bot.log"
+    setup_logging(level=logging.INFO, log_file=str(log_file))
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logging.getLogger("eldoria.test").exception("échec")
+    stop_logging()
+
+    text = log_file.read_text(encoding="utf-8")
+    assert "échec" in text
+    assert "ValueError: boom" in text
+
+
+def test_deferred_queue_handler_merges_args_without_formatting():
+    handler = DeferredFormatQueueHandler(None)
+    items = ["a"]
+    record = logging.LogRecord("x", logging.ERROR, __file__, 1, "items=%s", (items,), (ValueError, ValueError("e"), None))
+
+    prepared = handler.prepare(record)
+    items.append("b")
+
+    assert prepared.msg == "items=['a']"
+    assert prepared.args is None
+    assert prepared.exc_info is record.exc_info
+    assert prepared.exc_text is None
+    assert record.args == (items,)
+
+
+def test_setup_logging_twice_stops_previous_listener(tmp_path):
+    first = setup_logging(level=logging.INFO, log_file=str(tmp_path / "a.log"))
+    second = setup_logging(level=logging.INFO, log_file=str(tmp_path / "b.log"))
+
+    assert first is not second
+    assert first._thread is None
+    assert get_log_listener() is second
+    assert len(logging.getLogger().handlers) == 1
+
+
+def _record(msg="échec (user_id=%s)", args=(1,), level=logging.ERROR, name="eldoria.extensions.xp_voice", exc=None):
+    exc_info = (type(exc), exc, None) if exc is not None else None
+    return logging.LogRecord(name, level, __file__, 1, msg, args, exc_info)
+
+
+def test_deduplicator_lets_burst_through_then_summarizes_window():
+    now = [0.0]
+    dedup = LogDeduplicator(window=60, burst=2, clock=lambda: now[0])
+
+    results = [dedup.filter(_record(args=(i,), exc=ValueError("x"))) for i in range(5)]
+
+    assert results == [True, True, False, False, False]
+    assert dedup.suppressed_total == 3
+    assert dedup.drain_summaries() == []
+
+    now[0] = 61.0
+    assert dedup.filter(_record(args=(9,), exc=ValueError("x"))) is True
+    [summary] = dedup.drain_summaries()
+    assert summary.name == "eldoria.extensions.xp_voice"
+    assert summary.levelno == logging.ERROR
+    assert summary.getMessage().startswith("🔁 3 messages similaires supprimés en 61 s [ValueError] : échec (user_id=%s)")
+    assert dedup.filter(summary) is True
+
+
+def test_deduplicator_keys_on_logger_template_and_exception_type():
+    dedup = LogDeduplicator(window=60, burst=1, clock=lambda: 0.0)
+
+    assert dedup.filter(_record(exc=ValueError("a"))) is True
+    assert dedup.filter(_record(exc=KeyError("a"))) is True
+    assert dedup.filter(_record(name="eldoria.extensions.duels", exc=ValueError("a"))) is True
+    assert dedup.filter(_record(msg="autre %s", exc=ValueError("a"))) is True
+    assert dedup.filter(_record(args=(2,), exc=ValueError("b"))) is False
+
+
+def test_deduplicator_ignores_levels_below_threshold():
+    dedup = LogDeduplicator(window=60, burst=1, clock=lambda: 0.0)
+
+    assert all(dedup.filter(_record(level=logging.INFO)) for _ in range(10))
+
+
+def test_deduplicator_periodic_sweep_summarizes_idle_keys():
+    now = [0.0]
+    dedup = LogDeduplicator(window=10, burst=1, clock=lambda: now[0])
+    dedup.filter(_record())
+    dedup.filter(_record())
+
+    now[0] = 11.0
+    dedup.filter(_record(msg="autre chose", level=logging.INFO))
+
+    [summary] = dedup.drain_summaries()
+    assert "1 messages similaires supprimés" in summary.getMessage()
+
+
+def test_deduplicator_drain_closes_expired_windows_without_new_record():
+    now = [0.0]
+    dedup = LogDeduplicator(window=10, burst=1, clock=lambda: now[0])
+    dedup.filter(_record())
+    dedup.filter(_record())
+    dedup.filter(_record())
+
+    now[0] = 5.0
+    assert dedup.drain_summaries() == []
+
+    now[0] = 10.0
+    [summary] = dedup.drain_summaries()
+    assert "2 messages similaires supprimés en 10 s" in summary.getMessage()
+    assert dedup.drain_summaries() == []
+
+
+def test_error_storm_is_collapsed_in_log_file_and_flushed_on_stop(tmp_path):
+    log_file = tmp_path / "bot.log"
+    setup_logging(level=logging.INFO, log_file=str(log_file), dedup_burst=2)
+    logger = logging.getLogger("eldoria.extensions.xp_voice")
+
+    for member_id in range(50):
+        try:
+            raise PermissionError("Missing Access")
+        except PermissionError:
+            logger.exception("XP vocal: erreur inattendue lors du tick (user_id=%s)", member_id)
+    stop_logging()
+
+    text = log_file.read_text(encoding="utf-8")
+    assert text.count("PermissionError: Missing Access") == 2
+    assert "🔁 48 messages similaires supprimés" in text
+
+
+def test_summary_is_written_when_window_closes_without_further_logs(tmp_path):
+    log_file = tmp_path / "bot.log"
+    setup_logging(level=logging.INFO, log_file=str(log_file), dedup_window=0.2, dedup_burst=1)
+    logger = logging.getLogger("eldoria.extensions.duels")
+
+    for duel_id in range(5):
+        logger.warning("Duel introuvable (duel_id=%s)", duel_id)
+
+    deadline = time.monotonic() + 5.0
+    while "🔁 4 messages similaires supprimés" not in log_file.read_text(encoding="utf-8"):
+        assert time.monotonic() < deadline, "résumé non écrit à la clôture de la fenêtre"
+        time.sleep(0.05)
+
+    root_handler = logging.getLogger().handlers[0]
+    stop_logging()
+    assert root_handler._ticker is None
@@ -0,0 +1,121 @@
+import asyncio
+import sys
+import threading
+import time
+
+import pytest
+
+from eldoria.app import loop_watchdog as wd_mod
+
+
+def _blocking_frame():
+    return sys._getframe()
+
+
+def test_attribute_frame_outside_eldoria_uses_innermost_frame():
+    capture = wd_mod.attribute_frame(_blocking_frame())
+
+    assert capture.owner == "(hors eldoria)"
+    assert "_blocking_frame" in capture.site
+    assert "_blocking_frame" in capture.stack
+
+
+def test_attribute_frame_prefers_extension_handler_and_innermost_eldoria_call():
+    namespace_ext = {"__name__": "eldoria.extensions.core"}
+    namespace_repo = {"__name__": "eldoria.db.repo.xp_repo"}
+    exec("def handler(inner):\n    return inner()", namespace_ext)
+    exec("import sys\ndef query():\n    return sys._getframe()", namespace_repo)
+
+    frame = namespace_ext["handler"](namespace_repo["query"])
+    capture = wd_mod.attribute_frame(frame)
+
+    assert capture.owner == "eldoria.extensions.core.handler"
+    assert capture.site.startswith("eldoria.db.repo.xp_repo.query:")
+
+
+def test_check_captures_stack_only_when_loop_is_stalled(monkeypatch):
+    watchdog = wd_mod.LoopWatchdog(threshold=0.2, interval=0.05)
+    watchdog._loop_thread_id = threading.get_ident()
+    now = time.monotonic()
+
+    watchdog._last_beat = now
+    monkeypatch.setattr(wd_mod.time, "monotonic", lambda: now + 0.1)
+    assert watchdog.check() is None
+
+    monkeypatch.setattr(wd_mod.time, "monotonic", lambda: now + 0.5)
+    capture = watchdog.check()
+    assert capture is not None
+    assert watchdog._pending is capture
+    # Un seul relevé par blocage
+    assert watchdog.check() is None
+
+
+def test_record_lag_closes_pending_blocking_and_aggregates(caplog):
+    watchdog = wd_mod.LoopWatchdog(threshold=0.1)
+    capture = wd_mod.BlockingCapture(owner="eldoria.extensions.logs.Logs.logs", site="reader.tail_lines:12", stack="stack\n")
+
+    watchdog.record_lag(0.002)
+    watchdog._pending = capture
+    watchdog.record_lag(0.4)
+    watchdog._pending = capture
+    watchdog.record_lag(0.2)
+
+    [offender] = watchdog.top_offenders()
+    assert offender.count == 2
+    assert offender.total_s == pytest.approx(0.6)
+    assert offender.max_s == pytest.approx(0.4)
+    assert watchdog.max_lag == pytest.approx(0.4)
+    assert wd_mod.LOOP_LAG_SECONDS.count() == 3
+    assert wd_mod.LOOP_BLOCKED_TOTAL.value(owner=capture.owner) == 2
+    assert "Boucle asyncio bloquée 400 ms" in caplog.text
+
+
+def test_top_offenders_sorted_by_total_duration():
+    watchdog = wd_mod.LoopWatchdog()
+    watchdog.record_blocking(wd_mod.BlockingCapture("a", "x", ""), 0.3)
+    watchdog.record_blocking(wd_mod.BlockingCapture("b", "y", ""), 0.5)
+    watchdog.record_blocking(wd_mod.BlockingCapture("a", "x", ""), 0.3)
+
+    assert [o.owner for o in watchdog.top_offenders()] == ["a", "b"]
+    assert [o.owner for o in watchdog.top_offenders(1)] == ["a"]
+
+
+def test_summary_without_blocking():
+    watchdog = wd_mod.LoopWatchdog(threshold=0.25)
+    watchdog.record_lag(0.001)
+
+    lines = watchdog.summary()
+
+    assert lines[0].startswith("Retard de la boucle : p50")
+    assert "250 ms" in lines[1]
+    assert lines[-1] == "Aucun blocage détecté."
+
+
+@pytest.mark.asyncio
+async def test_watchdog_detects_blocking_call_on_running_loop():
+    watchdog = wd_mod.LoopWatchdog(threshold=0.05, interval=0.01)
+    watchdog.start()
+    try:
+        await asyncio.sleep(0.03)
+        time.sleep(0.2)  # appel bloquant volontaire sur la boucle
+        await asyncio.sleep(0.05)
+    finally:
+        await watchdog.stop()
+
+    assert not watchdog.running
+    [offender] = watchdog.top_offenders()
+    assert "test_watchdog_detects_blocking_call_on_running_loop" in offender.last_stack
+    assert offender.max_s >= 0.1
+
+
+def test_start_watchdog_is_a_singleton(monkeypatch):
+    started = []
+    monkeypatch.setattr(wd_mod, "_WATCHDOG", None)
+    monkeypatch.setattr(wd_mod.LoopWatchdog, "start", lambda self: started.append(self))
+
+    first = wd_mod.start_watchdog(300)
+    second = wd_mod.start_watchdog(300)
+
+    assert first is second is wd_mod.get_watchdog()
+    assert first.threshold == pytest.approx(0.3)
+    assert len(started) == 2
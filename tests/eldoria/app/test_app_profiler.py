@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import sys
+
+import pytest
+
+from eldoria.app import profiler as mod
+from eldoria.app import startup as startup_mod
+from tests._fakes import FakeBot, Logger
+
+
+@pytest.fixture()
+def active_profiler(monkeypatch):
+    """Profiler global actif le temps du test (hook d'import retiré à la fin)."""
+    monkeypatch.setattr(mod, "_PROFILER", None, raising=True)
+    profiler = mod.start_profiling()
+    yield profiler
+    profiler.uninstall()
+    monkeypatch.setattr(mod, "_PROFILER", None, raising=True)
+
+
+def _write_package(root, name):
+    pkg = root / name
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text(f"from {name} import child\n")
+    (pkg / "child.py").write_text("import time\nVALUE = 1\n")
+
+
+def test_import_hook_records_nested_modules(active_profiler, tmp_path, monkeypatch):
+    _write_package(tmp_path, "profiled_pkg")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    import profiled_pkg
+
+    assert profiled_pkg.child.VALUE == 1
+    records = {r.name: r for r in active_profiler.imports}
+    assert records["profiled_pkg.child"].parent == "profiled_pkg"
+    assert records["profiled_pkg.child"].depth == records["profiled_pkg"].depth + 1
+    assert records["profiled_pkg"].cumulative_ms >= records["profiled_pkg.child"].cumulative_ms
+    assert records["profiled_pkg"].self_ms <= records["profiled_pkg"].cumulative_ms
+
+    for name in ("profiled_pkg", "profiled_pkg.child"):
+        sys.modules.pop(name, None)
+
+
+def test_uninstall_removes_hook(active_profiler):
+    assert any(isinstance(f, mod._ImportTimingFinder) for f in sys.meta_path)
+
+    active_profiler.uninstall()
+
+    assert not any(isinstance(f, mod._ImportTimingFinder) for f in sys.meta_path)
+
+
+def test_start_profiling_from_env_respects_variable(monkeypatch):
+    monkeypatch.setattr(mod, "_PROFILER", None, raising=True)
+    monkeypatch.delenv(mod.PROFILE_ENV_VAR, raising=False)
+
+    assert mod.start_profiling_from_env() is None
+    assert mod.get_profiler() is None
+
+    monkeypatch.setenv(mod.PROFILE_ENV_VAR, "1")
+    profiler = mod.start_profiling_from_env()
+    try:
+        assert profiler is not None
+        assert mod.get_profiler() is profiler
+        assert mod.start_profiling() is profiler
+    finally:
+        profiler.uninstall()
+        monkeypatch.setattr(mod, "_PROFILER", None, raising=True)
+
+
+def test_step_and_load_extensions_feed_profiler(active_profiler, monkeypatch):
+    monkeypatch.setattr(startup_mod, "EXTENSIONS", ["ext.a", "ext.b"], raising=True)
+    bot = FakeBot()
+
+    startup_mod.step("Extensions", lambda: startup_mod.load_extensions(bot), logger=Logger())
+    startup_mod.step("Boom", lambda: 1 / 0, critical=False, logger=Logger())
+
+    assert [e.name for e in active_profiler.extensions] == ["ext.a", "ext.b"]
+    assert [(s.name, s.ok) for s in active_profiler.steps] == [("Extensions", True), ("Boom", False)]
+
+
+def test_finish_profiling_writes_json_and_tree(active_profiler, tmp_path):
+    active_profiler.record_step("Initialisation de la base de données", 12.5)
+    active_profiler.record_extension("eldoria.extensions.core", 3.0)
+    active_profiler.mark("on_connect")
+    active_profiler.mark("on_connect")  # seul le premier passage compte
+    with active_profiler.import_frame("big.module"), active_profiler.import_frame("big.module.child"):
+        pass
+
+    json_path, txt_path = mod.finish_profiling(tmp_path)
+
+    assert mod.get_profiler() is None
+    data = json.loads(json_path.read_text(encoding="utf-8"))
+    assert list(data["marks_ms"]) == ["on_connect"]
+    assert data["steps"][0]["name"] == "Initialisation de la base de données"
+    assert data["extensions"][0]["ms"] == 3.0
+    assert [r["name"] for r in data["imports"]][-2:] == ["big.module", "big.module.child"]
+
+    text = txt_path.read_text(encoding="utf-8")
+    assert "Initialisation de la base de données" in text
+    assert "eldoria.extensions.core" in text
+
+
+def test_format_tree_hides_fast_subtrees():
+    profiler = mod.StartupProfiler(started_at=0.0)
+    profiler.imports = [
+        mod.ImportRecord("slow", None, 0, 0.0, self_ms=5.0, cumulative_ms=50.0),
+        mod.ImportRecord("slow.child", "slow", 1, 1.0, self_ms=45.0, cumulative_ms=45.0),
+        mod.ImportRecord("fast", None, 0, 2.0, self_ms=0.1, cumulative_ms=0.2),
+        mod.ImportRecord("fast.heavy_child", "fast", 1, 2.1, self_ms=0.1, cumulative_ms=0.1),
+    ]
+
+    text = profiler.format_tree(min_ms=1.0)
+
+    assert "slow.child" in text
+    assert "fast" not in text
+
+
+def test_finish_profiling_without_profiler_is_noop(monkeypatch):
+    monkeypatch.setattr(mod, "_PROFILER", None, raising=True)
+
+    assert mod.finish_profiling() is None
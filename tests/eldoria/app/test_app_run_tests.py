@@ -243,3 +243,130 @@ def test_run_tests_logger_defaults_to_module_log(monkeypatch):
     assert mod.run_tests(logger=None) == "1/1 Tests validés"
     # Verify defaulted logger is used
     assert any("Lancement des tests" in msg for msg in fake_logger.infos)
+
+
+# ----------------------------
+# run_tests_cached() / run_tests_in_background()
+# ----------------------------
+
+def _outside_pytest(monkeypatch, tmp_path):
+    import sys
+
+    import eldoria.app.run_tests as mod
+
+    monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+    monkeypatch.delitem(sys.modules, "pytest", raising=False)
+    monkeypatch.setattr(mod, "TESTS_CACHE_PATH", tmp_path / "data" / "startup_tests.json", raising=True)
+    monkeypatch.setattr(mod, "compute_source_hash", lambda: "hash-1", raising=True)
+    return mod
+
+
+def test_compute_source_hash_changes_with_content_and_ignores_pycache(tmp_path):
+    import eldoria.app.run_tests as mod
+
+    src = tmp_path / "src"
+    (src / "__pycache__").mkdir(parents=True)
+    (src / "a.py").write_text("x = 1\n")
+    (src / "__pycache__" / "a.py").write_text("ignored\n")
+
+    first = mod.compute_source_hash((src,))
+    (src / "__pycache__" / "a.py").write_text("still ignored\n")
+    assert mod.compute_source_hash((src,)) == first
+
+    (src / "a.py").write_text("x = 2\n")
+    assert mod.compute_source_hash((src,)) != first
+
+
+def test_run_tests_cached_returns_none_inside_pytest(monkeypatch):
+    import eldoria.app.run_tests as mod
+
+    monkeypatch.setattr(mod, "run_tests", lambda **_: pytest.fail("ne doit pas être appelé"), raising=True)
+    assert mod.run_tests_cached(logger=Logger()) is None
+
+
+def test_run_tests_cached_runs_once_then_reuses_cache(monkeypatch, tmp_path):
+    mod = _outside_pytest(monkeypatch, tmp_path)
+    calls = []
+
+    def fake_run_tests(*, logger=None):
+        calls.append(logger)
+        return "10/10 Tests validés"
+
+    monkeypatch.setattr(mod, "run_tests", fake_run_tests, raising=True)
+
+    assert mod.run_tests_cached(logger=Logger()) == "10/10 Tests validés"
+    assert mod.run_tests_cached(logger=Logger()) == "10/10 Tests validés (cache)"
+    assert len(calls) == 1
+
+    # Nouveau code -> nouveau run
+    monkeypatch.setattr(mod, "compute_source_hash", lambda: "hash-2", raising=True)
+    assert mod.run_tests_cached(logger=Logger()) == "10/10 Tests validés"
+    assert len(calls) == 2
+
+
+def test_run_tests_cached_caches_failure_and_reraises(monkeypatch, tmp_path):
+    from eldoria.exceptions.internal import TestsFailed
+
+    mod = _outside_pytest(monkeypatch, tmp_path)
+
+    def fake_run_tests(*, logger=None):
+        raise TestsFailed()
+
+    monkeypatch.setattr(mod, "run_tests", fake_run_tests, raising=True)
+
+    monkeypatch.setenv("TESTS_STRICT", "1")
+    with pytest.raises(TestsFailed):
+        mod.run_tests_cached(logger=Logger())
+
+    # Même build, mode strict : l'échec en cache bloque comme un vrai run (sans relancer les tests)
+    monkeypatch.setattr(mod, "run_tests", lambda **_: pytest.fail("ne doit pas être relancé"), raising=True)
+    logger = Logger()
+    with pytest.raises(TestsFailed):
+        mod.run_tests_cached(logger=logger)
+    assert logger.warnings
+
+
+def test_run_tests_cached_failure_in_cache_non_strict_returns_label(monkeypatch, tmp_path):
+    mod = _outside_pytest(monkeypatch, tmp_path)
+    monkeypatch.setenv("TESTS_STRICT", "0")
+    monkeypatch.setattr(mod, "run_tests", lambda **_: "2 tests fails / 10", raising=True)
+
+    assert mod.run_tests_cached(logger=Logger()) == "2 tests fails / 10"
+
+    monkeypatch.setattr(mod, "run_tests", lambda **_: pytest.fail("ne doit pas être relancé"), raising=True)
+    logger = Logger()
+    assert mod.run_tests_cached(logger=logger) == "2 tests fails / 10 (cache)"
+    assert logger.warnings
+
+
+def test_run_tests_cached_does_not_cache_skipped_runs(monkeypatch, tmp_path):
+    mod = _outside_pytest(monkeypatch, tmp_path)
+    monkeypatch.setattr(mod, "run_tests", lambda **_: None, raising=True)
+
+    assert mod.run_tests_cached(logger=Logger()) is None
+    assert not mod.TESTS_CACHE_PATH.exists()
+
+
+@pytest.mark.asyncio
+async def test_run_tests_in_background_logs_label(monkeypatch):
+    import eldoria.app.run_tests as mod
+
+    monkeypatch.setattr(mod, "run_tests_cached", lambda **_: "3/3 Tests validés", raising=True)
+    logger = Logger()
+
+    assert await mod.run_tests_in_background(logger=logger) == "3/3 Tests validés"
+    assert "3/3 Tests validés" in logger.infos[0][1]
+
+
+@pytest.mark.asyncio
+async def test_run_tests_in_background_swallows_failures(monkeypatch):
+    import eldoria.app.run_tests as mod
+
+    def boom(**_):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(mod, "run_tests_cached", boom, raising=True)
+    logger = Logger()
+
+    assert await mod.run_tests_in_background(logger=logger) is None
+    assert logger.exceptions
@@ -0,0 +1,109 @@
+import asyncio
+import sys
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+from eldoria.app import runtime_profiler as rp_mod
+
+
+def _leaf():
+    return sys._getframe()
+
+
+def _middle():
+    return _leaf()
+
+
+def test_collapse_frame_orders_from_outer_to_inner_with_prefix():
+    stack = rp_mod.collapse_frame(_middle(), prefix="thread:main")
+
+    names = stack.split(";")
+    assert names[0] == "thread:main"
+    assert names[-2].endswith("._middle")
+    assert names[-1].endswith("._leaf")
+
+
+def test_sampling_profile_collapsed_and_top_functions():
+    profile = rp_mod.SamplingProfile(duration_s=1.0, interval_s=0.01)
+    for _ in range(3):
+        profile.add("a;b;c")
+    profile.add("a;d")
+
+    assert profile.collapsed() == "a;b;c 3\na;d 1\n"
+    assert profile.top_functions() == [("c", 3), ("d", 1)]
+    lines = profile.summary()
+    assert lines[0].startswith("4 échantillons")
+    assert "75.0%  c" in lines[1]
+
+
+def test_sampler_targets_one_thread():
+    release = threading.Event()
+
+    def busy_worker():
+        release.wait(5)
+
+    worker = threading.Thread(target=busy_worker)
+    worker.start()
+    try:
+        sampler = rp_mod.StackSampler(thread_id=worker.ident)
+        sampler.sample_once()
+        sampler.sample_once()
+    finally:
+        release.set()
+        worker.join()
+
+    assert sampler.profile.samples == 2
+    assert all("busy_worker" in stack for stack in sampler.profile.stacks)
+
+
+def test_sampler_all_threads_prefixes_thread_name_and_skips_itself():
+    sampler = rp_mod.StackSampler()
+
+    helper = threading.Thread(target=sampler.sample_once, name="sampler-helper")
+    helper.start()
+    helper.join()
+
+    assert not any(stack.startswith("thread:sampler-helper;") for stack in sampler.profile.stacks)
+    assert any(stack.startswith("thread:MainThread;") for stack in sampler.profile.stacks)
+
+
+@pytest.mark.asyncio
+async def test_sample_stacks_captures_blocking_code_on_loop():
+    async def spin():
+        await asyncio.sleep(0.01)
+        end = time.perf_counter() + 0.1
+        while time.perf_counter() < end:
+            pass
+
+    task = asyncio.create_task(spin())
+    profile = await rp_mod.sample_stacks(0.2, interval=0.002)
+    await task
+
+    assert profile.samples > 0
+    assert any("spin" in stack for stack in profile.stacks)
+    assert not rp_mod.profiling_busy()
+
+
+@pytest.mark.asyncio
+async def test_memory_diff_reports_growth_by_module_and_stops_tracing():
+    assert not tracemalloc.is_tracing()
+    keep = []
+
+    async def allocate():
+        await asyncio.sleep(0.01)
+        keep.append([bytearray(1024) for _ in range(200)])
+
+    task = asyncio.create_task(allocate())
+    diff = await rp_mod.memory_diff(0.05)
+    await task
+
+    assert not tracemalloc.is_tracing()
+    assert diff.modules[0].module == __name__
+    assert diff.modules[0].size_diff >= 200 * 1024
+    assert diff.summary()[0].startswith("Mesure sur")
+    report = diff.report()
+    assert "# Croissance par module" in report
+    assert "# Lignes d'allocation" in report
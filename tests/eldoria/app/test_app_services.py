@@ -12,8 +12,9 @@ def test_services_len_is_number_of_fields():
         welcome=object(),
         xp=object(),
         ticketing=object(),
+        bootstrap=object(),
     )
-    assert len(s) == 7
+    assert len(s) == 8
 
 
 def test_services_stores_attributes():
@@ -24,6 +25,7 @@ def test_services_stores_attributes():
     welcome = object()
     xp = object()
     ticketing = object()
+    bootstrap = object()
 
     s = Services(
         duel=duel,
@@ -33,6 +35,7 @@ def test_services_stores_attributes():
         welcome=welcome,
         xp=xp,
         ticketing=ticketing,
+        bootstrap=bootstrap,
     )
 
     assert s.duel is duel
@@ -42,6 +45,7 @@ def test_services_stores_attributes():
     assert s.welcome is welcome
     assert s.xp is xp
     assert s.ticketing is ticketing
+    assert s.bootstrap is bootstrap
 
 
 def test_services_is_slots_dataclass_no_dict_and_no_new_attrs():
@@ -53,6 +57,7 @@ def test_services_is_slots_dataclass_no_dict_and_no_new_attrs():
         welcome=object(),
         xp=object(),
         ticketing=object(),
+        bootstrap=object(),
     )
 
     # slots => pas de __dict__
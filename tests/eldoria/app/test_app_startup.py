@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import pytest
 
 from eldoria.app import startup as mod
@@ -131,6 +133,7 @@ def test_init_services_assigns_services_and_returns_len(monkeypatch):
     monkeypatch.setattr(mod, "WelcomeService", lambda: ("welcome",), raising=True)
     monkeypatch.setattr(mod, "XpService", lambda: ("xp",), raising=True)
     monkeypatch.setattr(mod, "TicketingService", lambda: ("ticketing",), raising=True)
+    monkeypatch.setattr(mod, "BootstrapService", lambda: ("bootstrap",), raising=True)
 
     # Services(...) -> on retourne un objet avec __len__
     created = {}
@@ -139,7 +142,7 @@ def test_init_services_assigns_services_and_returns_len(monkeypatch):
 
     n = mod.init_services(bot)
 
-    assert n == 7
+    assert n == 8
     assert bot._services is not None
     assert set(created.keys()) == {
         "duel",
@@ -149,6 +152,7 @@ def test_init_services_assigns_services_and_returns_len(monkeypatch):
         "welcome",
         "xp",
         "ticketing",
+        "bootstrap",
     }
 
 
@@ -167,10 +171,12 @@ def test_startup_calls_steps_in_order_and_runs_actions(monkeypatch):
     
     # On patch les fonctions appelées par startup() pour prouver qu'elles sont exécutées
     monkeypatch.setattr(mod, "init_services", lambda b: calls.append(("init_services", b)) or 6, raising=True)
+    monkeypatch.setattr(mod, "install_http_stats", lambda b: calls.append(("install_http_stats", b)) or True, raising=True)
     monkeypatch.setattr(mod, "load_extensions", lambda b: calls.append(("load_extensions", b)) or 2, raising=True)
     monkeypatch.setattr(mod, "init_db", lambda: calls.append(("init_db", None)), raising=True)
     monkeypatch.setattr(mod, "cleanup_temp_channels", lambda b: calls.append(("cleanup", b)), raising=True)
     monkeypatch.setattr(mod, "init_games", lambda: calls.append(("init_games", None)), raising=True)
+    monkeypatch.setattr(mod, "backfill_duel_stats", lambda b: calls.append(("backfill_duel_stats", b)), raising=True)
     monkeypatch.setattr(mod, "init_duel_ui", lambda: calls.append(("init_duel_ui", None)), raising=True)
     monkeypatch.setattr(
         mod,
@@ -178,7 +184,8 @@ def test_startup_calls_steps_in_order_and_runs_actions(monkeypatch):
         lambda b: calls.append(("init_ticket_ui", b)),
         raising=True,
     )
-    monkeypatch.setattr(mod, "run_tests", fake_run_tests, raising=True)
+    monkeypatch.setattr(mod, "run_tests_cached", fake_run_tests, raising=True)
+    monkeypatch.setattr(mod, "STARTUP_TESTS", "blocking", raising=True)
 
     # Fake step : on capture les paramètres, et on exécute action() pour simuler le vrai comportement
     step_calls = []
@@ -194,10 +201,12 @@ def test_startup_calls_steps_in_order_and_runs_actions(monkeypatch):
     assert step_calls == [
         ("Tests", False),
         ("Initialisation des services", False),
+        ("Instrumentation des appels REST", False),
         ("Initialisation des extensions", True),
         ("Initialisation de la base de données", True),
         ("Nettoyage des channels temporaires", False),
         ("Initialisation des jeux de duel", False),
+        ("Statistiques de duel", False),
         ("Initialisation UI duel", False),
         ("Initialisation UI ticketing", False),
     ]
@@ -206,10 +215,43 @@ def test_startup_calls_steps_in_order_and_runs_actions(monkeypatch):
     assert calls == [
         ("run_tests", None),
         ("init_services", bot),
+        ("install_http_stats", bot),
         ("load_extensions", bot),
         ("init_db", None),
         ("cleanup", bot),
         ("init_games", None),
+        ("backfill_duel_stats", bot),
         ("init_duel_ui", None),
         ("init_ticket_ui", bot),
     ]
+
+
+
+@pytest.mark.parametrize("mode", ["background", "off"])
+def test_startup_skips_tests_step_unless_blocking(monkeypatch, mode):
+    bot = FakeBot()
+    called = []
+
+    for name in ("init_services", "install_http_stats", "load_extensions", "cleanup_temp_channels", "backfill_duel_stats", "init_ticket_ui"):
+        monkeypatch.setattr(mod, name, lambda b: None, raising=True)
+    for name in ("init_db", "init_games", "init_duel_ui"):
+        monkeypatch.setattr(mod, name, lambda: None, raising=True)
+    monkeypatch.setattr(mod, "run_tests_cached", lambda **_: called.append("tests"), raising=True)
+    monkeypatch.setattr(mod, "STARTUP_TESTS", mode, raising=True)
+
+    step_names = []
+    monkeypatch.setattr(
+        mod, "step", lambda name, action, **_: step_names.append(name) or action(), raising=True
+    )
+
+    mod.startup(bot)
+
+    assert "Tests" not in step_names
+    assert called == []
+
+
+def test_backfill_duel_stats_delegates_to_duel_service():
+    duel = SimpleNamespace(backfill_stats=lambda: 12)
+    bot = FakeBot(services=SimpleNamespace(duel=duel))
+
+    assert mod.backfill_duel_stats(bot) == 12
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 
 from eldoria.db.repo import duel_repo as mod
-from tests._fakes import FakeConn, FakeConnCM, FakeCursor
+from tests._fakes import FakeConn, FakeConnCM, FakeCursor, traced_schema_conn
 
 
 @pytest.fixture
@@ -102,24 +102,9 @@ def test_get_active_duel_for_user_filters_status_and_orders(fconn: FakeConn):
 def test_update_duel_if_status_returns_false_if_no_fields_to_update():
     assert mod.update_duel_if_status(1, "CONFIG") is False
 
-def test_update_duel_if_status_executes_update_and_checks_changes_true(monkeypatch):
+def test_update_duel_if_status_executes_update_and_checks_rowcount_true(monkeypatch):
     conn = FakeConn()
-
-    # 1) UPDATE => pas besoin de résultat
-    # 2) SELECT changes() => fetchone()[0] -> 1
-    cursors = [
-        FakeCursor(one=None),
-        FakeCursor(one=(1,)),
-    ]
-    idx = {"i": 0}
-
-    def execute(sql: str, params: tuple = ()):
-        conn.calls.append((sql.strip(), params))
-        cur = cursors[idx["i"]]
-        idx["i"] += 1
-        return cur
-
-    conn.execute = execute  # type: ignore[assignment]
+    conn.set_next(rowcount=1)
 
     # get_conn ne doit pas être appelé car conn fourni
     monkeypatch.setattr(mod, "get_conn", lambda: (_ for _ in ()).throw(AssertionError("get_conn called")), raising=True)
@@ -138,90 +123,46 @@ def test_update_duel_if_status_executes_update_and_checks_changes_true(monkeypat
     assert ok is True
 
     # UPDATE params : (message_id, game_type, stake_xp, expires_at, finished_at, payload, duel_id, required_status)
+    assert len(conn.calls) == 1
     sql1, params1 = conn.calls[0]
     assert sql1.startswith("UPDATE duels")
     assert params1 == (999, None, 10, None, None, "{}", 7, "CONFIG")
 
-    sql2, params2 = conn.calls[1]
-    assert sql2 == "SELECT changes()"
-    assert params2 == ()
-
-def test_update_duel_if_status_changes_zero_returns_false(monkeypatch):
+def test_update_duel_if_status_rowcount_zero_returns_false(monkeypatch):
     conn = FakeConn()
-
-    cursors = [FakeCursor(one=None), FakeCursor(one=(0,))]
-    i = {"n": 0}
-
-    def execute(sql: str, params: tuple = ()):
-        conn.calls.append((sql.strip(), params))
-        cur = cursors[i["n"]]
-        i["n"] += 1
-        return cur
-
-    conn.execute = execute  # type: ignore[assignment]
-
+    conn.set_next(rowcount=0)
     monkeypatch.setattr(mod, "get_conn", lambda: (_ for _ in ()).throw(AssertionError("get_conn called")), raising=True)
 
     ok = mod.update_duel_if_status(1, "ACTIVE", payload="x", conn=conn)
     assert ok is False
 
 def test_update_duel_if_status_uses_get_conn_when_conn_none(fconn: FakeConn):
-    # UPDATE (ignore) + changes() == 1
-    seq = [FakeCursor(one=None), FakeCursor(one=(1,))]
-    i = {"n": 0}
-
-    def exec_seq(sql: str, params: tuple = ()):
-        fconn.calls.append((sql.strip(), params))
-        cur = seq[i["n"]]
-        i["n"] += 1
-        return cur
-
-    fconn.execute = exec_seq  # type: ignore[assignment]
+    fconn.set_next(rowcount=1)
 
     ok = mod.update_duel_if_status(1, "CONFIG", payload="{}", conn=None)
     assert ok is True
+    assert len(fconn.calls) == 1
 
 # ----------------------------
 # transition_status
 # ----------------------------
 
-def test_transition_status_updates_and_checks_changes(monkeypatch):
+def test_transition_status_updates_and_checks_rowcount(monkeypatch):
     conn = FakeConn()
-    seq = [FakeCursor(one=None), FakeCursor(one=(1,))]
-    i = {"n": 0}
-
-    def exec_seq(sql: str, params: tuple = ()):
-        conn.calls.append((sql.strip(), params))
-        cur = seq[i["n"]]
-        i["n"] += 1
-        return cur
-
-    conn.execute = exec_seq  # type: ignore[assignment]
+    conn.set_next(rowcount=1)
     monkeypatch.setattr(mod, "get_conn", lambda: (_ for _ in ()).throw(AssertionError("get_conn called")), raising=True)
 
     ok = mod.transition_status(7, "INVITED", "ACTIVE", 9999, conn=conn)
     assert ok is True
 
+    assert len(conn.calls) == 1
     sql1, params1 = conn.calls[0]
     assert sql1.startswith("UPDATE duels")
     assert params1 == ("ACTIVE", 9999, 7, "INVITED")
 
-    sql2, params2 = conn.calls[1]
-    assert sql2 == "SELECT changes()"
-    assert params2 == ()
-
-def test_transition_status_changes_zero_returns_false(monkeypatch):
+def test_transition_status_rowcount_zero_returns_false(monkeypatch):
     conn = FakeConn()
-    seq = [FakeCursor(one=None), FakeCursor(one=(0,))]
-    i = {"n": 0}
-
-    def exec_seq(sql: str, params: tuple = ()):
-        conn.calls.append((sql.strip(), params))
-        cur = seq[i["n"]]
-        i["n"] += 1
-        return cur
-
-    conn.execute = exec_seq  # type: ignore[assignment]
+    conn.set_next(rowcount=0)
     monkeypatch.setattr(mod, "get_conn", lambda: (_ for _ in ()).throw(AssertionError("get_conn called")), raising=True)
 
     assert mod.transition_status(7, "INVITED", "ACTIVE", None, conn=conn) is False
@@ -232,46 +173,58 @@ def test_transition_status_changes_zero_returns_false(monkeypatch):
 
 def test_update_payload_if_unchanged_updates_only_when_active_and_payload_matches(monkeypatch):
     conn = FakeConn()
-    seq = [FakeCursor(one=None), FakeCursor(one=(1,))]
-    i = {"n": 0}
-
-    def exec_seq(sql: str, params: tuple = ()):
-        conn.calls.append((sql.strip(), params))
-        cur = seq[i["n"]]
-        i["n"] += 1
-        return cur
-
-    conn.execute = exec_seq  # type: ignore[assignment]
+    conn.set_next(rowcount=1)
     monkeypatch.setattr(mod, "get_conn", lambda: (_ for _ in ()).throw(AssertionError("get_conn called")), raising=True)
 
     ok = mod.update_payload_if_unchanged(5, old_payload_json=None, new_payload_json="{}", conn=conn)
     assert ok is True
 
+    assert len(conn.calls) == 1
     sql1, params1 = conn.calls[0]
     assert "UPDATE duels" in sql1
     assert "status='ACTIVE'" in sql1
     assert "COALESCE(payload, '') = COALESCE(?, '')" in sql1
     assert params1 == ("{}", 5, None)
 
-    sql2, _ = conn.calls[1]
-    assert sql2 == "SELECT changes()"
-
-def test_update_payload_if_unchanged_changes_zero_returns_false(monkeypatch):
+def test_update_payload_if_unchanged_rowcount_zero_returns_false(monkeypatch):
     conn = FakeConn()
-    seq = [FakeCursor(one=None), FakeCursor(one=(0,))]
-    i = {"n": 0}
-
-    def exec_seq(sql: str, params: tuple = ()):
-        conn.calls.append((sql.strip(), params))
-        cur = seq[i["n"]]
-        i["n"] += 1
-        return cur
-
-    conn.execute = exec_seq  # type: ignore[assignment]
+    conn.set_next(rowcount=0)
     monkeypatch.setattr(mod, "get_conn", lambda: (_ for _ in ()).throw(AssertionError("get_conn called")), raising=True)
 
     assert mod.update_payload_if_unchanged(5, old_payload_json="a", new_payload_json="b", conn=conn) is False
 
+# ----------------------------
+# Nombre de requêtes (base réelle)
+# ----------------------------
+
+def test_conditional_updates_run_a_single_statement_each():
+    conn, statements = traced_schema_conn()
+    conn.execute(
+        "INSERT INTO duels(guild_id, channel_id, player_a_id, player_b_id, status, created_at, expires_at) "
+        "VALUES (1, 2, 3, 4, 'INVITED', 0, 100)"
+    )
+    duel_id = conn.execute("SELECT duel_id FROM duels").fetchone()[0]
+
+    statements.clear()
+    assert mod.transition_status(duel_id, "INVITED", "ACTIVE", 200, conn=conn) is True
+    assert len(statements) == 1
+
+    statements.clear()
+    assert mod.transition_status(duel_id, "INVITED", "ACTIVE", 200, conn=conn) is False
+    assert len(statements) == 1
+
+    statements.clear()
+    assert mod.update_payload_if_unchanged(duel_id, None, '{"a": 1}', conn=conn) is True
+    assert mod.update_payload_if_unchanged(duel_id, None, '{"a": 2}', conn=conn) is False
+    assert len(statements) == 2
+
+    statements.clear()
+    assert mod.update_duel_if_status(duel_id, "ACTIVE", stake_xp=50, conn=conn) is True
+    assert mod.update_duel_if_status(duel_id, "CONFIG", stake_xp=60, conn=conn) is False
+    assert len(statements) == 2
+    assert conn.execute("SELECT stake_xp, payload FROM duels").fetchone() == (50, '{"a": 1}')
+    conn.close()
+
 # ----------------------------
 # list_expired_duels
 # ----------------------------
@@ -300,3 +253,24 @@ def test_cleanup_duels_executes_delete_with_cutoffs(fconn: FakeConn):
 
     assert _norm_sql(sql).startswith("DELETE FROM DUELS")
     assert params == (100, 200)
+
+
+# ----------------------------
+# list_duels_with_status
+# ----------------------------
+
+def test_list_duels_with_status_returns_empty_without_statuses(monkeypatch):
+    monkeypatch.setattr(mod, "get_conn", lambda: (_ for _ in ()).throw(AssertionError("get_conn called")), raising=True)
+    assert mod.list_duels_with_status(()) == []
+
+
+def test_list_duels_with_status_builds_in_clause(fconn: FakeConn):
+    fconn.set_next_cursor(FakeCursor(all=[("R1",), ("R2",)]))
+
+    rows = mod.list_duels_with_status(("FINISHED", "EXPIRED"))
+
+    assert rows == [("R1",), ("R2",)]
+    sql, params = fconn.calls[0]
+    assert "WHERE status IN (?,?)" in sql
+    assert "ORDER BY duel_id ASC" in sql
+    assert params == ("FINISHED", "EXPIRED")
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pytest
+
+from eldoria.db import connection, schema
+from eldoria.db.repo import duel_stats_repo as mod
+
+
+@pytest.fixture
+def stats_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "duel_stats.db"
+    monkeypatch.setattr(connection, "DB_PATH", str(db_path))
+    schema.init_db()
+    return db_path
+
+
+def test_ds_get_stats_returns_zeros_for_unknown_member(stats_db):
+    assert mod.ds_get_stats(1, 42) == {
+        "wins": 0,
+        "losses": 0,
+        "draws": 0,
+        "expired": 0,
+        "xp_won": 0,
+        "xp_lost": 0,
+        "last_duel_at": 0,
+    }
+
+
+def test_ds_increment_creates_then_accumulates(stats_db):
+    mod.ds_increment(1, 42, wins=1, xp_won=10, played_at=100)
+    mod.ds_increment(1, 42, losses=1, xp_lost=5, played_at=50)
+    mod.ds_increment(1, 42, draws=1, expired=1, played_at=200)
+
+    stats = mod.ds_get_stats(1, 42)
+    assert stats == {
+        "wins": 1,
+        "losses": 1,
+        "draws": 1,
+        "expired": 1,
+        "xp_won": 10,
+        "xp_lost": 5,
+        "last_duel_at": 200,
+    }
+    # scoping par serveur
+    assert mod.ds_get_stats(2, 42)["wins"] == 0
+
+
+def test_ds_list_leaderboard_orders_by_wins_then_net_xp_and_skips_expired_only(stats_db):
+    mod.ds_increment(1, 10, wins=2, xp_won=20)
+    mod.ds_increment(1, 11, wins=2, xp_won=50, losses=1, xp_lost=10)
+    mod.ds_increment(1, 12, wins=5)
+    mod.ds_increment(1, 13, expired=3)
+    mod.ds_increment(2, 99, wins=10)
+
+    rows = mod.ds_list_leaderboard(1)
+    assert [r[0] for r in rows] == [12, 11, 10]
+    assert rows[1] == (11, 2, 1, 0, 50, 10)
+
+    assert [r[0] for r in mod.ds_list_leaderboard(1, limit=1, offset=1)] == [11]
+
+
+def test_ds_is_empty_and_replace_all(stats_db):
+    assert mod.ds_is_empty() is True
+
+    mod.ds_increment(1, 10, wins=1)
+    assert mod.ds_is_empty() is False
+
+    n = mod.ds_replace_all([
+        {"guild_id": 1, "user_id": 20, "draws": 2, "last_duel_at": 7},
+        {"guild_id": 1, "user_id": 21, "wins": 1, "xp_won": 5},
+    ])
+
+    assert n == 2
+    assert mod.ds_get_stats(1, 10)["wins"] == 0
+    assert mod.ds_get_stats(1, 20)["draws"] == 2
+    assert mod.ds_get_stats(1, 20)["last_duel_at"] == 7
+    assert mod.ds_get_stats(1, 21)["xp_won"] == 5
@@ -55,3 +55,19 @@ def test_record_ticket_persists_number_and_enforces_uniqueness_per_guild(ticket_
 
     with pytest.raises(sqlite3.IntegrityError):
         ticketing_repo.tk_record_ticket(10, 1, 101, 1001, 123458)
+
+
+def test_purge_closed_before_keeps_open_and_recent_tickets(ticket_db):
+    ticketing_repo.tk_record_ticket(10, 1, 100, 1000, 1_000)
+    ticketing_repo.tk_record_ticket(10, 2, 101, 1000, 1_000)
+    ticketing_repo.tk_record_ticket(10, 3, 102, 1000, 1_000)
+    ticketing_repo.tk_record_ticket(10, 4, 103, 1000, 1_000)
+    with connection.get_conn() as conn:
+        conn.execute("UPDATE tickets SET status='CLOSED', closed_at=2000 WHERE ticket_number IN (1, 2)")
+        conn.execute("UPDATE tickets SET status='CLOSED', closed_at=9000 WHERE ticket_number = 3")
+
+    assert ticketing_repo.tk_purge_closed_before(5_000) == 2
+
+    with connection.get_conn() as conn:
+        numbers = [r[0] for r in conn.execute("SELECT ticket_number FROM tickets ORDER BY ticket_number")]
+    assert numbers == [3, 4]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 
 from eldoria.db.repo import welcome_message_repo as mod
-from tests._fakes import FakeConn, FakeConnCM
+from tests._fakes import FakeConn, FakeConnCM, traced_schema_conn
 
 
 @pytest.fixture
@@ -54,39 +54,45 @@ def test_wm_set_config_noop_when_no_fields(monkeypatch):
     mod.wm_set_config(1)
     # rien à assert : absence d'exception prouve no-op
 
-def test_wm_set_config_updates_enabled_only_and_ensures_row_exists(fconn: FakeConn):
+def test_wm_set_config_updates_enabled_only_in_single_upsert(fconn: FakeConn):
     mod.wm_set_config(10, enabled=False)
 
-    assert len(fconn.calls) == 2
-
-    sql1, params1 = fconn.calls[0]
-    assert "INSERT OR IGNORE INTO welcome_config" in sql1
-    assert params1 == (10,)
-
-    sql2, params2 = fconn.calls[1]
-    assert sql2.startswith("UPDATE welcome_config SET")
-    assert "enabled=?" in sql2
-    assert "WHERE guild_id=?" in sql2
-    assert params2 == (0, 10)
+    assert len(fconn.calls) == 1
+    sql, params = fconn.calls[0]
+    # la ligne est créée avec channel_id=0 (NOT NULL) si absente
+    assert sql.startswith("INSERT INTO welcome_config(guild_id, enabled, channel_id)")
+    assert "ON CONFLICT(guild_id) DO UPDATE SET enabled=excluded.enabled" in sql
+    assert "channel_id=excluded" not in sql
+    assert params == (10, 0, 0)
 
 def test_wm_set_config_updates_channel_only(fconn: FakeConn):
     mod.wm_set_config(10, channel_id=1234)
 
-    assert len(fconn.calls) == 2
-    sql2, params2 = fconn.calls[1]
-    assert "channel_id=?" in sql2
-    assert params2 == (1234, 10)
+    assert len(fconn.calls) == 1
+    sql, params = fconn.calls[0]
+    assert "DO UPDATE SET channel_id=excluded.channel_id" in sql
+    assert params == (10, 0, 1234)
 
 def test_wm_set_config_updates_both_enabled_and_channel(fconn: FakeConn):
     mod.wm_set_config(10, enabled=True, channel_id=555)
 
-    assert len(fconn.calls) == 2
-    sql2, params2 = fconn.calls[1]
+    assert len(fconn.calls) == 1
+    sql, params = fconn.calls[0]
+    assert "DO UPDATE SET enabled=excluded.enabled, channel_id=excluded.channel_id" in sql
+    assert params == (10, 1, 555)
+
+def test_wm_set_config_is_a_single_statement_on_real_db(monkeypatch):
+    conn, statements = traced_schema_conn()
+    monkeypatch.setattr(mod, "get_conn", lambda: FakeConnCM(conn), raising=True)
+
+    mod.wm_set_config(10, channel_id=42)
+    mod.wm_set_config(10, enabled=True)
+    mod.wm_set_config(11, enabled=True)
 
-    # ordre des sets = enabled puis channel_id (selon ton code)
-    assert "enabled=?" in sql2
-    assert "channel_id=?" in sql2
-    assert params2 == (1, 555, 10)
+    assert len(statements) == 3
+    rows = conn.execute("SELECT guild_id, enabled, channel_id FROM welcome_config ORDER BY guild_id").fetchall()
+    assert rows == [(10, 1, 42), (11, 1, 0)]
+    conn.close()
 
 def test_wm_set_enabled_delegates_to_set_config(monkeypatch):
     seen = {}
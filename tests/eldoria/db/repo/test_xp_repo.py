@@ -1,7 +1,7 @@
 import pytest
 
 from eldoria.db.repo import xp_repo as mod
-from tests._fakes import FakeConn, FakeConnCM, FakeCursor
+from tests._fakes import FakeConn, FakeConnCM, FakeCursor, traced_schema_conn
 
 
 @pytest.fixture
@@ -217,30 +217,22 @@ def test_xp_voice_get_progress_casts_values_when_row_exists(fconn: FakeConn):
         "xp_today": 40,
     }
 
-def test_xp_voice_upsert_progress_always_inserts_ignore_and_updates_only_if_sets_present(fconn: FakeConn):
+def test_xp_voice_upsert_progress_single_upsert_updates_only_given_fields(fconn: FakeConn):
     mod.xp_voice_upsert_progress(1, 2)
     assert len(fconn.calls) == 1
-    assert fconn.calls[0][0] == "INSERT OR IGNORE INTO xp_voice_progress(guild_id, user_id) VALUES (?, ?)"
-    assert fconn.calls[0][1] == (1, 2)
+    sql0, params0 = fconn.calls[0]
+    assert sql0.startswith("INSERT INTO xp_voice_progress(guild_id, user_id)")
+    assert sql0.endswith("ON CONFLICT(guild_id, user_id) DO NOTHING")
+    assert params0 == (1, 2)
 
     fconn.calls.clear()
     mod.xp_voice_upsert_progress(1, 2, day_key="x", xp_today=5)
-    assert len(fconn.calls) == 2
+    assert len(fconn.calls) == 1
 
     sql1, params1 = fconn.calls[0]
-    assert "INSERT OR IGNORE INTO xp_voice_progress" in sql1
-    assert params1 == (1, 2)
-
-    sql2, params2 = fconn.calls[1]
-    assert sql2.startswith("UPDATE xp_voice_progress SET")
-    assert "day_key=?" in sql2
-    assert "xp_today=?" in sql2
-    assert "WHERE guild_id=? AND user_id=?" in sql2
-    assert params2 == ("x", 5, 1, 2)
-
-# ----------------------------
-# xp_is_enabled
-# ----------------------------
+    assert sql1.startswith("INSERT INTO xp_voice_progress(guild_id, user_id, day_key, xp_today)")
+    assert "ON CONFLICT(guild_id, user_id) DO UPDATE SET day_key=excluded.day_key, xp_today=excluded.xp_today" in sql1
+    assert params1 == (1, 2, "x", 5)
 
 def test_xp_is_enabled_false_when_missing(fconn: FakeConn):
     fconn.set_next(one=None)
@@ -313,63 +305,36 @@ def test_xp_set_member_noop_when_no_fields(monkeypatch):
     mod.xp_set_member(1, 2)
     # no get_conn
 
-def test_xp_set_member_inserts_then_updates_partial(fconn: FakeConn):
+def test_xp_set_member_single_upsert_partial(fconn: FakeConn):
     mod.xp_set_member(1, 2, xp=10)
 
-    assert len(fconn.calls) == 2
-    assert fconn.calls[0][0] == "INSERT OR IGNORE INTO xp_members(guild_id, user_id) VALUES (?, ?)"
-    assert fconn.calls[0][1] == (1, 2)
-
-    sql2, params2 = fconn.calls[1]
-    assert sql2.startswith("UPDATE xp_members SET")
-    assert "xp=?" in sql2
-    assert "WHERE guild_id=? AND user_id=?" in sql2
-    assert params2 == (10, 1, 2)
+    assert len(fconn.calls) == 1
+    sql, params = fconn.calls[0]
+    assert sql.startswith("INSERT INTO xp_members(guild_id, user_id, xp)")
+    assert "DO UPDATE SET xp=excluded.xp" in sql
+    assert "last_xp_ts" not in sql
+    assert params == (1, 2, 10)
 
-def test_xp_add_xp_uses_provided_conn_executes_insert_update_optional_last_ts_and_select(monkeypatch):
+def test_xp_add_xp_uses_provided_conn_single_upsert_returning(monkeypatch):
     conn = FakeConn()
-
-    # Simule séquence : INSERT(ignore) (no fetch), UPDATE (no fetch), UPDATE last_ts (no fetch), SELECT xp fetchone
-    seq = [
-        FakeCursor(one=None),
-        FakeCursor(one=None),
-        FakeCursor(one=None),
-        FakeCursor(one=(42,)),
-    ]
-    i = {"n": 0}
-
-    def exec_seq(sql: str, params: tuple = ()):
-        conn.calls.append((sql.strip(), params))
-        cur = seq[i["n"]]
-        i["n"] += 1
-        return cur
-
-    conn.execute = exec_seq  # type: ignore[assignment]
+    conn.set_next(one=(42,))
     monkeypatch.setattr(mod, "get_conn", lambda: (_ for _ in ()).throw(AssertionError("get_conn called")), raising=True)
 
     new_xp = mod.xp_add_xp(1, 2, 5, set_last_xp_ts=999, conn=conn)
     assert new_xp == 42
 
-    assert "INSERT OR IGNORE INTO xp_members" in conn.calls[0][0]
-    assert "UPDATE xp_members SET xp = MAX" in conn.calls[1][0]
-    assert "UPDATE xp_members SET last_xp_ts=?" in conn.calls[2][0]
-    assert conn.calls[2][1] == (999, 1, 2)
-    assert "SELECT xp FROM xp_members" in conn.calls[3][0]
+    assert len(conn.calls) == 1
+    sql, params = conn.calls[0]
+    assert sql.startswith("INSERT INTO xp_members")
+    assert "ON CONFLICT(guild_id, user_id) DO UPDATE SET" in sql
+    assert "RETURNING xp" in sql
+    assert params == (1, 2, 5, 999)
 
 def test_xp_add_xp_uses_get_conn_when_conn_none(fconn: FakeConn):
-    # Simule insert/update/select sans last_ts
-    seq = [FakeCursor(one=None), FakeCursor(one=None), FakeCursor(one=(10,))]
-    i = {"n": 0}
-
-    def exec_seq(sql: str, params: tuple = ()):
-        fconn.calls.append((sql.strip(), params))
-        cur = seq[i["n"]]
-        i["n"] += 1
-        return cur
-
-    fconn.execute = exec_seq  # type: ignore[assignment]
+    fconn.set_next(one=(10,))
 
     assert mod.xp_add_xp(1, 2, 5) == 10
+    assert len(fconn.calls) == 1
 
 def test_xp_list_members_maps_rows_and_uses_limit_offset(fconn: FakeConn):
     fconn.set_next(all=[("10", "1000"), (2, 5)])
@@ -395,29 +360,20 @@ def test_xp_get_member_casts_ints_when_row_exists(monkeypatch):
 def test_xp_set_member_updates_both_fields_in_one_query(fconn: FakeConn):
     mod.xp_set_member(1, 2, xp=10, last_xp_ts=20)
 
-    assert len(fconn.calls) == 2
-    sql2, params2 = fconn.calls[1]
-    assert "xp=?" in sql2
-    assert "last_xp_ts=?" in sql2
-    assert params2 == (10, 20, 1, 2)
+    assert len(fconn.calls) == 1
+    sql, params = fconn.calls[0]
+    assert "DO UPDATE SET xp=excluded.xp, last_xp_ts=excluded.last_xp_ts" in sql
+    assert params == (1, 2, 10, 20)
 
-def test_xp_add_xp_with_conn_and_no_last_ts_does_not_update_last_ts(monkeypatch):
+def test_xp_add_xp_with_conn_and_no_last_ts_passes_null_last_ts(monkeypatch):
     conn = FakeConn()
-    seq = [FakeCursor(one=None), FakeCursor(one=None), FakeCursor(one=(5,))]
-    i = {"n": 0}
-
-    def exec_seq(sql: str, params: tuple = ()):
-        conn.calls.append((sql.strip(), params))
-        cur = seq[i["n"]]
-        i["n"] += 1
-        return cur
-
-    conn.execute = exec_seq  # type: ignore[assignment]
+    conn.set_next(one=(5,))
     monkeypatch.setattr(mod, "get_conn", lambda: (_ for _ in ()).throw(AssertionError("get_conn called")), raising=True)
 
     assert mod.xp_add_xp(1, 2, 1, set_last_xp_ts=None, conn=conn) == 5
-    assert len(conn.calls) == 3
-    assert not any("last_xp_ts" in sql for (sql, _) in conn.calls)
+    assert len(conn.calls) == 1
+    # NULL : COALESCE conserve le last_xp_ts existant
+    assert conn.calls[0][1] == (1, 2, 1, None)
 
 def test_xp_set_config_updates_single_field_voice_levelup_channel_id(fconn: FakeConn):
     fconn.calls.clear()
@@ -428,3 +384,58 @@ def test_xp_set_config_updates_single_field_voice_levelup_channel_id(fconn: Fake
     assert "voice_levelup_channel_id=?" in sql2
     assert "enabled=?" not in sql2
     assert params2 == (123, 1)
+
+
+def test_xp_voice_purge_before_deletes_only_past_days():
+    import sqlite3
+
+    from eldoria.db import schema
+
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(schema.SCHEMA_SQL)
+    conn.executemany(
+        "INSERT INTO xp_voice_progress(guild_id, user_id, day_key) VALUES (?, ?, ?)",
+        [(1, 10, "20260101"), (1, 11, "20260210"), (1, 12, ""), (2, 10, "20260213")],
+    )
+
+    assert mod.xp_voice_purge_before("20260210", conn=conn) == 2
+    rows = conn.execute("SELECT guild_id, user_id FROM xp_voice_progress ORDER BY guild_id, user_id").fetchall()
+    assert rows == [(1, 11), (2, 10)]
+    conn.close()
+
+
+# ----------------------------
+# Nombre de requêtes (base réelle)
+# ----------------------------
+
+def test_xp_add_xp_is_a_single_statement_and_keeps_semantics():
+    conn, statements = traced_schema_conn()
+
+    assert mod.xp_add_xp(1, 2, 5, conn=conn) == 5
+    assert mod.xp_add_xp(1, 2, -10, set_last_xp_ts=77, conn=conn) == 0
+    assert mod.xp_add_xp(1, 2, 3, conn=conn) == 3
+    assert mod.xp_add_xp(1, 3, -4, set_last_xp_ts=9, conn=conn) == 0
+
+    assert len(statements) == 4
+    rows = conn.execute("SELECT user_id, xp, last_xp_ts FROM xp_members ORDER BY user_id").fetchall()
+    assert rows == [(2, 3, 77), (3, 0, 9)]
+    conn.close()
+
+
+def test_xp_set_member_and_voice_upsert_are_single_statements(monkeypatch):
+    conn, statements = traced_schema_conn()
+    monkeypatch.setattr(mod, "get_conn", lambda: FakeConnCM(conn), raising=True)
+
+    mod.xp_set_member(1, 2, last_xp_ts=50)
+    mod.xp_set_member(1, 2, xp=7)
+    assert len(statements) == 2
+    assert conn.execute("SELECT xp, last_xp_ts FROM xp_members").fetchone() == (7, 50)
+
+    statements.clear()
+    mod.xp_voice_upsert_progress(1, 2)
+    mod.xp_voice_upsert_progress(1, 2, day_key="20260101", buffer_seconds=30)
+    mod.xp_voice_upsert_progress(1, 2, xp_today=4)
+    assert len(statements) == 3
+    row = conn.execute("SELECT day_key, last_tick_ts, buffer_seconds, bonus_cents, xp_today FROM xp_voice_progress").fetchone()
+    assert row == ("20260101", 0, 30, 0, 4)
+    conn.close()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pytest
+
+from eldoria.db import cache as mod
+
+
+@pytest.fixture
+def cache():
+    return mod.GuildCache("test")
+
+
+def test_get_or_load_calls_loader_once_then_hits(cache):
+    calls = []
+
+    def loader(gid):
+        calls.append(gid)
+        return {"gid": gid}
+
+    assert cache.get_or_load(1, loader) == {"gid": 1}
+    assert cache.get_or_load(1, loader) == {"gid": 1}
+
+    assert calls == [1]
+    assert cache.stats() == {"guilds": 1, "hits": 1, "misses": 1}
+
+
+def test_invalidate_forces_reload(cache):
+    values = iter(["old", "new"])
+
+    assert cache.get_or_load(1, lambda _gid: next(values)) == "old"
+    cache.invalidate(1)
+
+    assert cache.get_or_load(1, lambda _gid: next(values)) == "new"
+
+
+def test_invalidation_during_load_does_not_store_stale_value(cache):
+    def loader(gid):
+        # écriture concurrente pendant la lecture
+        cache.invalidate(gid)
+        return "stale"
+
+    assert cache.get_or_load(1, loader) == "stale"
+    assert 1 not in cache
+    assert cache.peek(1) is None
+
+
+def test_fill_and_clear(cache):
+    cache.fill({1: "a", 2: "b"})
+
+    assert len(cache) == 2
+    assert cache.get_or_load(2, lambda _gid: pytest.fail("loader called")) == "b"
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_registry_returns_same_cache_and_invalidates_all(monkeypatch):
+    monkeypatch.setattr(mod, "_CACHES", {}, raising=True)
+    a = mod.guild_cache("a")
+    b = mod.guild_cache("b")
+    assert mod.guild_cache("a") is a
+
+    a.fill({1: "x", 2: "y"})
+    b.fill({1: "z"})
+
+    mod.invalidate_guild(1)
+    assert 1 not in a and 1 not in b and 2 in a
+
+    mod.clear_all()
+    assert mod.cache_stats() == {
+        "a": {"guilds": 0, "hits": 0, "misses": 0},
+        "b": {"guilds": 0, "hits": 0, "misses": 0},
+    }
+
+
+def test_bootstrapped_guilds_are_forgotten_with_their_caches():
+    mod.mark_bootstrapped([1, 2])
+    assert mod.is_bootstrapped(1) and mod.is_bootstrapped(2)
+    assert not mod.is_bootstrapped(3)
+
+    mod.invalidate_guild(1)
+    assert not mod.is_bootstrapped(1) and mod.is_bootstrapped(2)
+
+    mod.clear_all()
+    assert not mod.is_bootstrapped(2)
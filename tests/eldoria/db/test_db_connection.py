@@ -79,3 +79,20 @@ def test_get_conn_does_not_commit_on_exception(monkeypatch, mod):
     # pas de commit si init échoue
     assert fake_conn.committed == 0
     # IMPORTANT: on ne teste pas le close ici car ton implémentation ne le fait pas
+
+
+def test_upsert_sql_builds_insert_with_defaults_and_updates_only_fields(mod):
+    sql, params = mod.upsert_sql("t", {"gid": 1, "uid": 2}, {"b": 5}, defaults={"a": 0, "b": 0})
+
+    assert sql == (
+        "INSERT INTO t(gid, uid, a, b) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(gid, uid) DO UPDATE SET b=excluded.b"
+    )
+    assert params == (1, 2, 0, 5)
+
+
+def test_upsert_sql_without_fields_only_creates_row(mod):
+    sql, params = mod.upsert_sql("t", {"gid": 1}, {})
+
+    assert sql == "INSERT INTO t(gid) VALUES (?) ON CONFLICT(gid) DO NOTHING"
+    assert params == (1,)
@@ -182,3 +182,292 @@ def test_replace_db_file_other_oserror_is_raised(monkeypatch, mod):
         mod.replace_db_file("new.db")
 
     assert e.value.errno == errno.EPERM
+
+
+def _seed_db(path, rows=3000):
+    import os
+    import sqlite3
+
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS t (x BLOB)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(os.urandom(200),) for _ in range(rows)])
+    conn.commit()
+    conn.close()
+
+
+def test_backup_to_file_copies_in_steps_without_holding_lock(monkeypatch, tmp_path, mod):
+    import sqlite3
+    import threading
+
+    db = tmp_path / "eldoria.db"
+    _seed_db(db)
+    monkeypatch.setattr(mod, "DB_PATH", str(db), raising=False)
+
+    seen = []
+    lock_free = []
+
+    def progress(done, total):
+        seen.append((done, total))
+        # Un autre thread doit pouvoir prendre le verrou de la base pendant la copie
+        def try_lock():
+            acquired = mod._DB_LOCK.acquire(timeout=0)
+            if acquired:
+                mod._DB_LOCK.release()
+            lock_free.append(acquired)
+
+        t = threading.Thread(target=try_lock)
+        t.start()
+        t.join()
+
+    stats = mod.backup_to_file(str(tmp_path / "copy.db"), pages=50, sleep=0, progress=progress)
+
+    assert stats.steps == len(seen) > 1
+    assert seen[-1][0] == seen[-1][1] == stats.pages
+    assert all(lock_free)
+    assert stats.restarts == 0 and not stats.locked
+    assert stats.size == (tmp_path / "copy.db").stat().st_size
+
+    conn = sqlite3.connect(tmp_path / "copy.db")
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 3000
+    conn.close()
+
+
+def test_backup_to_file_restarts_on_concurrent_writes_then_finishes_under_lock(monkeypatch, tmp_path, mod):
+    import sqlite3
+
+    db = tmp_path / "eldoria.db"
+    _seed_db(db)
+    monkeypatch.setattr(mod, "DB_PATH", str(db), raising=False)
+
+    writer = sqlite3.connect(db)
+    writes = {"n": 0}
+
+    def progress(done, total):
+        # Écrit à chaque lot : la copie repart du début à chaque fois
+        writes["n"] += 1
+        writer.execute("INSERT INTO t VALUES (x'00')")
+        writer.commit()
+
+    try:
+        stats = mod.backup_to_file(str(tmp_path / "copy.db"), pages=50, sleep=0, max_restarts=2, progress=progress)
+    finally:
+        writer.close()
+
+    assert stats.restarts == 3
+    assert stats.locked is True
+
+    conn = sqlite3.connect(tmp_path / "copy.db")
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 3000 + writes["n"]
+    conn.close()
+
+
+# -------------------- Restauration --------------------
+
+def _legacy_db(path):
+    """Base d'une ancienne version : table xp_config sans les colonnes ajoutées depuis, user_version à 0."""
+    import sqlite3
+
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE xp_config (guild_id INTEGER PRIMARY KEY, enabled INTEGER NOT NULL DEFAULT 0)")
+    conn.execute("INSERT INTO xp_config (guild_id, enabled) VALUES (42, 1)")
+    conn.commit()
+    conn.close()
+
+
+def test_validate_db_file_returns_schema_version(tmp_path, mod):
+    db = tmp_path / "incoming.db"
+    _legacy_db(db)
+
+    assert mod.validate_db_file(str(db)) == 0
+    assert mod.validate_db_file(str(db), full=True) == 0
+
+
+def test_validate_db_file_rejects_newer_schema_and_foreign_db(tmp_path, mod):
+    import sqlite3
+
+    from eldoria.exceptions.general import InvalidDatabaseFile
+
+    newer = tmp_path / "newer.db"
+    _legacy_db(newer)
+    conn = sqlite3.connect(newer)
+    conn.execute(f"PRAGMA user_version = {mod.schema.SCHEMA_VERSION + 1};")
+    conn.close()
+    with pytest.raises(InvalidDatabaseFile, match="plus récent"):
+        mod.validate_db_file(str(newer))
+
+    foreign = tmp_path / "foreign.db"
+    _seed_db(foreign, rows=1)
+    with pytest.raises(InvalidDatabaseFile, match="aucune table Eldoria"):
+        mod.validate_db_file(str(foreign))
+
+
+def test_validate_db_file_rejects_unreadable_file(tmp_path, mod):
+    from eldoria.exceptions.general import InvalidDatabaseFile
+
+    junk = tmp_path / "junk.db"
+    junk.write_bytes(b"pas une base SQLite" * 100)
+    with pytest.raises(InvalidDatabaseFile, match="illisible"):
+        mod.validate_db_file(str(junk))
+
+
+def test_restore_db_file_migrates_before_swap_and_invalidates_under_lock(monkeypatch, tmp_path, mod):
+    import sqlite3
+    import threading
+
+    current = tmp_path / "eldoria.db"
+    _seed_db(current, rows=1)
+    incoming = tmp_path / "incoming.db"
+    _legacy_db(incoming)
+    monkeypatch.setattr(mod, "DB_PATH", str(current), raising=False)
+
+    seen = {}
+
+    def on_swapped():
+        # Appelé sous le verrou : un autre thread ne peut pas interroger la base entre l'échange et l'invalidation
+        acquired = []
+        t = threading.Thread(target=lambda: acquired.append(mod._DB_LOCK.acquire(timeout=0)))
+        t.start()
+        t.join()
+        seen["lock_free"] = acquired[0]
+        conn = sqlite3.connect(current)
+        seen["user_version"] = conn.execute("PRAGMA user_version;").fetchone()[0]
+        conn.close()
+
+    report = mod.restore_db_file(str(incoming), on_swapped=on_swapped)
+
+    assert seen == {"lock_free": False, "user_version": mod.schema.SCHEMA_VERSION}
+    assert (report.from_version, report.to_version) == (0, mod.schema.SCHEMA_VERSION)
+    assert not incoming.exists()
+
+    conn = sqlite3.connect(current)
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(xp_config)")}
+    assert "voice_enabled" in cols
+    assert conn.execute("SELECT enabled FROM xp_config WHERE guild_id = 42").fetchone()[0] == 1
+    conn.close()
+
+
+def test_restore_db_file_refused_leaves_current_db_untouched(monkeypatch, tmp_path, mod):
+    from eldoria.exceptions.general import InvalidDatabaseFile
+
+    current = tmp_path / "eldoria.db"
+    _seed_db(current, rows=1)
+    before = current.read_bytes()
+    incoming = tmp_path / "incoming.db"
+    _seed_db(incoming, rows=1)
+    monkeypatch.setattr(mod, "DB_PATH", str(current), raising=False)
+
+    called = []
+    with pytest.raises(InvalidDatabaseFile):
+        mod.restore_db_file(str(incoming), on_swapped=lambda: called.append(True))
+
+    assert called == []
+    assert current.read_bytes() == before
+
+
+# -------------------- Maintenance périodique --------------------
+
+def _churned_db(path, *, incremental=True):
+    """Base avec beaucoup de lignes à purger (pages libres après purge), convertie ou non en auto_vacuum incrémental."""
+    import sqlite3
+
+    conn = sqlite3.connect(path)
+    if incremental:
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+    conn.execute("CREATE TABLE xp_voice_progress (guild_id INTEGER, user_id INTEGER, day_key TEXT, pad BLOB)")
+    conn.executemany(
+        "INSERT INTO xp_voice_progress VALUES (1, ?, ?, randomblob(500))",
+        [(i, "20260101" if i < 2000 else "20260213") for i in range(4000)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_incremental_vacuum_never_runs_a_full_vacuum_on_unconverted_db(monkeypatch, tmp_path, mod, caplog):
+    import sqlite3
+
+    db = tmp_path / "eldoria.db"
+    _churned_db(db, incremental=False)
+    conn = sqlite3.connect(db)
+    conn.execute("DELETE FROM xp_voice_progress WHERE day_key < '20260213'")
+    conn.commit()
+    conn.close()
+    size_before = db.stat().st_size
+    monkeypatch.setattr(mod, "DB_PATH", str(db), raising=False)
+
+    with caplog.at_level("WARNING", logger=mod.__name__):
+        assert mod.incremental_vacuum(10_000) == 0
+
+    assert db.stat().st_size == size_before
+    assert any("vacuum ignoré" in r.getMessage() for r in caplog.records)
+    conn = sqlite3.connect(db)
+    assert conn.execute("PRAGMA auto_vacuum;").fetchone()[0] == 0
+    conn.close()
+
+
+def test_run_maintenance_purges_analyzes_and_vacuums(monkeypatch, tmp_path, mod):
+    import sqlite3
+
+    db = tmp_path / "eldoria.db"
+    _churned_db(db)
+    monkeypatch.setattr(mod, "DB_PATH", str(db), raising=False)
+
+    def purge(conn):
+        return conn.execute("DELETE FROM xp_voice_progress WHERE day_key < '20260213'").rowcount
+
+    report = mod.run_maintenance(purges={"xp_voice_progress": purge}, vacuum_pages=10_000)
+
+    assert report.purged == {"xp_voice_progress": 2000}
+    assert report.analyzed is True
+    assert report.vacuumed_pages > 0
+    assert report.free_pages == 0
+    assert report.reclaimed == report.size_before - report.size_after > 0
+
+    conn = sqlite3.connect(db)
+    assert conn.execute("PRAGMA auto_vacuum;").fetchone()[0] == 2
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] >= 1
+    assert conn.execute("SELECT COUNT(*) FROM xp_voice_progress").fetchone()[0] == 2000
+    conn.close()
+
+    # Deuxième passage : statistiques déjà présentes, PRAGMA optimize seulement
+    assert mod.run_maintenance(purges={}, vacuum_pages=10_000).analyzed is False
+
+
+def test_incremental_vacuum_respects_page_budget(monkeypatch, tmp_path, mod):
+    import sqlite3
+
+    db = tmp_path / "eldoria.db"
+    conn = sqlite3.connect(db)
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+    conn.execute("CREATE TABLE t (x BLOB)")
+    conn.executemany("INSERT INTO t VALUES (randomblob(3000))", [()] * 500)
+    conn.commit()
+    conn.execute("DELETE FROM t")
+    conn.commit()
+    free_before = conn.execute("PRAGMA freelist_count;").fetchone()[0]
+    conn.close()
+    monkeypatch.setattr(mod, "DB_PATH", str(db), raising=False)
+
+    assert free_before > 100
+    assert mod.incremental_vacuum(100, step=30) == 100
+    assert mod.incremental_vacuum(0) == 0
+
+    conn = sqlite3.connect(db)
+    assert conn.execute("PRAGMA freelist_count;").fetchone()[0] == free_before - 100
+    conn.close()
+
+
+def test_run_maintenance_logs_failed_purge_and_continues(monkeypatch, tmp_path, mod, caplog):
+    import sqlite3
+
+    db = tmp_path / "eldoria.db"
+    _seed_db(db, rows=10)
+    monkeypatch.setattr(mod, "DB_PATH", str(db), raising=False)
+
+    def broken(conn):
+        raise sqlite3.OperationalError("no such table: tickets")
+
+    report = mod.run_maintenance(purges={"tickets": broken}, vacuum_pages=0)
+
+    assert report.purged == {}
+    assert report.vacuumed_pages == 0
+    assert "Purge de tickets impossible" in caplog.text
@@ -105,12 +105,16 @@ def test_init_db_executes_schema_script_and_calls_migrate(monkeypatch):
 
     monkeypatch.setattr(mod, "get_conn", lambda: cm, raising=True)
 
-    migrate_calls = {"n": 0}
+    migrate_calls = []
 
-    def fake_migrate():
-        migrate_calls["n"] += 1
+    def fake_migrate(c):
+        migrate_calls.append(c)
 
-    monkeypatch.setattr(mod, "migrate_db", fake_migrate, raising=True)
+    monkeypatch.setattr(mod, "migrate_conn", fake_migrate, raising=True)
+    rebuild_calls = []
+    monkeypatch.setattr(mod, "migrate_without_rowid", lambda c: rebuild_calls.append(c) or {}, raising=True)
+    vacuum_calls = []
+    monkeypatch.setattr(mod, "enable_incremental_vacuum", lambda c: vacuum_calls.append(c) or False, raising=True)
 
     mod.init_db()
 
@@ -124,8 +128,49 @@ def test_init_db_executes_schema_script_and_calls_migrate(monkeypatch):
     assert "CREATE TABLE IF NOT EXISTS ticket_sequences" in conn.scripts[0]
     assert "ticket_number   INTEGER NOT NULL" in conn.scripts[0]
 
-    # migrate appelé après
-    assert migrate_calls["n"] == 1
+    # migration appelée après, sur la même connexion, puis version du schéma enregistrée
+    assert migrate_calls == [conn]
+    assert rebuild_calls == [conn]  # user_version lue à 1 : migration v2 appliquée
+    assert conn.executed[-1] == f"PRAGMA user_version = {mod.SCHEMA_VERSION};"
+    assert vacuum_calls == [conn]
+
+
+def test_apply_schema_creates_and_versions_a_standalone_file(tmp_path):
+    import sqlite3
+
+    conn = sqlite3.connect(tmp_path / "incoming.db")
+    try:
+        mod.apply_schema(conn)
+        conn.commit()
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert mod.table_names() <= tables
+        assert conn.execute("PRAGMA user_version;").fetchone()[0] == mod.SCHEMA_VERSION
+    finally:
+        conn.close()
+
+
+def test_apply_schema_converts_old_db_to_incremental_vacuum_once(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE t (x BLOB)")
+    conn.executemany("INSERT INTO t VALUES (randomblob(3000))", [()] * 200)
+    conn.commit()
+    conn.execute("DELETE FROM t")
+    conn.commit()
+    assert conn.execute("PRAGMA auto_vacuum;").fetchone()[0] == 0
+    assert conn.execute("PRAGMA freelist_count;").fetchone()[0] > 0
+
+    try:
+        mod.apply_schema(conn)
+        conn.commit()
+
+        assert conn.execute("PRAGMA auto_vacuum;").fetchone()[0] == mod.AUTO_VACUUM_INCREMENTAL
+        assert conn.execute("PRAGMA freelist_count;").fetchone()[0] == 0
+        assert mod.enable_incremental_vacuum(conn) is False
+    finally:
+        conn.close()
 
 
 def test_migrate_db_adds_ticket_number_to_existing_table(monkeypatch):
@@ -152,3 +197,75 @@ def test_migrate_db_adds_ticket_number_to_existing_table(monkeypatch):
     sql = "\n".join(conn.executed)
     assert "ALTER TABLE tickets ADD COLUMN ticket_number INTEGER;" in sql
     assert "CREATE UNIQUE INDEX IF NOT EXISTS idx_tickets_guild_number" in sql
+
+
+def _v1_schema_sql():
+    """Schéma v1 : mêmes tables, toutes avec rowid."""
+    return mod.SCHEMA_SQL.replace(") WITHOUT ROWID;", ");")
+
+
+def test_apply_schema_rebuilds_v1_composite_key_tables_without_rowid(tmp_path):
+    import sqlite3
+
+    conn = sqlite3.connect(tmp_path / "v1.db")
+    conn.executescript(_v1_schema_sql())
+    conn.executemany(
+        "INSERT INTO xp_members(guild_id, user_id, xp, last_xp_ts) VALUES (?, ?, ?, ?)",
+        [(1, uid, uid * 10, uid) for uid in range(50)],
+    )
+    conn.execute("INSERT INTO reaction_roles VALUES (1, 2, '🔥', 3)")
+    conn.execute("PRAGMA user_version = 1;")
+    conn.commit()
+
+    try:
+        mod.apply_schema(conn)
+        conn.commit()
+
+        for table in mod.WITHOUT_ROWID_TABLES:
+            sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = ?", (table,)).fetchone()[0]
+            assert "WITHOUT ROWID" in sql, table
+        assert conn.execute("PRAGMA user_version;").fetchone()[0] == mod.SCHEMA_VERSION
+        assert conn.execute("SELECT COUNT(*), SUM(xp) FROM xp_members").fetchone() == (50, sum(range(50)) * 10)
+        assert conn.execute("SELECT role_id FROM reaction_roles WHERE emoji = '🔥'").fetchone() == (3,)
+        assert not conn.execute("SELECT 1 FROM sqlite_master WHERE name LIKE '%__rebuild'").fetchall()
+    finally:
+        conn.close()
+
+
+def test_rebuild_without_rowid_copies_in_batches_and_is_idempotent():
+    import sqlite3
+
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(_v1_schema_sql())
+    conn.executemany("INSERT INTO xp_voice_progress(guild_id, user_id) VALUES (1, ?)", [(u,) for u in range(23)])
+    # Trous dans les rowid : la copie par lots suit les rowid, pas un décalage
+    conn.execute("DELETE FROM xp_voice_progress WHERE user_id IN (3, 4, 5, 17)")
+
+    assert mod.rebuild_without_rowid(conn, "xp_voice_progress", batch_rows=5) == 19
+    assert mod.migrate_without_rowid(conn) == {
+        t: 0 for t in mod.WITHOUT_ROWID_TABLES if t != "xp_voice_progress"
+    }
+    assert mod.migrate_without_rowid(conn) == {}
+    assert conn.execute("SELECT COUNT(*) FROM xp_voice_progress").fetchone()[0] == 19
+    conn.close()
+
+
+def test_rebuild_without_rowid_failure_keeps_old_table():
+    import sqlite3
+
+    import pytest
+
+    conn = sqlite3.connect(":memory:")
+    # Ancienne table plus permissive : une ligne sans user_id ne peut pas être copiée
+    conn.execute("CREATE TABLE xp_members (guild_id INTEGER, user_id INTEGER, xp INTEGER, last_xp_ts INTEGER)")
+    conn.executemany("INSERT INTO xp_members VALUES (?, ?, 0, 0)", [(1, 1), (1, None)])
+    conn.commit()
+
+    with pytest.raises(sqlite3.IntegrityError):
+        mod.rebuild_without_rowid(conn, "xp_members")
+
+    sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'xp_members'").fetchone()[0]
+    assert "WITHOUT ROWID" not in sql
+    assert conn.execute("SELECT COUNT(*) FROM xp_members").fetchone()[0] == 2
+    assert not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'xp_members__rebuild'").fetchall()
+    conn.close()
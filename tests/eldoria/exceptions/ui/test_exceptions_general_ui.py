@@ -25,6 +25,16 @@ def test_general_error_message_member_not_found_includes_ids():
     assert msg == "❌ Impossible de retrouver le membre 456 dans le serveur 123."
 
 
+def test_general_error_message_invalid_backup_manifest_includes_reason():
+    err = exc.InvalidBackupManifest("partie 2 corrompue")
+    assert general_error_message(err) == "❌ Sauvegarde en plusieurs parties invalide : partie 2 corrompue."
+
+
+def test_general_error_message_invalid_database_file_includes_reason():
+    err = exc.InvalidDatabaseFile("aucune table Eldoria")
+    assert general_error_message(err) == "❌ Base de données refusée : aucune table Eldoria."
+
+
 def test_general_error_message_guild_not_found_includes_id():
     err = exc.GuildNotFound(guild_id=999)
     msg = general_error_message(err)
@@ -4,6 +4,7 @@ Les stubs Eldoria ont été factorisés dans `tests/_bootstrap/eldoria_stubs.py`
 """
 
 import importlib
+from types import SimpleNamespace
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
@@ -92,6 +93,188 @@ async def test_on_ready_sync_exception_is_caught(core_module):
     bot.sync_commands.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_on_ready_schedules_background_tests(core_module, monkeypatch):
+    Core = core_module.Core
+    calls = []
+
+    async def fake_run_tests_in_background(*, logger=None):
+        calls.append(logger)
+        return "Tests validés"
+
+    monkeypatch.setattr(core_module, "STARTUP_TESTS", "background")
+    monkeypatch.setattr(core_module, "run_tests_in_background", fake_run_tests_in_background)
+
+    bot = FakeBot()
+    cog = Core(bot)
+    await cog.on_ready()
+
+    assert cog._tests_task is not None
+    assert await cog._tests_task == "Tests validés"
+    assert calls == [core_module.log]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["off", "blocking"])
+async def test_on_ready_does_not_schedule_tests_outside_background_mode(core_module, monkeypatch, mode):
+    Core = core_module.Core
+    monkeypatch.setattr(core_module, "STARTUP_TESTS", mode)
+
+    bot = FakeBot()
+    cog = Core(bot)
+    await cog.on_ready()
+
+    assert cog._tests_task is None
+
+
+@pytest.mark.asyncio
+async def test_on_connect_and_on_ready_feed_startup_profiler(core_module, monkeypatch):
+    from eldoria.app.profiler import StartupProfiler
+
+    profiler = StartupProfiler()
+    finished = []
+    monkeypatch.setattr(core_module, "get_profiler", lambda: profiler)
+    monkeypatch.setattr(core_module, "finish_profiling", lambda: finished.append(True))
+    monkeypatch.setattr(core_module, "STARTUP_TESTS", "off")
+
+    cog = core_module.Core(FakeBot())
+    await cog.on_connect()
+    await cog.on_ready()
+
+    assert list(profiler.marks) == ["on_connect", "on_ready", "commandes synchronisées"]
+    assert finished == [True]
+
+
+@pytest.mark.asyncio
+async def test_on_ready_bootstraps_all_guilds_in_one_call(core_module):
+    bot = FakeBot()
+    cog = core_module.Core(bot)
+
+    await cog.on_ready()
+
+    assert bot.services.bootstrap.calls == [("bootstrap_guilds", [1, 2]), ("warm_caches", [1, 2])]
+
+
+@pytest.mark.asyncio
+async def test_on_ready_warm_up_failure_is_logged(core_module, caplog):
+    bot = FakeBot()
+
+    def boom(_ids):
+        raise RuntimeError("db locked")
+
+    bot.services.bootstrap.warm_caches = boom
+    cog = core_module.Core(bot)
+
+    await cog.on_ready()
+
+    assert bot._booted is True
+    assert any("Préchargement des caches" in r.getMessage() for r in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_on_ready_bootstrap_failure_is_logged(core_module, caplog):
+    bot = FakeBot()
+
+    def boom(_ids):
+        raise RuntimeError("db locked")
+
+    bot.services.bootstrap.bootstrap_guilds = boom
+    cog = core_module.Core(bot)
+
+    await cog.on_ready()
+
+    assert bot._booted is True
+    assert any("Initialisation des guilds" in r.getMessage() for r in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_on_guild_join_and_remove_update_bootstrap(core_module):
+    bot = FakeBot()
+    cog = core_module.Core(bot)
+    guild = FakeGuild(42)
+
+    await cog.on_guild_join(guild)
+    await cog.on_guild_remove(guild)
+
+    assert bot.services.bootstrap.calls == [("ensure_guild", 42), ("forget", 42)]
+
+
+@pytest.mark.asyncio
+async def test_on_ready_starts_metrics_server_once_when_configured(core_module, monkeypatch):
+    started = []
+
+    async def fake_start(port, host):
+        started.append((port, host))
+        return object()
+
+    monkeypatch.setattr(core_module, "METRICS_PORT", 9100)
+    monkeypatch.setattr(core_module.metrics, "start_http_server", fake_start)
+    cog = core_module.Core(FakeBot())
+
+    await cog.on_ready()
+    cog.bot._booted = False
+    await cog.on_ready()
+
+    assert started == [(9100, core_module.METRICS_HOST)]
+
+
+@pytest.mark.asyncio
+async def test_on_ready_metrics_server_failure_is_logged(core_module, monkeypatch, caplog):
+    async def fake_start(port, host):
+        raise OSError("address in use")
+
+    monkeypatch.setattr(core_module, "METRICS_PORT", 9100)
+    monkeypatch.setattr(core_module.metrics, "start_http_server", fake_start)
+    cog = core_module.Core(FakeBot())
+
+    await cog.on_ready()
+
+    assert cog.bot._booted is True
+    assert "Impossible d'exposer les métriques" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_on_ready_starts_loop_watchdog_when_enabled(core_module, monkeypatch):
+    started = []
+    monkeypatch.setattr(core_module, "LOOP_WATCHDOG_MS", 300)
+    monkeypatch.setattr(core_module, "start_watchdog", started.append)
+
+    await core_module.Core(FakeBot()).on_ready()
+
+    assert started == [300]
+
+
+@pytest.mark.asyncio
+async def test_on_ready_skips_loop_watchdog_when_disabled(core_module, monkeypatch):
+    started = []
+    monkeypatch.setattr(core_module, "LOOP_WATCHDOG_MS", 0)
+    monkeypatch.setattr(core_module, "start_watchdog", started.append)
+
+    await core_module.Core(FakeBot()).on_ready()
+
+    assert started == []
+
+
+def test_collector_reports_guild_count(core_module):
+    core_module.Core(FakeBot())
+
+    text = core_module.metrics.render_prometheus()
+
+    assert "eldoria_guilds 2" in text
+
+
+@pytest.mark.asyncio
+async def test_application_command_listeners_record_metrics(core_module):
+    cog = core_module.Core(FakeBot())
+    ok_ctx = SimpleNamespace(command=SimpleNamespace(qualified_name="ping"))
+
+    await cog.on_application_command(ok_ctx)
+    await cog.on_application_command_completion(ok_ctx)
+
+    assert core_module.metrics.COMMANDS_TOTAL.value(command="ping", status="ok") == 1
+    assert core_module.metrics.COMMAND_SECONDS.count(command="ping") == 1
+
+
 # ---------------------------------------------------------------------------
 # Tests on_message (router)
 # ---------------------------------------------------------------------------
@@ -459,3 +642,16 @@ def test_setup_adds_cog(core_module):
     added = bot.add_cog.call_args.args[0]
     assert isinstance(added, Core)
     assert added.bot is bot
+
+
+@pytest.mark.asyncio
+async def test_on_ready_compiles_json_resources(core_module, monkeypatch, caplog):
+    calls = []
+    monkeypatch.setattr(core_module, "preload_resources", lambda: calls.append(True) or {"duels.json": True})
+    caplog.set_level("INFO")
+    cog = core_module.Core(FakeBot())
+
+    await cog.on_ready()
+
+    assert calls == [True]
+    assert any("Compilation des ressources JSON (1/1)" in r.getMessage() for r in caplog.records)
@@ -0,0 +1,94 @@
+from datetime import UTC, datetime, time
+
+import pytest
+
+import eldoria.extensions.db_maintenance as mod
+from tests._fakes import FakeBot, FakeDatetime, FakeSaveService
+
+
+async def _direct_to_thread(fn, *args, **kwargs):
+    return fn(*args, **kwargs)
+
+
+def test_init_starts_loop_when_time_is_valid(monkeypatch):
+    monkeypatch.setattr(mod, "DB_MAINTENANCE_ENABLED", True)
+    monkeypatch.setattr(mod, "DB_MAINTENANCE_TIME", "04:30")
+    monkeypatch.setattr(mod, "AUTO_SAVE_TZ", "UTC")
+    cog = mod.DbMaintenance(FakeBot(save=FakeSaveService()))
+
+    assert cog._maintenance_time.hour == 4 and cog._maintenance_time.minute == 30
+    assert cog.daily_maintenance.started is True
+
+
+def test_init_disabled_or_invalid_time_does_not_start(monkeypatch):
+    monkeypatch.setattr(mod, "DB_MAINTENANCE_ENABLED", True)
+    monkeypatch.setattr(mod, "DB_MAINTENANCE_TIME", "quatre heures")
+    cog = mod.DbMaintenance(FakeBot(save=FakeSaveService()))
+    assert cog._maintenance_time is None
+
+    monkeypatch.setattr(mod, "DB_MAINTENANCE_ENABLED", False)
+    cog = mod.DbMaintenance(FakeBot(save=FakeSaveService()))
+    assert cog._maintenance_time is None
+
+
+@pytest.mark.asyncio
+async def test_daily_maintenance_runs_once_at_configured_minute(monkeypatch):
+    monkeypatch.setattr(mod, "DB_MAINTENANCE_ENABLED", False)
+    monkeypatch.setattr(mod, "DB_VACUUM_PAGES", 500)
+    monkeypatch.setattr(mod, "VOICE_PROGRESS_RETENTION_DAYS", 7)
+    monkeypatch.setattr(mod, "CLOSED_TICKETS_RETENTION_DAYS", 90)
+    monkeypatch.setattr(mod.asyncio, "to_thread", _direct_to_thread)
+    monkeypatch.setattr(mod, "datetime", FakeDatetime)
+
+    save = FakeSaveService()
+    cog = mod.DbMaintenance(FakeBot(save=save))
+    cog._maintenance_time = time(4, 30, tzinfo=UTC)
+
+    FakeDatetime._now = datetime(2026, 2, 13, 4, 29, tzinfo=UTC)
+    await cog.daily_maintenance()
+    assert save.maintenance_calls == []
+
+    FakeDatetime._now = datetime(2026, 2, 13, 4, 30, tzinfo=UTC)
+    await cog.daily_maintenance()
+    await cog.daily_maintenance()
+    assert save.maintenance_calls == [
+        {"vacuum_pages": 500, "voice_retention_days": 7, "tickets_retention_days": 90},
+    ]
+
+    FakeDatetime._now = datetime(2026, 2, 14, 4, 30, tzinfo=UTC)
+    await cog.daily_maintenance()
+    assert len(save.maintenance_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_maintenance_logs_failures(monkeypatch, caplog):
+    monkeypatch.setattr(mod, "DB_MAINTENANCE_ENABLED", False)
+    monkeypatch.setattr(mod.asyncio, "to_thread", _direct_to_thread)
+
+    save = FakeSaveService()
+
+    def boom(**_kwargs):
+        raise RuntimeError("disque plein")
+
+    save.run_maintenance = boom  # type: ignore[method-assign]
+    cog = mod.DbMaintenance(FakeBot(save=save))
+
+    await cog.run_maintenance()
+
+    assert "Échec de la maintenance de la base" in caplog.text
+
+
+def test_setup_adds_cog(monkeypatch):
+    monkeypatch.setattr(mod, "DB_MAINTENANCE_ENABLED", False)
+    bot = FakeBot(save=FakeSaveService())
+    added = {}
+
+    def add_cog(cog):
+        added["cog"] = cog
+
+    bot.add_cog = add_cog  # type: ignore[attr-defined]
+
+    mod.setup(bot)
+
+    assert isinstance(added["cog"], mod.DbMaintenance)
+    assert added["cog"].save is bot.services.save
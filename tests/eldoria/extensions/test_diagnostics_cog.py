@@ -0,0 +1,221 @@
+import pytest
+
+import eldoria.extensions.diagnostics as diag_mod
+from eldoria.exceptions.general import FeatureNotConfigured, NotAllowed
+from tests._fakes import FakeBot, FakeCtx, FakeUser
+
+
+def _cog(monkeypatch, *, enabled=True, admin_id=123):
+    monkeypatch.setattr(diag_mod, "DIAGNOSTICS_ENABLED", enabled)
+    monkeypatch.setattr(diag_mod, "get_diagnostics_admin_id", lambda: admin_id)
+    return diag_mod.Diagnostics(FakeBot())
+
+
+def _admin_ctx(uid=123):
+    user = FakeUser(uid)
+    user.name = "Admin"  # type: ignore[attr-defined]
+    return FakeCtx(user=user)
+
+
+@pytest.mark.asyncio
+async def test_sync_commands_disabled_raises(monkeypatch):
+    cog = _cog(monkeypatch, enabled=False)
+
+    with pytest.raises(FeatureNotConfigured):
+        await cog.sync_commands_command(_admin_ctx())
+
+
+@pytest.mark.asyncio
+async def test_sync_commands_non_admin_denied(monkeypatch):
+    cog = _cog(monkeypatch, admin_id=999)
+
+    with pytest.raises(NotAllowed):
+        await cog.sync_commands_command(_admin_ctx(123))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("synced", "expected"), [(True, "✅"), (False, "⏭️")])
+async def test_sync_commands_reports_result(monkeypatch, synced, expected):
+    calls = []
+
+    async def fake_sync(bot, *, force=False):
+        calls.append(force)
+        return synced
+
+    monkeypatch.setattr(diag_mod, "sync_commands_if_changed", fake_sync)
+    cog = _cog(monkeypatch)
+    ctx = _admin_ctx()
+
+    await cog.sync_commands_command(ctx, force=True)
+
+    assert calls == [True]
+    assert ctx.followup.sent[0]["content"].startswith(expected)
+    assert ctx.followup.sent[0]["ephemeral"] is True
+
+
+def test_setup_adds_cog(monkeypatch):
+    monkeypatch.setattr(diag_mod, "DIAGNOSTICS_ENABLED", False)
+    bot = FakeBot()
+
+    diag_mod.setup(bot)
+
+    bot.add_cog.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_metrics_non_admin_denied(monkeypatch):
+    cog = _cog(monkeypatch, admin_id=999)
+
+    with pytest.raises(NotAllowed):
+        await cog.metrics_command(_admin_ctx(123))
+
+
+@pytest.mark.asyncio
+async def test_metrics_sends_summary_and_prometheus_export(monkeypatch):
+    monkeypatch.setattr(diag_mod.metrics, "summarize", lambda: ["Événements :", "  on_message : 1.0/min, p99 4.0 ms"])
+    monkeypatch.setattr(diag_mod.metrics, "render_prometheus", lambda: "eldoria_events_total 1\n")
+    cog = _cog(monkeypatch)
+    ctx = _admin_ctx()
+
+    await cog.metrics_command(ctx)
+
+    sent = ctx.followup.sent[0]
+    assert "on_message : 1.0/min, p99 4.0 ms" in sent["content"]
+    assert sent["ephemeral"] is True
+    assert sent["file"].filename == "metrics.txt"
+    assert sent["file"].fp.read() == b"eldoria_events_total 1\n"
+
+
+@pytest.mark.asyncio
+async def test_metrics_without_measure_says_so(monkeypatch):
+    monkeypatch.setattr(diag_mod.metrics, "summarize", lambda: [])
+    cog = _cog(monkeypatch)
+    ctx = _admin_ctx()
+
+    await cog.metrics_command(ctx)
+
+    assert "Aucune mesure" in ctx.followup.sent[0]["content"]
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_when_watchdog_disabled(monkeypatch):
+    monkeypatch.setattr(diag_mod, "get_watchdog", lambda: None)
+    cog = _cog(monkeypatch)
+    ctx = _admin_ctx()
+
+    await cog.loop_lag_command(ctx)
+
+    assert ctx.followup.sent[0]["content"].startswith("⏭️")
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_sends_summary_and_worst_stack(monkeypatch):
+    from eldoria.app.loop_watchdog import BlockingCapture, LoopWatchdog
+
+    watchdog = LoopWatchdog()
+    watchdog.record_blocking(BlockingCapture("eldoria.extensions.logs.Logs.logs", "reader:1", "File x\n"), 0.4)
+    monkeypatch.setattr(diag_mod, "get_watchdog", lambda: watchdog)
+    cog = _cog(monkeypatch)
+    ctx = _admin_ctx()
+
+    await cog.loop_lag_command(ctx)
+
+    sent = ctx.followup.sent[0]
+    assert "eldoria.extensions.logs.Logs.logs → reader:1" in sent["content"]
+    assert sent["file"].filename == "loop_lag_stack.txt"
+    assert sent["file"].fp.read() == b"File x\n"
+
+
+@pytest.mark.asyncio
+async def test_rest_stats_reports_summary_for_guild(monkeypatch):
+    from eldoria.app.http_stats import RestCall, get_rest_stats
+
+    get_rest_stats().record_call(RestCall("POST", "/channels/{channel_id}/messages", "extensions.core", 42))
+    cog = _cog(monkeypatch)
+    ctx = _admin_ctx()
+
+    await cog.rest_stats_command(ctx, guild_id="42")
+
+    assert "POST /channels/{channel_id}/messages : 1" in ctx.followup.sent[0]["content"]
+
+
+@pytest.mark.asyncio
+async def test_rest_stats_invalid_guild_id(monkeypatch):
+    cog = _cog(monkeypatch)
+    ctx = _admin_ctx()
+
+    await cog.rest_stats_command(ctx, guild_id="abc")
+
+    assert ctx.followup.sent[0]["content"].startswith("❌")
+
+
+@pytest.mark.asyncio
+async def test_profile_sends_collapsed_stacks(monkeypatch):
+    from eldoria.app.runtime_profiler import SamplingProfile
+
+    calls = []
+
+    async def fake_sample(duration, *, all_threads=False):
+        calls.append((duration, all_threads))
+        profile = SamplingProfile(duration_s=duration, interval_s=0.005)
+        profile.add("eldoria.extensions.core.Core.on_message;sqlite3.Connection.execute")
+        return profile
+
+    monkeypatch.setattr(diag_mod, "sample_stacks", fake_sample)
+    cog = _cog(monkeypatch)
+    ctx = _admin_ctx()
+
+    await cog.profile_command(ctx, duration=5, all_threads=True)
+
+    sent = ctx.followup.sent[0]
+    assert calls == [(5, True)]
+    assert "sqlite3.Connection.execute" in sent["content"]
+    assert sent["file"].filename == "profile.collapsed.txt"
+    assert sent["file"].fp.read() == b"eldoria.extensions.core.Core.on_message;sqlite3.Connection.execute 1\n"
+
+
+@pytest.mark.asyncio
+async def test_profile_refused_while_busy(monkeypatch):
+    monkeypatch.setattr(diag_mod, "profiling_busy", lambda: True)
+    cog = _cog(monkeypatch)
+    ctx = _admin_ctx()
+
+    await cog.profile_command(ctx)
+    await cog.memory_snapshot_command(ctx)
+
+    assert [m["content"] for m in ctx.followup.sent] == ["⏭️ Un profilage est déjà en cours."] * 2
+
+
+@pytest.mark.asyncio
+async def test_memory_snapshot_sends_report(monkeypatch):
+    from eldoria.app.runtime_profiler import MemoryDiff, MemoryStat
+
+    async def fake_diff(duration):
+        return MemoryDiff(
+            duration_s=duration,
+            traced_current=2048,
+            traced_peak=4096,
+            modules=[MemoryStat("eldoria.ui.duels.view", 4096, 2048, 10)],
+            lines=["view.py:12: size=4 KiB (+2 KiB)"],
+        )
+
+    monkeypatch.setattr(diag_mod, "memory_diff", fake_diff)
+    cog = _cog(monkeypatch)
+    ctx = _admin_ctx()
+
+    await cog.memory_snapshot_command(ctx, duration=30)
+
+    sent = ctx.followup.sent[0]
+    assert "eldoria.ui.duels.view" in sent["content"]
+    assert sent["file"].filename == "memory_diff.txt"
+    assert b"view.py:12" in sent["file"].fp.read()
+
+
+@pytest.mark.asyncio
+async def test_profiling_commands_require_admin(monkeypatch):
+    cog = _cog(monkeypatch, admin_id=999)
+
+    with pytest.raises(NotAllowed):
+        await cog.profile_command(_admin_ctx(123))
+    with pytest.raises(NotAllowed):
+        await cog.memory_snapshot_command(_admin_ctx(123))
@@ -1,3 +1,6 @@
+import asyncio
+
+import discord
 import pytest
 
 # Import du module après les stubs
@@ -8,10 +11,8 @@ from tests._fakes import (
     FakeChannel,
     FakeCtx,
     FakeDuelService,
-    FakeFetchMessageChannel,
     FakeGuild,
     FakeMember,
-    FakeMessage,
     FakeXpService,
 )
 
@@ -161,6 +162,81 @@ async def test_clear_expired_duels_skips_if_guild_missing(monkeypatch):
     assert xp.sync_calls == []
 
 
+@pytest.mark.asyncio
+async def test_clear_expired_duels_groups_by_channel_and_bounds_concurrency(monkeypatch):
+    duel = FakeDuelService()
+    bot = FakeBot(duel_service=duel, xp_service=FakeXpService())
+    duel._cancel_return = [
+        {"guild_id": 1, "duel_id": i, "channel_id": 100 + (i % 6), "message_id": i}
+        for i in range(18)
+    ]
+    monkeypatch.setattr(duels_mod, "EXPIRED_UI_MAX_CONCURRENCY", 2)
+
+    d = Duels(bot)
+
+    running: dict[int, int] = {}
+    order: dict[int, list[int]] = {}
+    peak = {"channels": 0}
+
+    async def fake_apply(self, info):
+        ch = info["channel_id"]
+        running[ch] = running.get(ch, 0) + 1
+        assert running[ch] == 1  # séquentiel dans un même salon
+        peak["channels"] = max(peak["channels"], len([c for c, n in running.items() if n]))
+        await asyncio.sleep(0)
+        order.setdefault(ch, []).append(info["duel_id"])
+        running[ch] -= 1
+
+    monkeypatch.setattr(Duels, "_apply_expired_ui", fake_apply, raising=True)
+
+    await d.clear_expired_duels_loop()  # type: ignore[operator]
+
+    assert sum(len(v) for v in order.values()) == 18
+    assert order[100] == [0, 6, 12]
+    assert peak["channels"] == 2
+
+
+@pytest.mark.asyncio
+async def test_clear_expired_duels_skips_deleted_message(monkeypatch):
+    duel = FakeDuelService()
+    xp = FakeXpService()
+    bot = FakeBot(duel_service=duel, xp_service=xp)
+    guild = FakeGuild(123)
+    bot._guilds[123] = guild
+    duel._cancel_return = [
+        {"guild_id": 123, "duel_id": 1, "xp_changed": True, "sync_roles_user_ids": [1], "channel_id": 20, "message_id": 10},
+    ]
+
+    d = Duels(bot)
+
+    async def not_found(self, info):
+        raise discord.NotFound()
+
+    monkeypatch.setattr(Duels, "_apply_expired_ui", not_found, raising=True)
+
+    await d.clear_expired_duels_loop()  # type: ignore[operator]
+
+    assert xp.sync_calls == []
+
+
+@pytest.mark.asyncio
+async def test_on_interaction_delegates_to_duel_dispatcher(monkeypatch):
+    bot = FakeBot(duel_service=FakeDuelService(), xp_service=FakeXpService())
+    d = Duels(bot)
+
+    calls = []
+
+    async def fake_dispatch(interaction, b):
+        calls.append((interaction, b))
+        return True
+
+    monkeypatch.setattr(duels_mod, "dispatch_duel_interaction", fake_dispatch)
+
+    await d.on_interaction("INTER")  # type: ignore[arg-type]
+
+    assert calls == [("INTER", bot)]
+
+
 # ---------------------------------------------------------------------------
 # Tests _apply_expired_ui
 # ---------------------------------------------------------------------------
@@ -172,24 +248,19 @@ async def test_apply_expired_ui_happy_path(monkeypatch):
     guild = FakeGuild(123)
     bot._guilds[123] = guild
 
-    msg = FakeMessage()
-    fake_channel = FakeFetchMessageChannel(20, message=msg)
-
     async def fake_get_member(g, mid):
         assert g is guild
         return FakeMember(mid)
 
-    async def fake_get_chan(*, bot, channel_id):
-        assert bot is bot  # noqa: B015
-        assert channel_id == 20
-        return fake_channel
-
     async def fake_build_embed(**kwargs):
         return ("EMBED", ["FILES"])
 
+    async def no_fetch(*_a, **_k):
+        raise AssertionError("aucun fetch attendu")
+
     monkeypatch.setattr(duels_mod, "get_member_by_id_or_raise", fake_get_member)
-    monkeypatch.setattr(duels_mod, "get_text_or_thread_channel", fake_get_chan)
     monkeypatch.setattr(duels_mod, "build_expired_duels_embed", fake_build_embed)
+    monkeypatch.setattr(bot, "fetch_channel", no_fetch)
 
     d = Duels(bot)
     info = {
@@ -205,7 +276,7 @@ async def test_apply_expired_ui_happy_path(monkeypatch):
 
     await d._apply_expired_ui(info)
 
-    assert fake_channel.fetched == [10]
+    msg = bot.partial_channels[20].messages[10]
     assert msg.edits == [{"content": "", "embed": "EMBED", "view": None, "files": None}]
 
 
@@ -381,3 +452,74 @@ def test_setup_adds_cog(monkeypatch):
 
     assert isinstance(added["cog"], Duels)
     assert added["cog"].bot is bot
+
+
+# ---------------------------------------------------------------------------
+# Tests /duel_stats et /duel_leaderboard
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_duel_stats_command_defaults_to_author(monkeypatch):
+    duel = FakeDuelService()
+    duel.stats_return = {"wins": 2, "played": 3}
+    bot = FakeBot(duel_service=duel, xp_service=FakeXpService())
+    d = Duels(bot)
+
+    async def fake_build(*, user, stats):
+        return (("EMBED", user.id, stats["wins"]), ["FILES"])
+
+    monkeypatch.setattr(duels_mod, "build_duel_stats_embed", fake_build)
+
+    ctx = FakeCtx(guild=FakeGuild(123), channel=FakeChannel(99), user=FakeMember(1))
+    await d.duel_stats_command(ctx, None)
+
+    assert duel.get_stats_calls == [(123, 1)]
+    last = ctx.followup.sent[-1]
+    assert last["embed"] == ("EMBED", 1, 2)
+    assert last["ephemeral"] is True
+
+
+@pytest.mark.asyncio
+async def test_duel_stats_command_uses_given_member(monkeypatch):
+    duel = FakeDuelService()
+    bot = FakeBot(duel_service=duel, xp_service=FakeXpService())
+    d = Duels(bot)
+
+    async def fake_build(*, user, stats):
+        return ("EMBED", [])
+
+    monkeypatch.setattr(duels_mod, "build_duel_stats_embed", fake_build)
+
+    ctx = FakeCtx(guild=FakeGuild(123), channel=FakeChannel(99), user=FakeMember(1))
+    await d.duel_stats_command(ctx, FakeMember(2))
+
+    assert duel.get_stats_calls == [(123, 2)]
+
+
+@pytest.mark.asyncio
+async def test_duel_leaderboard_command_sends_paginator(monkeypatch):
+    duel = FakeDuelService()
+    duel.leaderboard_return = [(1, 3, 0, 0, 30, 0)]
+    bot = FakeBot(duel_service=duel, xp_service=FakeXpService())
+    d = Duels(bot)
+
+    created = {}
+
+    def paginator_factory(*, items, embed_generator, identifiant_for_embed, bot):
+        async def create_embed(self):
+            return ("EMBED", ["FILES"])
+
+        created.update(items=items, gen=embed_generator, ident=identifiant_for_embed, bot=bot)
+        return type("PaginatorStub", (), {"create_embed": create_embed})()
+
+    monkeypatch.setattr(duels_mod, "Paginator", paginator_factory)
+
+    ctx = FakeCtx(guild=FakeGuild(123), channel=FakeChannel(99), user=FakeMember(1))
+    await d.duel_leaderboard_command(ctx)
+
+    assert duel.get_leaderboard_calls == [(123, 200, 0)]
+    assert created["items"] == [(1, 3, 0, 0, 30, 0)]
+    assert created["gen"] is duels_mod.build_duel_leaderboard_embed
+    assert created["ident"] == 123
+    last = ctx.followup.sent[-1]
+    assert last["embed"] == "EMBED"
+    assert hasattr(last["view"], "create_embed")
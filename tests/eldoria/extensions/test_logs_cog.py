@@ -116,7 +116,7 @@ async def test_logs_command_admin_sends_codeblock(monkeypatch, caplog):
     monkeypatch.setattr(logs_mod, "LOG_ENABLED", True)
     monkeypatch.setattr(logs_mod, "get_log_admin_id", lambda: 123)
 
-    monkeypatch.setattr(logs_mod, "tail_lines", lambda: "ligne1\nligne2\n")
+    monkeypatch.setattr(logs_mod, "tail_lines", lambda maxlen=200: "ligne1\nligne2\n")
 
     cog = logs_mod.Logs(FakeBot())
 
@@ -144,7 +144,7 @@ async def test_logs_command_admin_sends_file_when_too_long(monkeypatch):
     monkeypatch.setattr(logs_mod, "LOG_ENABLED", True)
     monkeypatch.setattr(logs_mod, "get_log_admin_id", lambda: 123)
 
-    monkeypatch.setattr(logs_mod, "tail_lines", lambda: "a" * 2000)
+    monkeypatch.setattr(logs_mod, "tail_lines", lambda maxlen=200: "a" * 2000)
 
     # discord.File(...) -> objet minimal inspecté par le test
     monkeypatch.setattr(
@@ -166,3 +166,73 @@ async def test_logs_command_admin_sends_file_when_too_long(monkeypatch):
     assert "file" in payload
     assert payload["file"].filename == "bot.log.tail.txt"
     assert payload.get("ephemeral") is True
+
+
+def _admin_cog(monkeypatch):
+    monkeypatch.setattr(logs_mod, "LOG_ENABLED", True)
+    monkeypatch.setattr(logs_mod, "get_log_admin_id", lambda: 123)
+    user = FakeUser(123)
+    user.name = "Faucon"  # type: ignore[attr-defined]
+    return logs_mod.Logs(FakeBot()), FakeCtx(user=user)
+
+
+@pytest.mark.asyncio
+async def test_logs_command_passes_line_count_to_tail(monkeypatch):
+    calls = []
+    monkeypatch.setattr(logs_mod, "tail_lines", lambda maxlen=200: calls.append(maxlen) or "x")
+    cog, ctx = _admin_cog(monkeypatch)
+
+    await cog.logs_command(ctx, lines=50)
+
+    assert calls == [50]
+
+
+@pytest.mark.asyncio
+async def test_logs_command_with_filters_uses_search(monkeypatch):
+    from eldoria.utils.reader import LogRecordText
+
+    queries = []
+
+    def fake_search(query):
+        queries.append(query)
+        return [LogRecordText("01/01/2026  10:00:00  ERROR       eldoria.x - boom", None, "ERROR", "eldoria.x")]
+
+    monkeypatch.setattr(logs_mod, "search_logs", fake_search)
+    cog, ctx = _admin_cog(monkeypatch)
+
+    await cog.logs_command(ctx, lines=20, level="ERROR", logger="eldoria.x", text="boom", since_minutes=30, until_minutes=5)
+
+    [query] = queries
+    assert (query.level, query.logger, query.text, query.limit) == ("ERROR", "eldoria.x", "boom", 20)
+    assert query.since < query.until
+    assert "boom" in ctx.followup.sent[0]["content"]
+
+
+@pytest.mark.asyncio
+async def test_logs_command_search_without_result(monkeypatch):
+    monkeypatch.setattr(logs_mod, "search_logs", lambda query: [])
+    cog, ctx = _admin_cog(monkeypatch)
+
+    await cog.logs_command(ctx, text="introuvable")
+
+    assert ctx.followup.sent[0]["content"] == "Aucun enregistrement ne correspond à ces critères."
+
+
+@pytest.mark.asyncio
+async def test_logs_command_compresses_large_results(monkeypatch):
+    import gzip
+
+    big = "ligne de log assez longue\n" * 20000
+    monkeypatch.setattr(logs_mod, "tail_lines", lambda maxlen=200: big)
+    monkeypatch.setattr(
+        logs_mod.discord,
+        "File",
+        lambda fp=None, filename=None: SimpleNamespace(fp=fp, filename=filename),
+    )
+    cog, ctx = _admin_cog(monkeypatch)
+
+    await cog.logs_command(ctx, lines=5000)
+
+    payload = ctx.followup.sent[0]
+    assert payload["file"].filename == "bot.log.tail.txt.gz"
+    assert gzip.decompress(payload["file"].fp.read()).decode("utf-8") == big
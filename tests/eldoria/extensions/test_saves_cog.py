@@ -185,45 +185,83 @@ async def test_send_db_backup_when_db_missing(monkeypatch, tmp_path):
     assert ch.sent[-1]["content"] == "Fichier DB introuvable !"
 
 
+def _artifact(tmp_path, sha256="ab" * 32):
+    from eldoria.features.save._internal.archive import BackupArtifact
+
+    path = tmp_path / f"Eldoria_20260213_{sha256[:12]}.db.gz"
+    path.write_bytes(b"gz")
+    return BackupArtifact(path=path, sha256=sha256, raw_size=4096, size=2)
+
+
+async def _direct_to_thread(fn, *args):
+    return fn(*args)
+
+
 @pytest.mark.asyncio
-async def test_send_db_backup_happy_path_and_remove_failure_ignored(monkeypatch, tmp_path):
+async def test_send_db_backup_happy_path_uploads_artifact_and_marks_it(monkeypatch, tmp_path):
     M = _import_module_with_patched_decorators(monkeypatch)
 
     monkeypatch.setattr(M, "SAVE_ENABLED", False)
-
-    # travaille dans un dossier temporaire pour créer ./temp_eldoria_backup.db
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(M, "BACKUP_DIR", str(tmp_path / "backups"))
     db_path = tmp_path / "eldoria.db"
     db_path.write_bytes(b"db")
 
     save = FakeSaveService(db_path=str(db_path))
-
-    # backup_to_file crée le fichier temporaire attendu
-    def backup_to_file(dst: str):
-        Path(dst).write_bytes(b"backup")
-        save.backup_calls.append(dst)
-
-    save.backup_to_file = backup_to_file  # type: ignore[method-assign]
+    save.artifact = _artifact(tmp_path)
 
     bot = FakeBot(guild=None, save=save, temp_voice=FakeTempVoiceService())
     cog = M.Saves(bot)
+    monkeypatch.setattr(M.asyncio, "to_thread", _direct_to_thread, raising=True)
 
-    monkeypatch.setattr(M.os.path, "exists", lambda _p: True, raising=True)
+    ch = FakeChannel()
+    assert await cog._send_db_backup(channel=ch, reason="R") is True
 
-    async def fake_to_thread(fn, *args):
-        fn(*args)
+    assert save.backup_calls == [str(tmp_path / "backups")]
+    assert ch.sent[-1]["content"] == "R"
+    assert ch.sent[-1]["file"].filename == save.artifact.filename
+    assert save.uploaded_hash == save.artifact.sha256
 
-    monkeypatch.setattr(M.asyncio, "to_thread", fake_to_thread, raising=True)
 
-    # remove échoue, doit être ignoré
-    monkeypatch.setattr(M.os, "remove", lambda _p: (_ for _ in ()).throw(OSError("no")), raising=True)
+@pytest.mark.asyncio
+async def test_send_db_backup_skips_unchanged_db_unless_forced(monkeypatch, tmp_path):
+    M = _import_module_with_patched_decorators(monkeypatch)
+
+    monkeypatch.setattr(M, "SAVE_ENABLED", False)
+    monkeypatch.setattr(M, "BACKUP_DIR", str(tmp_path / "backups"))
+    db_path = tmp_path / "eldoria.db"
+    db_path.write_bytes(b"db")
+
+    save = FakeSaveService(db_path=str(db_path))
+    save.artifact = _artifact(tmp_path)
+    save.uploaded_hash = save.artifact.sha256
+
+    cog = M.Saves(FakeBot(guild=None, save=save, temp_voice=FakeTempVoiceService()))
+    monkeypatch.setattr(M.asyncio, "to_thread", _direct_to_thread, raising=True)
 
     ch = FakeChannel()
-    await cog._send_db_backup(channel=ch, reason="R")
+    assert await cog._send_db_backup(channel=ch, reason="auto", force=False) is False
+    assert ch.sent == []
 
-    assert ch.sent
-    assert ch.sent[-1]["content"] == "R"
-    assert ch.sent[-1]["file"] is not None
+    assert await cog._send_db_backup(channel=ch, reason="manuel") is True
+    assert ch.sent[-1]["content"] == "manuel"
+
+
+@pytest.mark.asyncio
+async def test_send_db_backup_failure_does_not_mark_uploaded(monkeypatch, tmp_path):
+    M = _import_module_with_patched_decorators(monkeypatch)
+
+    monkeypatch.setattr(M, "SAVE_ENABLED", False)
+    db_path = tmp_path / "eldoria.db"
+    db_path.write_bytes(b"db")
+
+    save = FakeSaveService(db_path=str(db_path))  # pas d'artefact : create_backup échoue
+    cog = M.Saves(FakeBot(guild=None, save=save, temp_voice=FakeTempVoiceService()))
+    monkeypatch.setattr(M.asyncio, "to_thread", _direct_to_thread, raising=True)
+
+    ch = FakeChannel()
+    assert await cog._send_db_backup(channel=ch, reason="R") is False
+    assert ch.sent == []
+    assert save.uploaded_hash is None
 
 
 @pytest.mark.asyncio
@@ -464,11 +502,11 @@ async def test_insert_db_replace_failure_unlinks_tmp_and_reports(monkeypatch, tm
 
     att.save = save_to  # type: ignore[method-assign]
 
-    # replace_db_file échoue
-    def replace_raises(_p):
+    # restore_db_file échoue
+    def restore_raises(_p, _on_swapped=None):
         raise RuntimeError("boom")
 
-    save.replace_db_file = replace_raises  # type: ignore[method-assign]
+    save.restore_db_file = restore_raises  # type: ignore[method-assign]
 
     async def fake_to_thread(fn, *args):
         fn(*args)
@@ -530,10 +568,12 @@ async def test_auto_save_calls_send_once_per_day(monkeypatch):
 
     # empêcher le vrai start: on force __init__ mais on patch _send_db_backup
     calls = {"send": 0}
-    async def fake_send_db_backup(self, *, channel, reason):
+    async def fake_send_db_backup(self, *, channel, reason, force=True):
         calls["send"] += 1
         assert channel is ch
         assert "automatique" in reason.lower()
+        # l'auto-save n'envoie pas une base inchangée
+        assert force is False
 
     monkeypatch.setattr(M.Saves, "_send_db_backup", fake_send_db_backup, raising=True)
 
@@ -683,11 +723,185 @@ async def test_insert_db_success(monkeypatch):
     # attachment saved (normalisation Windows/POSIX)
     assert [Path(p).as_posix() for p in att.saved_to] == ["data/temp_eldoria.db"]
 
-    # replace called + init_db called (normalisation Windows/POSIX)
-    assert [Path(str(p)).as_posix() for p in save.replace_calls] == ["data/temp_eldoria.db"]
-    assert save.init_db_calls == 1
+    # restauration (contrôle + migration + échange) hors boucle, sans init_db synchrone (normalisation Windows/POSIX)
+    assert [Path(str(p)).as_posix() for p in save.restore_calls] == ["data/temp_eldoria.db"]
+    assert save.init_db_calls == 0
+
+    # caches vidés à l'échange, guilds réinitialisées et caches rechargés sur la nouvelle base
+    assert bot.services.bootstrap.calls == [("reset",), ("bootstrap_guilds", [1]), ("warm_caches", [1])]
 
     # cleanup: channel 222 missing => remove_active called
     assert temp_voice.remove_calls == [(1, 1, 222)]
 
     assert ctx.followup.sent[-1]["content"].startswith("✅ Base de données remplacée")
+
+
+@pytest.mark.asyncio
+async def test_insert_db_decompresses_gz_attachment(monkeypatch):
+    M = _import_module_with_patched_decorators(monkeypatch)
+
+    monkeypatch.setattr(M, "SAVE_ENABLED", True)
+    monkeypatch.setattr(M, "get_save_admin_id", lambda: 1)
+    monkeypatch.setattr(M, "get_save_guild_id", lambda: 10)
+    monkeypatch.setattr(M, "get_save_channel_id", lambda: 20)
+
+    ch = FakeChannel()
+    att = FakeAttachment(filename="Eldoria_20260213_abcdef012345.db.gz")
+    ch.fetch_map[123] = FakeMessage([att])
+
+    save = FakeSaveService(db_path="./data/eldoria.db")
+    bot = FakeBot(guild=FakeGuild(channel=ch), save=save, temp_voice=FakeTempVoiceService())
+    bot.guilds = []
+    cog = M.Saves(bot)
+
+    async def fake_get_channel(_bot, _cid):
+        return ch
+
+    async def valid(_attachment):
+        return True
+
+    monkeypatch.setattr(M, "get_text_or_thread_channel", fake_get_channel, raising=True)
+    monkeypatch.setattr(M, "is_valid_sqlite_db", valid)
+    monkeypatch.setattr(M.asyncio, "to_thread", _direct_to_thread)
+
+    ctx = FakeCtx(uid=1)
+    await cog.insert_db_command(ctx, message_id="123")
+
+    gz = "data/temp_Eldoria_20260213_abcdef012345.db.gz"
+    db = "data/temp_Eldoria_20260213_abcdef012345.db"
+    assert [(Path(a).as_posix(), Path(b).as_posix()) for a, b in save.decompress_calls] == [(gz, db)]
+    assert [Path(p).as_posix() for p in save.restore_calls] == [db]
+    assert ctx.followup.sent[-1]["content"].startswith("✅ Base de données remplacée")
+
+
+def _make_real_artifact(tmp_path):
+    import os
+    import sqlite3
+
+    from eldoria.features.save._internal import archive
+
+    db = tmp_path / "source.db"
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE t (x BLOB)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(os.urandom(64),) for _ in range(1000)])
+    conn.commit()
+    conn.close()
+
+    def snapshot(dst):
+        s = sqlite3.connect(db)
+        d = sqlite3.connect(dst)
+        s.backup(d)
+        d.close()
+        s.close()
+
+    return archive.create_backup(tmp_path / "backups", keep=3, snapshot=snapshot)
+
+
+@pytest.mark.asyncio
+async def test_large_backup_is_sent_in_parts_and_restored_from_manifest(monkeypatch, tmp_path):
+    import hashlib
+
+    M = _import_module_with_patched_decorators(monkeypatch)
+
+    monkeypatch.setattr(M, "SAVE_ENABLED", True)
+    monkeypatch.setattr(M, "get_save_admin_id", lambda: 1)
+    monkeypatch.setattr(M, "get_save_guild_id", lambda: 10)
+    monkeypatch.setattr(M, "get_save_channel_id", lambda: 20)
+    monkeypatch.setattr(M, "BACKUP_DIR", str(tmp_path / "backups"))
+    monkeypatch.setattr(M.Saves, "_chunk_size", lambda self, _channel: 8 * 1024)
+    monkeypatch.setattr(M.asyncio, "to_thread", _direct_to_thread)
+
+    db_path = tmp_path / "data" / "eldoria.db"
+    db_path.parent.mkdir()
+    db_path.write_bytes(b"db")
+    save = FakeSaveService(db_path=str(db_path))
+    save.artifact = _make_real_artifact(tmp_path)
+
+    restored: list[bytes] = []
+    save.restore_db_file = lambda p, _on_swapped=None: restored.append(Path(p).read_bytes())  # type: ignore[method-assign]
+
+    ch = FakeChannel()
+    bot = FakeBot(guild=FakeGuild(channel=ch), save=save, temp_voice=FakeTempVoiceService())
+    bot.guilds = []
+    cog = M.Saves(bot)
+
+    # Le contenu des pièces jointes est relevé au moment de l'envoi (le fichier est fermé ensuite)
+    uploads: dict[int, tuple[str, bytes]] = {}
+    original_send = ch.send
+
+    async def recording_send(content=None, *, file=None, **kwargs):
+        msg = await original_send(content=content, file=file, **kwargs)
+        uploads[msg.id] = (file.filename, file.fp.read())
+        return msg
+
+    ch.send = recording_send  # type: ignore[method-assign]
+
+    assert await cog._send_db_backup(channel=ch, reason="R") is True
+
+    names = [name for name, _ in uploads.values()]
+    assert len(names) > 2
+    assert names[-1].endswith(".manifest.json")
+    assert ch.sent[-1]["content"].startswith("R\n")
+    assert not (tmp_path / "backups" / ".upload").exists()
+
+    def _attachment(filename, data):
+        async def _save(self, path):
+            Path(path).write_bytes(data)
+
+        return type("UploadedAttachment", (), {"filename": filename, "save": _save})()
+
+    for mid, (name, data) in uploads.items():
+        ch.fetch_map[mid] = FakeMessage([_attachment(name, data)])
+
+    async def fake_get_channel(_bot, _cid):
+        return ch
+
+    monkeypatch.setattr(M, "get_text_or_thread_channel", fake_get_channel, raising=True)
+
+    ctx = FakeCtx(uid=1)
+    manifest_id = max(uploads)
+    await cog.insert_db_command(ctx, message_id=str(manifest_id))
+
+    assert [hashlib.sha256(data).hexdigest() for data in restored] == [save.artifact.sha256]
+    assert ctx.followup.sent[-1]["content"].startswith("✅ Base de données remplacée")
+    assert not (db_path.parent / "temp_restore_parts").exists()
+    assert sorted(p.name for p in db_path.parent.iterdir()) == ["eldoria.db"]
+
+
+@pytest.mark.asyncio
+async def test_restore_from_manifest_with_missing_part_raises(monkeypatch, tmp_path):
+    from eldoria.exceptions.general import InvalidBackupManifest
+    from eldoria.features.save._internal import chunks
+
+    M = _import_module_with_patched_decorators(monkeypatch)
+
+    monkeypatch.setattr(M, "SAVE_ENABLED", True)
+    monkeypatch.setattr(M, "get_save_admin_id", lambda: 1)
+    monkeypatch.setattr(M, "get_save_guild_id", lambda: 10)
+    monkeypatch.setattr(M, "get_save_channel_id", lambda: 20)
+    monkeypatch.setattr(M.asyncio, "to_thread", _direct_to_thread)
+
+    artifact = _make_real_artifact(tmp_path)
+    parts = chunks.split_file(artifact.path, tmp_path / "parts", 8 * 1024)
+    manifest = chunks.build_manifest(artifact, [chunks.with_message_id(c, 500 + c.index) for c, _ in parts])
+    payload = manifest.to_json().encode("utf-8")
+
+    async def _save(self, path):
+        Path(path).write_bytes(payload)
+
+    ch = FakeChannel()
+    ch.fetch_map[42] = FakeMessage([type("ManifestAttachment", (), {"filename": manifest.filename, "save": _save})()])
+
+    save = FakeSaveService(db_path=str(tmp_path / "data" / "eldoria.db"))
+    bot = FakeBot(guild=FakeGuild(channel=ch), save=save, temp_voice=FakeTempVoiceService())
+    cog = M.Saves(bot)
+
+    async def fake_get_channel(_bot, _cid):
+        return ch
+
+    monkeypatch.setattr(M, "get_text_or_thread_channel", fake_get_channel, raising=True)
+
+    with pytest.raises(InvalidBackupManifest, match="partie 1 introuvable"):
+        await cog.insert_db_command(FakeCtx(uid=1), message_id="42")
+    assert save.restore_calls == []
+    assert not (tmp_path / "data" / "temp_restore_parts").exists()
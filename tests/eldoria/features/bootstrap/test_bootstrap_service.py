@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from eldoria.db import connection, schema
+from eldoria.features.bootstrap.bootstrap_service import BootstrapService
+from eldoria.features.xp.xp_service import XpService
+
+
+@pytest.fixture
+def bootstrap_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "bootstrap.db"
+    monkeypatch.setattr(connection, "DB_PATH", str(db_path))
+    schema.init_db()
+    return db_path
+
+
+def _count(db_path, table: str) -> int:
+    with sqlite3.connect(str(db_path)) as conn:
+        return int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+
+
+def _trace_statements(monkeypatch):
+    """Compte les INSERT exécutés via get_conn (set_trace_callback)."""
+    statements: list[str] = []
+    real_connect = sqlite3.connect
+
+    def traced_connect(*args, **kwargs):
+        conn = real_connect(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(connection.sqlite3, "connect", traced_connect)
+    return statements
+
+
+def test_bootstrap_guilds_creates_all_feature_defaults_once(bootstrap_db):
+    service = BootstrapService()
+
+    assert service.bootstrap_guilds([1, 2, 2, 3]) == 3
+
+    assert _count(bootstrap_db, "xp_config") == 3
+    assert _count(bootstrap_db, "xp_levels") == 15
+    assert _count(bootstrap_db, "welcome_config") == 3
+    assert _count(bootstrap_db, "ticketing_config") == 3
+    assert all(service.is_bootstrapped(g) for g in (1, 2, 3))
+
+    # Idempotent
+    service.bootstrap_guilds([1, 2, 3])
+    assert _count(bootstrap_db, "xp_config") == 3
+
+
+def test_bootstrap_guilds_keeps_existing_config(bootstrap_db):
+    from eldoria.db.repo import welcome_message_repo
+
+    welcome_message_repo.wm_set_config(1, enabled=True, channel_id=42)
+
+    BootstrapService().bootstrap_guilds([1])
+
+    assert welcome_message_repo.wm_get_config(1) == {"enabled": True, "channel_id": 42}
+
+
+def test_bootstrap_guilds_empty_is_noop(bootstrap_db):
+    assert BootstrapService().bootstrap_guilds([]) == 0
+
+
+def test_ensure_guild_writes_only_first_time(bootstrap_db, monkeypatch):
+    service = BootstrapService()
+    statements = _trace_statements(monkeypatch)
+
+    assert service.ensure_guild(7) is True
+    writes = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert writes
+
+    statements.clear()
+    assert service.ensure_guild(7) is False
+    assert statements == []
+
+
+def test_xp_ensure_defaults_skips_bootstrapped_guild(bootstrap_db, monkeypatch):
+    BootstrapService().bootstrap_guilds([5])
+    statements = _trace_statements(monkeypatch)
+
+    XpService().ensure_defaults(5)
+    assert statements == []
+
+    # Niveaux explicites : on écrit toujours
+    XpService().ensure_defaults(5, {1: 0})
+    assert any("xp_levels" in s for s in statements)
+
+
+def test_forget_and_reset(bootstrap_db):
+    service = BootstrapService()
+    service.bootstrap_guilds([1, 2])
+
+    service.forget(1)
+    assert not service.is_bootstrapped(1)
+    assert service.is_bootstrapped(2)
+
+    service.reset()
+    assert not service.is_bootstrapped(2)
+
+
+def _selects(statements: list[str]) -> list[str]:
+    return [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+
+def test_warm_caches_loads_each_table_in_one_query(bootstrap_db, monkeypatch):
+    from eldoria.db.repo import reaction_roles_repo, secret_roles_repo, temp_voice_repo
+
+    service = BootstrapService()
+    service.bootstrap_guilds([1, 2, 3])
+    secret_roles_repo.sr_upsert(1, 10, "sésame", 100)
+    reaction_roles_repo.rr_upsert(2, 20, "✅", 200)
+    temp_voice_repo.tv_upsert_parent(1, 30, 5)
+    temp_voice_repo.tv_add_active(1, 30, 31)
+
+    statements = _trace_statements(monkeypatch)
+    report = service.warm_caches([1, 2, 3])
+
+    assert len(_selects(statements)) == 8
+    assert report.guilds == 3
+    assert report.rows["xp_config"] == 3
+    assert report.rows["xp_levels"] == 15
+    assert report.rows["secret_roles"] == 1
+    assert report.rows["reaction_roles"] == 1
+    assert report.rows["temp_voice_active"] == 1
+    assert report.total_rows == sum(report.rows.values())
+
+
+def test_warmed_hot_path_reads_do_not_query(bootstrap_db, monkeypatch):
+    from eldoria.features.role.role_service import RoleService
+    from eldoria.features.temp_voice.temp_voice_service import TempVoiceService
+    from eldoria.features.ticketing.ticketing_service import TicketingService
+    from eldoria.features.welcome.welcome_service import WelcomeService
+
+    service = BootstrapService()
+    service.bootstrap_guilds([1, 2])
+    RoleService().sr_upsert(1, 10, "sésame", 100)
+    service.warm_caches([1, 2])
+
+    statements = _trace_statements(monkeypatch)
+    xp, role, tv = XpService(), RoleService(), TempVoiceService()
+    for gid in (1, 2):
+        xp.get_config(gid)
+        xp.get_levels(gid)
+        xp.get_role_ids(gid)
+        xp.is_enabled(gid)
+        role.sr_match(gid, 10, "sésame")
+        role.rr_get_role_id(gid, 20, "✅")
+        tv.get_parent(gid, 30)
+        tv.find_parent_of_active(gid, 31)
+        WelcomeService().get_config(gid)
+        TicketingService().get_config(gid)
+
+    assert statements == []
+    assert role.sr_match(1, 10, "sésame") == 100
+    assert role.sr_match(2, 10, "sésame") is None
+
+
+def test_writes_invalidate_cached_entries(bootstrap_db):
+    from eldoria.features.role.role_service import RoleService
+    from eldoria.features.temp_voice.temp_voice_service import TempVoiceService
+    from eldoria.features.welcome.welcome_service import WelcomeService
+
+    service = BootstrapService()
+    service.bootstrap_guilds([1])
+    service.warm_caches([1])
+    xp, role, tv, welcome = XpService(), RoleService(), TempVoiceService(), WelcomeService()
+
+    assert role.sr_match(1, 10, "sésame") is None
+    role.sr_upsert(1, 10, "sésame", 100)
+    assert role.sr_match(1, 10, "sésame") == 100
+
+    xp.set_config(1, points_per_message=42)
+    assert xp.get_config(1)["points_per_message"] == 42
+
+    xp.upsert_role_id(1, 2, 555)
+    assert xp.get_role_ids(1) == {2: 555}
+
+    tv.add_active(1, 30, 31)
+    assert tv.find_parent_of_active(1, 31) == 30
+    tv.remove_active(1, 30, 31)
+    assert tv.find_parent_of_active(1, 31) is None
+
+    welcome.set_config(1, enabled=True, channel_id=7)
+    assert welcome.get_config(1) == {"enabled": True, "channel_id": 7}
+    welcome.delete_config(1)
+    assert welcome.get_config(1) == {"enabled": False, "channel_id": 0}
+
+
+def test_reset_clears_caches(bootstrap_db, monkeypatch):
+    service = BootstrapService()
+    service.bootstrap_guilds([1])
+    service.warm_caches([1])
+
+    service.reset()
+    statements = _trace_statements(monkeypatch)
+    XpService().get_config(1)
+
+    assert len(_selects(statements)) == 1
@@ -260,11 +260,17 @@ def test_finish_duel_transitions_and_pays_draw(monkeypatch):
         return True
 
     monkeypatch.setattr(helpers_mod, "update_duel_if_status", fake_update)
+    monkeypatch.setattr(
+        helpers_mod,
+        "record_duel_result",
+        lambda *a, conn=None: calls.__setitem__("stats", (*a, conn)),
+    )
 
     helpers_mod.finish_duel(1, constants.DUEL_RESULT_DRAW)
 
     assert calls["modify"] == (10, 111, 222, 10, conn)
     assert calls["update"] == (1, constants.DUEL_STATUS_FINISHED, 12345, conn)
+    assert calls["stats"] == (10, 111, 222, constants.DUEL_RESULT_DRAW, 10, 12345, conn)
 
 def test_finish_duel_transitions_and_pays_win_a(monkeypatch):
     duel = _duel_row(
@@ -288,6 +294,7 @@ def test_finish_duel_transitions_and_pays_win_a(monkeypatch):
 
     monkeypatch.setattr(helpers_mod, "now_ts", lambda: 1)
     monkeypatch.setattr(helpers_mod, "update_duel_if_status", lambda *a, **k: True)
+    monkeypatch.setattr(helpers_mod, "record_duel_result", lambda *a, **k: None)
 
     helpers_mod.finish_duel(1, constants.DUEL_RESULT_WIN_A)
 
@@ -112,6 +112,11 @@ def test_cancel_expired_duels_expires_active_and_refunds(monkeypatch):
         "modify_xp_for_players",
         lambda gid, a, b, stake, conn=None: refund_calls.setdefault("args", (gid, a, b, stake, conn)),
     )
+    monkeypatch.setattr(
+        m_mod.stats,
+        "record_duel_expired",
+        lambda gid, a, b, ts, conn=None: refund_calls.setdefault("stats", (gid, a, b, ts, conn)),
+    )
 
     out = m_mod.cancel_expired_duels()
 
@@ -119,6 +124,7 @@ def test_cancel_expired_duels_expires_active_and_refunds(monkeypatch):
     assert out[0]["previous_status"] == constants.DUEL_STATUS_ACTIVE
     assert out[0]["xp_changed"] is True
     assert refund_calls["args"] == (10, 111, 222, 10, conn)
+    assert refund_calls["stats"] == (10, 111, 222, 1000, conn)
 
 # ------------------------------------------------------------
 # cancel_expired_duels - cas spécial ACTIVE "terminable" => auto-finish
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import eldoria.features.duel._internal.stats as stats_mod
+from eldoria.db import connection, schema
+from eldoria.db.repo import duel_stats_repo
+from eldoria.exceptions import duel as exc
+from eldoria.features.duel import constants
+from eldoria.features.duel._internal import maintenance
+from eldoria.features.duel.games import init_games
+
+
+@pytest.fixture
+def duel_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "duels.db"
+    monkeypatch.setattr(connection, "DB_PATH", str(db_path))
+    schema.init_db()
+    init_games()
+    return db_path
+
+
+def _insert_duel(*, status, payload=None, stake_xp=10, a=111, b=222, finished_at=1000, guild_id=1, expires_at=None):
+    with connection.get_conn() as conn:
+        conn.execute(
+            """
+            INSERT INTO duels(guild_id, channel_id, message_id, player_a_id, player_b_id,
+                              game_type, stake_xp, status, created_at, expires_at, finished_at, payload)
+            VALUES (?, 5, 6, ?, ?, 'RPS', ?, ?, 0, ?, ?, ?)
+            """,
+            (guild_id, a, b, stake_xp, status, expires_at, finished_at, json.dumps(payload) if payload else None),
+        )
+
+
+# ------------------------------------------------------------
+# result_deltas / record_*
+# ------------------------------------------------------------
+def test_result_deltas_win_a_win_b_draw():
+    assert stats_mod.result_deltas(constants.DUEL_RESULT_WIN_A, 10) == (
+        {"wins": 1, "xp_won": 10},
+        {"losses": 1, "xp_lost": 10},
+    )
+    assert stats_mod.result_deltas(constants.DUEL_RESULT_WIN_B, 5) == (
+        {"losses": 1, "xp_lost": 5},
+        {"wins": 1, "xp_won": 5},
+    )
+    assert stats_mod.result_deltas(constants.DUEL_RESULT_DRAW, 5) == ({"draws": 1}, {"draws": 1})
+
+
+def test_result_deltas_rejects_unknown_result():
+    with pytest.raises(exc.InvalidResult):
+        stats_mod.result_deltas("NOPE", 10)
+
+
+def test_record_duel_result_and_expired_use_given_conn(monkeypatch):
+    calls = []
+    monkeypatch.setattr(stats_mod, "ds_increment", lambda gid, uid, **k: calls.append((gid, uid, k)))
+    conn = object()
+
+    stats_mod.record_duel_result(1, 111, 222, constants.DUEL_RESULT_WIN_B, 50, 99, conn=conn)
+    stats_mod.record_duel_expired(1, 111, 222, 100, conn=conn)
+
+    assert calls == [
+        (1, 111, {"losses": 1, "xp_lost": 50, "played_at": 99, "conn": conn}),
+        (1, 222, {"wins": 1, "xp_won": 50, "played_at": 99, "conn": conn}),
+        (1, 111, {"expired": 1, "played_at": 100, "conn": conn}),
+        (1, 222, {"expired": 1, "played_at": 100, "conn": conn}),
+    ]
+
+
+def test_get_player_stats_adds_played_and_net(monkeypatch):
+    monkeypatch.setattr(
+        stats_mod,
+        "ds_get_stats",
+        lambda gid, uid: {"wins": 3, "losses": 1, "draws": 2, "expired": 4, "xp_won": 30, "xp_lost": 10, "last_duel_at": 0},
+    )
+
+    out = stats_mod.get_player_stats(1, 2)
+
+    assert out["played"] == 6
+    assert out["xp_net"] == 20
+
+
+# ------------------------------------------------------------
+# rebuild (backfill) depuis la table duels
+# ------------------------------------------------------------
+def test_rebuild_duel_stats_aggregates_finished_and_accepted_expired(duel_db):
+    _insert_duel(status="FINISHED", payload={"a_move": "ROCK", "b_move": "SCISSORS"}, stake_xp=10)
+    _insert_duel(status="FINISHED", payload={"a_move": "ROCK", "b_move": "ROCK"}, stake_xp=10, finished_at=2000)
+    _insert_duel(status="FINISHED", payload={"a_move": "ROCK", "b_move": "PAPER"}, stake_xp=50)
+    # expiré après acceptation (baseline présente) -> compté
+    _insert_duel(status="EXPIRED", payload={"xp_baseline": {"player_a_before_xp": 1, "player_b_before_xp": 2}})
+    # expiré avant acceptation -> ignoré
+    _insert_duel(status="EXPIRED", payload=None)
+    # duel terminé mais incomplet -> ignoré
+    _insert_duel(status="FINISHED", payload={"a_move": "ROCK", "b_move": None})
+
+    written = maintenance.rebuild_duel_stats()
+
+    assert written == 2
+    a = duel_stats_repo.ds_get_stats(1, 111)
+    b = duel_stats_repo.ds_get_stats(1, 222)
+    assert (a["wins"], a["losses"], a["draws"], a["expired"], a["xp_won"], a["xp_lost"]) == (1, 1, 1, 1, 10, 50)
+    assert (b["wins"], b["losses"], b["draws"], b["expired"], b["xp_won"], b["xp_lost"]) == (1, 1, 1, 1, 50, 10)
+    assert a["last_duel_at"] == 2000
+
+
+def test_rebuild_matches_live_stats_for_expired_duel(duel_db, monkeypatch):
+    # Horloge qui avance à chaque lecture : un horodatage relu deux fois diverge
+    ticks = iter(range(5000, 5100))
+    monkeypatch.setattr(maintenance, "now_ts", lambda: next(ticks))
+    _insert_duel(
+        status="ACTIVE",
+        payload={"xp_baseline": {"player_a_before_xp": 1, "player_b_before_xp": 2}, "a_move": "ROCK"},
+        finished_at=None,
+        expires_at=100,
+    )
+
+    [expired] = maintenance.cancel_expired_duels()
+    assert expired["previous_status"] == constants.DUEL_STATUS_ACTIVE
+    live = [duel_stats_repo.ds_get_stats(1, uid) for uid in (111, 222)]
+
+    maintenance.rebuild_duel_stats()
+    rebuilt = [duel_stats_repo.ds_get_stats(1, uid) for uid in (111, 222)]
+
+    assert rebuilt == live
+    assert live[0]["expired"] == 1
+    with connection.get_conn() as conn:
+        (finished_at,) = conn.execute("SELECT finished_at FROM duels").fetchone()
+    assert live[0]["last_duel_at"] == finished_at
+
+
+def test_backfill_duel_stats_if_empty_only_runs_once(duel_db):
+    _insert_duel(status="FINISHED", payload={"a_move": "ROCK", "b_move": "SCISSORS"})
+
+    assert maintenance.backfill_duel_stats_if_empty() == 2
+    assert maintenance.backfill_duel_stats_if_empty() is None
@@ -265,6 +265,11 @@ def test_is_complete_false_when_missing_one_move():
     assert rps_mod.RPSGame.is_complete(duel) is False
 
 
+def test_is_complete_false_when_other_move_key_absent():
+    duel = _duel_row(payload=json.dumps({"xp_baseline": {}, rps.RPS_PAYLOAD_A_MOVE: rps.RPS_MOVE_ROCK}))
+    assert rps_mod.RPSGame.is_complete(duel) is False
+
+
 def test_resolve_raises_when_incomplete_payload():
     duel = _duel_row(payload=json.dumps({rps.RPS_PAYLOAD_A_MOVE: rps.RPS_MOVE_ROCK, rps.RPS_PAYLOAD_B_MOVE: None}))
     with pytest.raises(exc.PayloadError):
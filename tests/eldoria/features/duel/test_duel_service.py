@@ -101,3 +101,17 @@ def test_get_allowed_stakes_delegates(monkeypatch):
     monkeypatch.setattr(service_mod.helpers, "get_allowed_stakes", lambda duel_id: [10, 20])
 
     assert svc.get_allowed_stakes(10) == [10, 20]
+
+
+def test_stats_methods_delegate(monkeypatch):
+    svc = service_mod.DuelService()
+
+    monkeypatch.setattr(service_mod.stats, "get_player_stats", lambda gid, uid: {"gid": gid, "uid": uid})
+    monkeypatch.setattr(service_mod.stats, "get_leaderboard", lambda gid, limit, offset: [(gid, limit, offset)])
+    monkeypatch.setattr(service_mod.maintenance, "rebuild_duel_stats", lambda: 7)
+    monkeypatch.setattr(service_mod.maintenance, "backfill_duel_stats_if_empty", lambda: None)
+
+    assert svc.get_stats(1, 2) == {"gid": 1, "uid": 2}
+    assert svc.get_leaderboard(1, limit=5, offset=10) == [(1, 5, 10)]
+    assert svc.rebuild_stats() == 7
+    assert svc.backfill_stats() is None
@@ -12,7 +12,7 @@ def test_sr_match_delegates_to_repo(monkeypatch):
         calls["args"] = (guild_id, channel_id, phrase)
         return 999
 
-    monkeypatch.setattr(role_service_mod.secret_roles_repo, "sr_match", fake_sr_match)
+    monkeypatch.setattr(role_service_mod.secret_roles_repo, "sr_match_cached", fake_sr_match)
 
     out = svc.sr_match(1, 2, "hello")
 
@@ -138,7 +138,7 @@ def test_rr_get_role_id_delegates_to_repo(monkeypatch):
         assert (guild_id, message_id, emoji) == (5, 6, "✅")
         return 321
 
-    monkeypatch.setattr(role_service_mod.reaction_roles_repo, "rr_get_role_id", fake_get)
+    monkeypatch.setattr(role_service_mod.reaction_roles_repo, "rr_get_role_id_cached", fake_get)
 
     assert svc.rr_get_role_id(5, 6, "✅") == 321
 
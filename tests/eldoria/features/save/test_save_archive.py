@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import gzip
+import os
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from eldoria.features.save._internal import archive
+
+
+def _make_db(path, rows=10):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS t (x INTEGER)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(rows)])
+    conn.commit()
+    conn.close()
+
+
+def _snapshot_of(src):
+    def snapshot(dst):
+        s = sqlite3.connect(src)
+        d = sqlite3.connect(dst)
+        try:
+            s.backup(d)
+        finally:
+            d.close()
+            s.close()
+    return snapshot
+
+
+def test_artifact_name_uses_date_and_hash_prefix():
+    name = archive.artifact_name("0123456789abcdef" * 4, datetime(2026, 2, 13))
+    assert name == "Eldoria_20260213_0123456789ab.db.gz"
+
+
+def test_compress_file_is_deterministic_and_round_trips(tmp_path):
+    src = tmp_path / "src.bin"
+    src.write_bytes(os.urandom(3000) * 1000)
+
+    h1, size = archive.compress_file(src, tmp_path / "a.gz")
+    h2, _ = archive.compress_file(src, tmp_path / "b.gz")
+
+    assert h1 == h2
+    assert size == src.stat().st_size
+    assert (tmp_path / "a.gz").read_bytes() == (tmp_path / "b.gz").read_bytes()
+    assert (tmp_path / "a.gz").stat().st_size < size
+
+    archive.decompress_file(tmp_path / "a.gz", tmp_path / "out.bin")
+    assert (tmp_path / "out.bin").read_bytes() == src.read_bytes()
+
+
+def test_create_backup_reuses_artifact_when_db_unchanged(tmp_path):
+    db = tmp_path / "eldoria.db"
+    _make_db(db)
+    backups = tmp_path / "backups"
+    when = datetime(2026, 2, 13)
+
+    first = archive.create_backup(backups, keep=5, when=when, snapshot=_snapshot_of(db))
+    second = archive.create_backup(backups, keep=5, when=when, snapshot=_snapshot_of(db))
+
+    assert first.sha256 == second.sha256
+    assert first.path == second.path
+    assert archive.list_artifacts(backups) == [first.path]
+    # Aucun fichier temporaire ne subsiste
+    assert sorted(p.name for p in backups.iterdir()) == [first.filename]
+
+    with gzip.open(first.path, "rb") as f:
+        assert len(f.read()) == first.raw_size
+
+    _make_db(db, rows=1)
+    third = archive.create_backup(backups, keep=5, when=when, snapshot=_snapshot_of(db))
+    assert third.sha256 != first.sha256
+    assert len(archive.list_artifacts(backups)) == 2
+
+
+def test_create_backup_reuses_unchanged_artifact_across_days_and_keeps_history(tmp_path):
+    db = tmp_path / "eldoria.db"
+    backups = tmp_path / "backups"
+
+    _make_db(db, rows=1)
+    old = archive.create_backup(backups, keep=2, when=datetime(2026, 2, 1), snapshot=_snapshot_of(db))
+    os.utime(old.path, (1000, 1000))
+    _make_db(db, rows=1)
+    changed = archive.create_backup(backups, keep=2, when=datetime(2026, 2, 2), snapshot=_snapshot_of(db))
+    os.utime(changed.path, (2000, 2000))
+
+    # Semaine calme : même contenu chaque jour, aucun nouveau fichier
+    for day in range(3, 10):
+        quiet = archive.create_backup(backups, keep=2, when=datetime(2026, 2, day), snapshot=_snapshot_of(db))
+        assert quiet.path == changed.path
+        assert quiet.filename == "Eldoria_20260202_" + changed.short_hash + ".db.gz"
+
+    # La sauvegarde précédente, différente, n'a pas été évincée par des copies identiques
+    assert archive.list_artifacts(backups) == [changed.path, old.path]
+    assert changed.path.stat().st_mtime > 2000
+
+
+def test_create_backup_rotates_local_copies(tmp_path):
+    db = tmp_path / "eldoria.db"
+    backups = tmp_path / "backups"
+    paths = []
+    for day in range(1, 5):
+        _make_db(db, rows=day)
+        artifact = archive.create_backup(backups, keep=2, when=datetime(2026, 2, day), snapshot=_snapshot_of(db))
+        os.utime(artifact.path, (day * 1000, day * 1000))
+        paths.append(artifact.path)
+
+    archive.rotate(backups, keep=2)
+    assert archive.list_artifacts(backups) == [paths[3], paths[2]]
+
+
+def test_create_backup_cleans_up_when_snapshot_fails(tmp_path):
+    backups = tmp_path / "backups"
+
+    def failing(dst):
+        open(dst, "wb").close()
+        raise sqlite3.OperationalError("boom")
+
+    with pytest.raises(sqlite3.OperationalError):
+        archive.create_backup(backups, keep=3, snapshot=failing)
+    assert list(backups.iterdir()) == []
+
+
+def test_upload_marker_round_trip(tmp_path):
+    backups = tmp_path / "backups"
+    assert archive.last_uploaded_hash(backups) is None
+
+    archive.mark_uploaded(backups, "f" * 64)
+    assert archive.last_uploaded_hash(backups) == "f" * 64
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from eldoria.exceptions.general import InvalidBackupManifest
+from eldoria.features.save._internal import archive, chunks
+
+
+def _make_artifact(tmp_path, rows=2000):
+    db = tmp_path / "eldoria.db"
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE t (x BLOB)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(os.urandom(64),) for _ in range(rows)])
+    conn.execute("PRAGMA user_version = 3")
+    conn.commit()
+    conn.close()
+
+    def snapshot(dst):
+        s = sqlite3.connect(db)
+        d = sqlite3.connect(dst)
+        try:
+            s.backup(d)
+        finally:
+            d.close()
+            s.close()
+
+    return db, archive.create_backup(tmp_path / "backups", keep=3, when=datetime(2026, 2, 13), snapshot=snapshot)
+
+
+def test_split_file_produces_ordered_parts_of_bounded_size(tmp_path):
+    src = tmp_path / "archive.db.gz"
+    src.write_bytes(os.urandom(10_000))
+
+    parts = chunks.split_file(src, tmp_path / "parts", 4096)
+
+    assert [c.index for c, _ in parts] == [0, 1, 2]
+    assert [c.size for c, _ in parts] == [4096, 4096, 1808]
+    assert [c.filename for c, _ in parts] == ["archive.db.gz.part001", "archive.db.gz.part002", "archive.db.gz.part003"]
+    assert b"".join(p.read_bytes() for _, p in parts) == src.read_bytes()
+
+
+def test_manifest_json_round_trip_keeps_schema_version_and_message_ids(tmp_path):
+    _, artifact = _make_artifact(tmp_path)
+    parts = chunks.split_file(artifact.path, tmp_path / "parts", 16 * 1024)
+    sent = [chunks.with_message_id(c, 100 + c.index) for c, _ in parts]
+
+    manifest = chunks.build_manifest(artifact, sent)
+    parsed = chunks.BackupManifest.from_json(manifest.to_json())
+
+    assert parsed == manifest
+    assert parsed.schema_version == 3
+    assert parsed.filename == "Eldoria_20260213_" + artifact.short_hash + ".manifest.json"
+    assert [c.message_id for c in parsed.chunks] == [100 + i for i in range(len(parts))]
+
+
+def test_assemble_restores_identical_db(tmp_path):
+    _, artifact = _make_artifact(tmp_path)
+    parts = chunks.split_file(artifact.path, tmp_path / "parts", 16 * 1024)
+    manifest = chunks.build_manifest(artifact, [c for c, _ in parts])
+
+    out = tmp_path / "restored.db"
+    chunks.assemble(manifest, [p for _, p in parts], out)
+
+    assert hashlib.sha256(out.read_bytes()).hexdigest() == artifact.sha256
+    conn = sqlite3.connect(out)
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2000
+    conn.close()
+    assert not (tmp_path / "restored.db.gz.part").exists()
+
+
+def test_assemble_rejects_corrupted_part_and_cleans_up(tmp_path):
+    _, artifact = _make_artifact(tmp_path)
+    parts = chunks.split_file(artifact.path, tmp_path / "parts", 16 * 1024)
+    manifest = chunks.build_manifest(artifact, [c for c, _ in parts])
+
+    corrupted = parts[1][1]
+    data = bytearray(corrupted.read_bytes())
+    data[10] ^= 0xFF
+    corrupted.write_bytes(bytes(data))
+
+    out = tmp_path / "restored.db"
+    with pytest.raises(InvalidBackupManifest, match="partie 2 corrompue"):
+        chunks.assemble(manifest, [p for _, p in parts], out)
+    assert not out.exists()
+    assert not (tmp_path / "restored.db.gz.part").exists()
+
+
+def test_assemble_rejects_missing_parts(tmp_path):
+    _, artifact = _make_artifact(tmp_path)
+    parts = chunks.split_file(artifact.path, tmp_path / "parts", 16 * 1024)
+    manifest = chunks.build_manifest(artifact, [c for c, _ in parts])
+
+    with pytest.raises(InvalidBackupManifest):
+        chunks.assemble(manifest, [p for _, p in parts][:-1], tmp_path / "restored.db")
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda d: d.update(format="autre"),
+        lambda d: d.update(version=99),
+        lambda d: d.pop("db_sha256"),
+        lambda d: d["chunks"].reverse(),
+        lambda d: d.update(archive_size=d["archive_size"] + 1),
+        lambda d: d.update(chunks=[]),
+    ],
+)
+def test_manifest_from_json_rejects_inconsistent_manifests(tmp_path, mutate):
+    _, artifact = _make_artifact(tmp_path, rows=200)
+    parts = chunks.split_file(artifact.path, tmp_path / "parts", 1024)
+    data = json.loads(chunks.build_manifest(artifact, [c for c, _ in parts]).to_json())
+    mutate(data)
+
+    with pytest.raises(InvalidBackupManifest):
+        chunks.BackupManifest.from_json(json.dumps(data))
+
+
+def test_manifest_from_json_rejects_garbage():
+    with pytest.raises(InvalidBackupManifest, match="JSON illisible"):
+        chunks.BackupManifest.from_json("{pas du json")
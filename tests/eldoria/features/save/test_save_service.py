@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 import eldoria.features.save.save_service as save_service_mod
 
 
@@ -53,6 +55,65 @@ def test_replace_db_file_delegates_to_maintenance(monkeypatch):
     assert called["path"] == "/tmp/new.sqlite"
 
 
+def test_restore_db_file_wraps_os_errors_but_keeps_validation_errors(monkeypatch):
+    import pytest
+
+    from eldoria.exceptions.general import DatabaseRestoreError, InvalidDatabaseFile
+
+    svc = save_service_mod.SaveService()
+
+    def refused(path, **_kwargs):
+        raise InvalidDatabaseFile("quick_check en échec")
+
+    monkeypatch.setattr(save_service_mod.maintenance, "restore_db_file", refused)
+    with pytest.raises(InvalidDatabaseFile):
+        svc.restore_db_file("/tmp/new.sqlite")
+
+    def broken(path, **_kwargs):
+        raise OSError("disque plein")
+
+    monkeypatch.setattr(save_service_mod.maintenance, "restore_db_file", broken)
+    with pytest.raises(DatabaseRestoreError):
+        svc.restore_db_file("/tmp/new.sqlite")
+
+
+def test_run_maintenance_builds_retention_purges(monkeypatch):
+    import sqlite3
+
+    from eldoria.db import schema
+
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(schema.SCHEMA_SQL)
+    now = 1_771_000_000  # 2026-02-13
+    conn.executemany(
+        "INSERT INTO xp_voice_progress(guild_id, user_id, day_key) VALUES (?, ?, ?)",
+        [(1, 10, "20260101"), (1, 11, save_service_mod.day_key_utc(now))],
+    )
+    conn.execute(
+        "INSERT INTO tickets(guild_id, ticket_number, channel_id, owner_id, status, created_at, closed_at) "
+        "VALUES (1, 1, 100, 1000, 'CLOSED', 0, ?)",
+        (now - 100 * 86400,),
+    )
+
+    captured = {}
+
+    def fake_run(*, purges, vacuum_pages):
+        captured["vacuum_pages"] = vacuum_pages
+        captured["purged"] = {table: purge(conn) for table, purge in purges.items()}
+        return "report"
+
+    monkeypatch.setattr(save_service_mod.maintenance, "run_maintenance", fake_run)
+    svc = save_service_mod.SaveService()
+
+    assert svc.run_maintenance(vacuum_pages=10, voice_retention_days=7, tickets_retention_days=90, now=now) == "report"
+    assert captured == {"vacuum_pages": 10, "purged": {"xp_voice_progress": 1, "tickets": 1}}
+
+    # Rétention des tickets à 0 : aucune purge de tickets
+    svc.run_maintenance(vacuum_pages=0, voice_retention_days=7, tickets_retention_days=0, now=now)
+    assert list(captured["purged"]) == ["xp_voice_progress"]
+    conn.close()
+
+
 def test_init_db_delegates_to_schema(monkeypatch):
     svc = save_service_mod.SaveService()
 
@@ -70,3 +131,31 @@ def test_init_db_delegates_to_schema(monkeypatch):
     svc.init_db()
 
     assert called["n"] == 1
+
+
+def test_create_backup_delegates_to_archive(monkeypatch):
+    svc = save_service_mod.SaveService()
+
+    called = {}
+
+    def fake_create_backup(backup_dir, *, keep):
+        called["args"] = (backup_dir, keep)
+        return "artifact"
+
+    monkeypatch.setattr(save_service_mod, "create_backup", fake_create_backup)
+
+    assert svc.create_backup("/tmp/backups", 3) == "artifact"
+    assert str(called["args"][0]) == "/tmp/backups"
+    assert called["args"][1] == 3
+
+
+def test_chunked_backup_helpers_are_resolved_lazily():
+    svc = save_service_mod.SaveService()
+
+    assert svc.is_manifest_filename("Eldoria_20260213_abc.MANIFEST.json")
+    assert not svc.is_manifest_filename("Eldoria_20260213_abc.db.gz")
+
+    from eldoria.exceptions.general import InvalidBackupManifest
+
+    with pytest.raises(InvalidBackupManifest):
+        svc.parse_manifest("[]")
@@ -10,7 +10,7 @@ def test_find_parent_of_active_delegates_to_repo(monkeypatch):
 
     monkeypatch.setattr(
         svc_mod.temp_voice_repo,
-        "tv_find_parent_of_active",
+        "tv_find_parent_of_active_cached",
         fake_tv_find_parent_of_active,
     )
 
@@ -44,7 +44,7 @@ def test_get_parent_delegates_to_repo(monkeypatch):
         calls["args"] = (guild_id, parent_channel_id)
         return 42
 
-    monkeypatch.setattr(svc_mod.temp_voice_repo, "tv_get_parent", fake_tv_get_parent)
+    monkeypatch.setattr(svc_mod.temp_voice_repo, "tv_get_parent_cached", fake_tv_get_parent)
 
     svc = svc_mod.TempVoiceService()
     assert svc.get_parent(1, 10) == 42
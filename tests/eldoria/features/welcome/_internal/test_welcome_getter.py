@@ -7,12 +7,9 @@ import eldoria.features.welcome._internal.welcome_getter as getter_mod
 def test_get_welcome_message_full_flow(monkeypatch):
     calls = {}
 
-    # 1) JSON loader
-    monkeypatch.setattr(
-        getter_mod,
-        "load_welcome_json",
-        lambda: {"messages": ["dummy"]},
-    )
+    # 1) Pool compilé
+    pool = object()
+    monkeypatch.setattr(getter_mod, "get_welcome_pool", lambda: pool)
 
     # 2) DB recent keys
     def fake_recent(guild_id: int, *, limit: int):
@@ -26,8 +23,8 @@ def test_get_welcome_message_full_flow(monkeypatch):
     )
 
     # 3) picker
-    def fake_picker(*, data, user, server, recent_keys, recent_limit):
-        calls["picker"] = (data, user, server, recent_keys, recent_limit)
+    def fake_picker(*, pool, user, server, recent_keys, recent_limit):
+        calls["picker"] = (pool, user, server, recent_keys, recent_limit)
         return ("Title", "Message", ["🎉"], "k3")
 
     monkeypatch.setattr(getter_mod, "pick_welcome_message", fake_picker)
@@ -52,7 +49,7 @@ def test_get_welcome_message_full_flow(monkeypatch):
     assert out == ("Title", "Message", ["🎉"])
 
     assert calls["recent"] == (1, 5)
-    assert calls["picker"][1:] == ("Bob", "Eldoria", ["k2", "k1"], 5)
+    assert calls["picker"] == (pool, "Bob", "Eldoria", ["k2", "k1"], 5)
     assert calls["record"] == (1, "k3", 5)
 
 
@@ -61,7 +58,7 @@ def test_get_welcome_message_full_flow(monkeypatch):
 # ------------------------------------------------------------
 
 def test_get_welcome_message_no_recent_lookup_when_limit_zero(monkeypatch):
-    monkeypatch.setattr(getter_mod, "load_welcome_json", lambda: {})
+    monkeypatch.setattr(getter_mod, "get_welcome_pool", lambda: None)
 
     # Si appelé => fail
     monkeypatch.setattr(
@@ -97,7 +94,7 @@ def test_get_welcome_message_no_recent_lookup_when_limit_zero(monkeypatch):
 # ------------------------------------------------------------
 
 def test_get_welcome_message_does_not_record_when_key_none(monkeypatch):
-    monkeypatch.setattr(getter_mod, "load_welcome_json", lambda: {})
+    monkeypatch.setattr(getter_mod, "get_welcome_pool", lambda: None)
     monkeypatch.setattr(
         getter_mod.welcome_message_repo,
         "wm_get_recent_message_keys",
@@ -130,7 +127,7 @@ def test_get_welcome_message_does_not_record_when_key_none(monkeypatch):
 # ------------------------------------------------------------
 
 def test_get_welcome_message_does_not_record_fallback(monkeypatch):
-    monkeypatch.setattr(getter_mod, "load_welcome_json", lambda: {})
+    monkeypatch.setattr(getter_mod, "get_welcome_pool", lambda: None)
     monkeypatch.setattr(
         getter_mod.welcome_message_repo,
         "wm_get_recent_message_keys",
@@ -1,6 +1,7 @@
 import pytest
 
 import eldoria.features.welcome._internal.welcome_picker as picker_mod
+from eldoria.json_tools.welcome_json import compile_welcome_pool
 
 
 def test_pick_welcome_message_returns_fallback_when_pool_empty(monkeypatch):
@@ -8,7 +9,7 @@ def test_pick_welcome_message_returns_fallback_when_pool_empty(monkeypatch):
     data = {"packs": []}
 
     title, msg, emojis, key = picker_mod.pick_welcome_message(
-        data=data,
+        pool=compile_welcome_pool(data),
         user="Bob",
         server="Eldoria",
         recent_keys=[],
@@ -39,7 +40,7 @@ def test_pick_welcome_message_builds_pool_from_valid_packs_and_replaces_placehol
     monkeypatch.setattr(picker_mod.random, "sample", lambda seq, k: seq[:k])
 
     title, msg, emojis, key = picker_mod.pick_welcome_message(
-        data=data,
+        pool=compile_welcome_pool(data),
         user="Bob",
         server="Eldoria",
         recent_keys=[],
@@ -73,7 +74,7 @@ def test_pick_welcome_message_filters_invalid_pack_shapes(monkeypatch):
     )
 
     title, msg, emojis, key = picker_mod.pick_welcome_message(
-        data=data,
+        pool=compile_welcome_pool(data),
         user="Bob",
         server="Eldoria",
         recent_keys=[],
@@ -108,7 +109,7 @@ def test_pick_welcome_message_excludes_recent_keys_when_possible(monkeypatch):
     monkeypatch.setattr(picker_mod.random, "sample", lambda seq, k: seq[:k])
 
     title, msg, emojis, key = picker_mod.pick_welcome_message(
-        data=data,
+        pool=compile_welcome_pool(data),
         user="Bob",
         server="Eldoria",
         recent_keys=["k1", "k2"],   # récents
@@ -143,7 +144,7 @@ def test_pick_welcome_message_when_all_keys_recent_falls_back_to_full_pool(monke
     monkeypatch.setattr(picker_mod.random, "sample", lambda seq, k: seq[:k])
 
     title, msg, emojis, key = picker_mod.pick_welcome_message(
-        data=data,
+        pool=compile_welcome_pool(data),
         user="Bob",
         server="Eldoria",
         recent_keys=["k1", "k2"],
@@ -178,7 +179,7 @@ def test_pick_welcome_message_negative_recent_limit_treated_as_zero(monkeypatch,
     monkeypatch.setattr(picker_mod.random, "sample", lambda seq, k: seq[:k])
 
     title, msg, emojis, key = picker_mod.pick_welcome_message(
-        data=data,
+        pool=compile_welcome_pool(data),
         user="Bob",
         server="Eldoria",
         recent_keys=["k1"],   # ne doit PAS exclure (limit => 0)
@@ -211,7 +212,7 @@ def test_pick_welcome_message_limits_emojis_to_two(monkeypatch):
     monkeypatch.setattr(picker_mod.random, "sample", fake_sample)
 
     title, msg, emojis, key = picker_mod.pick_welcome_message(
-        data=data,
+        pool=compile_welcome_pool(data),
         user="Bob",
         server="Eldoria",
         recent_keys=[],
@@ -44,7 +44,7 @@ _Cfg = type("_Cfg", (), {"__init__": _cfg_init})
 
 @pytest.mark.asyncio
 async def test_returns_none_when_no_guild(monkeypatch):
-    monkeypatch.setattr(mod, "xp_get_config", lambda _gid: {"enabled": True})
+    monkeypatch.setattr(mod, "xp_get_config_cached", lambda _gid: {"enabled": True})
     monkeypatch.setattr(mod, "XpConfig", _Cfg)
 
     msg = MessageStub(guild=None, author=MemberStub(), content="hello")
@@ -53,7 +53,7 @@ async def test_returns_none_when_no_guild(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_returns_none_when_author_is_bot(monkeypatch):
-    monkeypatch.setattr(mod, "xp_get_config", lambda _gid: {"enabled": True})
+    monkeypatch.setattr(mod, "xp_get_config_cached", lambda _gid: {"enabled": True})
     monkeypatch.setattr(mod, "XpConfig", _Cfg)
 
     msg = MessageStub(guild=FakeGuild(), author=MemberStub(bot=True), content="hello")
@@ -62,7 +62,7 @@ async def test_returns_none_when_author_is_bot(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_returns_none_when_xp_disabled(monkeypatch):
-    monkeypatch.setattr(mod, "xp_get_config", lambda _gid: {"enabled": False})
+    monkeypatch.setattr(mod, "xp_get_config_cached", lambda _gid: {"enabled": False})
     monkeypatch.setattr(mod, "XpConfig", _Cfg)
 
     # Si XP disabled, ne doit pas toucher au reste
@@ -76,7 +76,7 @@ async def test_returns_none_when_cooldown_not_passed(monkeypatch):
     guild = FakeGuild(123)
     member = MemberStub(42)
 
-    monkeypatch.setattr(mod, "xp_get_config", lambda _gid: {"enabled": True, "cooldown_seconds": 10, "points_per_message": 5})
+    monkeypatch.setattr(mod, "xp_get_config_cached", lambda _gid: {"enabled": True, "cooldown_seconds": 10, "points_per_message": 5})
     monkeypatch.setattr(mod, "XpConfig", _Cfg)
 
     monkeypatch.setattr(mod, "now_ts", lambda: 1_000)
@@ -93,7 +93,7 @@ async def test_returns_none_when_points_per_message_results_in_zero(monkeypatch)
     guild = FakeGuild(123)
     member = MemberStub(42)
 
-    monkeypatch.setattr(mod, "xp_get_config", lambda _gid: {"enabled": True, "points_per_message": -5})
+    monkeypatch.setattr(mod, "xp_get_config_cached", lambda _gid: {"enabled": True, "points_per_message": -5})
     monkeypatch.setattr(mod, "XpConfig", _Cfg)
 
     monkeypatch.setattr(mod, "now_ts", lambda: 1_000)
@@ -109,7 +109,7 @@ async def test_happy_path_adds_xp_computes_levels_and_syncs_roles(monkeypatch):
     guild = FakeGuild(123)
     member = MemberStub(42)
 
-    monkeypatch.setattr(mod, "xp_get_config", lambda _gid: {"enabled": True, "points_per_message": 8, "cooldown_seconds": 0, "bonus_percent": 0})
+    monkeypatch.setattr(mod, "xp_get_config_cached", lambda _gid: {"enabled": True, "points_per_message": 8, "cooldown_seconds": 0, "bonus_percent": 0})
     monkeypatch.setattr(mod, "XpConfig", _Cfg)
 
     monkeypatch.setattr(mod, "now_ts", lambda: 1_000)
@@ -123,7 +123,7 @@ async def test_happy_path_adds_xp_computes_levels_and_syncs_roles(monkeypatch):
 
     monkeypatch.setattr(mod, "xp_add_xp", _xp_add_xp)
 
-    monkeypatch.setattr(mod, "xp_get_levels", lambda _gid: [(1, 0), (2, 100), (3, 200)])
+    monkeypatch.setattr(mod, "xp_get_levels_cached", lambda _gid: [(1, 0), (2, 100), (3, 200)])
 
     compute_calls = []
 
@@ -161,7 +161,7 @@ async def test_bonus_applied_when_server_tag_active(monkeypatch):
 
     monkeypatch.setattr(
         mod,
-        "xp_get_config",
+        "xp_get_config_cached",
         lambda _gid: {"enabled": True, "points_per_message": 10, "cooldown_seconds": 0, "bonus_percent": 50},
     )
     monkeypatch.setattr(mod, "XpConfig", _Cfg)
@@ -176,7 +176,7 @@ async def test_bonus_applied_when_server_tag_active(monkeypatch):
         return gained
 
     monkeypatch.setattr(mod, "xp_add_xp", _xp_add_xp)
-    monkeypatch.setattr(mod, "xp_get_levels", lambda _gid: [(1, 0)])
+    monkeypatch.setattr(mod, "xp_get_levels_cached", lambda _gid: [(1, 0)])
     monkeypatch.setattr(mod, "compute_level", lambda xp, levels: 1)
 
     async def _sync(*_a, **_k):
@@ -199,7 +199,7 @@ async def test_karuta_small_k_message_applies_malus(monkeypatch):
 
     monkeypatch.setattr(
         mod,
-        "xp_get_config",
+        "xp_get_config_cached",
         lambda _gid: {"enabled": True, "points_per_message": 10, "cooldown_seconds": 0, "bonus_percent": 0, "karuta_k_small_percent": 30},
     )
     monkeypatch.setattr(mod, "XpConfig", _Cfg)
@@ -214,7 +214,7 @@ async def test_karuta_small_k_message_applies_malus(monkeypatch):
         return gained
 
     monkeypatch.setattr(mod, "xp_add_xp", _xp_add_xp)
-    monkeypatch.setattr(mod, "xp_get_levels", lambda _gid: [(1, 0)])
+    monkeypatch.setattr(mod, "xp_get_levels_cached", lambda _gid: [(1, 0)])
     monkeypatch.setattr(mod, "compute_level", lambda xp, levels: 1)
 
     async def _sync(*_a, **_k):
@@ -240,7 +240,7 @@ async def test_bonus_then_karuta_malus_order(monkeypatch):
 
     monkeypatch.setattr(
         mod,
-        "xp_get_config",
+        "xp_get_config_cached",
         lambda _gid: {
             "enabled": True,
             "points_per_message": 10,
@@ -261,7 +261,7 @@ async def test_bonus_then_karuta_malus_order(monkeypatch):
         return gained
 
     monkeypatch.setattr(mod, "xp_add_xp", _xp_add_xp)
-    monkeypatch.setattr(mod, "xp_get_levels", lambda _gid: [(1, 0)])
+    monkeypatch.setattr(mod, "xp_get_levels_cached", lambda _gid: [(1, 0)])
     monkeypatch.setattr(mod, "compute_level", lambda xp, levels: 1)
 
     async def _sync(*_a, **_k):
@@ -285,7 +285,7 @@ async def test_content_none_or_blank_does_not_trigger_karuta(monkeypatch):
 
     monkeypatch.setattr(
         mod,
-        "xp_get_config",
+        "xp_get_config_cached",
         lambda _gid: {"enabled": True, "points_per_message": 10, "cooldown_seconds": 0, "bonus_percent": 0, "karuta_k_small_percent": 30},
     )
     monkeypatch.setattr(mod, "XpConfig", _Cfg)
@@ -300,7 +300,7 @@ async def test_content_none_or_blank_does_not_trigger_karuta(monkeypatch):
         return gained
 
     monkeypatch.setattr(mod, "xp_add_xp", _xp_add_xp)
-    monkeypatch.setattr(mod, "xp_get_levels", lambda _gid: [(1, 0)])
+    monkeypatch.setattr(mod, "xp_get_levels_cached", lambda _gid: [(1, 0)])
     monkeypatch.setattr(mod, "compute_level", lambda xp, levels: 1)
 
     async def _sync(*_a, **_k):
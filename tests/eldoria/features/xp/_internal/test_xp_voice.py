@@ -103,12 +103,12 @@ def _install_repo_mocks(monkeypatch, *, config_raw: dict, progress: dict, levels
     def xp_get_levels(_gid: int):
         return levels
 
-    monkeypatch.setattr(mod.xp_repo, "xp_get_config", xp_get_config, raising=True)
+    monkeypatch.setattr(mod.xp_repo, "xp_get_config_cached", xp_get_config, raising=True)
     monkeypatch.setattr(mod.xp_repo, "xp_voice_get_progress", xp_voice_get_progress, raising=True)
     monkeypatch.setattr(mod.xp_repo, "xp_voice_upsert_progress", xp_voice_upsert_progress, raising=True)
     monkeypatch.setattr(mod.xp_repo, "xp_get_member", xp_get_member, raising=True)
     monkeypatch.setattr(mod.xp_repo, "xp_add_xp", xp_add_xp, raising=True)
-    monkeypatch.setattr(mod.xp_repo, "xp_get_levels", xp_get_levels, raising=True)
+    monkeypatch.setattr(mod.xp_repo, "xp_get_levels_cached", xp_get_levels, raising=True)
 
     return upsert_calls, add_calls
 
@@ -166,7 +166,7 @@ async def test_tick_returns_none_for_bot(monkeypatch):
     m = MemberStub(bot=True, voice=VoiceStateStub())
 
     # si bot => ne doit pas toucher repo
-    monkeypatch.setattr(mod.xp_repo, "xp_get_config", lambda *_: (_ for _ in ()).throw(AssertionError("repo called")))
+    monkeypatch.setattr(mod.xp_repo, "xp_get_config_cached", lambda *_: (_ for _ in ()).throw(AssertionError("repo called")))
     assert await mod.tick_voice_xp_for_member(g, m) is None
 
 
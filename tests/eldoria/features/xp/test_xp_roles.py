@@ -100,11 +100,11 @@ async def test_sync_member_level_roles_skips_bots(monkeypatch):
 async def test_sync_member_level_roles_fetches_xp_and_updates_roles(monkeypatch):
     # DB / logique métier mockées
     monkeypatch.setattr(roles_mod, "xp_get_member", lambda gid, mid: (150, None))
-    monkeypatch.setattr(roles_mod, "xp_get_levels", lambda gid: [(0, 0), (100, 1), (200, 2)])
+    monkeypatch.setattr(roles_mod, "xp_get_levels_cached", lambda gid: [(0, 0), (100, 1), (200, 2)])
     monkeypatch.setattr(roles_mod, "compute_level", lambda xp, levels: 2)
 
     role_ids = {1: 111, 2: 222, 3: 333}
-    monkeypatch.setattr(roles_mod, "xp_get_role_ids", lambda gid: role_ids)
+    monkeypatch.setattr(roles_mod, "xp_get_role_ids_cached", lambda gid: role_ids)
 
     r111 = RoleStub(111)
     r222 = RoleStub(222)
@@ -127,10 +127,10 @@ async def test_sync_member_level_roles_fetches_xp_and_updates_roles(monkeypatch)
 @pytest.mark.asyncio
 async def test_sync_member_level_roles_no_role_ids_noop(monkeypatch):
     monkeypatch.setattr(roles_mod, "xp_get_member", lambda gid, mid: (50, None))
-    monkeypatch.setattr(roles_mod, "xp_get_levels", lambda gid: [(0, 0)])
+    monkeypatch.setattr(roles_mod, "xp_get_levels_cached", lambda gid: [(0, 0)])
     monkeypatch.setattr(roles_mod, "compute_level", lambda xp, levels: 1)
 
-    monkeypatch.setattr(roles_mod, "xp_get_role_ids", lambda gid: {})
+    monkeypatch.setattr(roles_mod, "xp_get_role_ids_cached", lambda gid: {})
 
     guild = GuildStub(123)
     member = MemberStub(42, roles=[RoleStub(111)])
@@ -144,7 +144,7 @@ async def test_sync_member_level_roles_no_role_ids_noop(monkeypatch):
 @pytest.mark.asyncio
 async def test_sync_member_level_roles_fallback_to_defaults_when_no_levels(monkeypatch):
     # levels vides => fallback sur XP_LEVELS_DEFAULTS
-    monkeypatch.setattr(roles_mod, "xp_get_levels", lambda gid: [])
+    monkeypatch.setattr(roles_mod, "xp_get_levels_cached", lambda gid: [])
 
     # on force des defaults minimalistes (ordre garanti via list(dict.items()))
     monkeypatch.setattr(roles_mod, "XP_LEVELS_DEFAULTS", {1: 0, 2: 100})
@@ -158,7 +158,7 @@ async def test_sync_member_level_roles_fallback_to_defaults_when_no_levels(monke
     monkeypatch.setattr(roles_mod, "compute_level", _compute_level)
 
     monkeypatch.setattr(roles_mod, "xp_get_member", lambda gid, mid: (10, None))
-    monkeypatch.setattr(roles_mod, "xp_get_role_ids", lambda gid: {1: 111})
+    monkeypatch.setattr(roles_mod, "xp_get_role_ids_cached", lambda gid: {1: 111})
 
     r111 = RoleStub(111)
     guild = GuildStub(123, roles={111: r111})
@@ -173,9 +173,9 @@ async def test_sync_member_level_roles_fallback_to_defaults_when_no_levels(monke
 @pytest.mark.asyncio
 async def test_sync_member_level_roles_handles_discord_forbidden(monkeypatch):
     monkeypatch.setattr(roles_mod, "xp_get_member", lambda gid, mid: (150, None))
-    monkeypatch.setattr(roles_mod, "xp_get_levels", lambda gid: [(0, 0)])
+    monkeypatch.setattr(roles_mod, "xp_get_levels_cached", lambda gid: [(0, 0)])
     monkeypatch.setattr(roles_mod, "compute_level", lambda xp, levels: 2)
-    monkeypatch.setattr(roles_mod, "xp_get_role_ids", lambda gid: {2: 222, 1: 111})
+    monkeypatch.setattr(roles_mod, "xp_get_role_ids_cached", lambda gid: {2: 222, 1: 111})
 
     r111 = RoleStub(111)
     r222 = RoleStub(222)
@@ -191,7 +191,7 @@ async def test_sync_member_level_roles_handles_discord_forbidden(monkeypatch):
 async def test_sync_xp_roles_for_users_returns_when_disabled(monkeypatch):
     calls: dict[str, int] = {"get_member": 0, "sync": 0}
 
-    monkeypatch.setattr(roles_mod, "xp_is_enabled", lambda gid: False)
+    monkeypatch.setattr(roles_mod, "xp_is_enabled_cached", lambda gid: False)
 
     async def _get_member_by_id_or_raise(*, guild, member_id: int):
         calls["get_member"] += 1
@@ -211,7 +211,7 @@ async def test_sync_xp_roles_for_users_returns_when_disabled(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_sync_xp_roles_for_users_processes_each_user_and_continues_on_errors(monkeypatch):
-    monkeypatch.setattr(roles_mod, "xp_is_enabled", lambda gid: True)
+    monkeypatch.setattr(roles_mod, "xp_is_enabled_cached", lambda gid: True)
 
     members = {
         1: MemberStub(1),
@@ -244,7 +244,7 @@ def test_get_xp_role_ids_returns_empty_when_guild_id_missing():
 
 
 def test_get_xp_role_ids_returns_empty_on_none_result(monkeypatch):
-    monkeypatch.setattr(roles_mod, "xp_get_role_ids", lambda gid: None)
+    monkeypatch.setattr(roles_mod, "xp_get_role_ids_cached", lambda gid: None)
     assert roles_mod.get_xp_role_ids(123) == {}
 
 
@@ -252,5 +252,5 @@ def test_get_xp_role_ids_returns_empty_on_exception(monkeypatch):
     def _boom(_gid: int):
         raise RuntimeError("db down")
 
-    monkeypatch.setattr(roles_mod, "xp_get_role_ids", _boom)
+    monkeypatch.setattr(roles_mod, "xp_get_role_ids_cached", _boom)
     assert roles_mod.get_xp_role_ids(123) == {}
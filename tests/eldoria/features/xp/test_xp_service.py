@@ -101,13 +101,25 @@ def test_ensure_defaults_delegates(svc, monkeypatch):
     assert called["args"] == (10, {1: 0})
 
 
+def test_ensure_defaults_skips_bootstrapped_guild(svc, monkeypatch):
+    from eldoria.db import cache
+
+    calls = []
+    monkeypatch.setattr(svc_mod.xp_repo, "xp_ensure_defaults", lambda *a: calls.append(a))
+    cache.mark_bootstrapped([10])
+
+    svc.ensure_defaults(10)
+    svc.ensure_defaults(11)
+    assert calls == [(11, None)]
+
+
 def test_get_config_delegates(svc, monkeypatch):
     monkeypatch.setattr(svc_mod.xp_repo, "xp_get_config", lambda gid: {"gid": gid})
     assert svc.get_config(99) == {"gid": 99}
 
 
 def test_get_role_ids_delegates(svc, monkeypatch):
-    monkeypatch.setattr(svc_mod.xp_repo, "xp_get_role_ids", lambda gid: {1: 111})
+    monkeypatch.setattr(svc_mod.xp_repo, "xp_get_role_ids_cached", lambda gid: {1: 111})
     assert svc.get_role_ids(10) == {1: 111}
 
 
@@ -145,7 +157,7 @@ def test_upsert_role_id_delegates(svc, monkeypatch):
 
 
 def test_get_levels_delegates(svc, monkeypatch):
-    monkeypatch.setattr(svc_mod.xp_repo, "xp_get_levels", lambda gid: [(1, 0), (2, 10)])
+    monkeypatch.setattr(svc_mod.xp_repo, "xp_get_levels_cached", lambda gid: [(1, 0), (2, 10)])
     assert svc.get_levels(10) == [(1, 0), (2, 10)]
 
 
@@ -1,9 +1,12 @@
-from eldoria.json_tools.duels_json import get_duel_embed_data, get_game_text
+import json
+
+from eldoria.json_tools import duels_json as mod
+from eldoria.json_tools.duels_json import compile_duel_texts, get_duel_embed_data, get_game_text
 
 
 def test_get_duel_embed_data_defaults_when_file_missing(monkeypatch):
-    # On évite de monkeypatch open() (VSCode pytest), on patch la fonction loader
-    monkeypatch.setattr("eldoria.json_tools.duels_json.load_duels_json", lambda: {})
+    # Fichier absent => compile({}) : valeurs par défaut
+    monkeypatch.setattr(mod, "get_duel_texts", lambda: compile_duel_texts({}))
 
     data = get_duel_embed_data()
 
@@ -15,12 +18,13 @@ def test_get_duel_embed_data_defaults_when_file_missing(monkeypatch):
 
 def test_get_duel_embed_data_uses_title_and_description_when_valid(monkeypatch):
     monkeypatch.setattr(
-        "eldoria.json_tools.duels_json.load_duels_json",
-        lambda: {
+        mod,
+        "get_duel_texts",
+        lambda: compile_duel_texts({
             "title": "  Mon titre  ",
             "description": "  Ma description  ",
             "games": {},
-        },
+        }),
     )
 
     data = get_duel_embed_data()
@@ -31,8 +35,9 @@ def test_get_duel_embed_data_uses_title_and_description_when_valid(monkeypatch):
 def test_get_duel_embed_data_filters_invalid_games_and_strips(monkeypatch):
     # Mélange de jeux valides/invalides + trims
     monkeypatch.setattr(
-        "eldoria.json_tools.duels_json.load_duels_json",
-        lambda: {
+        mod,
+        "get_duel_texts",
+        lambda: compile_duel_texts({
             "title": "T",
             "description": "D",
             "games": {
@@ -43,7 +48,7 @@ def test_get_duel_embed_data_filters_invalid_games_and_strips(monkeypatch):
                 "NO_DESC": {"name": "name", "description": ""},  # desc vide -> ignoré
                 "RPS": {"name": "  Rock Paper Scissors  ", "description": "  Rules  "},  # valide
             },
-        },
+        }),
     )
 
     data = get_duel_embed_data()
@@ -57,8 +62,9 @@ def test_get_duel_embed_data_filters_invalid_games_and_strips(monkeypatch):
 def test_get_duel_embed_data_fallback_games_when_all_invalid(monkeypatch):
     # Si aucun jeu valide, fallback RPS
     monkeypatch.setattr(
-        "eldoria.json_tools.duels_json.load_duels_json",
-        lambda: {"title": "T", "description": "D", "games": {"BAD": {"name": "", "description": ""}}},
+        mod,
+        "get_duel_texts",
+        lambda: compile_duel_texts({"title": "T", "description": "D", "games": {"BAD": {"name": "", "description": ""}}}),
     )
 
     data = get_duel_embed_data()
@@ -68,14 +74,15 @@ def test_get_duel_embed_data_fallback_games_when_all_invalid(monkeypatch):
 
 def test_get_game_text_returns_game_when_exists(monkeypatch):
     monkeypatch.setattr(
-        "eldoria.json_tools.duels_json.get_duel_embed_data",
-        lambda: {
+        mod,
+        "get_duel_texts",
+        lambda: compile_duel_texts({
             "title": "T",
             "description": "D",
             "games": {
                 "RPS": {"name": "  N  ", "description": "  Desc  "},
             },
-        },
+        }),
     )
 
     name, desc = get_game_text("RPS")
@@ -85,8 +92,9 @@ def test_get_game_text_returns_game_when_exists(monkeypatch):
 
 def test_get_game_text_fallback_when_missing(monkeypatch):
     monkeypatch.setattr(
-        "eldoria.json_tools.duels_json.get_duel_embed_data",
-        lambda: {"title": "T", "description": "D", "games": {}},
+        mod,
+        "get_duel_texts",
+        lambda: compile_duel_texts({"title": "T", "description": "D", "games": {"OTHER": {"name": "N", "description": "D"}}}),
     )
 
     name, desc = get_game_text("RPS")
@@ -96,8 +104,9 @@ def test_get_game_text_fallback_when_missing(monkeypatch):
 
 def test_get_game_text_fallback_when_invalid_payload(monkeypatch):
     monkeypatch.setattr(
-        "eldoria.json_tools.duels_json.get_duel_embed_data",
-        lambda: {"title": "T", "description": "D", "games": {"RPS": "not a dict"}},
+        mod,
+        "get_duel_texts",
+        lambda: compile_duel_texts({"title": "T", "description": "D", "games": {"OK": {"name": "N", "description": "D"}, "RPS": "not a dict"}}),
     )
 
     name, desc = get_game_text("RPS")
@@ -108,10 +117,26 @@ def test_get_game_text_fallback_when_invalid_payload(monkeypatch):
 def test_get_game_text_accepts_non_string_key(monkeypatch):
     # get_game_text convertit en str(game_key)
     monkeypatch.setattr(
-        "eldoria.json_tools.duels_json.get_duel_embed_data",
-        lambda: {"title": "T", "description": "D", "games": {"123": {"name": "N", "description": "D"}}},
+        mod,
+        "get_duel_texts",
+        lambda: compile_duel_texts({"title": "T", "description": "D", "games": {"123": {"name": "N", "description": "D"}}}),
     )
 
     name, desc = get_game_text(123)  # type: ignore[arg-type]
     assert name == "N"
     assert desc == "D"
+
+
+def test_duel_texts_are_read_from_the_compiled_resource(monkeypatch, tmp_path):
+    p = tmp_path / "duels.json"
+    p.write_text(json.dumps({"title": "Titre", "games": {"RPS": {"name": "N", "description": "D"}}}), encoding="utf-8")
+    monkeypatch.setattr(mod._DUELS, "path", p)
+    mod._DUELS.reset()
+    try:
+        texts = mod.get_duel_texts()
+        assert texts.title == "Titre"
+        assert get_game_text("RPS") == ("N", "D")
+        # Servi depuis la mémoire : même objet tant que le fichier ne change pas
+        assert mod.get_duel_texts() is texts
+    finally:
+        mod._DUELS.reset()
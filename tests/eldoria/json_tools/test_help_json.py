@@ -1,18 +1,5 @@
-import json
-
-from eldoria.json_tools.help_json import load_help_config, load_help_json
-
-
-def test_load_help_json_file_not_found():
-    assert load_help_json(path="does_not_exist_help.json") == {}
-
-
-def test_load_help_json_valid(tmp_path):
-    data = {"ok": True}
-    p = tmp_path / "help.json"
-    p.write_text(json.dumps(data), encoding="utf-8")
-
-    assert load_help_json(path=str(p)) == data
+from eldoria.json_tools import help_json as mod
+from eldoria.json_tools.help_json import compile_help_config, load_help_config
 
 
 def test_load_help_config_structured_format(monkeypatch):
@@ -32,8 +19,7 @@ def test_load_help_config_structured_format(monkeypatch):
         }
     }
 
-    # On patch le loader, pas open()
-    monkeypatch.setattr("eldoria.json_tools.help_json.load_help_json", lambda: data)
+    monkeypatch.setattr(mod, "get_help_config", lambda: compile_help_config(data))
 
     help_infos, categories, cat_desc = load_help_config()
 
@@ -59,7 +45,7 @@ def test_load_help_config_intermediate_format(monkeypatch):
         "category_descriptions": {"Moderation": "Outils de modération"},
     }
 
-    monkeypatch.setattr("eldoria.json_tools.help_json.load_help_json", lambda: data)
+    monkeypatch.setattr(mod, "get_help_config", lambda: compile_help_config(data))
 
     help_infos, categories, cat_desc = load_help_config()
     assert help_infos == {"ban": "Ban un utilisateur"}
@@ -70,9 +56,23 @@ def test_load_help_config_intermediate_format(monkeypatch):
 def test_load_help_config_legacy_format(monkeypatch):
     data = {"oldcmd": "ancienne description"}
 
-    monkeypatch.setattr("eldoria.json_tools.help_json.load_help_json", lambda: data)
+    monkeypatch.setattr(mod, "get_help_config", lambda: compile_help_config(data))
 
     help_infos, categories, cat_desc = load_help_config()
     assert help_infos == {"oldcmd": "ancienne description"}
     assert categories == {}
     assert cat_desc == {}
+
+
+def test_load_help_config_returns_mutable_copies_of_the_compiled_config(monkeypatch):
+    config = compile_help_config({"categories": {"Divers": {"description": "d", "commands": {"foo": "bar"}}}})
+    monkeypatch.setattr(mod, "get_help_config", lambda: config)
+
+    help_infos, categories, _ = load_help_config()
+    help_infos.pop("foo")
+    categories["Divers"].append("x")
+
+    # La version compilée (partagée) n'est pas modifiée
+    assert dict(config.help_infos) == {"foo": "bar"}
+    assert config.categories["Divers"] == ("foo",)
+    assert load_help_config()[0] == {"foo": "bar"}
@@ -0,0 +1,156 @@
+import json
+import logging
+import os
+
+import pytest
+
+from eldoria.json_tools import resources as mod
+
+
+def _compile(data):
+    return {"value": data.get("value", "default")}
+
+
+def _write(path, payload, *, bump: int = 0):
+    path.write_text(payload if isinstance(payload, str) else json.dumps(payload), encoding="utf-8")
+    # Garantit une date de modification différente même sur un système de fichiers à faible résolution
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump * 1_000_000_000))
+
+
+def _wait_reload(resource):
+    thread = resource._reload_thread
+    if thread is not None:
+        thread.join(timeout=5)
+
+
+@pytest.fixture
+def res(tmp_path):
+    return mod.JsonResource(tmp_path / "r.json", _compile, check_interval=0)
+
+
+def test_missing_file_compiles_defaults(res):
+    assert res.get() == {"value": "default"}
+    assert res.loads == 1
+    assert res.failures == 0
+
+
+def test_file_is_parsed_once_then_served_from_memory(res, monkeypatch):
+    _write(res.path, {"value": "a"})
+    first = res.get()
+
+    monkeypatch.setattr(mod, "read_json_object", lambda _p: (_ for _ in ()).throw(AssertionError("re-parsed")))
+    for _ in range(5):
+        assert res.get() is first
+    assert res.loads == 1
+
+
+def test_changed_file_is_reloaded_in_background(res):
+    _write(res.path, {"value": "a"})
+    assert res.get() == {"value": "a"}
+
+    _write(res.path, {"value": "bb"}, bump=1)
+    # La lecture qui détecte le changement sert encore l'ancienne version
+    assert res.get() == {"value": "a"}
+    _wait_reload(res)
+
+    assert res.get() == {"value": "bb"}
+    assert res.loads == 2
+
+
+def test_broken_reload_keeps_last_good_version(res, caplog):
+    _write(res.path, {"value": "a"})
+    assert res.get() == {"value": "a"}
+
+    _write(res.path, "{broken", bump=1)
+    with caplog.at_level(logging.WARNING):
+        res.get()
+        _wait_reload(res)
+
+    assert res.get() == {"value": "a"}
+    assert res.failures == 1
+    assert any("dernière version valide" in r.getMessage() for r in caplog.records)
+
+    # Le fichier fautif n'est pas relu en boucle ; une version corrigée est reprise
+    res.get()
+    _wait_reload(res)
+    assert res.failures == 1
+    _write(res.path, {"value": "c"}, bump=2)
+    res.get()
+    _wait_reload(res)
+    assert res.get() == {"value": "c"}
+
+
+def test_non_object_json_at_first_load_gives_defaults(res):
+    _write(res.path, [1, 2])
+
+    assert res.load() is False
+    assert res.get() == {"value": "default"}
+
+
+def test_shape_invalid_file_at_first_load_gives_defaults(tmp_path):
+    from eldoria.json_tools.help_json import compile_help_config
+
+    res = mod.JsonResource(tmp_path / "help.json", compile_help_config, check_interval=0)
+    # JSON valide, mais la compilation lève TypeError (catégorie qui n'est pas une liste de commandes)
+    _write(res.path, {"commands": {"ping": "Pong"}, "categories": {"x": 5}})
+
+    assert res.load() is False
+    assert res.get().help_infos == {}
+    assert res.failures == 1
+
+
+def test_shape_invalid_reload_keeps_last_good_version_and_is_not_retried(res, caplog, monkeypatch):
+    _write(res.path, {"value": "a"})
+    assert res.get() == {"value": "a"}
+
+    def _strict(data):
+        if not isinstance(data.get("value"), str):
+            raise TypeError("value doit être une chaîne")
+        return {"value": data["value"]}
+
+    monkeypatch.setattr(res, "compile", _strict)
+    _write(res.path, {"value": 5}, bump=1)
+    with caplog.at_level(logging.WARNING):
+        res.get()
+        _wait_reload(res)
+
+    assert res.get() == {"value": "a"}
+    assert res.failures == 1
+    assert sum("dernière version valide" in r.getMessage() for r in caplog.records) == 1
+
+    # Signature du fichier fautif mémorisée : aucun nouveau thread de rechargement
+    thread = res._reload_thread
+    res.get()
+    assert res._reload_thread is thread
+    assert res.failures == 1
+
+
+def test_mtime_is_checked_at_most_once_per_interval(res, monkeypatch):
+    _write(res.path, {"value": "a"})
+    res.check_interval = 3600
+    res.get()
+
+    monkeypatch.setattr(mod, "_signature", lambda _p: (_ for _ in ()).throw(AssertionError("stat called")))
+    assert res.get() == {"value": "a"}
+
+
+def test_preload_resources_loads_every_declared_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(mod, "RESOURCES_DIR", tmp_path)
+    monkeypatch.setattr(mod, "RESOURCE_MODULES", ())
+    monkeypatch.setattr(mod, "_RESOURCES", {})
+    _write(tmp_path / "ok.json", {"value": "x"})
+    _write(tmp_path / "bad.json", "{broken")
+
+    ok = mod.json_resource("ok.json", _compile)
+    mod.json_resource("bad.json", _compile)
+    assert mod.json_resource("ok.json", _compile) is ok
+
+    assert mod.preload_resources() == {"bad.json": False, "ok.json": True}
+    assert ok.get() == {"value": "x"}
+
+
+def test_preload_resources_imports_the_resource_modules():
+    loaded = mod.preload_resources()
+
+    assert {"duels.json", "help.json", "welcome_message.json"} <= set(loaded)
@@ -1,31 +1,59 @@
 import json
 
-from eldoria.json_tools.welcome_json import load_welcome_json
+import pytest
 
+from eldoria.json_tools import welcome_json as mod
+from eldoria.json_tools.welcome_json import compile_welcome_pool
 
-def test_load_welcome_json_file_not_found():
-    assert load_welcome_json(path="does_not_exist_welcome_message.json") == {}
 
-
-def test_load_welcome_json_valid_dict(tmp_path):
-    data = {"packs": []}
+@pytest.fixture
+def welcome_file(monkeypatch, tmp_path):
     p = tmp_path / "welcome_message.json"
-    p.write_text(json.dumps(data), encoding="utf-8")
+    monkeypatch.setattr(mod._WELCOME, "path", p)
+    mod._WELCOME.reset()
+    yield p
+    mod._WELCOME.reset()
 
-    assert load_welcome_json(path=str(p)) == data
 
+def test_get_welcome_pool_file_not_found_gives_empty_pool(welcome_file):
+    assert mod.get_welcome_pool().keys == ()
 
-def test_load_welcome_json_returns_empty_when_json_is_not_dict(tmp_path):
-    # Si le JSON n'est pas un dict (liste, str, int...), la fonction doit renvoyer {}
-    p = tmp_path / "welcome_message.json"
-    p.write_text(json.dumps(["not", "a", "dict"]), encoding="utf-8")
 
-    assert load_welcome_json(path=str(p)) == {}
+def test_get_welcome_pool_valid_file(welcome_file):
+    data = {"packs": [{"title": "T", "messages": {"w01": "Salut {user}"}, "emojis": ["🎉"]}]}
+    welcome_file.write_text(json.dumps(data), encoding="utf-8")
 
+    pool = mod.get_welcome_pool()
+    assert pool.keys == ("w01",)
+    assert pool.messages["w01"] == mod.WelcomeMessage(title="T", text="Salut {user}", emojis=("🎉",))
 
-def test_load_welcome_json_invalid_json_returns_empty(tmp_path):
-    # JSON invalide -> json.JSONDecodeError -> except Exception -> {}
-    p = tmp_path / "welcome_message.json"
-    p.write_text("{not valid json", encoding="utf-8")
 
-    assert load_welcome_json(path=str(p)) == {}
+def test_get_welcome_pool_empty_when_json_is_not_dict(welcome_file):
+    # Si le JSON n'est pas un dict (liste, str, int...), le pool est vide
+    welcome_file.write_text(json.dumps(["not", "a", "dict"]), encoding="utf-8")
+
+    assert mod.get_welcome_pool().keys == ()
+
+
+def test_get_welcome_pool_invalid_json_gives_empty_pool(welcome_file):
+    welcome_file.write_text("{not valid json", encoding="utf-8")
+
+    assert mod.get_welcome_pool().keys == ()
+
+
+def test_compile_welcome_pool_skips_invalid_packs_and_messages():
+    pool = compile_welcome_pool(
+        {
+            "packs": [
+                "not a dict",
+                {"title": "  ", "messages": {"a": "x"}},
+                {"title": "Ok", "messages": {}},
+                {"title": " T ", "messages": {"k1": "M1", "k2": "   ", 3: "M3"}, "emojis": ["🎉", "", 1]},
+            ]
+        }
+    )
+
+    assert pool.keys == ("k1",)
+    assert pool.messages["k1"] == mod.WelcomeMessage(title="T", text="M1", emojis=("🎉",))
+    with pytest.raises(TypeError):
+        pool.messages["x"] = pool.messages["k1"]  # type: ignore[index]
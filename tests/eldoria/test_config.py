@@ -57,3 +57,16 @@ def test_config_import_raises_when_save_enabled_but_missing_vars(monkeypatch):
 
     with pytest.raises(IncompleteFeatureConfig):
         _load_config_fresh(monkeypatch, "cfg_b")
+
+
+@pytest.mark.parametrize(("raw", "expected"), [(None, 250), ("0", 0), ("-5", 0), ("100", 100)])
+def test_loop_watchdog_threshold_defaults_and_bounds(monkeypatch, raw, expected):
+    monkeypatch.setenv("DISCORD_TOKEN", "x")
+    if raw is None:
+        monkeypatch.delenv("LOOP_WATCHDOG_MS", raising=False)
+    else:
+        monkeypatch.setenv("LOOP_WATCHDOG_MS", raw)
+
+    mod = _load_config_fresh(monkeypatch, "cfg_watchdog")
+
+    assert mod.LOOP_WATCHDOG_MS == expected
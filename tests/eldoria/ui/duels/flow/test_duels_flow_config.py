@@ -84,9 +84,10 @@ def test_stake_xp_view_builds_buttons_disabled_based_on_allowed_stakes(monkeypat
 
     assert labels == ["10", "20", "30"]
     assert disabled == [False, True, False]
+    assert [b.custom_id for b in view.children] == ["duel:777:stake:10", "duel:777:stake:20", "duel:777:stake:30"]
 
 # -----------------------------
-# StakeXpView callback: succès
+# handle_stake_choice: succès
 # -----------------------------
 @pytest.mark.asyncio
 async def test_stake_xp_view_click_success_flow(monkeypatch):
@@ -133,10 +134,7 @@ async def test_stake_xp_view_click_success_flow(monkeypatch):
     inter.channel = None
     inter.message = None
 
-    view = M.StakeXpView(bot=bot, duel_id=777)
-    button = view.children[0]
-
-    await button.callback(inter)  # type: ignore[misc]
+    await M.handle_stake_choice(inter, bot, 777, "10")
 
     assert inter.response.deferred is True
     assert duel.configure_calls == [{"duel_id": 777, "stake_xp": 10}]
@@ -162,7 +160,7 @@ async def test_stake_xp_view_click_success_flow(monkeypatch):
     assert inter.original_edits[-1]["view"] is None
 
 # -----------------------------
-# StakeXpView callback: erreurs
+# handle_stake_choice: erreurs
 # -----------------------------
 @pytest.mark.asyncio
 async def test_stake_xp_view_click_configure_raises_duel_error(monkeypatch):
@@ -187,10 +185,7 @@ async def test_stake_xp_view_click_configure_raises_duel_error(monkeypatch):
 
     inter = FakeInteraction(user=FakeUser(42))
 
-    view = M.StakeXpView(bot=bot, duel_id=777)
-    button = view.children[0]
-
-    await button.callback(inter)  # type: ignore[misc]
+    await M.handle_stake_choice(inter, bot, 777, "10")
 
     assert duel.configure_calls == [{"duel_id": 777, "stake_xp": 10}]
     assert inter.original_edits
@@ -225,10 +220,7 @@ async def test_stake_xp_view_click_send_invite_raises_duel_error(monkeypatch):
 
     inter = FakeInteraction(user=FakeUser(42))
 
-    view = M.StakeXpView(bot=bot, duel_id=777)
-    button = view.children[0]
-
-    await button.callback(inter)  # type: ignore[misc]
+    await M.handle_stake_choice(inter, bot, 777, "10")
 
     assert len(channel.sent) == 1
     msg: FakeMessage = channel.sent[0]["message"]
@@ -269,10 +261,7 @@ async def test_stake_xp_view_click_member_lookup_value_error(monkeypatch):
 
     inter = FakeInteraction(user=FakeUser(42))
 
-    view = M.StakeXpView(bot=bot, duel_id=777)
-    button = view.children[0]
-
-    await button.callback(inter)  # type: ignore[misc]
+    await M.handle_stake_choice(inter, bot, 777, "10")
 
     assert len(channel.sent) == 1
     msg: FakeMessage = channel.sent[0]["message"]
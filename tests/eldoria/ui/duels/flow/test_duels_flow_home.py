@@ -83,9 +83,11 @@ def test_home_view_creates_buttons_from_games_and_truncates_label(monkeypatch):
     assert labels[0] == "RPS"
     assert labels[1] == ("X" * 80)  # tronqué à 80
     assert labels[2] == "no_name"  # fallback sur game_key
+    assert [b.custom_id for b in view.children] == ["duel:777:game:rps", "duel:777:game:long", "duel:777:game:no_name"]
+    assert view.timeout is None
 
 # ------------------------------------------------------------
-# HomeView click success
+# handle_game_choice success
 # ------------------------------------------------------------
 @pytest.mark.asyncio
 async def test_home_view_click_success_builds_stake_embed_and_edits_original(monkeypatch):
@@ -116,11 +118,8 @@ async def test_home_view_click_success_builds_stake_embed_and_edits_original(mon
 
     inter = FakeInteraction(user=FakeUser(42))
 
-    view = M.HomeView(bot=bot, duel_id=777)
-
-    # bouton 0 => game_key "rps"
-    btn0 = view.children[0]
-    await btn0.callback(inter)  # type: ignore[misc]
+    # bouton 0 => custom_id "duel:777:game:rps"
+    await M.handle_game_choice(inter, bot, 777, "rps")
 
     assert inter.response.deferred is True
     assert duel.configure_game_type_calls == [{"duel_id": 777, "gk": "rps"}]
@@ -132,7 +131,7 @@ async def test_home_view_click_success_builds_stake_embed_and_edits_original(mon
     assert last["view"] == ("STAKE_VIEW", 777, bot)
 
 # ------------------------------------------------------------
-# HomeView click DuelError
+# handle_game_choice DuelError
 # ------------------------------------------------------------
 @pytest.mark.asyncio
 async def test_home_view_click_duel_error_shows_error_message(monkeypatch):
@@ -154,10 +153,7 @@ async def test_home_view_click_duel_error_shows_error_message(monkeypatch):
     )
 
     inter = FakeInteraction(user=FakeUser(42))
-    view = M.HomeView(bot=bot, duel_id=777)
-    btn = view.children[0]
-
-    await btn.callback(inter)  # type: ignore[misc]
+    await M.handle_game_choice(inter, bot, 777, "rps")
 
     assert inter.response.deferred is True
     assert duel.configure_game_type_calls == [{"duel_id": 777, "gk": "rps"}]
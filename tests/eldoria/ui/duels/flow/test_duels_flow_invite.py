@@ -85,7 +85,7 @@ async def test_build_invite_duels_embed_builds_fields_footer_and_files(monkeypat
     assert files == ["FILE"]
 
 # ------------------------------------------------------------
-# InviteView.accept
+# handle_accept
 # ------------------------------------------------------------
 @pytest.mark.asyncio
 async def test_invite_view_accept_duel_error_sends_ephemeral(monkeypatch):
@@ -101,9 +101,7 @@ async def test_invite_view_accept_duel_error_sends_ephemeral(monkeypatch):
 
     inter = FakeInteraction(user=FakeUser(42))
     # FakeInteraction a déjà response/followup
-    view = M.InviteView(bot=bot, duel_id=777)
-
-    await view.accept(None, inter)  # type: ignore[arg-type]
+    await M.handle_accept(inter, bot, 777, None)
 
     assert inter.response.deferred is True
     assert duel.accept_calls == [{"duel_id": 777, "user_id": 42}]
@@ -133,8 +131,7 @@ async def test_invite_view_accept_render_fails_fallback_message(monkeypatch):
     inter = FakeInteraction(user=FakeUser(42))
     inter.message = _make_message(content="invite content")
 
-    view = M.InviteView(bot=bot, duel_id=777)
-    await view.accept(None, inter)  # type: ignore[arg-type]
+    await M.handle_accept(inter, bot, 777, None)
 
     assert inter.followup.sent
     last = inter.followup.sent[-1]
@@ -164,8 +161,7 @@ async def test_invite_view_accept_success_edits_invite_message(monkeypatch):
     inter = FakeInteraction(user=FakeUser(42))
     inter.message = _make_message(content="hello")
 
-    view = M.InviteView(bot=bot, duel_id=777)
-    await view.accept(None, inter)  # type: ignore[arg-type]
+    await M.handle_accept(inter, bot, 777, None)
 
     assert inter.response.deferred is True
     assert duel.accept_calls == [{"duel_id": 777, "user_id": 42}]
@@ -173,7 +169,7 @@ async def test_invite_view_accept_success_edits_invite_message(monkeypatch):
     assert inter.message.edits == [{"content": "hello", "embed": "EMBED", "view": "VIEW", "files": None}]
 
 # ------------------------------------------------------------
-# InviteView.refuse
+# handle_refuse
 # ------------------------------------------------------------
 @pytest.mark.asyncio
 async def test_invite_view_refuse_duel_error_sends_ephemeral(monkeypatch):
@@ -187,9 +183,7 @@ async def test_invite_view_refuse_duel_error_sends_ephemeral(monkeypatch):
     monkeypatch.setattr(M, "require_user_id", lambda *, interaction: 42)
 
     inter = FakeInteraction(user=FakeUser(42))
-    view = M.InviteView(bot=bot, duel_id=777)
-
-    await view.refuse(None, inter)  # type: ignore[arg-type]
+    await M.handle_refuse(inter, bot, 777, None)
 
     assert inter.response.deferred is True
     assert duel.refuse_calls == [{"duel_id": 777, "user_id": 42}]
@@ -224,9 +218,7 @@ async def test_invite_view_refuse_member_lookup_value_error(monkeypatch):
     )
 
     inter = FakeInteraction(user=FakeUser(42))
-    view = M.InviteView(bot=bot, duel_id=777)
-
-    await view.refuse(None, inter)  # type: ignore[arg-type]
+    await M.handle_refuse(inter, bot, 777, None)
 
     assert inter.original_edits
     assert inter.original_edits[-1]["content"] == "Un des participants n'a pas pu être trouvé."
@@ -273,12 +265,17 @@ async def test_invite_view_refuse_success_fetches_message_and_edits(monkeypatch)
     monkeypatch.setattr(M, "get_text_or_thread_channel", fake_get_channel)
 
     inter = FakeInteraction(user=FakeUser(42))
-    view = M.InviteView(bot=bot, duel_id=777)
-
-    await view.refuse(None, inter)  # type: ignore[arg-type]
+    await M.handle_refuse(inter, bot, 777, None)
 
     assert duel.refuse_calls == [{"duel_id": 777, "user_id": 42}]
     assert channel.fetched == [444]
 
     # message édité
-    assert channel.message.edits == [{"content": "", "embed": "REFUSE_EMBED", "view": None, "files": None}]
\ No newline at end of file
+    assert channel.message.edits == [{"content": "", "embed": "REFUSE_EMBED", "view": None, "files": None}]
+
+def test_invite_view_buttons_are_routed_by_custom_id():
+    view = M.InviteView(bot=FakeBot(FakeDuelService()), duel_id=777)
+
+    assert [b.custom_id for b in view.children] == ["duel:777:accept", "duel:777:refuse"]
+    assert view.timeout is None
+    assert view.is_dispatchable() is False
@@ -20,3 +20,16 @@ def test_register_calls_register_renderer(monkeypatch):
     M.register()
 
     assert calls == [("RPS_KEY", M.render_rps)]
+
+
+def test_register_registers_rps_button_handler(monkeypatch):
+    actions: list[tuple[str, object]] = []
+
+    import eldoria.ui.duels.dispatcher as dispatcher
+    import eldoria.ui.duels.registry as reg
+    monkeypatch.setattr(reg, "register_renderer", lambda *_a: None)
+    monkeypatch.setattr(dispatcher, "register_action", lambda action, handler: actions.append((action, handler)))
+
+    M.register()
+
+    assert actions == [("rps", M.handle_rps_move)]
@@ -6,8 +6,22 @@ from eldoria.ui.duels.games.rps import view as M
 from tests._fakes import FakeBot, FakeDuelError, FakeDuelService, FakeInteraction, FakeUser
 
 
+def test_rps_view_builds_one_routed_button_per_move():
+    bot = FakeBot(FakeDuelService())
+
+    v = M.RpsView(bot=bot, duel_id=777)
+
+    assert [b.label for b in v.children] == ["🪨 Pierre", "📄 Feuille", "✂️ Ciseaux"]
+    assert [b.custom_id for b in v.children] == [
+        "duel:777:rps:ROCK",
+        "duel:777:rps:PAPER",
+        "duel:777:rps:SCISSORS",
+    ]
+    assert v.timeout is None
+
+
 @pytest.mark.asyncio
-async def test_play_success_calls_apply_snapshot(monkeypatch):
+async def test_handle_rps_move_success_calls_apply_snapshot(monkeypatch):
     monkeypatch.setattr(M, "DuelError", FakeDuelError)
     monkeypatch.setattr(M, "duel_error_message", lambda e: f"ERR:{e}")
     monkeypatch.setattr(M, "require_user_id", lambda *, interaction: 42)
@@ -21,21 +35,20 @@ async def test_play_success_calls_apply_snapshot(monkeypatch):
 
     duel = FakeDuelService()
     bot = FakeBot(duel)
-
-    v = M.RpsView(bot=bot, duel_id=777)
-
     inter = FakeInteraction(user=FakeUser(42))
 
-    await v._play(inter, move="ROCK")
+    await M.handle_rps_move(inter, bot, 777, "ROCK")
 
     assert inter.response.deferred is True
     assert duel.play_game_action_calls == [
         {"duel_id": 777, "user_id": 42, "action": {"move": "ROCK"}}
     ]
     assert applied and applied[0]["snapshot"] == duel.snapshot_play_game_action
+    assert applied[0]["bot"] is bot
+
 
 @pytest.mark.asyncio
-async def test_play_duel_error_sends_ephemeral_and_does_not_apply(monkeypatch):
+async def test_handle_rps_move_duel_error_sends_ephemeral_and_does_not_apply(monkeypatch):
     monkeypatch.setattr(M, "DuelError", FakeDuelError)
     monkeypatch.setattr(M, "duel_error_message", lambda e: f"ERR:{e}")
     monkeypatch.setattr(M, "require_user_id", lambda *, interaction: 42)
@@ -48,67 +61,11 @@ async def test_play_duel_error_sends_ephemeral_and_does_not_apply(monkeypatch):
     duel = FakeDuelService()
     duel.raise_on_play_game_action = FakeDuelError("nope")
     bot = FakeBot(duel)
-
-    v = M.RpsView(bot=bot, duel_id=777)
     inter = FakeInteraction(user=FakeUser(42))
 
-    await v._play(inter, move="ROCK")
+    await M.handle_rps_move(inter, bot, 777, "ROCK")
 
     assert inter.followup.sent
     last = inter.followup.sent[-1]
     assert last["content"] == "ERR:nope"
     assert last["ephemeral"] is True
-
-@pytest.mark.asyncio
-async def test_rock_calls_play_with_rock(monkeypatch):
-    monkeypatch.setattr(M, "RPS_MOVE_ROCK", "ROCK")
-
-    calls: list[str] = []
-
-    async def fake_play(interaction, move):
-        calls.append(move)
-
-    duel = FakeDuelService()
-    bot = FakeBot(duel)
-    v = M.RpsView(bot=bot, duel_id=1)
-
-    monkeypatch.setattr(v, "_play", fake_play)
-
-    await v.rock(None, FakeInteraction(user=FakeUser(1)))  # type: ignore[arg-type]
-    assert calls == ["ROCK"]
-
-@pytest.mark.asyncio
-async def test_paper_calls_play_with_paper(monkeypatch):
-    monkeypatch.setattr(M, "RPS_MOVE_PAPER", "PAPER")
-
-    calls: list[str] = []
-
-    async def fake_play(interaction, move):
-        calls.append(move)
-
-    duel = FakeDuelService()
-    bot = FakeBot(duel)
-    v = M.RpsView(bot=bot, duel_id=1)
-
-    monkeypatch.setattr(v, "_play", fake_play)
-
-    await v.paper(None, FakeInteraction(user=FakeUser(1)))  # type: ignore[arg-type]
-    assert calls == ["PAPER"]
-
-@pytest.mark.asyncio
-async def test_scissors_calls_play_with_scissors(monkeypatch):
-    monkeypatch.setattr(M, "RPS_MOVE_SCISSORS", "SCISSORS")
-
-    calls: list[str] = []
-
-    async def fake_play(interaction, move):
-        calls.append(move)
-
-    duel = FakeDuelService()
-    bot = FakeBot(duel)
-    v = M.RpsView(bot=bot, duel_id=1)
-
-    monkeypatch.setattr(v, "_play", fake_play)
-
-    await v.scissors(None, FakeInteraction(user=FakeUser(1)))  # type: ignore[arg-type]
-    assert calls == ["SCISSORS"]
\ No newline at end of file
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+
+from eldoria.ui.duels import dispatcher as M
+from tests._fakes import FakeBot, FakeInteraction, FakeUser
+
+
+@pytest.fixture(autouse=True)
+def _isolated_handlers(monkeypatch):
+    monkeypatch.setattr(M, "_HANDLERS", {})
+
+
+def test_build_custom_id_with_and_without_arg():
+    assert M.build_custom_id(12, "accept") == "duel:12:accept"
+    assert M.build_custom_id(12, "stake", 50) == "duel:12:stake:50"
+
+
+def test_build_custom_id_is_capped_to_100_chars():
+    assert len(M.build_custom_id(1, "game", "x" * 200)) == 100
+
+
+@pytest.mark.parametrize(
+    ("custom_id", "expected"),
+    [
+        ("duel:12:accept", (12, "accept", None)),
+        ("duel:12:rps:ROCK", (12, "rps", "ROCK")),
+        ("duel:12:game:a:b", (12, "game", "a:b")),
+        ("tv:go:add", None),
+        ("duel:abc:accept", None),
+        ("duel:12", None),
+        ("duel:12:", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_custom_id(custom_id, expected):
+    assert M.parse_custom_id(custom_id) == expected
+
+
+@pytest.mark.asyncio
+async def test_dispatch_routes_to_registered_handler():
+    calls: list[tuple] = []
+
+    async def handler(interaction, bot, duel_id, arg):
+        calls.append((interaction, bot, duel_id, arg))
+
+    M.register_action("rps", handler)
+    bot = FakeBot()
+    inter = FakeInteraction(user=FakeUser(1), data={"custom_id": "duel:7:rps:PAPER"})
+
+    handled = await M.dispatch_duel_interaction(inter, bot)
+
+    assert handled is True
+    assert calls == [(inter, bot, 7, "PAPER")]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_ignores_foreign_custom_ids():
+    inter = FakeInteraction(user=FakeUser(1), data={"custom_id": "ticket:create"})
+
+    assert await M.dispatch_duel_interaction(inter, FakeBot()) is False
+    assert await M.dispatch_duel_interaction(FakeInteraction(user=FakeUser(1)), FakeBot()) is False
+
+
+@pytest.mark.asyncio
+async def test_dispatch_unknown_action_is_consumed_without_error():
+    inter = FakeInteraction(user=FakeUser(1), data={"custom_id": "duel:7:unknown"})
+
+    assert await M.dispatch_duel_interaction(inter, FakeBot()) is True
+
+
+@pytest.mark.asyncio
+async def test_dispatch_logs_handler_errors(caplog):
+    async def boom(*_a):
+        raise RuntimeError("boom")
+
+    M.register_action("accept", boom)
+    inter = FakeInteraction(user=FakeUser(1), data={"custom_id": "duel:7:accept"})
+
+    with caplog.at_level("ERROR"):
+        assert await M.dispatch_duel_interaction(inter, FakeBot()) is True
+
+    assert "duel_id=7" in caplog.text
+
+
+def test_components_view_is_not_dispatchable_and_has_no_timeout():
+    view = M.DuelComponentsView()
+    view.add_button(label="A", custom_id="duel:1:accept", disabled=True)
+
+    assert view.timeout is None
+    assert view.is_dispatchable() is False
+    assert view.children[0].custom_id == "duel:1:accept"
+    assert view.children[0].disabled is True
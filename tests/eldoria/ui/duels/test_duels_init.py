@@ -27,3 +27,21 @@ def test_init_duel_ui_imports_rps_and_calls_register(monkeypatch):
     init_duel_ui()
 
     assert calls == ["register"]
+
+
+def test_init_duel_ui_registers_flow_button_handlers(monkeypatch):
+    import eldoria.ui.duels.dispatcher as dispatcher
+    from eldoria.ui.duels.flow import config, home, invite
+
+    fake_rps = ModuleType("eldoria.ui.duels.games.rps")
+    fake_rps.register = lambda: None  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "eldoria.ui.duels.games.rps", fake_rps)
+    monkeypatch.setattr(games_pkg, "rps", fake_rps, raising=False)
+    monkeypatch.setattr(dispatcher, "_HANDLERS", {})
+
+    init_duel_ui()
+
+    assert dispatcher.require_action("game") is home.handle_game_choice
+    assert dispatcher.require_action("stake") is config.handle_stake_choice
+    assert dispatcher.require_action("accept") is invite.handle_accept
+    assert dispatcher.require_action("refuse") is invite.handle_refuse
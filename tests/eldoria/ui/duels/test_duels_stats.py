@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import discord  # type: ignore
+import pytest
+
+from eldoria.ui.duels import stats as M
+from tests._fakes import FakeAvatar, FakeBot, FakeGuild, FakeMember
+
+
+def make_user(display_name: str):
+    return type(
+        "UserStub",
+        (),
+        {"display_name": display_name, "display_avatar": FakeAvatar("https://cdn/a.png")},
+    )()
+
+
+@pytest.fixture(autouse=True)
+def _no_images(monkeypatch):
+    monkeypatch.setattr(M, "decorate", lambda e, t, b: e)
+    monkeypatch.setattr(M, "common_files", lambda t, b: ["FILES"])
+
+
+@pytest.mark.asyncio
+async def test_build_duel_stats_embed_with_history():
+    stats = {"wins": 3, "losses": 1, "draws": 0, "expired": 2, "xp_won": 60, "xp_lost": 10, "played": 4, "xp_net": 50}
+
+    embed, files = await M.build_duel_stats_embed(user=make_user("Alice"), stats=stats)
+
+    assert isinstance(embed, discord.Embed)
+    assert embed.author == {"name": "Alice", "icon_url": "https://cdn/a.png"}
+    assert "Victoires : **3**" in embed.fields[0]["value"]
+    assert "Expirés : **2**" in embed.fields[0]["value"]
+    assert "Solde : **+50 XP**" in embed.fields[1]["value"]
+    assert embed.fields[2]["value"] == "**75 %** sur 4 duel(s)"
+    assert files == ["FILES"]
+
+
+@pytest.mark.asyncio
+async def test_build_duel_stats_embed_without_history():
+    embed, _files = await M.build_duel_stats_embed(user=make_user("Bob"), stats={"played": 0})
+
+    assert embed.description == "Aucun duel joué pour le moment."
+    assert embed.fields == []
+
+
+@pytest.mark.asyncio
+async def test_build_duel_leaderboard_embed_lists_members_with_rank_offset():
+    guild = FakeGuild(42)
+    guild.add_member(FakeMember(1, display_name="Alice"))
+    bot = FakeBot(guild=guild)
+
+    items = [(1, 5, 1, 2, 80, 20), (2, 3, 3, 0, 30, 40)]
+    embed, _files = await M.build_duel_leaderboard_embed(items, 1, 3, 42, bot)
+
+    lines = embed.fields[0]["value"].splitlines()
+    assert lines[0] == "**11.** Alice — **5V** / 1D / 2N — +60 XP"
+    assert lines[1] == "**12.** ID 2 — **3V** / 3D / 0N — -10 XP"
+    assert embed.footer["text"] == "Page 2/3"
+
+
+@pytest.mark.asyncio
+async def test_build_duel_leaderboard_embed_empty():
+    embed, _files = await M.build_duel_leaderboard_embed([], 0, 0, 42, FakeBot())
+
+    assert embed.fields[0]["name"] == "Aucun duel"
+    assert embed.footer["text"] == "Page 1/1"
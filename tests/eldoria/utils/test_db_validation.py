@@ -137,3 +137,33 @@ async def test_is_valid_sqlite_db_cleanup_retries_on_permission_error(tmp_path,
     assert await mod.is_valid_sqlite_db(att) is True
     assert calls["unlink"] == 3
     assert calls["sleep"] == 2
+
+
+@pytest.mark.asyncio
+async def test_is_valid_sqlite_db_accepts_gzipped_db_and_cleans_both_files(tmp_path, monkeypatch, mod):
+    import gzip
+    import sqlite3
+
+    db = tmp_path / "real.db"
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE t (x)")
+    conn.commit()
+    conn.close()
+
+    att = make_attachment(filename="Eldoria_20260213_abc.db.gz", payload=gzip.compress(db.read_bytes()))
+    temp_file = tmp_path / "upload_tmp"
+    monkeypatch.setattr(mod.tempfile, "NamedTemporaryFile", lambda delete=False: make_tmp(str(temp_file)))
+
+    assert await mod.is_valid_sqlite_db(att) is True
+    assert not temp_file.exists()
+    assert not (tmp_path / "upload_tmp.db").exists()
+
+
+@pytest.mark.asyncio
+async def test_is_valid_sqlite_db_rejects_corrupt_gzip(tmp_path, monkeypatch, mod):
+    att = make_attachment(filename="backup.db.gz", payload=b"not gzip at all")
+    temp_file = tmp_path / "upload_tmp"
+    monkeypatch.setattr(mod.tempfile, "NamedTemporaryFile", lambda delete=False: make_tmp(str(temp_file)))
+
+    assert await mod.is_valid_sqlite_db(att) is False
+    assert not temp_file.exists()
@@ -7,6 +7,7 @@ from eldoria.utils.discord_utils import (
     extract_id_from_link,
     find_channel_id,
     get_member_by_id_or_raise,
+    get_partial_message,
     get_text_or_thread_channel,
     require_guild,
     require_user_id,
@@ -267,3 +268,25 @@ async def test_get_text_or_thread_channel_raises_when_not_messageable_type():
     bot = BotStub(channel_by_id={10: DummyMessageable()})
     with pytest.raises(ChannelRequired):
         await get_text_or_thread_channel(bot, 10)
+
+
+# ------------------------------------------------------------
+# get_partial_message
+# ------------------------------------------------------------
+
+
+def test_get_partial_message_builds_from_ids_without_fetch():
+    from tests._fakes import FakeBot
+
+    bot = FakeBot()
+
+    async def no_fetch(*_a, **_k):
+        raise AssertionError("aucun fetch attendu")
+
+    bot.fetch_channel = no_fetch
+
+    msg = get_partial_message(bot, 10, 55)
+
+    assert msg.id == 55
+    assert msg.channel.id == 10
+    assert msg is bot.partial_channels[10].messages[55]
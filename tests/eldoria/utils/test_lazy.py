@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+
+from eldoria.utils.lazy import LazyImport, lazy_import
+
+
+def test_lazy_import_resolves_on_first_call():
+    ref = lazy_import("json", "dumps")
+
+    assert isinstance(ref, LazyImport)
+    assert not ref.is_loaded
+    assert "non chargé" in repr(ref)
+
+    assert ref({"a": 1}) == '{"a": 1}'
+    assert ref.is_loaded
+
+
+def test_lazy_import_delegates_attribute_access():
+    ref = lazy_import("json", "JSONDecoder")
+
+    assert ref.__name__ == "JSONDecoder"
+    assert ref.is_loaded
+
+
+def test_lazy_import_unknown_target_raises_on_use_only():
+    ref = lazy_import("json", "does_not_exist")
+
+    with pytest.raises(AttributeError):
+        ref()
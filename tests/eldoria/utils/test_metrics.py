@@ -0,0 +1,217 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from eldoria.utils import metrics
+
+
+def test_counter_counts_per_label_set():
+    counter = metrics.Counter("t_total", "Test.", ("kind",))
+
+    counter.inc(kind="a")
+    counter.inc(2, kind="a")
+    counter.inc(kind="b")
+
+    assert counter.value(kind="a") == 3
+    assert counter.value(kind="b") == 1
+    assert counter.value(kind="c") == 0
+
+
+def test_counter_rejects_unknown_labels():
+    counter = metrics.Counter("t_total", "Test.", ("kind",))
+
+    with pytest.raises(ValueError):
+        counter.inc(other="a")
+
+
+def test_histogram_quantile_interpolates_within_bucket():
+    histogram = metrics.Histogram("t_seconds", "Test.", buckets=(0.01, 0.1, 1.0))
+
+    for _ in range(90):
+        histogram.observe(0.005)
+    for _ in range(10):
+        histogram.observe(0.5)
+
+    assert histogram.count() == 100
+    assert histogram.quantile(0.5) == pytest.approx(0.01 * 50 / 90)
+    assert 0.1 < histogram.quantile(0.99) <= 1.0
+    assert histogram.quantile(0.99, **{}) == histogram.quantile(0.99)
+
+
+def test_histogram_quantile_without_observation_is_none():
+    histogram = metrics.Histogram("t_seconds", "Test.", ("h",))
+
+    assert histogram.quantile(0.99, h="x") is None
+
+
+def test_registry_renders_prometheus_text():
+    registry = metrics.MetricsRegistry()
+    registry.counter("app_events_total", "Événements.", ("event",)).inc(event='on_"msg"')
+    histogram = registry.histogram("app_seconds", "Durées.", buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(2.0)
+
+    text = registry.render_prometheus()
+
+    assert "# TYPE app_events_total counter" in text
+    assert 'app_events_total{event="on_\\"msg\\""} 1' in text
+    assert "# TYPE app_seconds histogram" in text
+    assert 'app_seconds_bucket{le="0.1"} 1' in text
+    assert 'app_seconds_bucket{le="1"} 1' in text
+    assert 'app_seconds_bucket{le="+Inf"} 2' in text
+    assert "app_seconds_sum 2.05" in text
+    assert "app_seconds_count 2" in text
+
+
+def test_registry_rejects_same_name_with_other_type():
+    registry = metrics.MetricsRegistry()
+    registry.counter("x", "X.")
+
+    with pytest.raises(ValueError):
+        registry.gauge("x", "X.")
+
+
+def test_collectors_run_before_export_and_errors_are_ignored():
+    registry = metrics.MetricsRegistry()
+    gauge = registry.gauge("app_guilds", "Guilds.")
+
+    def broken():
+        raise RuntimeError("boom")
+
+    registry.register_collector(broken)
+    registry.register_collector(lambda: gauge.set(3))
+
+    assert "app_guilds 3" in registry.render_prometheus()
+
+
+@pytest.mark.asyncio
+async def test_timed_event_counts_calls_errors_and_duration():
+    @metrics.timed_event("on_test")
+    async def handler(fail):
+        if fail:
+            raise RuntimeError("boom")
+
+    await handler(False)
+    with pytest.raises(RuntimeError):
+        await handler(True)
+
+    name = handler.__qualname__
+    assert metrics.EVENTS_TOTAL.value(event="on_test", handler=name) == 2
+    assert metrics.EVENT_ERRORS_TOTAL.value(event="on_test", handler=name) == 1
+    assert metrics.EVENT_SECONDS.count(event="on_test", handler=name) == 2
+
+
+@pytest.mark.asyncio
+async def test_timed_loop_records_status():
+    @metrics.timed_loop("test_loop")
+    async def body(fail):
+        if fail:
+            raise RuntimeError("boom")
+        return "done"
+
+    assert await body(False) == "done"
+    with pytest.raises(RuntimeError):
+        await body(True)
+
+    assert metrics.LOOP_ITERATIONS_TOTAL.value(loop="test_loop", status="ok") == 1
+    assert metrics.LOOP_ITERATIONS_TOTAL.value(loop="test_loop", status="error") == 1
+    assert metrics.LOOP_SECONDS.count(loop="test_loop") == 2
+
+
+@pytest.mark.asyncio
+async def test_instrument_service_wraps_public_sync_and_async_methods():
+    def ping(self):
+        return "pong"
+
+    async def aping(self):
+        return "apong"
+
+    def fail(self):
+        raise ValueError("boom")
+
+    def _private(self):
+        return "hidden"
+
+    Demo = metrics.instrument_service("demo")(
+        type("Demo", (), {"ping": ping, "aping": aping, "fail": fail, "_private": _private})
+    )
+
+    demo = Demo()
+    assert demo.ping() == "pong"
+    assert await demo.aping() == "apong"
+    assert demo._private() == "hidden"
+    with pytest.raises(ValueError):
+        demo.fail()
+
+    assert metrics.SERVICE_CALLS_TOTAL.value(service="demo", method="ping", status="ok") == 1
+    assert metrics.SERVICE_CALLS_TOTAL.value(service="demo", method="aping", status="ok") == 1
+    assert metrics.SERVICE_CALLS_TOTAL.value(service="demo", method="fail", status="error") == 1
+    assert ("demo", "_private") not in {
+        (labels["service"], labels["method"]) for labels in metrics.SERVICE_SECONDS.label_sets()
+    }
+
+
+def test_command_started_and_finished_record_duration():
+    ctx = SimpleNamespace(command=SimpleNamespace(qualified_name="xp status"))
+
+    metrics.command_started(ctx)
+    metrics.command_finished(ctx, "ok")
+
+    assert metrics.COMMANDS_TOTAL.value(command="xp status", status="ok") == 1
+    assert metrics.COMMAND_SECONDS.count(command="xp status") == 1
+
+
+def test_command_finished_without_start_only_counts():
+    ctx = SimpleNamespace(command=None)
+
+    metrics.command_finished(ctx, "error")
+
+    assert metrics.COMMANDS_TOTAL.value(command="inconnue", status="error") == 1
+    assert metrics.COMMAND_SECONDS.label_sets() == []
+
+
+def test_pending_commands_are_bounded(monkeypatch):
+    monkeypatch.setattr(metrics, "_MAX_PENDING_COMMANDS", 3)
+    contexts = [SimpleNamespace(command=SimpleNamespace(name=f"c{i}")) for i in range(5)]
+
+    for ctx in contexts:
+        metrics.command_started(ctx)
+
+    assert len(metrics._PENDING_COMMANDS) == 3
+
+
+def test_summarize_lists_rates_and_quantiles():
+    metrics.EVENT_SECONDS.observe(0.004, event="on_message", handler="Core.on_message")
+
+    lines = metrics.summarize()
+
+    assert lines[0] == "Événements :"
+    assert "on_message / Core.on_message" in lines[1]
+    assert "p99" in lines[1]
+
+
+@pytest.mark.asyncio
+async def test_http_server_serves_metrics_and_404():
+    metrics.EVENTS_TOTAL.inc(event="on_message", handler="h")
+    server = await metrics.start_http_server(0)
+    port = server.sockets[0].getsockname()[1]
+
+    async def get(path):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        await writer.drain()
+        data = await reader.read()
+        writer.close()
+        return data.decode()
+
+    try:
+        ok = await get("/metrics")
+        missing = await get("/nope")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert ok.startswith("HTTP/1.1 200 OK")
+    assert 'eldoria_events_total{event="on_message",handler="h"} 1' in ok
+    assert missing.startswith("HTTP/1.1 404")
@@ -55,4 +55,113 @@ def test_tail_lines_default_maxlen(tmp_path):
     lines = result.splitlines()
     assert len(lines) == 200
     assert lines[0] == "100"
-    assert lines[-1] == "299"
\ No newline at end of file
+    assert lines[-1] == "299"
+
+def test_tail_lines_reads_blockwise_from_end(tmp_path, monkeypatch):
+    import eldoria.utils.reader as reader_mod
+
+    monkeypatch.setattr(reader_mod, "BLOCK_SIZE", 7)
+    log_file = tmp_path / "test.log"
+    log_file.write_text("é🚀 un\ndeux 🚀\ntrois\n", encoding="utf-8")
+
+    assert list(reader_mod.iter_lines_reverse(log_file, block_size=3)) == ["trois", "deux 🚀", "é🚀 un"]
+    assert tail_lines(path=str(log_file), maxlen=2) == "deux 🚀\ntrois\n"
+
+
+def test_tail_lines_continues_into_rotated_files(tmp_path):
+    log_file = tmp_path / "bot.log"
+    log_file.write_text("c\nd\n", encoding="utf-8")
+    (tmp_path / "bot.log.1").write_text("a\nb\n", encoding="utf-8")
+
+    assert tail_lines(path=str(log_file), maxlen=3) == "b\nc\nd\n"
+    assert tail_lines(path=str(log_file), maxlen=3, include_rotated=False) == "c\nd\n"
+
+
+def test_tail_lines_does_not_read_whole_file(tmp_path, monkeypatch):
+    import builtins
+
+    log_file = tmp_path / "big.log"
+    log_file.write_text("".join(f"ligne {i}\n" for i in range(200_000)), encoding="utf-8")
+    read_sizes = []
+    real_open = builtins.open
+
+    def spy_open(*args, **kwargs):
+        f = real_open(*args, **kwargs)
+        real_read = f.read
+
+        def read(size=-1):
+            data = real_read(size)
+            read_sizes.append(len(data))
+            return data
+
+        f.read = read
+        return f
+
+    monkeypatch.setattr(builtins, "open", spy_open)
+
+    assert tail_lines(path=str(log_file), maxlen=2) == "ligne 199998\nligne 199999\n"
+    assert sum(read_sizes) <= 64 * 1024 + 1
+
+
+def _write_log(path, entries):
+    lines = []
+    for ts, level, logger, message in entries:
+        lines.append(f"{ts}  {level:<10}  {logger:<30} - {message}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_search_logs_filters_by_level_logger_text_and_time(tmp_path):
+    from datetime import datetime
+
+    from eldoria.utils.reader import LogQuery, search_logs
+
+    log_file = tmp_path / "bot.log"
+    _write_log(
+        log_file,
+        [
+            ("01/03/2026  10:00:00", "INFO", "eldoria.extensions.core", "Bot prêt"),
+            ("01/03/2026  10:05:00", "ERROR", "eldoria.extensions.xp_voice", "XP vocal: erreur\nTraceback (most recent call last):\nValueError: boom"),
+            ("01/03/2026  10:10:00", "WARNING", "eldoria.extensions.duels", "Duel expiré introuvable"),
+            ("01/03/2026  10:15:00", "ERROR", "eldoria.extensions.xp_voice", "XP vocal: autre erreur"),
+        ],
+    )
+
+    errors = search_logs(LogQuery(level="ERROR"), path=str(log_file))
+    assert [r.text.splitlines()[0].split(" - ", 1)[1] for r in errors] == ["XP vocal: erreur", "XP vocal: autre erreur"]
+    assert "ValueError: boom" in errors[0].text
+
+    warnings_up = search_logs(LogQuery(level="warning", logger="eldoria.extensions.duels"), path=str(log_file))
+    assert [r.level for r in warnings_up] == ["WARNING"]
+
+    by_text = search_logs(LogQuery(text="BOOM"), path=str(log_file))
+    assert len(by_text) == 1 and by_text[0].logger == "eldoria.extensions.xp_voice"
+
+    window = search_logs(
+        LogQuery(since=datetime(2026, 3, 1, 10, 4), until=datetime(2026, 3, 1, 10, 12)), path=str(log_file)
+    )
+    assert [r.timestamp.minute for r in window] == [5, 10]
+
+    last = search_logs(LogQuery(level="INFO", limit=1), path=str(log_file))
+    assert [r.timestamp.minute for r in last] == [15]
+
+
+def test_search_logs_spans_rotated_files_and_keeps_marker_lines(tmp_path):
+    from eldoria.utils.reader import LogQuery, search_logs
+
+    log_file = tmp_path / "bot.log"
+    _write_log(log_file, [("02/03/2026  08:00:00", "ERROR", "eldoria.a", "récent")])
+    log_file.write_text("\n\n========== DÉMARRAGE DU BOT ==========\n" + log_file.read_text(encoding="utf-8"), encoding="utf-8")
+    _write_log(tmp_path / "bot.log.1", [("01/03/2026  08:00:00", "ERROR", "eldoria.a", "ancien")])
+
+    records = search_logs(LogQuery(level="ERROR"), path=str(log_file))
+    assert [r.text.rsplit(" ", 1)[-1] for r in records] == ["ancien", "récent"]
+
+    markers = search_logs(LogQuery(text="DÉMARRAGE"), path=str(log_file))
+    assert len(markers) == 1 and markers[0].timestamp is None
+
+
+def test_search_logs_raises_if_file_not_found(tmp_path):
+    from eldoria.utils.reader import LogQuery, search_logs
+
+    with pytest.raises(LogFileNotFound):
+        search_logs(LogQuery(text="x"), path=str(tmp_path / "missing.log"))